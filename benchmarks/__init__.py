@@ -0,0 +1 @@
+"""MetricMancer benchmark suite (run with: python -m benchmarks.suite)."""
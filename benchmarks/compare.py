@@ -0,0 +1,244 @@
+"""
+Benchmark regression gate.
+
+Compares benchmark results (see suite.py) against a stored baseline and
+fails when throughput drops beyond a tolerance.
+
+Timing noise is handled with repeated runs: each benchmark's median is
+compared, and its median absolute deviation (MAD) tells how noisy it is.
+A benchmark only counts as regressed when its throughput drop exceeds
+both the tolerance and NOISE_FACTOR times the relative MAD of either run,
+so a benchmark that is jittery on this machine needs a larger drop to fail.
+Benchmarks that still look regressed are re-run (--confirm times, in a
+fresh process state) and keep their best result, so a one-off slow run of
+the machine does not fail the gate.
+
+The suite is run on a repository generated from the baseline's spec, so
+both sides measure the same work.
+
+Usage:
+    python -m benchmarks.compare --baseline baseline.json            # run the suite, compare
+    python -m benchmarks.compare --baseline baseline.json --current latest.json
+    python -m benchmarks.compare --baseline baseline.json --update-baseline
+
+Exit codes: 0 = no regressions, 1 = regressions, 2 = missing/invalid baseline.
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from benchmarks.suite import SyntheticRepoSpec, run_suite, write_results
+
+# Default allowed throughput drop (0.15 = 15 %)
+DEFAULT_TOLERANCE = 0.15
+
+# A drop must also exceed this many relative MADs to count as a regression
+NOISE_FACTOR = 3.0
+
+# Re-runs of regressed benchmarks before the regression is reported
+DEFAULT_CONFIRM_RUNS = 1
+
+STATUS_OK = 'ok'
+STATUS_REGRESSION = 'REGRESSION'
+STATUS_IMPROVEMENT = 'improvement'
+STATUS_NOISY = 'noisy'
+STATUS_NEW = 'new'
+STATUS_MISSING = 'missing'
+
+
+@dataclass
+class BenchmarkDiff:
+    """
+    Comparison of one benchmark between baseline and current results.
+
+    Attributes:
+        name: Benchmark name
+        status: One of the STATUS_* values
+        baseline_throughput: Baseline items/s (None if new)
+        current_throughput: Current items/s (None if missing)
+        change: Relative throughput change (-0.2 = 20 % slower), None if not comparable
+        noise: Larger relative MAD of the two results
+        unit: Unit of the throughput
+    """
+    name: str
+    status: str
+    baseline_throughput: Optional[float] = None
+    current_throughput: Optional[float] = None
+    change: Optional[float] = None
+    noise: float = 0.0
+    unit: str = 'items'
+
+
+def _relative_mad(result: Dict[str, Any]) -> float:
+    median = result.get('median') or 0.0
+    return result.get('mad', 0.0) / median if median > 0 else 0.0
+
+
+def compare_benchmark(name: str, baseline: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]],
+                      tolerance: float = DEFAULT_TOLERANCE, noise_factor: float = NOISE_FACTOR) -> BenchmarkDiff:
+    """Compare one benchmark result against its baseline."""
+    if current is None:
+        return BenchmarkDiff(name, STATUS_MISSING, baseline_throughput=baseline.get('throughput'),
+                             unit=baseline.get('unit', 'items'))
+    if baseline is None:
+        return BenchmarkDiff(name, STATUS_NEW, current_throughput=current.get('throughput'),
+                             unit=current.get('unit', 'items'))
+
+    diff = BenchmarkDiff(name, STATUS_OK, baseline.get('throughput'), current.get('throughput'),
+                         unit=current.get('unit', 'items'))
+    if not diff.baseline_throughput or not diff.current_throughput:
+        return diff
+
+    diff.change = diff.current_throughput / diff.baseline_throughput - 1.0
+    diff.noise = max(_relative_mad(baseline), _relative_mad(current))
+    threshold = max(tolerance, noise_factor * diff.noise)
+    if abs(diff.change) > tolerance and abs(diff.change) <= threshold:
+        diff.status = STATUS_NOISY
+    elif diff.change < -threshold:
+        diff.status = STATUS_REGRESSION
+    elif diff.change > threshold:
+        diff.status = STATUS_IMPROVEMENT
+    return diff
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE,
+                    noise_factor: float = NOISE_FACTOR) -> List[BenchmarkDiff]:
+    """
+    Compare all benchmarks of two suite results.
+
+    Benchmarks only in the baseline are reported as missing, benchmarks only
+    in the current results as new; neither counts as a regression.
+    """
+    baseline_benchmarks = baseline.get('benchmarks', {})
+    current_benchmarks = current.get('benchmarks', {})
+    names = list(baseline_benchmarks) + [n for n in current_benchmarks if n not in baseline_benchmarks]
+    return [
+        compare_benchmark(name, baseline_benchmarks.get(name), current_benchmarks.get(name), tolerance, noise_factor)
+        for name in names
+    ]
+
+
+def regressed_names(diffs: List[BenchmarkDiff]) -> List[str]:
+    """Return the names of the benchmarks that regressed."""
+    return [d.name for d in diffs if d.status == STATUS_REGRESSION]
+
+
+def keep_best(current: Dict[str, Any], rerun: Dict[str, Any]):
+    """Replace results in current with re-run results that have a higher throughput."""
+    for name, result in rerun.get('benchmarks', {}).items():
+        previous = current['benchmarks'].get(name)
+        if previous is None or (result.get('throughput') or 0) > (previous.get('throughput') or 0):
+            current['benchmarks'][name] = result
+
+
+def _format_throughput(value: Optional[float]) -> str:
+    return f"{value:,.1f}" if value else "-"
+
+
+def format_diff(diffs: List[BenchmarkDiff], tolerance: float = DEFAULT_TOLERANCE) -> str:
+    """Format the comparison as a table, one line per benchmark, followed by a verdict."""
+    lines = [
+        f"{'Benchmark':32s} {'Baseline':>14s} {'Current':>14s} {'Change':>9s} {'Noise':>7s}  Status",
+        "-" * 92,
+    ]
+    for diff in diffs:
+        change = f"{diff.change:+.1%}" if diff.change is not None else "-"
+        noise = f"{diff.noise:.1%}" if diff.change is not None else "-"
+        lines.append(f"{diff.name:32s} {_format_throughput(diff.baseline_throughput):>14s} "
+                     f"{_format_throughput(diff.current_throughput):>14s} {change:>9s} {noise:>7s}  "
+                     f"{diff.status} ({diff.unit}/s)")
+
+    regressions = regressed_names(diffs)
+    lines.append("")
+    if regressions:
+        lines.append(f"❌ {len(regressions)} benchmark(s) regressed by more than {tolerance:.0%} "
+                     f"(beyond noise): {', '.join(regressions)}")
+    else:
+        lines.append(f"✅ No throughput regressions beyond {tolerance:.0%}")
+    return "\n".join(lines)
+
+
+def spec_mismatch(baseline: Dict[str, Any], current: Dict[str, Any]) -> bool:
+    """Return True when the two results were measured on differently shaped repositories."""
+    return baseline.get('metadata', {}).get('spec') != current.get('metadata', {}).get('spec')
+
+
+def load_results(path: str) -> Optional[Dict[str, Any]]:
+    """Load suite results from a JSON file, or return None if missing or invalid."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return results if isinstance(results, dict) and 'benchmarks' in results else None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare MetricMancer benchmark results against a baseline.")
+    parser.add_argument('--baseline', required=True, help="Baseline results JSON")
+    parser.add_argument('--current', help="Compare these results instead of running the suite")
+    parser.add_argument('--output', help="Also write the current results to this JSON file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed throughput drop as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument('--filter', dest='name_filter', help="Only run benchmarks whose name or group contains this")
+    parser.add_argument('--confirm', type=int, default=DEFAULT_CONFIRM_RUNS,
+                        help=f"Re-runs of regressed benchmarks before failing (default: {DEFAULT_CONFIRM_RUNS})")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Run the suite and store the results as the new baseline instead of comparing")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.tolerance < 0 or args.repeat < 1 or args.confirm < 0:
+        print("--tolerance and --confirm must be >= 0 and --repeat at least 1", file=sys.stderr)
+        return 2
+
+    if args.update_baseline:
+        results = run_suite(repeat=args.repeat, name_filter=args.name_filter, progress=print)
+        write_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"No valid baseline at {args.baseline}; create one with --update-baseline", file=sys.stderr)
+        return 2
+
+    if args.current:
+        current = load_results(args.current)
+        if current is None:
+            print(f"No valid results at {args.current}", file=sys.stderr)
+            return 2
+        diffs = compare_results(baseline, current, args.tolerance)
+    else:
+        spec_data = baseline.get('metadata', {}).get('spec')
+        spec = SyntheticRepoSpec(**spec_data) if spec_data else None
+        current = run_suite(spec, args.repeat, args.name_filter, progress=print)
+        diffs = compare_results(baseline, current, args.tolerance)
+        for _ in range(args.confirm):
+            suspects = regressed_names(diffs)
+            if not suspects:
+                break
+            print(f"\nRe-running {len(suspects)} regressed benchmark(s) to confirm...")
+            keep_best(current, run_suite(spec, args.repeat, names=suspects, progress=print))
+            diffs = compare_results(baseline, current, args.tolerance)
+        print("")
+    if args.output:
+        write_results(current, args.output)
+
+    if spec_mismatch(baseline, current):
+        print("⚠️  Baseline and current results use different synthetic repositories; "
+              "throughput is compared anyway", file=sys.stderr)
+
+    if args.name_filter:
+        diffs = [d for d in diffs if d.status != STATUS_MISSING]
+    print(format_diff(diffs, args.tolerance))
+    return 1 if any(d.status == STATUS_REGRESSION for d in diffs) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,447 @@
+"""
+MetricMancer benchmark suite.
+
+Generates a synthetic git repository (see synthetic_repo.py) and times the
+main building blocks of the pipeline on it:
+
+- scan:                     Scanner.scan over the repository
+- git_cache.prebuild:       GitDataCache.prebuild_cache_for_files (fresh cache per run)
+- parser.<name>:            every parser in src/languages/parsers
+- parser.treesitter.<g>:    the tree-sitter parser of every grammar, as ComplexityAnalyzer loads it
+- cognitive.<name>:         every cognitive complexity calculator
+- kpi_aggregator:           KPIAggregator.aggregate_directory over the analyzed repository
+- report.<format>:          each report format through ReportCoordinator
+- render.html:              ReportRenderer.render on an in-memory tree of render_files files
+- delta_analyzer:           DeltaAnalyzer.analyze_commit_range over the last commits
+- analyze:                  Analyzer.analyze end to end (scan results -> RepoInfo)
+
+Every benchmark runs once as a warm-up and then --repeat times; fast ones
+are looped so each run lasts at least MIN_RUN_SECONDS. Results (all runs,
+median, median absolute deviation and throughput) are written
+as JSON together with the git commit of MetricMancer, so results from
+different commits can be compared.
+
+Usage:
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --quick --filter parser
+"""
+import argparse
+import contextlib
+import gc
+import importlib
+import io
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic_repo import (SUPPORTED_EXTENSIONS, SyntheticRepoSpec, generate_repo, generate_report_tree,
+                                       generate_source)
+
+SCHEMA_VERSION = 1
+
+# Repository used with --quick (smoke runs, CI)
+QUICK_SPEC = SyntheticRepoSpec(files=20, functions_per_file=4, commits=6, authors=3, renames=1, render_files=500)
+
+# Fast benchmarks are looped until one timed run takes at least this long
+MIN_RUN_SECONDS = 0.05
+MAX_LOOPS = 1000
+
+# Source used for the parser and calculator benchmarks
+PARSER_SOURCE_FUNCTIONS = 50
+
+# Extensions without a synthetic source, benchmarked on the source of a compatible language
+SOURCE_ALIASES = {'.tsx': '.ts'}
+
+# Report formats benchmarked through ReportCoordinator
+REPORT_FORMATS = ('summary', 'quick-wins', 'tree', 'json', 'html')
+
+
+@dataclass
+class Benchmark:
+    """
+    One timed operation.
+
+    Attributes:
+        name: Unique name, e.g. 'parser.python'
+        group: Group name used when filtering and printing
+        func: The operation; called once per run
+        items: Work done per run (files, lines, commits), for throughput
+        unit: Name of the items
+    """
+    name: str
+    group: str
+    func: Callable[[], Any]
+    items: int = 1
+    unit: str = 'items'
+
+
+def median_absolute_deviation(values: List[float]) -> float:
+    """Return the median absolute deviation of values (0.0 for fewer than two values)."""
+    if len(values) < 2:
+        return 0.0
+    center = statistics.median(values)
+    return statistics.median(abs(v - center) for v in values)
+
+
+def _time_calls(func: Callable[[], Any], loops: int) -> float:
+    """
+    Return the seconds taken by loops calls of func, discarding their output.
+
+    Like timeit, garbage left by earlier benchmarks is collected first and
+    the collector is paused while timing, so its pauses do not land on
+    whichever benchmark happens to run next.
+    """
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 5, min_run_seconds: float = MIN_RUN_SECONDS) -> Dict[str, Any]:
+    """
+    Time a benchmark.
+
+    One untimed warm-up call also calibrates how many calls make up a run:
+    fast operations are called in a loop until a run lasts min_run_seconds,
+    so timer resolution and scheduler jitter do not dominate their timings.
+    Output written by the operation (CLI reports, progress bars) is discarded.
+
+    Returns:
+        dict with group, runs (seconds per call), loops, median, mad, min, items, unit
+        and throughput (items/s)
+    """
+    warmup = _time_calls(benchmark.func, 1)
+    loops = 1
+    if 0 < warmup < min_run_seconds:
+        loops = min(MAX_LOOPS, math.ceil(min_run_seconds / warmup))
+    runs = [_time_calls(benchmark.func, loops) / loops for _ in range(repeat)]
+
+    median = statistics.median(runs)
+    return {
+        'group': benchmark.group,
+        'runs': runs,
+        'loops': loops,
+        'median': median,
+        'mad': median_absolute_deviation(runs),
+        'min': min(runs),
+        'items': benchmark.items,
+        'unit': benchmark.unit,
+        'throughput': benchmark.items / median if median > 0 else None,
+    }
+
+
+class BenchmarkWorkspace:
+    """
+    A synthetic repository plus the pipeline state the benchmarks start from.
+
+    Attributes:
+        root: Temporary directory holding the repository and report output
+        repo_path: Path of the synthetic git repository
+        repo: Summary returned by generate_repo()
+        files: Scanner output for the repository
+        repo_info: Analyzed RepoInfo for the repository
+    """
+
+    def __init__(self, spec: SyntheticRepoSpec):
+        from src.app.core.analyzer import Analyzer
+        from src.app.scanning.scanner import Scanner
+        from src.languages.config import LANGUAGES
+
+        self.spec = spec
+        self.root = tempfile.mkdtemp(prefix='metricmancer_bench_')
+        self.repo_path = os.path.join(self.root, 'repo')
+        self.report_folder = os.path.join(self.root, 'output')
+        os.makedirs(self.report_folder)
+        self.repo = generate_repo(self.repo_path, spec)
+        self.scanner = Scanner(LANGUAGES)
+        self.analyzer = Analyzer(LANGUAGES)
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.files = self.scanner.scan([self.repo_path])
+            self.repo_info = self.analyze()
+
+    def analyze(self):
+        """Run the Analyzer on the scanned files with a cold git cache and return the RepoInfo."""
+        from src.utilities.git_cache import get_git_cache
+
+        get_git_cache().clear_cache()
+        return next(iter(self.analyzer.analyze(self.files).values()))
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _parser_benchmarks() -> List[Benchmark]:
+    from src.languages.config import LANGUAGES
+
+    benchmarks = []
+    seen = set()
+    for ext, language in LANGUAGES.items():
+        class_name = language.get('parser')
+        if not class_name or class_name in seen or ext not in SUPPORTED_EXTENSIONS:
+            continue
+        seen.add(class_name)
+        module_name = class_name.replace('ComplexityParser', '').lower()
+        parser = getattr(importlib.import_module(f"src.languages.parsers.{module_name}"), class_name)()
+        code = generate_source(ext, PARSER_SOURCE_FUNCTIONS)
+
+        def parse(parser=parser, code=code):
+            parser.compute_complexity(code)
+            parser.analyze_functions(code)
+
+        benchmarks.append(Benchmark(f"parser.{module_name}", 'parser', parse,
+                                    items=code.count('\n'), unit='lines'))
+    return benchmarks + _tree_sitter_parser_benchmarks()
+
+
+def _tree_sitter_parser_benchmarks() -> List[Benchmark]:
+    """Benchmarks of the production parsers of languages with a grammar (none without tree-sitter)."""
+    from src.kpis.complexity.analyzer import ComplexityAnalyzer
+    from src.languages.config import LANGUAGES
+    from src.languages.parsers.tree_sitter_parser import TreeSitterComplexityParser
+
+    analyzer = ComplexityAnalyzer()
+    benchmarks = []
+    seen = set()
+    for ext, language in LANGUAGES.items():
+        grammar = language.get('grammar')
+        source_ext = SOURCE_ALIASES.get(ext, ext)
+        if not grammar or grammar in seen or source_ext not in SUPPORTED_EXTENSIONS:
+            continue
+        seen.add(grammar)
+        if not isinstance(analyzer._load_parser(language), TreeSitterComplexityParser):
+            continue
+        code = generate_source(source_ext, PARSER_SOURCE_FUNCTIONS)
+        # Two equal but distinct strings: the parser memoizes the tree of the last string it saw
+        copies = (code, code[:-1] + code[-1])
+
+        def parse(language=language, copies=copies):
+            for copy in copies:
+                analyzer.analyze_functions(copy, language)
+                analyzer.calculate_for_file(copy, language)
+
+        benchmarks.append(Benchmark(f"parser.treesitter.{grammar}", 'parser', parse,
+                                    items=2 * code.count('\n'), unit='lines'))
+    return benchmarks
+
+
+def _cognitive_benchmarks() -> List[Benchmark]:
+    from src.kpis.cognitive_complexity.calculator_factory import CognitiveComplexityCalculatorFactory
+
+    benchmarks = []
+    seen = set()
+    for ext, (module_name, class_name) in CognitiveComplexityCalculatorFactory.CALCULATORS.items():
+        source_ext = SOURCE_ALIASES.get(ext, ext)
+        if class_name in seen or source_ext not in SUPPORTED_EXTENSIONS:
+            continue
+        seen.add(class_name)
+        module = importlib.import_module(f"src.kpis.cognitive_complexity.{module_name}")
+        calculator = getattr(module, class_name)()
+        code = generate_source(source_ext, PARSER_SOURCE_FUNCTIONS)
+        # Named after the class: C and C++ (and TypeScript and TSX) share a module
+        name = class_name.replace('CognitiveComplexityCalculator', '').lower()
+        benchmarks.append(Benchmark(f"cognitive.{name}", 'cognitive',
+                                    lambda calculator=calculator, code=code: calculator.calculate_for_file(code),
+                                    items=code.count('\n'), unit='lines'))
+    return benchmarks
+
+
+def _report_benchmarks(workspace: BenchmarkWorkspace) -> List[Benchmark]:
+    from src.app.coordination.format_mapper import FormatMapper
+    from src.app.coordination.report_coordinator import ReportCoordinator
+    from src.config.app_config import AppConfig
+
+    benchmarks = []
+    for fmt in REPORT_FORMATS:
+        config = AppConfig(directories=[workspace.repo_path], output_formats=[fmt],
+                           report_folder=workspace.report_folder)
+        coordinator = ReportCoordinator(config)
+        extension = FormatMapper.get_extension(fmt) or '.txt'
+        output_file = f"bench_{fmt.replace('-', '_')}{extension}"
+
+        def generate(coordinator=coordinator, fmt=fmt, output_file=output_file):
+            coordinator.generate_single_report(workspace.repo_info, fmt, output_file, [], True)
+
+        benchmarks.append(Benchmark(f"report.{fmt}", 'report', generate,
+                                    items=len(workspace.files), unit='files'))
+    return benchmarks
+
+
+def _render_benchmark(spec: SyntheticRepoSpec) -> Benchmark:
+    """HTML rendering alone, on a tree far larger than the synthetic git repository."""
+    from src.report.report_renderer import ReportRenderer
+
+    tree = generate_report_tree(spec.render_files, spec.seed)
+    renderer = ReportRenderer()
+    return Benchmark('render.html', 'render', lambda: renderer.render(tree),
+                     items=spec.render_files, unit='files')
+
+
+def build_benchmarks(workspace: BenchmarkWorkspace) -> List[Benchmark]:
+    """Return all benchmarks for a workspace."""
+    from src.analysis.delta.delta_analyzer import DeltaAnalyzer
+    from src.app.kpi.kpi_aggregator import KPIAggregator
+    from src.utilities.git_cache import GitDataCache
+
+    file_count = len(workspace.files)
+    repo_root = str(Path(workspace.repo_path).resolve())
+    relative_paths = [str(Path(f['path']).resolve().relative_to(repo_root)) for f in workspace.files]
+    delta_commits = min(10, workspace.repo['commits'] - 1)
+    aggregator = KPIAggregator()
+    delta_analyzer = DeltaAnalyzer(workspace.repo_path)
+
+    def prebuild():
+        GitDataCache().prebuild_cache_for_files(repo_root, relative_paths)
+
+    benchmarks = [
+        Benchmark('scan', 'scan', lambda: workspace.scanner.scan([workspace.repo_path]),
+                  items=file_count, unit='files'),
+        Benchmark('git_cache.prebuild', 'git', prebuild, items=file_count, unit='files'),
+    ]
+    benchmarks += _parser_benchmarks()
+    benchmarks += _cognitive_benchmarks()
+    benchmarks.append(Benchmark('kpi_aggregator', 'kpi', lambda: aggregator.aggregate_directory(workspace.repo_info),
+                                items=file_count, unit='files'))
+    benchmarks += _report_benchmarks(workspace)
+    benchmarks.append(_render_benchmark(workspace.spec))
+    if delta_commits > 0:
+        benchmarks.append(Benchmark('delta_analyzer', 'git',
+                                    lambda: delta_analyzer.analyze_commit_range(f"HEAD~{delta_commits}", 'HEAD'),
+                                    items=delta_commits, unit='commits'))
+    # End to end: Analyzer.analyze with a cold git cache
+    benchmarks.append(Benchmark('analyze', 'pipeline', workspace.analyze, items=file_count, unit='files'))
+    return benchmarks
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.dirname(__file__)),
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(spec: SyntheticRepoSpec = None, repeat: int = 5, name_filter: Optional[str] = None,
+              progress: Callable[[str], None] = None, names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Generate the synthetic repository, run the benchmarks and return the results.
+
+    Args:
+        spec: Repository shape (defaults to SyntheticRepoSpec())
+        repeat: Timed runs per benchmark (after one warm-up run)
+        name_filter: Only run benchmarks whose name or group contains this text
+        progress: Optional callback receiving one line per finished benchmark
+        names: Only run the benchmarks with these exact names
+
+    Returns:
+        JSON-serializable dict with 'metadata', 'repo' and 'benchmarks' (by name)
+    """
+    spec = spec or SyntheticRepoSpec()
+    workspace = BenchmarkWorkspace(spec)
+    try:
+        results = {}
+        for benchmark in build_benchmarks(workspace):
+            if name_filter and name_filter not in benchmark.name and name_filter not in benchmark.group:
+                continue
+            if names is not None and benchmark.name not in names:
+                continue
+            results[benchmark.name] = run_benchmark(benchmark, repeat)
+            if progress:
+                progress(format_result(benchmark.name, results[benchmark.name]))
+        repo = {key: workspace.repo[key] for key in ('commits', 'lines')}
+        repo['files'] = len(workspace.files)
+    finally:
+        workspace.cleanup()
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'metadata': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'spec': asdict(spec),
+        },
+        'repo': repo,
+        'benchmarks': results,
+    }
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    """Format one benchmark result as a single line."""
+    throughput = result.get('throughput')
+    rate = f"{throughput:12.1f} {result['unit']}/s" if throughput else ""
+    return f"{name:32s} {result['median'] * 1000:10.2f} ms ± {result['mad'] * 1000:7.2f} ms {rate}"
+
+
+def write_results(results: Dict[str, Any], path: str):
+    """Write suite results to a JSON file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    defaults = SyntheticRepoSpec()
+    parser = argparse.ArgumentParser(description="Run the MetricMancer benchmark suite on a synthetic git repository.")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file for the results")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument('--filter', dest='name_filter', help="Only run benchmarks whose name or group contains this")
+    parser.add_argument('--quick', action='store_true', help="Small repository and one run per benchmark")
+    parser.add_argument('--files', type=int, default=defaults.files, help="Files in the synthetic repository")
+    parser.add_argument('--functions', type=int, default=defaults.functions_per_file, help="Functions per file")
+    parser.add_argument('--depth', type=int, default=defaults.nesting_depth, help="Nesting depth per function")
+    parser.add_argument('--commits', type=int, default=defaults.commits, help="Commits after the initial one")
+    parser.add_argument('--authors', type=int, default=defaults.authors, help="Distinct commit authors")
+    parser.add_argument('--renames', type=int, default=defaults.renames, help="Commits that rename a file")
+    parser.add_argument('--seed', type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument('--render-files', type=int, default=defaults.render_files,
+                        help="Files in the in-memory tree of the HTML rendering benchmark")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.quick:
+        spec, repeat = QUICK_SPEC, 1
+    else:
+        spec = SyntheticRepoSpec(files=args.files, functions_per_file=args.functions, nesting_depth=args.depth,
+                                 commits=args.commits, authors=args.authors, renames=args.renames, seed=args.seed,
+                                 render_files=args.render_files)
+        repeat = args.repeat
+    if repeat < 1:
+        print("--repeat must be at least 1", file=sys.stderr)
+        return 2
+
+    print(f"Benchmarking on a synthetic repository: {spec.files} files, {spec.commits} commits, "
+          f"{repeat} run(s) per benchmark")
+    results = run_suite(spec, repeat, args.name_filter, progress=print)
+    write_results(results, args.output)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,420 @@
+"""
+Synthetic git repository generator for benchmarks.
+
+Builds a deterministic git repository from a SyntheticRepoSpec: source files
+in a mix of languages with a configurable number of functions and nesting
+depth, followed by a history of commits by several authors that edit
+functions and rename files. The same spec and seed always produce the same
+file contents and commit sequence, so benchmark results can be compared
+between commits of MetricMancer.
+
+Usage:
+    from benchmarks.synthetic_repo import SyntheticRepoSpec, generate_repo
+
+    spec = SyntheticRepoSpec(files=200, commits=50, authors=5)
+    info = generate_repo('/tmp/bench_repo', spec)
+"""
+import os
+import random
+import subprocess
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+# Default language mix (extension -> share of files)
+DEFAULT_LANGUAGE_MIX = {
+    '.py': 0.30,
+    '.java': 0.15,
+    '.js': 0.15,
+    '.ts': 0.10,
+    '.go': 0.10,
+    '.c': 0.10,
+    '.cpp': 0.05,
+    '.cs': 0.05,
+}
+
+# Every extension the generator can render (one per parser in src/languages/parsers)
+SUPPORTED_EXTENSIONS = ('.py', '.java', '.js', '.ts', '.go', '.c', '.cpp', '.cs',
+                        '.adb', '.idl', '.json', '.yaml', '.sh')
+
+
+@dataclass
+class SyntheticRepoSpec:
+    """
+    Shape of a synthetic repository.
+
+    Attributes:
+        files: Number of source files
+        language_mix: Share of files per extension (normalized, need not sum to 1)
+        functions_per_file: Functions (or top-level entries for data files) per file
+        nesting_depth: Depth of nested control flow in each function
+        commits: Commits after the initial one, each editing one to three files
+        authors: Number of distinct commit authors
+        renames: Number of commits that also rename a file
+        directories: Number of top-level directories the files are spread over
+        seed: Random seed; the same spec always produces the same repository
+        render_files: Files in the in-memory tree used by the report rendering benchmark
+    """
+    files: int = 100
+    language_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_LANGUAGE_MIX))
+    functions_per_file: int = 8
+    nesting_depth: int = 3
+    commits: int = 30
+    authors: int = 4
+    renames: int = 3
+    directories: int = 5
+    seed: int = 42
+    render_files: int = 50000
+
+
+@dataclass
+class _FileState:
+    path: str
+    ext: str
+    revisions: List[int]  # One revision counter per function; bumping it edits that function
+
+
+# ---------------------------------------------------------------------------
+# Source rendering
+# ---------------------------------------------------------------------------
+
+def _python_function(name: str, depth: int, revision: int) -> List[str]:
+    lines = [f"def {name}(value, items):", "    total = 0"]
+    indent = "    "
+    for level in range(depth):
+        if level % 2 == 0:
+            lines.append(f"{indent}if value > {level + revision} and len(items) > {level}:")
+        else:
+            lines.append(f"{indent}for item in items:")
+        indent += "    "
+    lines.append(f"{indent}total += value * {revision + 1}")
+    lines.append("    return total")
+    return lines
+
+
+def _c_like_function(ext: str, name: str, depth: int, revision: int) -> List[str]:
+    signatures = {
+        '.java': f"    public int {name}(int value, int[] items) {{",
+        '.cs': f"    public int {name}(int value, int[] items) {{",
+        '.js': f"function {name}(value, items) {{",
+        '.ts': f"function {name}(value: number, items: number[]): number {{",
+        '.go': f"func {name}(value int, items []int) int {{",
+        '.c': f"int {name}(int value, int *items, int count) {{",
+        '.cpp': f"int Worker::{name}(int value, int *items, int count) {{",
+    }
+    loops = {
+        '.java': "for (int item : items) {",
+        '.cs': "foreach (int item in items) {",
+        '.js': "for (const item of items) {",
+        '.ts': "for (const item of items) {",
+        '.go': "for _, item := range items {",
+        '.c': "for (int i = 0; i < count; i++) {",
+        '.cpp': "for (int i = 0; i < count; i++) {",
+    }
+    declare = {'.js': "let total = 0;", '.ts': "let total = 0;", '.go': "total := 0"}.get(ext, "int total = 0;")
+    base = "        " if ext in ('.java', '.cs') else "    "
+    semicolon = "" if ext == '.go' else ";"
+    condition = "if value > {0} && value != {1} {{" if ext == '.go' else "if (value > {0} && value != {1}) {{"
+
+    lines = [signatures[ext], base + declare]
+    indent = base
+    for level in range(depth):
+        if level % 2 == 0:
+            lines.append(indent + condition.format(level + revision, level))
+        else:
+            lines.append(indent + loops[ext])
+        indent += "    "
+    lines.append(f"{indent}total += value * {revision + 1}{semicolon}")
+    for level in range(depth):
+        indent = indent[:-4]
+        lines.append(indent + "}")
+    lines.append(f"{base}return total{semicolon}")
+    lines.append(base[:-4] + "}")
+    return lines
+
+
+def _ada_function(name: str, depth: int, revision: int) -> List[str]:
+    lines = [f"   function {name} (Value : Integer) return Integer is",
+             "      Total : Integer := 0;", "   begin"]
+    indent = "      "
+    for level in range(depth):
+        if level % 2 == 0:
+            lines.append(f"{indent}if Value > {level + revision} then")
+        else:
+            lines.append(f"{indent}for I in 1 .. Value loop")
+        indent += "   "
+    lines.append(f"{indent}Total := Total + Value * {revision + 1};")
+    for level in reversed(range(depth)):
+        indent = indent[:-3]
+        lines.append(indent + ("end if;" if level % 2 == 0 else "end loop;"))
+    lines += ["      return Total;", f"   end {name};"]
+    return lines
+
+
+def _shell_function(name: str, depth: int, revision: int) -> List[str]:
+    lines = [f"{name}() {{", "  total=0"]
+    indent = "  "
+    for level in range(depth):
+        if level % 2 == 0:
+            lines.append(f'{indent}if [ "$1" -gt {level + revision} ]; then')
+        else:
+            lines.append(f'{indent}for item in "$@"; do')
+        indent += "  "
+    lines.append(f"{indent}total=$((total + {revision + 1}))")
+    for level in reversed(range(depth)):
+        indent = indent[:-2]
+        lines.append(indent + ("fi" if level % 2 == 0 else "done"))
+    lines += ['  echo "$total"', "}"]
+    return lines
+
+
+def _nested_data(depth: int, revision: int, indent: str, yaml: bool) -> List[str]:
+    if depth == 0:
+        return [f"{indent}value: {revision}" if yaml else f'{indent}"value": {revision}']
+    if yaml:
+        return [f"{indent}level_{depth}:"] + _nested_data(depth - 1, revision, indent + "  ", yaml) + \
+            [f"{indent}items_{depth}: [1, 2, {revision}]"]
+    return ([f'{indent}"level_{depth}": {{'] + _nested_data(depth - 1, revision, indent + "  ", yaml) +
+            [f"{indent}}},", f'{indent}"items_{depth}": [1, 2, {revision}]'])
+
+
+def render_source(ext: str, module: str, revisions: List[int], depth: int) -> str:
+    """
+    Render a source file.
+
+    Args:
+        ext: File extension (one of SUPPORTED_EXTENSIONS)
+        module: Module/class name used inside the file
+        revisions: One revision number per function; changing one edits only that function
+        depth: Nesting depth of control flow in each function
+
+    Returns:
+        File content
+    """
+    names = [f"{module}_fn{i}" for i in range(len(revisions))]
+    lines: List[str] = []
+
+    if ext == '.py':
+        lines.append(f'"""Synthetic module {module}."""')
+        for name, revision in zip(names, revisions):
+            lines += [""] + [""] + _python_function(name, depth, revision)
+    elif ext in ('.java', '.cs'):
+        lines.append(f"public class {module.capitalize()} {{")
+        for name, revision in zip(names, revisions):
+            lines += [""] + _c_like_function(ext, name, depth, revision)
+        lines.append("}")
+    elif ext in ('.js', '.ts', '.go', '.c', '.cpp'):
+        if ext == '.go':
+            lines.append("package synthetic")
+        if ext == '.cpp':
+            lines.append("#include \"worker.h\"")
+        for name, revision in zip(names, revisions):
+            lines += [""] + _c_like_function(ext, name, depth, revision)
+    elif ext == '.adb':
+        lines.append(f"package body {module.capitalize()} is")
+        for name, revision in zip(names, revisions):
+            lines += [""] + _ada_function(name, depth, revision)
+        lines.append(f"end {module.capitalize()};")
+    elif ext == '.idl':
+        lines.append(f"module {module} {{")
+        for name, revision in zip(names, revisions):
+            lines.append(f"  interface {name.capitalize()} {{")
+            lines += [f"    long op{i}(in long value, in long rev{revision});" for i in range(depth + 1)]
+            lines.append("  };")
+        lines.append("};")
+    elif ext == '.sh':
+        lines.append("#!/bin/sh")
+        for name, revision in zip(names, revisions):
+            lines += [""] + _shell_function(name, depth, revision)
+    elif ext == '.yaml':
+        for name, revision in zip(names, revisions):
+            lines += [f"{name}:"] + _nested_data(depth, revision, "  ", yaml=True)
+    elif ext == '.json':
+        entries = []
+        for name, revision in zip(names, revisions):
+            entries.append([f'  "{name}": {{'] + _nested_data(depth, revision, "    ", yaml=False) + ["  }"])
+        lines.append("{")
+        for i, entry in enumerate(entries):
+            if i < len(entries) - 1:
+                entry[-1] += ","
+            lines += entry
+        lines.append("}")
+    else:
+        raise ValueError(f"Unsupported extension for synthetic source: {ext}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_source(ext: str, functions: int = 20, depth: int = 3, seed: int = 0) -> str:
+    """Render a standalone source file (no git), e.g. for parser benchmarks."""
+    rng = random.Random(seed)
+    return render_source(ext, "bench", [rng.randrange(100) for _ in range(functions)], depth)
+
+
+# ---------------------------------------------------------------------------
+# Repository generation
+# ---------------------------------------------------------------------------
+
+def _pick_extensions(spec: SyntheticRepoSpec, rng: random.Random) -> List[str]:
+    mix = {ext: share for ext, share in spec.language_mix.items() if share > 0}
+    unsupported = set(mix) - set(SUPPORTED_EXTENSIONS)
+    if unsupported:
+        raise ValueError(f"Unsupported extensions in language_mix: {sorted(unsupported)}")
+    total = sum(mix.values())
+    extensions = []
+    for ext, share in mix.items():
+        extensions += [ext] * round(spec.files * share / total)
+    # Rounding may leave the list a few files short or long
+    while len(extensions) < spec.files:
+        extensions.append(rng.choice(list(mix)))
+    return extensions[:spec.files]
+
+
+def _git(repo: str, args: List[str], env: Dict[str, str] = None) -> str:
+    result = subprocess.run(
+        ['git', '-c', 'commit.gpgsign=false', '-c', 'core.autocrlf=false'] + args,
+        cwd=repo, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def _commit_env(author: int, when: datetime) -> Dict[str, str]:
+    env = dict(os.environ)
+    stamp = when.strftime('%Y-%m-%dT%H:%M:%S%z')
+    env.update({
+        'GIT_AUTHOR_NAME': f'Author {author}',
+        'GIT_AUTHOR_EMAIL': f'author{author}@example.com',
+        'GIT_AUTHOR_DATE': stamp,
+        'GIT_COMMITTER_NAME': f'Author {author}',
+        'GIT_COMMITTER_EMAIL': f'author{author}@example.com',
+        'GIT_COMMITTER_DATE': stamp,
+    })
+    return env
+
+
+def _write(repo: str, state: _FileState, depth: int):
+    full_path = os.path.join(repo, state.path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    module = os.path.splitext(os.path.basename(state.path))[0]
+    with open(full_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(render_source(state.ext, module, state.revisions, depth))
+
+
+def generate_repo(path: str, spec: SyntheticRepoSpec = None) -> Dict:
+    """
+    Create a synthetic git repository at path (which must not exist or be empty).
+
+    Commit dates are spread over the days before generation, so churn
+    windows see the history regardless of when the benchmark runs.
+
+    Args:
+        path: Target directory
+        spec: Repository shape (defaults to SyntheticRepoSpec())
+
+    Returns:
+        dict with 'path', 'spec', 'files' (relative paths after renames),
+        'commits' (including the initial commit) and 'lines'
+    """
+    spec = spec or SyntheticRepoSpec()
+    rng = random.Random(spec.seed)
+    os.makedirs(path, exist_ok=True)
+    _git(path, ['init', '-q', '-b', 'main'])
+
+    states = []
+    for index, ext in enumerate(_pick_extensions(spec, rng)):
+        directory = f"pkg{index % max(1, spec.directories)}/sub{(index // max(1, spec.directories)) % 3}"
+        states.append(_FileState(f"{directory}/mod{index}{ext}", ext, [0] * spec.functions_per_file))
+
+    start = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=max(1, spec.commits // 2 + 1))
+    for state in states:
+        _write(path, state, spec.nesting_depth)
+    _git(path, ['add', '-A'])
+    _git(path, ['commit', '-q', '-m', 'Initial commit'], _commit_env(0, start))
+
+    rename_at = set(rng.sample(range(spec.commits), min(spec.renames, spec.commits))) if spec.commits else set()
+    for number in range(spec.commits):
+        author = rng.randrange(max(1, spec.authors))
+        for state in rng.sample(states, min(len(states), rng.randint(1, 3))):
+            function = rng.randrange(len(state.revisions)) if state.revisions else None
+            if function is not None:
+                state.revisions[function] += 1
+            _write(path, state, spec.nesting_depth)
+        if number in rename_at:
+            state = rng.choice(states)
+            directory, name = os.path.split(state.path)
+            new_path = f"{directory}/renamed{number}_{name}"
+            _git(path, ['mv', state.path, new_path])
+            state.path = new_path
+        _git(path, ['add', '-A'])
+        when = start + timedelta(hours=12 * (number + 1))
+        _git(path, ['commit', '-q', '-m', f'Change {number + 1}'], _commit_env(author, when))
+
+    lines = 0
+    for state in states:
+        with open(os.path.join(path, state.path), encoding='utf-8') as f:
+            lines += sum(1 for _ in f)
+
+    return {
+        'path': os.path.abspath(path),
+        'spec': asdict(spec),
+        'files': sorted(state.path for state in states),
+        'commits': spec.commits + 1,
+        'lines': lines,
+    }
+
+
+# ---------------------------------------------------------------------------
+# In-memory report trees
+# ---------------------------------------------------------------------------
+
+def generate_report_tree(files: int, seed: int = 42, files_per_directory: int = 20, fanout: int = 8):
+    """
+    Build an analyzed-looking RepoInfo with KPIs but no files on disk or git.
+
+    Report rendering only reads the model, so very large trees (tens of
+    thousands of files) can be benchmarked without generating a repository.
+
+    Args:
+        files: Number of files in the tree
+        seed: Random seed for the KPI values
+        files_per_directory: Files per directory
+        fanout: Subdirectories per directory
+
+    Returns:
+        RepoInfo whose directories carry aggregated KPIs like the Analyzer's
+    """
+    from src.app.kpi.kpi_aggregator import KPIAggregator
+    from src.kpis.base_kpi import BaseKPI
+    from src.kpis.model import File, RepoInfo, ScanDir
+
+    class StaticKPI(BaseKPI):
+        def calculate(self, *args, **kwargs):
+            return self.value
+
+    rng = random.Random(seed)
+    repo = RepoInfo(dir_name='synthetic', scan_dir_path='.', repo_root_path='/synthetic', repo_name='synthetic')
+    directories = [repo]
+    created = 0
+    while created < files:
+        # Directories form a tree with `fanout` children per directory, filled breadth first
+        parent = directories[(len(directories) - 1) // fanout]
+        name = f"dir{len(directories)}"
+        path = name if parent is repo else f"{parent.scan_dir_path}/{name}"
+        directory = ScanDir(dir_name=name, scan_dir_path=path,
+                            repo_root_path=repo.repo_root_path, repo_name=repo.repo_name)
+        parent.scan_dirs[name] = directory
+        directories.append(directory)
+        for _ in range(min(files_per_directory, files - created)):
+            file_name = f"mod{created}.py"
+            complexity, cognitive, churn = rng.randrange(60), rng.randrange(40), rng.randrange(25)
+            directory.files[file_name] = File(name=file_name, file_path=f"{path}/{file_name}", kpis={
+                'complexity': StaticKPI('complexity', complexity),
+                'cognitive_complexity': StaticKPI('cognitive_complexity', cognitive),
+                'churn': StaticKPI('churn', churn),
+                'hotspot': StaticKPI('hotspot', complexity * churn),
+                'Code Ownership': StaticKPI('Code Ownership', {f"Author {rng.randrange(4)}": 100.0}),
+            })
+            created += 1
+
+    KPIAggregator().aggregate_directory(repo)
+    return repo
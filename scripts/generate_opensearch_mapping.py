@@ -41,6 +41,10 @@ def json_type_to_opensearch_type(json_type: str, field_name: str, field_def: Dic
     if field_name == "filename" or field_name == "package" or field_name == "function_name":
         return "keyword"
 
+    # Status values are filtered on, not searched
+    if field_name == "git_kpis":
+        return "keyword"
+
     # Standard type mappings
     type_mapping = {
         "string": "text",
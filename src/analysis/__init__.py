@@ -3,18 +3,20 @@ Analysis package for MetricMancer.
 Contains hotspot analysis and code review strategy tools.
 """
 
-from src.analysis.hotspot_analyzer import (
-    extract_hotspots_from_data,
-    format_hotspots_table,
-    save_hotspots_to_file,
-    print_hotspots_summary
-)
+from src.utilities.lazy_exports import lazy_exports
 
-from src.analysis.code_review_advisor import (
-    CodeReviewAdvisor,
-    ReviewRecommendation,
-    generate_review_report
-)
+# Loaded on first access so importing src.analysis.hotspot_analyzer does not
+# pull in the code review advisor (and vice versa)
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    'extract_hotspots_from_data': 'src.analysis.hotspot_analyzer',
+    'format_hotspots_table': 'src.analysis.hotspot_analyzer',
+    'save_hotspots_to_file': 'src.analysis.hotspot_analyzer',
+    'print_hotspots_summary': 'src.analysis.hotspot_analyzer',
+    'CodeReviewAdvisor': 'src.analysis.code_review_advisor',
+    'ReviewRecommendation': 'src.analysis.code_review_advisor',
+    'generate_review_report': 'src.analysis.code_review_advisor',
+    'generate_review_report_for_repos': 'src.analysis.code_review_advisor',
+})
 
 __all__ = [
     # Hotspot analysis
@@ -26,4 +28,5 @@ __all__ = [
     'CodeReviewAdvisor',
     'ReviewRecommendation',
     'generate_review_report',
+    'generate_review_report_for_repos',
 ]
@@ -4,7 +4,7 @@ Based on "Your Code as a Crime Scene" methodology by Adam Tornhill.
 """
 
 import os
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Any, Optional
 from dataclasses import dataclass
 
 
@@ -22,6 +22,16 @@ class ReviewRecommendation:
     estimated_time_minutes: int
 
 
+class ReviewInput(NamedTuple):
+    """Metrics of one file, as passed to CodeReviewAdvisor.analyze_file."""
+    file_path: str
+    complexity: int
+    churn: float
+    hotspot: int
+    ownership_data: Optional[Dict[str, float]] = None
+    shared_ownership_data: Optional[Dict[str, Any]] = None
+
+
 class CodeReviewAdvisor:
     """Generates code review recommendations based on complexity, churn, and ownership metrics."""
 
@@ -41,8 +51,32 @@ class CodeReviewAdvisor:
     # Reviewer count thresholds
     REVIEWER_COMPLEXITY_HIGH = 20  # Complexity above this needs 2 reviewers
 
+    # Review priority per risk level (1 is highest)
+    PRIORITY_BY_RISK = {"critical": 1, "high": 2, "medium": 3, "low": 4}
+
+    # Review time additions in minutes: (threshold, minutes), highest threshold first
+    REVIEW_TIME_COMPLEXITY = ((50, 60), (20, 30), (10, 15))
+    REVIEW_TIME_CHURN = ((15, 20), (10, 10))
+    REVIEW_TIME_RISK = {"critical": 30, "high": 15}
+
     def __init__(self):
         self.recommendations = []
+        # Focus areas, checklist and template body depend only on a few
+        # threshold flags: (risk, category, ownership, complex, churning) -> sections
+        self._section_cache: Dict[Tuple, Tuple[List[str], List[str], str]] = {}
+
+    def analyze_files(self, files: Iterable[ReviewInput]) -> List[ReviewRecommendation]:
+        """
+        Analyze many files and generate their review recommendations.
+
+        Args:
+            files: ReviewInput of every file to analyze
+
+        Returns:
+            ReviewRecommendation objects in input order
+        """
+        analyze_file = self.analyze_file
+        return [analyze_file(*file_input) for file_input in files]
 
     def analyze_file(self, file_path: str, complexity: int, churn: float,
                      hotspot: int, ownership_data: Optional[Dict[str, float]] = None,
@@ -70,9 +104,9 @@ class CodeReviewAdvisor:
         # Generate recommendations
         priority = self._calculate_priority(risk_level, category)
         reviewers_needed, reviewer_rationale = self._determine_reviewer_count(risk_level, complexity)
-        focus_areas = self._generate_focus_areas(complexity, churn, category, ownership_type)
-        checklist = self._generate_checklist(complexity, churn, ownership_type)
-        template = self._generate_template(risk_level, complexity, churn, ownership_type, file_path)
+        focus_areas, checklist, template_body = self._get_sections(
+            risk_level, category, ownership_type, complexity, churn)
+        template = "\n".join(self._get_template_header(risk_level, file_path, complexity, churn) + [template_body])
         estimated_time = self._estimate_review_time(complexity, churn, risk_level)
 
         return ReviewRecommendation(
@@ -81,12 +115,26 @@ class CodeReviewAdvisor:
             priority=priority,
             reviewers_needed=reviewers_needed,
             reviewer_rationale=reviewer_rationale,
-            focus_areas=focus_areas,
-            checklist_items=checklist,
+            focus_areas=list(focus_areas),
+            checklist_items=list(checklist),
             template=template,
             estimated_time_minutes=estimated_time
         )
 
+    def _get_sections(self, risk_level: str, category: str, ownership_type: str,
+                      complexity: int, churn: float) -> Tuple[List[str], List[str], str]:
+        """Return (focus areas, checklist, template without header), built once per threshold combination."""
+        key = (risk_level, category, ownership_type, complexity > self.COMPLEXITY_HIGH, churn > self.CHURN_HIGH)
+        sections = self._section_cache.get(key)
+        if sections is None:
+            sections = (
+                self._generate_focus_areas(complexity, churn, category, ownership_type),
+                self._generate_checklist(complexity, churn, ownership_type),
+                self._generate_template_body(risk_level, complexity, churn, ownership_type)
+            )
+            self._section_cache[key] = sections
+        return sections
+
     def _classify_risk(self, complexity: int, churn: float, hotspot: int) -> Tuple[str, str]:
         """Classify file into risk level and category."""
         if complexity > self.COMPLEXITY_HIGH and churn > self.CHURN_HIGH:
@@ -154,13 +202,7 @@ class CodeReviewAdvisor:
 
     def _calculate_priority(self, risk_level: str, category: str) -> int:
         """Calculate review priority (1-5, where 1 is highest)."""
-        priority_map = {
-            "critical": 1,
-            "high": 2,
-            "medium": 3,
-            "low": 4
-        }
-        return priority_map.get(risk_level, 5)
+        return self.PRIORITY_BY_RISK.get(risk_level, 5)
 
     def _determine_reviewer_count(self, risk_level: str, complexity: int) -> Tuple[int, str]:
         """
@@ -251,9 +293,9 @@ class CodeReviewAdvisor:
 
         # Build checklist
         checklist = []
-        if complexity > 15:
+        if complexity > self.COMPLEXITY_HIGH:
             checklist.extend(complexity_items)
-        if churn > 10:
+        if churn > self.CHURN_HIGH:
             checklist.extend(churn_items)
         if ownership_type in ownership_items:
             checklist.extend(ownership_items[ownership_type])
@@ -265,19 +307,17 @@ class CodeReviewAdvisor:
     def _get_template_header(self, risk_level: str, file_path: str,
                              complexity: int, churn: float) -> List[str]:
         """Generate template header based on risk level."""
-        headers = {
-            "critical": [
-                f"🔥 CRITICAL HOTSPOT ALERT: {file_path}",
-                f"   Complexity: {complexity} | Churn: {churn:.1f} commits/month",
-                ""
-            ],
-            "high": [
-                f"⚠️  HIGH RISK AREA: {file_path}",
-                f"   Complexity: {complexity} | Churn: {churn:.1f} commits/month",
-                ""
-            ]
+        titles = {
+            "critical": "🔥 CRITICAL HOTSPOT ALERT",
+            "high": "⚠️  HIGH RISK AREA"
         }
-        return headers.get(risk_level, [])
+        if risk_level not in titles:
+            return []
+        return [
+            f"{titles[risk_level]}: {file_path}",
+            f"   Complexity: {complexity} | Churn: {churn:.1f} commits/month",
+            ""
+        ]
 
     def _get_template_ownership_context(self, ownership_type: str) -> List[str]:
         """Generate ownership context section."""
@@ -302,12 +342,12 @@ class CodeReviewAdvisor:
         """Generate focus items for review."""
         items = ["Review Focus:"]
 
-        if complexity > 15:
+        if complexity > self.COMPLEXITY_HIGH:
             items.extend([
                 "   □ Complexity: Can logic be simplified or extracted?",
                 "   □ Testing: Comprehensive coverage for complex paths?"
             ])
-        if churn > 10:
+        if churn > self.CHURN_HIGH:
             items.extend([
                 "   □ Patterns: Following established conventions?",
                 "   □ Root Cause: Addressing underlying issues?"
@@ -337,13 +377,12 @@ class CodeReviewAdvisor:
         }
         return actions.get(risk_level, ["Action Required:", "   ✓ Standard review process"])
 
-    def _generate_template(self, risk_level: str, complexity: int, churn: float,
-                           ownership_type: str, file_path: str) -> str:
-        """Generate a review comment template."""
+    def _generate_template_body(self, risk_level: str, complexity: int, churn: float,
+                                ownership_type: str) -> str:
+        """Generate the file-independent part of a review comment template."""
         template_parts = []
 
         # Add sections
-        template_parts.extend(self._get_template_header(risk_level, file_path, complexity, churn))
         template_parts.extend(self._get_template_ownership_context(ownership_type))
         template_parts.extend(self._get_template_focus_items(complexity, churn, risk_level))
         template_parts.append("")
@@ -351,34 +390,74 @@ class CodeReviewAdvisor:
 
         return "\n".join(template_parts)
 
+    def _generate_template(self, risk_level: str, complexity: int, churn: float,
+                           ownership_type: str, file_path: str) -> str:
+        """Generate a review comment template."""
+        header = self._get_template_header(risk_level, file_path, complexity, churn)
+        body = self._generate_template_body(risk_level, complexity, churn, ownership_type)
+        return "\n".join(header + [body])
+
     def _estimate_review_time(self, complexity: int, churn: float, risk_level: str) -> int:
         """Estimate review time in minutes."""
-        # Define time additions based on thresholds
-        complexity_time = {50: 60, 20: 30, 10: 15}
-        churn_time = {15: 20, 10: 10}
-        risk_time = {"critical": 30, "high": 15}
-
         # Calculate total time
         base_time = 15
 
         # Add complexity time (first matching threshold)
-        for threshold, time in sorted(complexity_time.items(), reverse=True):
+        for threshold, time in self.REVIEW_TIME_COMPLEXITY:
             if complexity > threshold:
                 base_time += time
                 break
 
         # Add churn time (first matching threshold)
-        for threshold, time in sorted(churn_time.items(), reverse=True):
+        for threshold, time in self.REVIEW_TIME_CHURN:
             if churn > threshold:
                 base_time += time
                 break
 
         # Add risk time
-        base_time += risk_time.get(risk_level, 0)
+        base_time += self.REVIEW_TIME_RISK.get(risk_level, 0)
 
         return base_time
 
 
+class ChangedFileMatcher:
+    """
+    Matches report file paths against changed file paths (e.g. from git diff).
+
+    A file matches a changed path when either path ends with the other at a
+    path component boundary: 'app/main.py' matches 'src/app/main.py' and vice
+    versa, but 'domain.py' does not match 'main.py'. Every component suffix of
+    the changed paths is kept in a set, so matching one file costs O(path depth)
+    regardless of how many files changed.
+    """
+
+    def __init__(self, changed_paths: Iterable[str]):
+        self._paths = set()
+        self._suffixes = set()
+        for path in changed_paths:
+            parts = _path_parts(path)
+            if not parts:
+                continue
+            self._paths.add('/'.join(parts))
+            for start in range(len(parts)):
+                self._suffixes.add('/'.join(parts[start:]))
+
+    def matches(self, file_path: str) -> bool:
+        """Whether file_path is, or ends with, or is a suffix of a changed path."""
+        parts = _path_parts(file_path)
+        if not parts:
+            return False
+        if '/'.join(parts) in self._suffixes:
+            return True
+        return any('/'.join(parts[start:]) in self._paths for start in range(1, len(parts)))
+
+
+def _path_parts(path: str) -> List[str]:
+    """Split a path into its components, ignoring '.', empty components and the separator style."""
+    normalized = os.path.normpath(path).replace(os.sep, '/')
+    return [part for part in normalized.split('/') if part and part != '.']
+
+
 def generate_review_report(data: Dict[str, Any], output_file: Optional[str] = None,
                            filter_files: Optional[List[str]] = None,
                            branch_name: Optional[str] = None,
@@ -396,47 +475,102 @@ def generate_review_report(data: Dict[str, Any], output_file: Optional[str] = No
     Returns:
         Formatted report string
     """
-    advisor = CodeReviewAdvisor()
-    recommendations = []
+    files = [
+        ReviewInput(file_info['path'], file_info['complexity'], file_info['churn'], file_info['hotspot'],
+                    file_info.get('ownership'), file_info.get('shared_ownership'))
+        for file_info in _extract_files_from_data(data)
+    ]
+    return _generate_review_report(files, output_file, filter_files, branch_name, base_branch)
+
+
+def generate_review_report_for_repos(repo_infos: List[Any], output_file: Optional[str] = None,
+                                     filter_files: Optional[List[str]] = None,
+                                     branch_name: Optional[str] = None,
+                                     base_branch: Optional[str] = None) -> str:
+    """
+    Generate the code review strategy report directly from analyzed repositories.
+
+    Same report as generate_review_report() on the merged dict form of
+    repo_infos, without building that dict: files are read from the
+    RepoInfo/ScanDir tree, and directories present in several repositories
+    are merged on the fly.
+
+    Args:
+        repo_infos: Analyzed RepoInfo objects
+        output_file: Optional file path to save the report
+        filter_files: Optional list of file paths to filter by (e.g., changed files in branch)
+        branch_name: Optional current branch name to display in report
+        base_branch: Optional base branch name for comparison
+
+    Returns:
+        Formatted report string
+    """
+    return _generate_review_report(review_inputs_from_repos(repo_infos), output_file,
+                                   filter_files, branch_name, base_branch)
 
-    # Extract files and their metrics
-    files_data = _extract_files_from_data(data)
 
+def review_inputs_from_repos(repo_infos: List[Any]) -> List[ReviewInput]:
+    """
+    Return the ReviewInput of every file in repo_infos, in report tree order.
+
+    Directories with the same name at the same level in several repositories
+    (e.g. src/ and tests/ both containing analysis/) are merged; for a file
+    present in several of them the last repository wins.
+    """
+    files: List[ReviewInput] = []
+    _collect_review_inputs(list(repo_infos), '', files)
+    return files
+
+
+def _collect_review_inputs(scan_dirs: List[Any], path: str, files: List[ReviewInput]):
+    """Append the files of scan_dirs (one merged directory) and of their subdirectories."""
+    merged_files: Dict[str, Any] = {}
+    merged_dirs: Dict[str, List[Any]] = {}
+    for scan_dir in scan_dirs:
+        merged_files.update(scan_dir.files)
+        for dirname, subdir in scan_dir.scan_dirs.items():
+            merged_dirs.setdefault(dirname, []).append(subdir)
+
+    for filename, file_obj in merged_files.items():
+        kpis = file_obj.kpis
+        files.append(ReviewInput(
+            f"{path}/{filename}" if path else filename,
+            _kpi_value(kpis, 'complexity'),
+            _kpi_value(kpis, 'churn'),
+            _kpi_value(kpis, 'hotspot'),
+            _ownership_data(kpis)
+        ))
+
+    for dirname, subdirs in merged_dirs.items():
+        _collect_review_inputs(subdirs, f"{path}/{dirname}" if path else dirname, files)
+
+
+def _kpi_value(kpis: Dict[str, Any], name: str) -> Any:
+    """Value of a file KPI (0 when missing)."""
+    kpi = kpis.get(name)
+    return getattr(kpi, 'value', 0) if kpi else 0
+
+
+def _ownership_data(kpis: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """Author -> percentage from a file's ownership KPI, or None."""
+    ownership_kpi = kpis.get('ownership')
+    if ownership_kpi and hasattr(ownership_kpi, 'calculation_values'):
+        return ownership_kpi.calculation_values.get('ownership') or None
+    return None
+
+
+def _generate_review_report(files: List[ReviewInput], output_file: Optional[str],
+                            filter_files: Optional[List[str]], branch_name: Optional[str],
+                            base_branch: Optional[str]) -> str:
+    """Filter, analyze, sort and format the review report of files."""
     # Filter files if filter list provided
     if filter_files:
-        # Normalize paths for comparison (both relative and absolute paths)
-        filter_set = set()
-        for f in filter_files:
-            # Add both the path as-is and just the filename part
-            filter_set.add(os.path.normpath(f))
-            # Also add the path relative to any common prefixes
-            filter_set.add(f.lstrip('./'))
-
-        original_count = len(files_data)
-        filtered_data = []
-        for file_info in files_data:
-            file_path = file_info['path']
-            norm_path = os.path.normpath(file_path)
-
-            # Check for exact match or if the file path ends with any of the filter paths
-            if (norm_path in filter_set or
-                any(norm_path.endswith(os.path.normpath(ff)) or
-                    os.path.normpath(ff).endswith(norm_path) for ff in filter_files)):
-                filtered_data.append(file_info)
-
-        files_data = filtered_data
-        print(f"   Filtered: {original_count} files → {len(files_data)} files")
-
-    for file_info in files_data:
-        rec = advisor.analyze_file(
-            file_path=file_info['path'],
-            complexity=file_info['complexity'],
-            churn=file_info['churn'],
-            hotspot=file_info['hotspot'],
-            ownership_data=file_info.get('ownership'),
-            shared_ownership_data=file_info.get('shared_ownership')
-        )
-        recommendations.append(rec)
+        matcher = ChangedFileMatcher(filter_files)
+        original_count = len(files)
+        files = [file_input for file_input in files if matcher.matches(file_input.file_path)]
+        print(f"   Filtered: {original_count} files → {len(files)} files")
+
+    recommendations = CodeReviewAdvisor().analyze_files(files)
 
     # Sort by priority
     recommendations.sort(key=lambda x: (x.priority, -x.estimated_time_minutes))
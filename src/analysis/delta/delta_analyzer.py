@@ -6,7 +6,6 @@ to provide precise function-level delta analysis between commits/branches.
 """
 
 import os
-import subprocess
 import textwrap
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -16,7 +15,8 @@ from src.analysis.delta.function_diff_parser import FunctionDiffParser
 from src.kpis.complexity.analyzer import ComplexityAnalyzer
 from src.kpis.cognitive_complexity.calculator_factory import CognitiveComplexityCalculatorFactory
 from src.languages.config import LANGUAGES
-from src.utilities.git_helpers import find_git_repo_root
+from src.utilities.branch_diff import get_branch_diff_service
+from src.utilities.git_helpers import check_git_output, find_git_repo_root, run_git
 
 
 class DeltaAnalyzer:
@@ -55,26 +55,22 @@ class DeltaAnalyzer:
         Returns:
             DeltaDiff object with all function-level changes
         """
+        # Branch lookups and the diff are shared with the review reports of this run
+        branch_diffs = get_branch_diff_service()
+
         # Get current branch if target not specified
         if target_branch is None:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            target_branch = result.stdout.strip()
+            target_branch = branch_diffs.current_branch(self.repo_root)
 
         # Get commit hashes
-        base_commit = self._get_commit_hash(base_branch)
-        target_commit = self._get_commit_hash(target_branch)
+        base_commit = branch_diffs.commit_hash(self.repo_root, base_branch)
+        target_commit = branch_diffs.commit_hash(self.repo_root, target_branch)
 
-        # Get diff between branches
-        diff_text = self._get_git_diff(base_branch, target_branch)
+        # Changed files and lines between branches (git diff base...target)
+        file_changes = branch_diffs.file_changes(self.repo_root, base_branch, target_branch)
 
-        # Parse and analyze
-        return self._analyze_diff(diff_text, base_commit, target_commit, base_branch, target_branch)
+        # Analyze
+        return self._analyze_file_changes(file_changes, base_commit, target_commit, base_branch, target_branch)
 
     def analyze_commit_range(
         self,
@@ -112,8 +108,8 @@ class DeltaAnalyzer:
         head_commit = self._get_commit_hash('HEAD')
 
         # Get diff for working tree (staged + unstaged)
-        staged_diff = self._run_git_command(['git', 'diff', '--cached', 'HEAD'])
-        unstaged_diff = self._run_git_command(['git', 'diff', 'HEAD'])
+        staged_diff = self._run_git_command(['diff', '--cached', 'HEAD'])
+        unstaged_diff = self._run_git_command(['diff', 'HEAD'])
 
         # Combine diffs
         diff_text = staged_diff + "\n" + unstaged_diff
@@ -123,29 +119,20 @@ class DeltaAnalyzer:
 
     def _get_commit_hash(self, ref: str) -> str:
         """Get full commit hash for a git reference."""
-        result = subprocess.run(
-            ['git', 'rev-parse', ref],
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
+        return self._run_git_command(['rev-parse', ref]).strip()
 
     def _get_git_diff(self, from_ref: str, to_ref: str) -> str:
         """Get git diff between two references."""
-        return self._run_git_command(['git', 'diff', f'{from_ref}...{to_ref}'])
-
-    def _run_git_command(self, command: List[str]) -> str:
-        """Run git command and return output."""
-        result = subprocess.run(
-            command,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
+        return self._run_git_command(['diff', f'{from_ref}...{to_ref}'])
+
+    def _run_git_command(self, args: List[str]) -> str:
+        """
+        Run a git command in the repository and return its output.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails, times out or is skipped
+        """
+        return check_git_output(self.repo_root, args)
 
     def _analyze_diff(
         self,
@@ -169,7 +156,29 @@ class DeltaAnalyzer:
             DeltaDiff object with all function changes
         """
         file_changes = self.diff_parser.parse_git_diff(diff_text)
+        return self._analyze_file_changes(file_changes, base_commit, target_commit, base_ref, target_ref)
+
+    def _analyze_file_changes(
+        self,
+        file_changes: List[Dict[str, Any]],
+        base_commit: str,
+        target_commit: str,
+        base_ref: str,
+        target_ref: str
+    ) -> DeltaDiff:
+        """
+        Extract function-level changes from parsed file changes.
+
+        Args:
+            file_changes: Changed files as returned by FunctionDiffParser.parse_git_diff()
+            base_commit: Base commit hash
+            target_commit: Target commit hash
+            base_ref: Base reference (for file retrieval)
+            target_ref: Target reference (for file retrieval)
 
+        Returns:
+            DeltaDiff object with all function changes
+        """
         added_functions = []
         modified_functions = []
         deleted_functions = []
@@ -427,17 +436,8 @@ class DeltaAnalyzer:
                     return f.read()
             return ""
 
-        try:
-            result = subprocess.run(
-                ['git', 'show', f'{ref}:{file_path}'],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            return result.stdout if result.returncode == 0 else ""
-        except Exception:
-            return ""
+        result = run_git(self.repo_root, ['show', f'{ref}:{file_path}'])
+        return result.stdout if result.ok else ""
 
     def _find_function_by_name(self, functions: List[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
         """Find a function by name in a list of functions."""
@@ -5,8 +5,11 @@ Parses git diffs and maps changed lines to specific functions using AST analysis
 """
 
 import ast
-from typing import Dict, List, Set, Any
-from unidiff import PatchSet
+from io import StringIO
+from typing import Any, Dict, Iterable, Iterator, List, Set
+
+# First line of each file's section in git diff output
+_FILE_SECTION_START = 'diff --git '
 
 
 class FunctionDiffParser:
@@ -33,14 +36,42 @@ class FunctionDiffParser:
             return []
 
         try:
-            patch_set = PatchSet(diff_text)
+            return list(self.iter_git_diff(StringIO(diff_text)))
         except Exception:
             # Malformed diff - return empty
             return []
 
-        file_changes = []
+    def iter_git_diff(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a git diff one file section at a time.
+
+        Each section (from one "diff --git" line to the next) is parsed on its
+        own, so a large diff is never held as a single PatchSet.
+
+        Args:
+            lines: Lines of git unified diff output, with line endings
+
+        Yields:
+            Dicts in the format of parse_git_diff(), in diff order
 
-        for patched_file in patch_set:
+        Raises:
+            unidiff.UnidiffParseError: If a section is malformed
+        """
+        section: List[str] = []
+        for line in lines:
+            if line.startswith(_FILE_SECTION_START) and section:
+                yield from self._parse_file_section(section)
+                section = []
+            section.append(line)
+        if section:
+            yield from self._parse_file_section(section)
+
+    def _parse_file_section(self, section: List[str]) -> Iterator[Dict[str, Any]]:
+        """Parse the diff lines of one file into parse_git_diff() dicts."""
+        # unidiff is only needed for delta reviews; keep it off the startup path
+        from unidiff import PatchSet
+
+        for patched_file in PatchSet(section):
             # Get file path (use target_file for new files, source for deleted)
             if patched_file.is_added_file:
                 file_path = patched_file.target_file[2:]  # Remove 'b/' prefix
@@ -59,14 +90,12 @@ class FunctionDiffParser:
                     if line.target_line_no is not None:
                         changed_lines.add(line.target_line_no)
 
-            file_changes.append({
+            yield {
                 'file_path': file_path,
                 'changed_lines': changed_lines,
                 'is_added': patched_file.is_added_file,
                 'is_deleted': patched_file.is_removed_file,
-            })
-
-        return file_changes
+            }
 
     def extract_functions_from_source(self, source_code: str, language: str) -> List[Dict[str, Any]]:
         """
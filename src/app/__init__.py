@@ -12,34 +12,36 @@ New structure (2024-10-16):
 - coordination/: Cross-cutting coordination (Hotspot, Report, Review)
 - infrastructure/: Infrastructure (TimingReporter, Collector)
 
-Backward compatibility: All old imports still work via these exports.
+Backward compatibility: All old imports still work via these exports,
+which are loaded lazily on first access to keep CLI startup fast.
 """
 
-# Core modules
-from src.app.core.analyzer import Analyzer, AggregatedSharedOwnershipKPI
+from src.utilities.lazy_exports import lazy_exports
 
-# Scanning
-from src.app.scanning.scanner import Scanner
-
-# Hierarchy
-from src.app.hierarchy.hierarchy_builder import HierarchyBuilder
-from src.app.hierarchy.data_converter import DataConverter
-
-# KPI
-from src.app.kpi.kpi_calculator import KPICalculator
-from src.app.kpi.kpi_aggregator import KPIAggregator
-from src.app.kpi.file_analyzer import FileAnalyzer
-
-# Coordination
-from src.app.coordination.hotspot_coordinator import HotspotCoordinator
-from src.app.coordination.report_coordinator import ReportCoordinator
-from src.app.coordination.review_coordinator import ReviewCoordinator
-
-# Infrastructure
-# timing_reporter and collector are modules, not classes
-
-# Main app
-from src.app.metric_mancer_app import MetricMancerApp
+# Exports are resolved on first attribute access (PEP 562), so importing one
+# submodule such as src.app.metric_mancer_app does not load every other one.
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    # Core modules
+    'Analyzer': 'src.app.core.analyzer',
+    'AggregatedSharedOwnershipKPI': 'src.app.core.analyzer',
+    # Scanning
+    'Scanner': 'src.app.scanning.scanner',
+    # Hierarchy
+    'HierarchyBuilder': 'src.app.hierarchy.hierarchy_builder',
+    'DataConverter': 'src.app.hierarchy.data_converter',
+    # KPI
+    'KPICalculator': 'src.app.kpi.kpi_calculator',
+    'KPIAggregator': 'src.app.kpi.kpi_aggregator',
+    'FileAnalyzer': 'src.app.kpi.file_analyzer',
+    # Coordination
+    'HotspotCoordinator': 'src.app.coordination.hotspot_coordinator',
+    'ReportCoordinator': 'src.app.coordination.report_coordinator',
+    'ReviewCoordinator': 'src.app.coordination.review_coordinator',
+    # Infrastructure
+    # timing_reporter and collector are modules, not classes
+    # Main app
+    'MetricMancerApp': 'src.app.metric_mancer_app',
+})
 
 __all__ = [
     # Core
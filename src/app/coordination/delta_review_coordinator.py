@@ -5,9 +5,11 @@ Handles delta-based code review coordination and file output.
 Separates delta review logic from main application flow following Open/Closed Principle.
 """
 import os
-from typing import Optional, Callable
+from typing import Optional, Callable, TYPE_CHECKING
 
-from src.analysis.delta import DeltaAnalyzer, DeltaReviewStrategyFormat, DeltaDiff
+if TYPE_CHECKING:
+    # The delta analysis stack is imported only when a delta review runs
+    from src.analysis.delta import DeltaAnalyzer, DeltaDiff
 
 
 class DeltaReviewCoordinator:
@@ -27,8 +29,8 @@ class DeltaReviewCoordinator:
     def generate_delta_review(
         repo_path: str,
         config,
-        analyzer_factory: Optional[Callable[[str], DeltaAnalyzer]] = None
-    ) -> Optional[DeltaDiff]:
+        analyzer_factory: Optional[Callable[[str], 'DeltaAnalyzer']] = None
+    ) -> Optional['DeltaDiff']:
         """
         Generate delta review analysis from repository.
 
@@ -47,6 +49,7 @@ class DeltaReviewCoordinator:
         try:
             # Create analyzer (allow injection for testing)
             if analyzer_factory is None:
+                from src.analysis.delta import DeltaAnalyzer
                 analyzer = DeltaAnalyzer(repo_path=repo_path)
             else:
                 analyzer = analyzer_factory(repo_path)
@@ -64,7 +67,7 @@ class DeltaReviewCoordinator:
             return None
 
     @staticmethod
-    def format_delta_review(delta_diff: DeltaDiff) -> str:
+    def format_delta_review(delta_diff: 'DeltaDiff') -> str:
         """
         Format delta review as markdown report.
 
@@ -74,11 +77,12 @@ class DeltaReviewCoordinator:
         Returns:
             Markdown-formatted review strategy report
         """
+        from src.analysis.delta import DeltaReviewStrategyFormat
         formatter = DeltaReviewStrategyFormat()
         return formatter.format(delta_diff)
 
     @staticmethod
-    def write_delta_review_file(delta_diff: DeltaDiff, output_path: str):
+    def write_delta_review_file(delta_diff: 'DeltaDiff', output_path: str):
         """
         Write delta review report to file.
 
@@ -101,7 +105,7 @@ class DeltaReviewCoordinator:
             print(f"\n⚠️  Failed to write delta review file: {e}")
 
     @staticmethod
-    def print_delta_summary(delta_diff: DeltaDiff):
+    def print_delta_summary(delta_diff: 'DeltaDiff'):
         """
         Print delta review summary to console.
 
@@ -0,0 +1,196 @@
+"""
+Parallel Report Runner Module
+
+Generates the reports of one run concurrently, one task per (format, repository)
+pair. Markdown, JSON and CLI formats are I/O bound and run on threads; HTML
+rendering is CPU bound (Jinja) and runs in forked worker processes.
+
+Forked workers inherit the analyzed RepoInfo objects and their prebuilt view
+models from the parent through a module-level snapshot, so only the small
+ReportTask is pickled per task, never a repository.
+
+Console output stays in serial order: each task's output is captured (per
+thread, or per process) and written to stdout in task order.
+"""
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.app.coordination.format_mapper import FormatMapper
+from src.app.coordination.report_coordinator import ReportCoordinator
+from src.kpis.model import RepoInfo
+from src.utilities.debug import debug_print
+from src.utilities.thread_output import captured_stdout, routed_stdout
+from src.utilities.tracing import get_tracer, span
+
+# Formats rendered in worker processes when fork is available
+PROCESS_FORMATS = ('html',)
+
+# (coordinator, repo_infos) of the running ParallelReportRunner; inherited by forked workers
+_snapshot: Optional[Tuple[ReportCoordinator, List[RepoInfo]]] = None
+
+
+@dataclass
+class ReportTask:
+    """
+    One unit of report generation.
+
+    Attributes:
+        index: Position in serial generation order (output is written in this order)
+        output_format: Output format name
+        repo_index: Index into the run's repo_infos (None = aggregate review-strategy report)
+        output_file: Output filename for per-repo reports
+        links: Cross-repository links of this report
+    """
+    index: int
+    output_format: str
+    repo_index: Optional[int] = None
+    output_file: Optional[str] = None
+    links: List[Dict] = field(default_factory=list)
+
+
+def _run_in_forked_worker(task: ReportTask, is_multi_format: bool) -> Tuple[str, int, int]:
+    """Generate one report in a forked worker from the inherited snapshot."""
+    coordinator, repo_infos = _snapshot
+    original_stdout = sys.stdout
+    sys.stdout = output = StringIO()
+    start_ns = time.perf_counter_ns()
+    try:
+        coordinator.generate_single_report(
+            repo_infos[task.repo_index], task.output_format, task.output_file, task.links, is_multi_format
+        )
+    finally:
+        sys.stdout = original_stdout
+    return output.getvalue(), start_ns, time.perf_counter_ns()
+
+
+def fork_available() -> bool:
+    """Whether worker processes can inherit the parent's memory (fork, and not macOS)."""
+    return 'fork' in multiprocessing.get_all_start_methods() and sys.platform != 'darwin'
+
+
+class ParallelReportRunner:
+    """
+    Runs report tasks concurrently while keeping console output in serial order.
+
+    Attributes:
+        coordinator: ReportCoordinator that generates each report
+        workers: Maximum number of concurrently generated reports
+        review_strategy_callback: Callback for review-strategy formats
+        use_processes: Render PROCESS_FORMATS in forked processes (False = threads only)
+    """
+
+    def __init__(self, coordinator: ReportCoordinator, workers: int,
+                 review_strategy_callback: Optional[Callable] = None, use_processes: bool = True):
+        self.coordinator = coordinator
+        self.workers = max(1, workers)
+        self.review_strategy_callback = review_strategy_callback
+        self.use_processes = use_processes and fork_available()
+
+    def plan(self, output_formats: List[str], repo_infos: List[RepoInfo], report_links: List[Dict],
+             is_multi_format: bool) -> List[ReportTask]:
+        """
+        Return the report tasks of a run in serial generation order.
+
+        Review-strategy formats aggregate all repositories and become a single task.
+        """
+        tasks = []
+        for output_format in output_formats:
+            if FormatMapper.is_review_strategy_format(output_format):
+                tasks.append(ReportTask(len(tasks), output_format))
+                continue
+            planned = self.coordinator.plan_reports(output_format, repo_infos, report_links, is_multi_format)
+            for repo_index, (_, output_file, links_for_this) in enumerate(planned):
+                tasks.append(ReportTask(len(tasks), output_format, repo_index, output_file, links_for_this))
+        return tasks
+
+    def run(self, output_formats: List[str], repo_infos: List[RepoInfo], report_links: List[Dict],
+            is_multi_format: bool):
+        """
+        Generate all reports and write their console output in serial order.
+
+        Raises:
+            The first exception raised by a task, after all tasks have finished
+        """
+        global _snapshot
+        tasks = self.plan(output_formats, repo_infos, report_links, is_multi_format)
+        process_tasks = [t for t in tasks if self.use_processes and t.output_format in PROCESS_FORMATS]
+        thread_tasks = [t for t in tasks if t not in process_tasks]
+        debug_print(f"[DEBUG] Generating {len(tasks)} reports: {len(process_tasks)} in processes, "
+                    f"{len(thread_tasks)} on threads")
+
+        # Built once here: threads share them, forked workers inherit them
+        for repo_info in repo_infos:
+            self.coordinator.get_view_model(repo_info)
+
+        futures: Dict[int, Future] = {}
+        process_pool = thread_pool = None
+        with routed_stdout():
+            try:
+                if process_tasks:
+                    self.coordinator.prepare_branch_diffs(repo_infos)
+                    # Fork all worker processes before this process starts any thread
+                    _snapshot = (self.coordinator, repo_infos)
+                    process_pool = ProcessPoolExecutor(
+                        max_workers=min(self.workers, len(process_tasks)),
+                        mp_context=multiprocessing.get_context('fork')
+                    )
+                    for task in process_tasks:
+                        futures[task.index] = process_pool.submit(_run_in_forked_worker, task, is_multi_format)
+                if thread_tasks:
+                    thread_pool = ThreadPoolExecutor(
+                        max_workers=min(self.workers, len(thread_tasks)), thread_name_prefix="metricmancer-report"
+                    )
+                    for task in thread_tasks:
+                        futures[task.index] = thread_pool.submit(
+                            self._run_on_thread, task, repo_infos, report_links, is_multi_format
+                        )
+                error = self._write_outputs_in_order(tasks, futures)
+            finally:
+                for pool in (thread_pool, process_pool):
+                    if pool is not None:
+                        pool.shutdown(wait=True)
+                _snapshot = None
+        if error is not None:
+            raise error
+
+    def _run_on_thread(self, task: ReportTask, repo_infos: List[RepoInfo], report_links: List[Dict],
+                       is_multi_format: bool) -> str:
+        """Generate one report on a worker thread and return what it printed."""
+        with captured_stdout() as (output, _), \
+                span(f"report {task.output_format}", 'report', format=task.output_format, repo=task.repo_index):
+            if task.repo_index is None:
+                self.coordinator.generate_reports_for_format(
+                    task.output_format, repo_infos, report_links, is_multi_format, self.review_strategy_callback
+                )
+            else:
+                self.coordinator.generate_single_report(
+                    repo_infos[task.repo_index], task.output_format, task.output_file, task.links, is_multi_format
+                )
+        return output.getvalue()
+
+    def _write_outputs_in_order(self, tasks: List[ReportTask], futures: Dict[int, Future]) -> Optional[Exception]:
+        """Write each task's output as soon as it and all earlier tasks are done; return the first error."""
+        first_error = None
+        for task in tasks:
+            try:
+                result = futures[task.index].result()
+            except Exception as e:  # remaining reports are still written
+                debug_print(f"[DEBUG] Report {task.output_format} failed: {e}")
+                first_error = first_error or e
+                continue
+            if isinstance(result, tuple):
+                output, start_ns, end_ns = result
+                tracer = get_tracer()
+                if tracer is not None:
+                    tracer.record(f"report {task.output_format}", 'report', start_ns, end_ns,
+                                  {'format': task.output_format, 'repo': task.repo_index, 'process': True})
+            else:
+                output = result
+            sys.stdout.write(output)
+        sys.stdout.flush()
+        return first_error
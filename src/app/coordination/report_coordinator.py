@@ -4,10 +4,12 @@ Report Coordinator Module
 Handles coordination of report generation across multiple formats and repositories.
 Separates report generation logic from main application flow.
 """
-from typing import List, Dict
+from typing import Dict, List, Tuple
 
 from src.kpis.model import RepoInfo
+from src.report.report_view_model import ReportViewModel
 from src.utilities.debug import debug_print
+from src.utilities.git_helpers import get_changed_files_in_branch
 from src.utilities.path_helpers import normalize_output_path
 from src.app.coordination.format_mapper import FormatMapper
 from src.app.coordination.filename_generator import FileNameGenerator
@@ -21,6 +23,7 @@ class ReportCoordinator:
     - Manage report file naming and extensions
     - Coordinate multi-format report generation
     - Handle cross-repository report linking
+    - Build each repository's ReportViewModel once and share it across formats
     """
 
     def __init__(self, app_config, report_generator_cls=None):
@@ -47,6 +50,39 @@ class ReportCoordinator:
             app_config.using_output_formats_flag
         )
 
+        # repo_root_path -> ReportViewModel, shared by all formats of this run
+        self._view_models: Dict[str, ReportViewModel] = {}
+
+    def get_view_model(self, repo_info: RepoInfo) -> ReportViewModel:
+        """
+        Return the view model of a repository, building it on first use.
+
+        Args:
+            repo_info: Analyzed and aggregated repository
+
+        Returns:
+            ReportViewModel shared by every format generated by this coordinator
+        """
+        key = repo_info.repo_root_path
+        view_model = self._view_models.get(key)
+        if view_model is None or view_model.repo_info is not repo_info:
+            view_model = ReportViewModel(repo_info, self.threshold_low, self.threshold_high)
+            self._view_models[key] = view_model
+        return view_model
+
+    def prepare_branch_diffs(self, repo_infos: List[RepoInfo]):
+        """
+        Resolve the changed files of every repository for the HTML review tab.
+
+        Called before HTML reports are rendered in forked workers, so the
+        workers inherit the run's memoized branch diffs instead of each
+        running the same git commands.
+        """
+        if not (self.app_config.include_review_tab and self.app_config.review_branch_only):
+            return
+        for repo_info in repo_infos:
+            get_changed_files_in_branch(repo_info.repo_root_path, self.app_config.review_base_branch)
+
     def get_generator_from_factory(self, output_format: str):
         """
         Get report generator from factory.
@@ -116,8 +152,14 @@ class ReportCoordinator:
             include_review_tab=self.app_config.include_review_tab,
             review_branch_only=self.app_config.review_branch_only,
             review_base_branch=self.app_config.review_base_branch,
+            html_chunked=self.app_config.html_chunked,
             # Pass extreme complexity threshold for summary report
-            extreme_complexity_threshold=self.app_config.extreme_complexity_threshold
+            extreme_complexity_threshold=self.app_config.extreme_complexity_threshold,
+            # Pass OpenSearch endpoint for the opensearch format
+            opensearch_url=self.app_config.opensearch_url,
+            opensearch_index=self.app_config.opensearch_index,
+            opensearch_batch_mb=self.app_config.opensearch_batch_mb,
+            view_model=self.get_view_model(repo_info)
         )
 
     def generate_reports_for_format(self, output_format: str, repo_infos: List[RepoInfo],
@@ -141,6 +183,27 @@ class ReportCoordinator:
             return
 
         # Generate one report per repo_info for this format
+        for repo_info, output_file, links_for_this in self.plan_reports(
+                output_format, repo_infos, report_links, is_multi_format):
+            self.generate_single_report(
+                repo_info, output_format, output_file, links_for_this, is_multi_format
+            )
+
+    def plan_reports(self, output_format: str, repo_infos: List[RepoInfo], report_links: List[Dict],
+                     is_multi_format: bool) -> List[Tuple[RepoInfo, str, List[Dict]]]:
+        """
+        Return the reports of one (non review-strategy) format, one per repo.
+
+        Args:
+            output_format: Output format name
+            repo_infos: List of repository information objects
+            report_links: Cross-repository links
+            is_multi_format: Whether multiple formats are being generated
+
+        Returns:
+            List of (repo_info, output_file, links_for_this) in repo order
+        """
+        planned = []
         for idx, repo_info in enumerate(repo_infos):
             base, ext = self.filename_generator.get_base_and_extension(
                 output_format, is_multi_format
@@ -148,10 +211,8 @@ class ReportCoordinator:
             output_file, links_for_this = self.filename_generator.generate_with_links(
                 base, ext, idx, len(repo_infos), report_links
             )
-
-            self.generate_single_report(
-                repo_info, output_format, output_file, links_for_this, is_multi_format
-            )
+            planned.append((repo_info, output_file, links_for_this))
+        return planned
 
     def _handle_review_strategy_format(self, output_format: str, repo_infos: List[RepoInfo],
                                        review_strategy_callback):
@@ -0,0 +1,111 @@
+"""
+Watch Coordinator Module
+
+Keeps MetricMancer running after the first analysis (--watch) and re-renders
+the selected reports whenever scanned files change.
+
+The process stays alive, so everything stays warm between updates: imported
+parsers, the GitDataCache (churn, tracked files, blame of unchanged files)
+and the analyzed RepoInfo hierarchy. On each change only the changed files
+are re-analyzed and only their directories re-aggregated. If a repository's
+HEAD moves (commit, checkout, pull), churn and blame of all its files may
+have changed, so its git cache is cleared and everything is re-analyzed.
+"""
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.app.scanning.file_watcher import FileWatcher
+from src.config.defaults import Defaults
+from src.utilities.git_cache import get_git_cache
+from src.utilities.git_helpers import run_git
+
+
+class WatchCoordinator:
+    """
+    Polls for changes and updates the analysis and reports in place.
+
+    Usage:
+        coordinator = WatchCoordinator(analyzer, ['src'], languages, render=print_reports)
+        coordinator.run(repo_infos)   # Until Ctrl+C
+    """
+
+    def __init__(self, analyzer, directories: List[str], languages_config: Dict,
+                 render: Callable[[List], None], interval: float = Defaults.WATCH_INTERVAL_SECONDS,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            analyzer: Analyzer that ran the first analysis (keeps its caches and repo index)
+            directories: Scanned directories to watch
+            languages_config: Supported extensions (as for Scanner)
+            render: Called with the current RepoInfo objects to re-render the reports
+            interval: Seconds between polls
+            sleep: Sleep function (replaced in tests)
+        """
+        self.analyzer = analyzer
+        self.directories = directories
+        self.render = render
+        self.interval = interval
+        self.sleep = sleep
+        self.watcher = FileWatcher(languages_config)
+
+    def run(self, repo_infos: List, max_polls: Optional[int] = None) -> List:
+        """
+        Watch the configured directories until interrupted.
+
+        Args:
+            repo_infos: RepoInfo objects of the first analysis (updated in place)
+            max_polls: Stop after this many polls (None = until Ctrl+C)
+
+        Returns:
+            The current RepoInfo objects
+        """
+        summary = {repo_info.repo_root_path: repo_info for repo_info in repo_infos}
+        self.watcher.start(self.directories)
+        heads = self._read_heads(summary)
+        print(f"\n[WATCH] Watching {self.watcher.file_count} files for changes (every {self.interval:g}s); "
+              f"press Ctrl+C to stop.")
+
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                polls += 1
+                self.sleep(self.interval)
+                summary = self._poll_once(summary, heads)
+        except KeyboardInterrupt:
+            print("\n[WATCH] Stopped.")
+        return list(summary.values())
+
+    def _poll_once(self, summary: Dict, heads: Dict) -> Dict:
+        """Apply one poll's changes; returns the (possibly replaced) summary."""
+        changes = self.watcher.poll()
+        new_heads = self._read_heads(summary)
+        moved = [root for root, head in new_heads.items() if root in heads and heads[root] != head]
+        heads.update(new_heads)
+        if not changes and not moved:
+            return summary
+
+        t_start = time.perf_counter()
+        if moved:
+            for repo_root in moved:
+                get_git_cache().clear_cache(repo_root)
+            summary = self.analyzer.analyze(self.watcher.files())
+            heads.update(self._read_heads(summary))
+            what = f"HEAD moved in {len(moved)} repo(s), re-analyzed {self.watcher.file_count} files"
+        else:
+            self.analyzer.reanalyze_files(summary, changes.changed, changes.removed)
+            what = f"{len(changes.changed)} changed, {len(changes.removed)} removed"
+        t_analyzed = time.perf_counter()
+
+        self.render(list(summary.values()))
+        t_end = time.perf_counter()
+        print(f"[WATCH] {what}: analysis {t_analyzed - t_start:.2f}s, reports {t_end - t_analyzed:.2f}s")
+        return summary
+
+    @staticmethod
+    def _read_heads(summary: Dict) -> Dict[str, Optional[str]]:
+        """Return {repo_root: HEAD commit} (None outside git or if git fails)."""
+        heads = {}
+        for repo_root in summary:
+            result = run_git(repo_root, ['rev-parse', '-q', '--verify', 'HEAD'])
+            heads[repo_root] = result.stdout.strip() if result.ok else None
+        return heads
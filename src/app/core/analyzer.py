@@ -1,17 +1,24 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
-from tqdm import tqdm
+import os
+import threading
 import time
 from datetime import datetime, timezone
 
 from src.app.hierarchy.hierarchy_builder import HierarchyBuilder
+from src.app.scanning.file_classifier import MODE_ANALYZE, MODE_SKIP, FileClassifier
 from src.app.kpi.kpi_aggregator import KPIAggregator
 from src.app.kpi.file_analyzer import FileAnalyzer
 from src.app.kpi.kpi_calculator import KPICalculator
+from src.config.defaults import Defaults
 from src.kpis.base_kpi import BaseKPI
 from src.kpis.complexity import ComplexityAnalyzer
 from src.kpis.model import RepoInfo
 from src.utilities.debug import debug_print
+from src.utilities.memory_tracking import memory_phase
+from src.utilities.profiling import get_profiler
+from src.utilities.repo_discovery import RepoDiscoveryIndex
+from src.utilities.tracing import span
 
 
 def initialize_timing():
@@ -28,24 +35,30 @@ def initialize_timing():
     }
 
 
-def prebuild_git_cache(repo_root_path, files_in_repo, churn_period_days):
+def prebuild_git_cache(repo_root_path, files_in_repo, churn_period_days, cache_memory_mb=None):
     """
     Pre-build git cache for all files in the repository.
 
+    Files analyzed in reduced mode (file_info['classification'] set) get churn but no blame.
+
     Returns:
         tuple: (cache_prebuild_time, git_cache)
     """
     from src.utilities.git_cache import get_git_cache
 
     t_start = time.perf_counter()
-    git_cache = get_git_cache(churn_period_days=churn_period_days)
+    git_cache = get_git_cache(churn_period_days=churn_period_days, memory_budget_mb=cache_memory_mb)
 
     file_paths = [
         str(Path(file_info['path']).relative_to(repo_root_path))
         for file_info in files_in_repo
     ]
+    churn_only = {
+        path for path, file_info in zip(file_paths, files_in_repo) if file_info.get('classification')
+    }
     debug_print(f"[PREBUILD] Pre-building cache for {len(file_paths)} files")
-    git_cache.prebuild_cache_for_files(str(repo_root_path.resolve()), file_paths)
+    with span('prebuild_git_cache', 'pipeline', repo=str(repo_root_path), files=len(file_paths)):
+        git_cache.prebuild_cache_for_files(str(repo_root_path.resolve()), file_paths, churn_only)
 
     t_end = time.perf_counter()
     elapsed = t_end - t_start
@@ -54,6 +67,20 @@ def prebuild_git_cache(repo_root_path, files_in_repo, churn_period_days):
     return elapsed
 
 
+def schedule_repos(files_by_root):
+    """
+    Order repositories for parallel analysis, largest first.
+
+    Starting the biggest repositories first keeps one large repo from
+    becoming the tail that every other worker waits on. Ties are broken by
+    path so the schedule is deterministic.
+
+    Returns:
+        list: Repository roots in scheduling order
+    """
+    return sorted(files_by_root, key=lambda root: (-len(files_by_root[root]), root))
+
+
 def extract_numeric_kpi(file, kpi_name):
     """Extract a numeric KPI value from a file if valid."""
     kpi = file.kpis.get(kpi_name)
@@ -172,15 +199,34 @@ class AggregatedSharedOwnershipKPI(BaseKPI):
 
 class Analyzer:
     def __init__(self, languages_config, threshold_low=10.0,
-                 threshold_high=20.0, churn_period_days=30):
+                 threshold_high=20.0, churn_period_days=30, cache_memory_mb=None,
+                 max_workers=Defaults.ANALYSIS_WORKERS, generated_files=Defaults.GENERATED_FILES_MODE,
+                 cognitive_languages=Defaults.COGNITIVE_LANGUAGES,
+                 cognitive_time_limit=Defaults.COGNITIVE_TIME_LIMIT_SECONDS):
         self.config = languages_config
         self.threshold_low = threshold_low
         self.threshold_high = threshold_high
         self.churn_period_days = churn_period_days
+        self.cache_memory_mb = cache_memory_mb
+        # Worker budget shared by all repositories in one analyze() call
+        self.max_workers = max(1, max_workers or 1)
         self.hierarchy_builder = HierarchyBuilder()
         self.kpi_aggregator = KPIAggregator()
-        # File analyzer with KPI calculator (Strategy pattern)
-        self.file_analyzer = None  # Initialized per-repo with KPICalculator
+        # Memoized directory -> repository root lookups; cleared on every (re)analysis so
+        # repositories created while watching are discovered
+        self.repo_index = RepoDiscoveryIndex()
+        # Per-repository timing buckets, merged into self.timing as repos finish (reset by analyze())
+        self.timing = initialize_timing()
+        self.repo_timing = {}
+        self._timing_lock = threading.Lock()
+        # Generated/minified/vendored files: 'skip', 'reduced' (churn only) or 'analyze'
+        self.generated_files = generated_files
+        self.file_classifier = FileClassifier()
+        # Files classified as generated/minified/vendored/oversized, by classification
+        self.classified_counts = Counter()
+        # Cognitive complexity: 'python' or 'all' languages, and the time limit per file
+        self.cognitive_languages = cognitive_languages
+        self.cognitive_time_limit = cognitive_time_limit
 
     def _group_files_by_repo(self, files):
         """
@@ -190,32 +236,46 @@ class Analyzer:
         git repository, all files should be grouped together under the git root,
         not separated by scan directory.
 
+        Each file is resolved from its own directory through a memoized
+        RepoDiscoveryIndex, so files inside submodules, linked worktrees or
+        nested repositories are grouped under that repository, and every
+        directory is checked for a .git entry only once per run.
+
         Returns:
             Tuple of (files_by_root, scan_dirs_by_root) where:
             - files_by_root: Dict[git_root_path, List[file_info]]
             - scan_dirs_by_root: Dict[git_root_path, Set[scan_dir_paths]]
         """
-        from src.utilities.git_helpers import find_git_repo_root
-
         files_by_root = defaultdict(list)
         scan_dirs_by_root = defaultdict(set)
 
         for file in files:
             scan_root = file.get('root', '')
+            file_dir = os.path.dirname(file['path']) if file.get('path') else scan_root
 
-            # Find the git repository root for this file
-            git_root = find_git_repo_root(scan_root)
+            # Find the closest git repository containing this file
+            git_root = self.repo_index.find_repo_root(file_dir)
 
             # Use git root if found, otherwise fall back to scan root
-            repo_root = git_root if git_root else scan_root
+            repo_root = git_root if git_root else os.path.abspath(scan_root)
 
             files_by_root[repo_root].append(file)
             scan_dirs_by_root[repo_root].add(scan_root)
 
+        debug_print(
+            f"[DEBUG] Analyzer: Repository discovery checked {self.repo_index.stat_calls} "
+            f"directories for {len(files)} files."
+        )
         return files_by_root, scan_dirs_by_root
 
-    def _analyze_repo(self, repo_root, files_in_repo, scan_dirs):
-        """Analyzes a single repository's files for complexity, churn, and other metrics."""
+    def _analyze_repo(self, repo_root, files_in_repo, scan_dirs, show_progress=True):
+        """
+        Analyzes a single repository's files for complexity, churn, and other metrics.
+
+        Safe to run for several repositories at once: each call uses its own
+        FileAnalyzer/KPICalculator and timing bucket, and writes only its own
+        repository's partition of the shared GitDataCache.
+        """
         debug_print(f"[DEBUG] Analyzing repo: {repo_root} with {len(files_in_repo)} files.")
 
         repo_root_path = Path(repo_root)
@@ -229,72 +289,148 @@ class Analyzer:
             timestamp=datetime.now(timezone.utc).isoformat()
         )
 
-        # Initialize timing accumulators
-        if not hasattr(self, 'timing'):
-            self.timing = initialize_timing()
-
-        # 2. Pre-build cache before KPI calculation
-        cache_time = prebuild_git_cache(repo_root_path, files_in_repo, self.churn_period_days)
-        self.timing['cache_prebuild'] += cache_time
-
-        # 3. Build the hierarchical data model and calculate KPIs
-        if not files_in_repo:
-            debug_print(f"[DEBUG] No files to analyze for repo: {repo_root}, returning None.")
-            return None
+        timing = initialize_timing()
+        try:
+            # 2. Skip (or mark for reduced analysis) generated, minified and vendored files
+            files_in_repo = self._classify_files(repo_root, files_in_repo)
+
+            # 3. Pre-build cache before KPI calculation
+            with memory_phase('cache_prebuild'):
+                timing['cache_prebuild'] += prebuild_git_cache(
+                    repo_root_path, files_in_repo, self.churn_period_days, self.cache_memory_mb
+                )
+
+            # 4. Build the hierarchical data model and calculate KPIs
+            if not files_in_repo:
+                debug_print(f"[DEBUG] No files to analyze for repo: {repo_root}, returning None.")
+                return None
+
+            from tqdm import tqdm  # Progress bars are loaded on first use, not at CLI startup
+
+            file_analyzer = self._create_file_analyzer(ComplexityAnalyzer())
+
+            with memory_phase('file_analysis'):
+                for file_info in tqdm(files_in_repo, desc=f"Analyzing files in {repo_root_path.name}", unit="file",
+                                      disable=not show_progress):
+                    file_obj = self._process_file(file_info, repo_root_path, file_analyzer, timing)
+                    if file_obj:
+                        self.hierarchy_builder.add_file_to_hierarchy(repo_info, file_obj)
+
+            # Measure KPI aggregation time
+            t_aggregation_start = time.perf_counter()
+            # Aggregate KPIs for the directory hierarchy
+            with span('aggregate_kpis', 'pipeline', repo=repo_root), memory_phase('kpi_aggregation'):
+                self._aggregate_scan_dir_kpis(repo_info)
+            timing['kpi_aggregation'] += time.perf_counter() - t_aggregation_start
+            return repo_info
+        finally:
+            self._record_repo_timing(repo_root, timing)
+
+    def _classify_files(self, repo_root, files_in_repo, count=True):
+        """
+        Classify a repository's files and drop or tag generated, minified and vendored ones.
 
-        complexity_analyzer = ComplexityAnalyzer()
+        Args:
+            count: Add the classified files to classified_counts (not for watch-mode updates)
 
-        for file_info in tqdm(files_in_repo, desc=f"Analyzing files in {repo_root_path.name}", unit="file"):
-            file_obj = self._process_file(file_info, repo_root_path, complexity_analyzer)
-            if file_obj:
-                self.hierarchy_builder.add_file_to_hierarchy(repo_info, file_obj)
+        Returns:
+            list: Files to analyze; in reduced mode classified files are kept
+            as copies with file_info['classification'] set
+        """
+        if self.generated_files == MODE_ANALYZE or not files_in_repo:
+            return files_in_repo
+
+        with span('classify_files', 'pipeline', repo=repo_root, files=len(files_in_repo)):
+            classes = self.file_classifier.classify(repo_root, files_in_repo)
+        if not classes:
+            return files_in_repo
+
+        if count:
+            with self._timing_lock:
+                self.classified_counts.update(classes.values())
+        debug_print(f"[CLASSIFY] {len(classes)} of {len(files_in_repo)} files in {repo_root} are "
+                    f"generated/minified/vendored ({self.generated_files})")
+        if self.generated_files == MODE_SKIP:
+            return [f for f in files_in_repo if f['path'] not in classes]
+        return [
+            {**f, 'classification': classes[f['path']]} if f['path'] in classes else f
+            for f in files_in_repo
+        ]
+
+    def _create_file_analyzer(self, complexity_analyzer):
+        """Create a FileAnalyzer with its own KPICalculator (Strategy pattern) for one repository."""
+        return FileAnalyzer(
+            languages_config=self.config,
+            kpi_calculator=KPICalculator(complexity_analyzer, self.cognitive_languages, self.cognitive_time_limit)
+        )
 
-        # Measure KPI aggregation time
-        t_aggregation_start = time.perf_counter()
-        # Aggregate KPIs for the directory hierarchy
-        self._aggregate_scan_dir_kpis(repo_info)
-        self.timing['kpi_aggregation'] += time.perf_counter() - t_aggregation_start
-        return repo_info
+    def _record_repo_timing(self, repo_root, timing):
+        """Store a repository's timing bucket and add it to the run totals."""
+        with self._timing_lock:
+            bucket = self.repo_timing.setdefault(repo_root, initialize_timing())
+            for key, value in timing.items():
+                bucket[key] = bucket.get(key, 0.0) + value
+                self.timing[key] = self.timing.get(key, 0.0) + value
 
-    def _process_file(self, file_info, repo_root_path, complexity_analyzer):
+    def _process_file(self, file_info, repo_root_path, file_analyzer, timing):
         """
         Process a single file and return a File object with all KPIs.
 
         REFACTORED: Delegates to FileAnalyzer (Strategy pattern with KPICalculator).
         """
-        # Initialize file analyzer with KPICalculator (once per repo)
-        if self.file_analyzer is None:
-            kpi_calculator = KPICalculator(complexity_analyzer)
-            self.file_analyzer = FileAnalyzer(
-                languages_config=self.config,
-                kpi_calculator=kpi_calculator
-            )
-
         # Delegate to FileAnalyzer - clean interface, returns File object
-        file_obj = self.file_analyzer.analyze_file(file_info, repo_root_path)
+        file_obj = file_analyzer.analyze_file(file_info, repo_root_path)
 
-        # Accumulate timing from KPICalculator to analyzer timing
-        kpi_timing = self.file_analyzer.kpi_calculator.get_timing_report()
+        # Accumulate timing from KPICalculator into the repository's timing bucket
+        kpi_timing = file_analyzer.kpi_calculator.get_timing_report()
         for key, value in kpi_timing.items():
-            self.timing[key] += value
+            timing[key] = timing.get(key, 0.0) + value
 
-        # Reset KPICalculator timing for next file
-        self.file_analyzer.kpi_calculator.reset_timing()
+        profiler = get_profiler()
+        if profiler is not None:
+            self._profile_file(profiler, file_info, file_analyzer, kpi_timing)
+
+        # Reset KPICalculator and FileAnalyzer timing for next file
+        file_analyzer.kpi_calculator.reset_timing()
+        file_analyzer.reset_timing()
 
         return file_obj
 
-    def _aggregate_scan_dir_kpis(self, scan_dir):
+    @staticmethod
+    def _profile_file(profiler, file_info, file_analyzer, kpi_timing):
+        """Record one file's read/parse/KPI timings with the active --profile profiler."""
+        try:
+            size_bytes = os.path.getsize(file_info['path'])
+        except OSError:
+            size_bytes = 0
+        profiler.record_file(
+            file_info['path'],
+            file_info.get('ext'),
+            size_bytes,
+            file_analyzer.last_line_count,
+            {**file_analyzer.timing, **kpi_timing}
+        )
+
+    def _aggregate_scan_dir_kpis(self, scan_dir, directories=None):
         """
         Aggregate KPIs for directory hierarchy using KPIAggregator (Phase 4).
 
         Delegates aggregation to KPIAggregator which handles recursive aggregation
         using Composite pattern. This reduces complexity from analyzer.py.
 
+        Args:
+            scan_dir: Root directory (RepoInfo)
+            directories: Only re-aggregate these directories, root first (watch mode);
+                         None aggregates the whole tree
+
         Returns:
             dict: Dictionary of aggregated KPI values
         """
         # Delegate aggregation to KPIAggregator (Phase 4 component)
-        aggregated_kpis = self.kpi_aggregator.aggregate_directory(scan_dir)
+        if directories is None:
+            aggregated_kpis = self.kpi_aggregator.aggregate_directory(scan_dir)
+        else:
+            aggregated_kpis = self.kpi_aggregator.aggregate_path(directories)
 
         # Handle Shared Ownership separately (requires special aggregation logic)
         # Collect all authors from the hierarchy
@@ -329,19 +465,151 @@ class Analyzer:
         }
 
     def analyze(self, files):
-        """Analyzes a list of files, groups them by repository, and returns a summary."""
+        """
+        Analyzes a list of files, groups them by repository, and returns a summary.
+
+        Repositories are analyzed in parallel on up to ``max_workers`` threads,
+        largest first (see schedule_repos). The summary is always ordered by
+        repository root, regardless of which repository finished first.
+        """
+        # Initialize timing accumulators
+        self.timing = initialize_timing()
+        self.repo_timing = {}
         if not files:
             return {}
 
+        self.repo_index.clear()
         files_by_root, scan_dirs_by_root = self._group_files_by_repo(files)
         debug_print(f"[DEBUG] Analyzer: Found {len(files_by_root)} repositories to analyze.")
 
+        schedule = schedule_repos(files_by_root)
+        workers = min(self.max_workers, len(schedule))
+
+        if workers <= 1:
+            results = {
+                repo_root: self._analyze_repo(
+                    repo_root, files_by_root[repo_root], list(scan_dirs_by_root[repo_root])
+                )
+                for repo_root in schedule
+            }
+        else:
+            results = self._analyze_repos_parallel(schedule, files_by_root, scan_dirs_by_root, workers)
+
         summary = {}
-        for repo_root in sorted(files_by_root.keys()):
-            repo_info = self._analyze_repo(
-                repo_root, files_by_root[repo_root], list(scan_dirs_by_root[repo_root])
-            )
-            if repo_info is not None:
-                summary[repo_root] = repo_info
+        for repo_root in sorted(results):
+            if results[repo_root] is not None:
+                summary[repo_root] = results[repo_root]
 
         return summary
+
+    def reanalyze_files(self, summary, changed_files, removed_paths):
+        """
+        Update an earlier analyze() result in place after files changed (watch mode).
+
+        Only the changed files are re-read, re-parsed and re-scored (with their
+        cached blame invalidated; churn is kept), and only the directories
+        containing changed or removed files are re-aggregated.
+
+        Args:
+            summary: {repo_root: RepoInfo} as returned by analyze(); updated in place
+            changed_files: File info dicts (as from Scanner.scan()) of added or modified files
+            removed_paths: Absolute paths of deleted files
+
+        Returns:
+            set: Roots of the repositories that were updated
+        """
+        from src.utilities.git_cache import get_git_cache
+
+        touched = defaultdict(set)
+        new_repos = set()
+        for path in removed_paths:
+            repo_root = self._find_summary_repo(summary, path)
+            if repo_root is not None:
+                rel_path = os.path.relpath(path, repo_root)
+                if self.hierarchy_builder.remove_file_from_hierarchy(summary[repo_root], rel_path):
+                    touched[repo_root].add(rel_path)
+
+        # Forget memoized lookups so a repository or submodule created since the last pass is found
+        self.repo_index.clear()
+        files_by_root, scan_dirs_by_root = self._group_files_by_repo(changed_files) if changed_files else ({}, {})
+        for repo_root, files_in_repo in files_by_root.items():
+            if repo_root not in summary:
+                # A repository that appeared while watching is analyzed in full
+                repo_info = self._analyze_repo(repo_root, files_in_repo, list(scan_dirs_by_root[repo_root]),
+                                               show_progress=False)
+                if repo_info is not None:
+                    summary[repo_root] = repo_info
+                    new_repos.add(repo_root)
+                continue
+
+            repo_info = summary[repo_root]
+            repo_root_path = Path(repo_root)
+            rel_paths = [os.path.relpath(f['path'], repo_root) for f in files_in_repo]
+            for rel_path in rel_paths:
+                self.hierarchy_builder.remove_file_from_hierarchy(repo_info, rel_path)
+                touched[repo_root].add(rel_path)
+
+            files_in_repo = self._classify_files(repo_root, files_in_repo, count=False)
+            get_git_cache().invalidate_files(repo_root, rel_paths)
+            timing = initialize_timing()
+            try:
+                timing['cache_prebuild'] += prebuild_git_cache(
+                    repo_root_path, files_in_repo, self.churn_period_days, self.cache_memory_mb
+                )
+                file_analyzer = self._create_file_analyzer(ComplexityAnalyzer())
+                for file_info in files_in_repo:
+                    file_obj = self._process_file(file_info, repo_root_path, file_analyzer, timing)
+                    if file_obj:
+                        self.hierarchy_builder.add_file_to_hierarchy(repo_info, file_obj)
+            finally:
+                self._record_repo_timing(repo_root, timing)
+
+        for repo_root, rel_paths in touched.items():
+            self._reaggregate(summary[repo_root], rel_paths)
+        return set(touched) | new_repos
+
+    def _find_summary_repo(self, summary, path):
+        """Return the root of the analyzed repository containing an absolute path, or None."""
+        candidates = [root for root in summary if path.startswith(os.path.join(root, ''))]
+        return max(candidates, key=len) if candidates else None
+
+    def _reaggregate(self, repo_info, rel_paths):
+        """Re-aggregate the directories on the paths to the given files, deepest first."""
+        chains = {}
+        for rel_path in rel_paths:
+            for directory in self.hierarchy_builder.get_directory_chain(repo_info, rel_path):
+                chains[id(directory)] = directory
+        # Root first, by depth, so aggregate_path re-aggregates children before parents
+        directories = sorted(chains.values(), key=lambda d: len(Path(d.scan_dir_path).parts))
+        with span('aggregate_kpis', 'pipeline', repo=repo_info.repo_root_path, directories=len(directories)):
+            self._aggregate_scan_dir_kpis(repo_info, directories)
+
+    def _analyze_repos_parallel(self, schedule, files_by_root, scan_dirs_by_root, workers):
+        """
+        Analyze repositories on a shared thread pool.
+
+        Threads suit this workload: most of the time per repository goes to
+        git subprocesses and file I/O, which release the GIL. Per-file
+        progress bars are replaced by one bar counting finished repositories.
+
+        Returns:
+            dict: repo_root -> RepoInfo (or None), in completion order
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from tqdm import tqdm
+
+        debug_print(f"[DEBUG] Analyzer: Analyzing {len(schedule)} repositories on {workers} workers.")
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metricmancer-repo") as executor:
+            # Submission order is the schedule: the pool starts the largest repos first
+            futures = {
+                executor.submit(
+                    self._analyze_repo, repo_root, files_by_root[repo_root],
+                    list(scan_dirs_by_root[repo_root]), False
+                ): repo_root
+                for repo_root in schedule
+            }
+            for future in tqdm(as_completed(futures), total=len(futures),
+                               desc="Analyzing repositories", unit="repo"):
+                results[futures[future]] = future.result()
+        return results
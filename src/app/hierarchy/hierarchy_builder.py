@@ -129,6 +129,63 @@ class HierarchyBuilder:
             )
             container.files[file.name] = file
 
+    def remove_file_from_hierarchy(
+        self,
+        repo_info: RepoInfo,
+        file_path: str
+    ) -> bool:
+        """
+        Remove a file from the hierarchy and prune directories left empty.
+
+        Args:
+            repo_info: Root RepoInfo object
+            file_path: Relative file path (e.g., "src/app/main.py")
+
+        Returns:
+            True if the file was in the hierarchy, False otherwise
+        """
+        path_parts, filename = self._parse_directory_path(file_path, repo_info.repo_root_path)
+        chain = self.get_directory_chain(repo_info, file_path)
+        if len(chain) != len(path_parts) + 1 or filename not in chain[-1].files:
+            return False
+
+        del chain[-1].files[filename]
+        # Prune empty directories bottom-up (never the repository itself)
+        for parent, child, name in zip(reversed(chain[:-1]), reversed(chain[1:]), reversed(path_parts)):
+            if child.files or child.scan_dirs:
+                break
+            del parent.scan_dirs[name]
+        return True
+
+    def get_directory_chain(
+        self,
+        repo_info: RepoInfo,
+        file_path: str
+    ) -> List[ScanDir]:
+        """
+        Return the existing directory nodes from the repository down to a file's directory.
+
+        Args:
+            repo_info: Root RepoInfo object
+            file_path: Relative file path (e.g., "src/app/main.py")
+
+        Returns:
+            [repo_info, ScanDir("src"), ScanDir("app")]; shorter if part of
+            the path does not exist in the hierarchy (yet)
+
+        Example:
+            >>> builder.get_directory_chain(repo_info, "src/app/main.py")
+            [repo_info, <ScanDir src>, <ScanDir app>]
+        """
+        path_parts, _ = self._parse_directory_path(file_path, repo_info.repo_root_path)
+        chain = [repo_info]
+        for part in path_parts:
+            next_dir = chain[-1].scan_dirs.get(part)
+            if next_dir is None:
+                break
+            chain.append(next_dir)
+        return chain
+
     def _parse_directory_path(
         self,
         file_path: str,
@@ -7,6 +7,8 @@ Separates timing concerns from main application logic.
 import time
 from typing import Dict, Any, Optional
 
+from src.utilities.memory_tracking import begin_memory_phase, end_memory_phase
+
 
 class TimingReporter:
     """
@@ -14,7 +16,8 @@ class TimingReporter:
 
     Responsibilities:
     - Measure execution time for various steps
-    - Format and print timing summaries
+    - Bracket the scan, analysis and report phases for --memory-profile
+    - Format and print timing and memory summaries
     """
 
     def __init__(self):
@@ -30,27 +33,33 @@ class TimingReporter:
 
     def start_scan(self):
         """Mark the start of scanning phase."""
+        begin_memory_phase('scan')
         self.timings['scan_start'] = time.perf_counter()
 
     def end_scan(self):
         """Mark the end of scanning phase."""
         self.timings['scan_end'] = time.perf_counter()
+        end_memory_phase('scan')
 
     def start_analysis(self):
         """Mark the start of analysis phase."""
+        begin_memory_phase('analysis')
         self.timings['analyze_start'] = time.perf_counter()
 
     def end_analysis(self):
         """Mark the end of analysis phase."""
         self.timings['analyze_end'] = time.perf_counter()
+        end_memory_phase('analysis')
 
     def start_report_generation(self):
         """Mark the start of report generation phase."""
+        begin_memory_phase('report_generation')
         self.timings['reportgen_start'] = time.perf_counter()
 
     def end_report_generation(self):
         """Mark the end of report generation phase."""
         self.timings['reportgen_end'] = time.perf_counter()
+        end_memory_phase('report_generation')
 
     def get_scan_duration(self) -> float:
         """Get scanning duration in seconds."""
@@ -97,6 +106,9 @@ class TimingReporter:
               f"{self.safe_format(analyzer_timing.get('complexity', 0))} seconds")
         print(f"  Cognitive complexity:   "
               f"{self.safe_format(analyzer_timing.get('cognitive_complexity', 0))} seconds")
+        for key in sorted(k for k in analyzer_timing if k.startswith('cognitive_complexity.')):
+            language = key[len('cognitive_complexity.'):] + ':'
+            print(f"    {language:<20} {self.safe_format(analyzer_timing[key])} seconds")
         print(f"  KPI aggregation:        "
               f"{self.safe_format(analyzer_timing.get('kpi_aggregation', 0))} seconds")
         print(f"  ChurnKPI (per file):    "
@@ -121,3 +133,55 @@ class TimingReporter:
         print(f"Report generation:  {self.get_report_generation_duration():.2f} seconds")
 
         self.print_analysis_breakdown(analyzer_timing)
+
+    @staticmethod
+    def _format_mb(val: Any) -> str:
+        """Format a value in MB, or "N/A" when it is unknown."""
+        return "N/A" if val is None else f"{float(val):.1f}"
+
+    def print_memory_summary(self, memory: Optional[Dict] = None):
+        """
+        Print peak memory per phase and the top allocation sites of phases above the threshold.
+
+        Args:
+            memory: Data from MemoryTracker.to_dict()
+        """
+        if not memory or not memory.get('phases'):
+            return
+
+        print("\n=== MEMORY SUMMARY ===")
+        print(f"  {'Phase':<24} {'Runs':>5} {'Peak traced MB':>15} {'RSS MB':>8} {'Peak RSS MB':>12}")
+        for phase in memory['phases']:
+            print(f"  {phase['name']:<24} {phase['calls']:>5} {self._format_mb(phase['peak_traced_mb']):>15} "
+                  f"{self._format_mb(phase['rss_mb']):>8} {self._format_mb(phase['rss_peak_mb']):>12}")
+        print(f"  Process peak RSS: {self._format_mb(memory.get('peak_rss_mb'))} MB")
+
+        for phase in memory['phases']:
+            if not phase['top_sites']:
+                continue
+            print(f"-- Top allocation sites: {phase['name']} "
+                  f"(peak above {self._format_mb(memory.get('threshold_mb'))} MB) --")
+            for site in phase['top_sites']:
+                print(f"  +{site['growth_mb']:8.2f} MB ({site['size_mb']:.2f} MB in {site['count']} blocks)  "
+                      f"{site['file']}:{site['line']}")
+
+    def print_git_summary(self, git_stats: Optional[Dict] = None):
+        """
+        Print calls, time and output size per git subcommand.
+
+        Args:
+            git_stats: Data from GitRunner.to_dict()
+        """
+        if not git_stats or not git_stats.get('commands'):
+            return
+
+        print("-- Git commands --")
+        for cmd in git_stats['commands']:
+            extra = ""
+            if cmd['failures'] or cmd['timeouts'] or cmd['skipped']:
+                extra = f"  ({cmd['failures']} failed, {cmd['timeouts']} timed out, {cmd['skipped']} skipped)"
+            print(f"  git {cmd['subcommand']:<18} {cmd['calls']:>6} calls  "
+                  f"{self.safe_format(cmd['seconds']):>8} seconds  "
+                  f"{cmd['bytes_out'] / (1024 * 1024):8.2f} MB{extra}")
+        if git_stats.get('open_circuits'):
+            print(f"  Circuit open (calls skipped): {', '.join(git_stats['open_circuits'])}")
@@ -6,6 +6,8 @@ Delegates KPI calculation to KPICalculator (Strategy pattern).
 
 Part of analyzer.py refactoring (Phase 2).
 """
+import time
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -13,6 +15,8 @@ from src.kpis.model import File, Function
 from src.kpis.complexity import ComplexityKPI
 from src.kpis.base_kpi import BaseKPI
 from src.utilities.debug import debug_print
+from src.utilities.file_reader import SourceFile
+from src.utilities.tracing import span
 from src.app.kpi.kpi_calculator import KPICalculator
 
 
@@ -47,6 +51,12 @@ class FileAnalyzer:
         """
         self.config = languages_config
         self.kpi_calculator = kpi_calculator
+        # Cumulative read/parse time in seconds, reset per file by Analyzer (like KPICalculator.timing)
+        self.timing = {'read': 0.0, 'parse': 0.0}
+        # Line count of the last file read, used by the --profile report
+        self.last_line_count = 0
+        # True if the parser's prefilter ruled out functions in the last file read (its content is '')
+        self.last_prefiltered = False
 
     def analyze_file(
         self,
@@ -90,25 +100,62 @@ class FileAnalyzer:
             )
             return None
 
-        # Step 2: Read file content
-        content = self._read_file_content(file_path)
-        if content is None:
-            return None
+        with span('analyze_file', 'file', file=str(file_path)):
+            if file_info.get('classification'):
+                return self._analyze_reduced_file(file_info, file_path, repo_root)
+            return self._analyze_supported_file(file_info, file_path, ext, repo_root)
+
+    def _analyze_reduced_file(self, file_info: Dict, file_path: Path, repo_root: Path) -> File:
+        """
+        Score a generated, minified or vendored file without reading, parsing or blaming it.
+
+        The file keeps its churn; complexity is 0, so it cannot rank as a hotspot.
+        """
+        return File(
+            name=file_path.name,
+            file_path=str(file_path.relative_to(repo_root)),
+            kpis=self.kpi_calculator.calculate_reduced(file_info, repo_root),
+            functions=[]
+        )
 
-        # Step 3: Get language configuration
+    def _analyze_supported_file(
+        self,
+        file_info: Dict,
+        file_path: Path,
+        ext: str,
+        repo_root: Path
+    ) -> Optional[File]:
+        """Read, parse and score a file whose extension has been validated."""
+        # Step 2: Get language configuration
         lang_config = self.config[ext]
 
+        # Step 3: Read file content ('' with last_prefiltered set if the prefilter rules out any functions)
+        with span('read', 'file') as read_span:
+            t_start = time.perf_counter()
+            content = self._read_file_content(file_path, lang_config)
+            self.timing['read'] += time.perf_counter() - t_start
+            read_span.set(chars=len(content) if content is not None else 0)
+        if content is None:
+            return None
+
         # Step 4: Analyze functions in the file
-        functions_data = self.kpi_calculator.complexity_analyzer.analyze_functions(
-            content, lang_config
-        )
+        functions_data = []
+        if content:
+            with span('parse', 'file', language=ext) as parse_span:
+                t_start = time.perf_counter()
+                functions_data = self.kpi_calculator.complexity_analyzer.analyze_functions(
+                    content, lang_config
+                )
+                self.timing['parse'] += time.perf_counter() - t_start
+                parse_span.set(functions=len(functions_data))
 
         # Step 6: Calculate all file-level KPIs
         file_kpis = self.kpi_calculator.calculate_all(
             file_info=file_info,
             repo_root=repo_root,
             content=content,
-            functions_data=functions_data
+            functions_data=functions_data,
+            prefiltered=self.last_prefiltered
         )
 
         # Step 7: Create Function objects with complexity and cognitive_complexity KPIs
@@ -128,6 +175,12 @@ class FileAnalyzer:
 
         return file_obj
 
+    def reset_timing(self):
+        """Reset read/parse timing (called by Analyzer after each file)."""
+        self.timing = {'read': 0.0, 'parse': 0.0}
+        self.last_line_count = 0
+        self.last_prefiltered = False
+
     def _is_supported_extension(self, ext: str) -> bool:
         """
         Check if file extension is supported.
@@ -140,20 +193,37 @@ class FileAnalyzer:
         """
         return ext in self.config
 
-    def _read_file_content(self, file_path: Path) -> Optional[str]:
+    def _read_file_content(self, file_path: Path, lang_config: Optional[Dict] = None) -> Optional[str]:
         """
-        Read file content with error handling.
+        Read and decode file content with error handling.
+
+        Large files are memory-mapped and binary files are skipped (see
+        SourceFile). With a language config, the parser's byte-level prefilter
+        runs first and a non-empty file it rules out is not decoded at all.
+        Sets last_line_count and last_prefiltered.
 
         Args:
             file_path: Path to file
+            lang_config: Language configuration of the file (None = always decode)
 
         Returns:
             File content as string
-            None if file cannot be read
+            '' if the file is empty, or (with last_prefiltered set) if the
+            prefilter rules out any functions in the file
+            None if file cannot be read or is binary
         """
+        self.last_prefiltered = False
         try:
-            with file_path.open('r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
+            with SourceFile(file_path) as source:
+                if source.is_binary():
+                    debug_print(f"[READ] Skipping binary file {file_path}")
+                    return None
+                self.last_line_count = source.line_count()
+                if lang_config is not None and source.size and \
+                        not self.kpi_calculator.complexity_analyzer.may_contain_functions(source.data, lang_config):
+                    self.last_prefiltered = True
+                    return ''
+                return source.decode()
         except Exception as e:
             debug_print(f"[WARN] Unable to read {file_path}: {e}")
             return None
@@ -185,7 +255,8 @@ class FileAnalyzer:
             if hasattr(cog_kpi, 'calculation_values'):
                 cog_values = cog_kpi.calculation_values or {}
 
-        for func_data in functions_data:
+        cog_by_function = self._match_cognitive_values(functions_data, cog_values)
+        for func_data, cog_value in zip(functions_data, cog_by_function):
             # Create complexity KPI for this function
             func_complexity_kpi = ComplexityKPI().calculate(
                 complexity=func_data.get('complexity', 0),
@@ -194,7 +265,6 @@ class FileAnalyzer:
 
             # Create cognitive_complexity KPI for this function (if available)
             func_name = func_data.get('name', 'N/A')
-            cog_value = cog_values.get(func_name)
             func_cog_kpi = None
             if cog_value is not None:
                 func_cog_kpi = CognitiveComplexityKPI(value=cog_value)
@@ -212,6 +282,28 @@ class FileAnalyzer:
 
         return function_objects
 
+    @staticmethod
+    def _match_cognitive_values(functions_data: List[Dict], cog_values: Dict) -> List[Optional[int]]:
+        """
+        Return the cognitive complexity of each function in functions_data (None if unknown).
+
+        Python scores are keyed by qualified name ('A.run', 'outer.<locals>.inner')
+        while the complexity parsers report plain names, so each function takes
+        the next score, in source order, whose last name component matches.
+        Functions left over (e.g. overloads sharing one score) fall back to the
+        score of their exact name.
+        """
+        by_short_name = defaultdict(deque)
+        for name, value in cog_values.items():
+            by_short_name[name.rsplit('.', 1)[-1]].append(value)
+
+        matched = []
+        for func_data in functions_data:
+            name = func_data.get('name', 'N/A')
+            candidates = by_short_name.get(name)
+            matched.append(candidates.popleft() if candidates else cog_values.get(name))
+        return matched
+
     def analyze_multiple_files(
         self,
         files_info: List[Dict],
@@ -257,8 +349,9 @@ class FileAnalyzer:
 
         Returns:
             Dict with keys:
-            - 'kpi_timing': Dict of KPI name → cumulative time
-            - 'total_kpi_time': Sum of all KPI calculation times
+            - 'kpi_timing': Dict of KPI name → cumulative time (with per-language
+              'cognitive_complexity.<Language>' breakdown keys)
+            - 'total_kpi_time': Sum of all KPI calculation times (breakdown keys not counted again)
 
         Example:
             stats = analyzer.get_statistics()
@@ -273,7 +366,7 @@ class FileAnalyzer:
             # }
         """
         kpi_timing = self.kpi_calculator.get_timing_report()
-        total_time = sum(kpi_timing.values())
+        total_time = sum(value for key, value in kpi_timing.items() if '.' not in key)
 
         return {
             'kpi_timing': kpi_timing,
@@ -20,7 +20,7 @@ REFACTORED:
 - Extracted AggregationStrategy for aggregation logic
 """
 
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional
 from src.utilities.debug import debug_print
 from src.app.kpi.directory_accessor import DirectoryObjectAccessor
 from src.app.kpi.kpi_value_collector import KPIValueCollector
@@ -172,20 +172,50 @@ class KPIAggregator:
                     # Recursively aggregate subdirectories
                     self.aggregate_directory(subdir)
 
-            # 2. Collect KPI values from all files in tree (recursive)
-            self.value_collector.collect_from_directory_tree(directory_obj, kpi_values)
+            # 2-4. Collect, aggregate and store this directory's KPIs
+            return self._aggregate_own_kpis(directory_obj, kpi_values)
 
-            # 3. Calculate aggregated values using strategy
-            result = self.aggregation_strategy.aggregate_kpi_collections(kpi_values)
+        except Exception as e:
+            debug_print(f"[KPIAggregator] Error aggregating directory: {e}")
+            return {}
 
-            # 4. Update directory's kpis dictionary with aggregated values
-            self._update_directory_kpis(directory_obj, result)
+    def aggregate_path(self, directories: List[Any]) -> Dict[str, Any]:
+        """
+        Re-aggregate only the given directories, e.g. the ancestors of changed files.
 
-            dir_name = self.directory_accessor.get_name(directory_obj)
-            debug_print(f"[KPIAggregator] Aggregated directory {dir_name}: {result}")
+        Unlike aggregate_directory(), subdirectories are not re-aggregated:
+        their KPIs are assumed to be current. Used by watch mode after a few
+        files were re-analyzed.
 
-            return result
+        Args:
+            directories: Directories ordered parents before children, e.g. the chain
+                         from HierarchyBuilder.get_directory_chain(); aggregated in
+                         reverse order, so children are up to date before their parents
 
+        Returns:
+            Dictionary mapping KPI names to aggregated values of the first (root) directory
+        """
+        result: Dict[str, Any] = {}
+        try:
+            for directory_obj in reversed(directories):
+                result = self._aggregate_own_kpis(directory_obj, {})
         except Exception as e:
-            debug_print(f"[KPIAggregator] Error aggregating directory: {e}")
+            debug_print(f"[KPIAggregator] Error re-aggregating directories: {e}")
             return {}
+        return result
+
+    def _aggregate_own_kpis(self, directory_obj: Any, kpi_values: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect KPI values from all files below a directory and store the aggregates on it."""
+        # Collect KPI values from all files in tree (recursive)
+        self.value_collector.collect_from_directory_tree(directory_obj, kpi_values)
+
+        # Calculate aggregated values using strategy
+        result = self.aggregation_strategy.aggregate_kpi_collections(kpi_values)
+
+        # Update directory's kpis dictionary with aggregated values
+        self._update_directory_kpis(directory_obj, result)
+
+        dir_name = self.directory_accessor.get_name(directory_obj)
+        debug_print(f"[KPIAggregator] Aggregated directory {dir_name}: {result}")
+
+        return result
@@ -7,12 +7,15 @@ Based on MetricMancer ARCHITECTURE.md design principles.
 This module implements the Strategy pattern for calculating KPIs,
 allowing easy extension with new KPI types without modifying existing code.
 """
-from typing import Dict, List, Protocol
+from typing import Dict, List, Optional, Protocol
 from pathlib import Path
+import os
 import time
 
+from src.config.defaults import Defaults
 from src.kpis.base_kpi import BaseKPI
 from src.utilities.debug import debug_print
+from src.utilities.tracing import span
 
 
 class KPIStrategy(Protocol):
@@ -92,25 +95,56 @@ class ComplexityKPIStrategy:
 
 
 class CognitiveComplexityKPIStrategy:
-    """Strategy for calculating Cognitive Complexity KPI from Python source code."""
+    """Strategy for calculating Cognitive Complexity KPI (Python files, or every language with a calculator)."""
+
+    def __init__(self, languages: str = Defaults.COGNITIVE_LANGUAGES,
+                 time_limit: float = Defaults.COGNITIVE_TIME_LIMIT_SECONDS):
+        """
+        Args:
+            languages: 'python' (only Python files are scored) or 'all'
+            time_limit: Seconds one file may take; slower files get no value (0 = no limit)
+        """
+        self.languages = languages
+        self.time_limit = time_limit
+
+    def language_of(self, file_info: Dict) -> Optional[str]:
+        """
+        Name of the file's language if this strategy scores it, else None.
+
+        Used by KPICalculator to report cognitive complexity timing per language.
+        """
+        from src.kpis.cognitive_complexity.calculator_factory import CognitiveComplexityCalculatorFactory
+        from src.languages.config import LANGUAGES
+
+        ext = file_info.get('ext', '')
+        if not ext.startswith('.'):
+            ext = f".{ext}"
+        if self.languages != 'all' and ext != '.py':
+            return None
+        if ext not in CognitiveComplexityCalculatorFactory.CALCULATORS:
+            return None
+        return LANGUAGES.get(ext, {}).get('name', ext)
 
     def calculate(
         self,
         file_info: Dict,
         repo_root: Path,
         content: str = None,
+        prefiltered: bool = False,
         **kwargs
     ) -> BaseKPI:
         """
-        Calculate Cognitive Complexity for Python files.
+        Calculate Cognitive Complexity for Python files, or for all supported languages.
 
-        Uses AST-based analysis to compute cognitive complexity following
-        the SonarSource specification. Only processes Python files.
+        Uses AST-based analysis (tree-sitter outside Python) to compute cognitive
+        complexity following the SonarSource specification. The tree-sitter
+        calculators reuse the tree the complexity parser built for the same content.
 
         Args:
             file_info: File information dict with 'path' and 'ext' keys
             repo_root: Repository root path
             content: File content as string (required for analysis)
+            prefiltered: True if content is '' because FileAnalyzer's prefilter ruled out any functions
             **kwargs: Additional parameters
 
         Returns:
@@ -118,18 +152,18 @@ class CognitiveComplexityKPIStrategy:
         """
         from src.kpis.cognitive_complexity import CognitiveComplexityKPI
 
-        # Only calculate for Python files
-        ext = file_info.get('ext', '')
-        if ext not in ['.py', 'py']:
+        if self.language_of(file_info) is None:
             return CognitiveComplexityKPI()
 
-        if not content:
+        # Empty files get no value; a file the prefilter ruled out has no functions and scores 0
+        if not content and not prefiltered:
             return CognitiveComplexityKPI()
 
         file_path = file_info.get('path')
         return CognitiveComplexityKPI().calculate(
             file_path=str(file_path),
-            file_content=content
+            file_content=content,
+            time_limit=self.time_limit
         )
 
 
@@ -163,6 +197,38 @@ class ChurnKPIStrategy:
         )
 
 
+class ChurnAccelerationKPIStrategy:
+    """Strategy for calculating churn acceleration (recent vs. long-term churn) from the churn histograms."""
+
+    def calculate(
+        self,
+        file_info: Dict,
+        repo_root: Path,
+        **kwargs
+    ) -> BaseKPI:
+        """
+        Calculate churn acceleration and the churn of each trend window.
+
+        Args:
+            file_info: File information dict with 'path' key
+            repo_root: Repository root path
+            **kwargs: Additional parameters
+
+        Returns:
+            ChurnAccelerationKPI comparing the shortest and longest trend window
+        """
+        from src.kpis.codechurn import ChurnAccelerationKPI
+
+        windows = Defaults.CHURN_TREND_WINDOWS
+        return ChurnAccelerationKPI().calculate(
+            file_path=str(file_info.get('path')),
+            repo_root=str(repo_root.resolve()),
+            short_days=windows[0],
+            long_days=windows[-1],
+            windows=windows
+        )
+
+
 class HotspotKPIStrategy:
     """Strategy for calculating hotspot KPI from complexity and churn."""
 
@@ -290,20 +356,24 @@ class KPICalculator:
         calculator.register_strategy('my_kpi', MyKPIStrategy())
     """
 
-    def __init__(self, complexity_analyzer):
+    def __init__(self, complexity_analyzer, cognitive_languages: str = Defaults.COGNITIVE_LANGUAGES,
+                 cognitive_time_limit: float = Defaults.COGNITIVE_TIME_LIMIT_SECONDS):
         """
         Initialize with default KPI strategies.
 
         Args:
             complexity_analyzer: ComplexityAnalyzer instance for parsing code
+            cognitive_languages: Files scored for cognitive complexity: 'python' or 'all'
+            cognitive_time_limit: Seconds one file's cognitive complexity may take (0 = no limit)
         """
         self.complexity_analyzer = complexity_analyzer
 
         # Register default strategies
         self.strategies = {
             'complexity': ComplexityKPIStrategy(complexity_analyzer),
-            'cognitive_complexity': CognitiveComplexityKPIStrategy(),
+            'cognitive_complexity': CognitiveComplexityKPIStrategy(cognitive_languages, cognitive_time_limit),
             'churn': ChurnKPIStrategy(),
+            'churn_acceleration': ChurnAccelerationKPIStrategy(),
             'hotspot': HotspotKPIStrategy(),
             'ownership': OwnershipKPIStrategy(),
             'shared_ownership': SharedOwnershipKPIStrategy()
@@ -335,7 +405,8 @@ class KPICalculator:
         file_info: Dict,
         repo_root: Path,
         content: str,
-        functions_data: List
+        functions_data: List,
+        prefiltered: bool = False
     ) -> Dict[str, BaseKPI]:
         """
         Calculate all registered KPIs for a file.
@@ -348,6 +419,7 @@ class KPICalculator:
             repo_root: Path to repository root
             content: File content as string
             functions_data: List of function dicts from complexity analysis
+            prefiltered: True if content is '' because the parser's prefilter ruled out any functions
 
         Returns:
             Dict mapping KPI names to calculated KPI objects
@@ -369,66 +441,120 @@ class KPICalculator:
         kpis = {}
 
         # 1. Complexity (independent - needs only functions_data)
-        t_start = time.perf_counter()
-        complexity_kpi = self.strategies['complexity'].calculate(
+        complexity_kpi = self._calculate_timed(
+            'complexity',
             file_info=file_info,
             repo_root=repo_root,
             content=content,
             functions_data=functions_data
         )
         kpis[complexity_kpi.name] = complexity_kpi
-        self.timing['complexity'] += time.perf_counter() - t_start
 
-        # 2. Cognitive Complexity (independent - AST-based Python analysis)
-        t_start = time.perf_counter()
-        cognitive_complexity_kpi = self.strategies['cognitive_complexity'].calculate(
+        # 2. Cognitive Complexity (independent - AST/tree-sitter analysis, timed per language)
+        language_of = getattr(self.strategies['cognitive_complexity'], 'language_of', None)
+        cognitive_complexity_kpi = self._calculate_timed(
+            'cognitive_complexity',
+            detail=language_of(file_info) if language_of else None,
             file_info=file_info,
             repo_root=repo_root,
-            content=content
+            content=content,
+            prefiltered=prefiltered
         )
         kpis[cognitive_complexity_kpi.name] = cognitive_complexity_kpi
-        self.timing['cognitive_complexity'] += time.perf_counter() - t_start
 
         # 3. Churn (independent - queries git)
-        t_start = time.perf_counter()
-        churn_kpi = self.strategies['churn'].calculate(
-            file_info=file_info,
-            repo_root=repo_root
-        )
+        churn_kpi = self._calculate_timed('churn', file_info=file_info, repo_root=repo_root)
         kpis[churn_kpi.name] = churn_kpi
-        self.timing['churn'] += time.perf_counter() - t_start
+
+        # 3b. Churn acceleration (in memory, from the churn histograms built with churn)
+        acceleration_kpi = self._calculate_timed('churn_acceleration', file_info=file_info, repo_root=repo_root)
+        kpis[acceleration_kpi.name] = acceleration_kpi
 
         # 4. Hotspot (depends on complexity + churn)
-        t_start = time.perf_counter()
-        hotspot_kpi = self.strategies['hotspot'].calculate(
+        hotspot_kpi = self._calculate_timed(
+            'hotspot',
             file_info=file_info,
             repo_root=repo_root,
             complexity_kpi=complexity_kpi,
             churn_kpi=churn_kpi
         )
         kpis[hotspot_kpi.name] = hotspot_kpi
-        self.timing['hotspot'] += time.perf_counter() - t_start
 
         # 5. Ownership (independent - queries git blame)
-        t_start = time.perf_counter()
-        ownership_kpi = self.strategies['ownership'].calculate(
-            file_info=file_info,
-            repo_root=repo_root
-        )
+        ownership_kpi = self._calculate_timed('ownership', file_info=file_info, repo_root=repo_root)
         kpis[ownership_kpi.name] = ownership_kpi
-        self.timing['ownership'] += time.perf_counter() - t_start
 
         # 6. Shared Ownership (independent - queries git)
-        t_start = time.perf_counter()
-        shared_kpi = self.strategies['shared_ownership'].calculate(
-            file_info=file_info,
-            repo_root=repo_root
-        )
+        shared_kpi = self._calculate_timed('shared_ownership', file_info=file_info, repo_root=repo_root)
         kpis[shared_kpi.name] = shared_kpi
-        self.timing['shared_ownership'] += time.perf_counter() - t_start
+
+        skip_reason = self._git_skip_reason(file_info, repo_root)
+        if skip_reason:
+            for kpi in (churn_kpi, acceleration_kpi, hotspot_kpi, ownership_kpi, shared_kpi):
+                kpi.calculation_values = dict(kpi.calculation_values or {}, status=skip_reason)
 
         return kpis
 
+    def calculate_reduced(self, file_info: Dict, repo_root: Path) -> Dict[str, BaseKPI]:
+        """
+        Calculate the KPIs of a generated, minified or vendored file in reduced mode.
+
+        Only churn is queried; complexity is 0 (the file is not parsed), so
+        hotspot is 0 too, and ownership (git blame) is not calculated. The
+        complexity KPI's calculation_values carry the file's classification.
+
+        Args:
+            file_info: Dict with 'path', 'ext' and 'classification' keys
+            repo_root: Path to repository root
+
+        Returns:
+            Dict with complexity, churn and hotspot KPIs
+        """
+        complexity_kpi = self._calculate_timed('complexity', file_info=file_info, repo_root=repo_root,
+                                               content=None, functions_data=[])
+        complexity_kpi.calculation_values = dict(complexity_kpi.calculation_values or {},
+                                                 classification=file_info.get('classification'))
+        churn_kpi = self._calculate_timed('churn', file_info=file_info, repo_root=repo_root)
+        hotspot_kpi = self._calculate_timed('hotspot', file_info=file_info, repo_root=repo_root,
+                                            complexity_kpi=complexity_kpi, churn_kpi=churn_kpi)
+        return {kpi.name: kpi for kpi in (complexity_kpi, churn_kpi, hotspot_kpi)}
+
+    @staticmethod
+    def _git_skip_reason(file_info: Dict, repo_root: Path) -> Optional[str]:
+        """
+        Return why the file's git data is missing (e.g. "skipped (timeout)"), or None.
+
+        A git command whose timeout or budget ran out leaves churn and ownership
+        empty; the reason is recorded in the git cache so the git KPIs can be
+        reported as skipped instead of as a file without history.
+        """
+        from src.utilities.git_cache import get_git_cache
+
+        file_path = file_info.get('path')
+        if not file_path:
+            return None
+        resolved_root = str(Path(repo_root).resolve())
+        rel_path = os.path.relpath(str(Path(file_path).resolve()), resolved_root)
+        return get_git_cache().get_skip_reason(resolved_root, rel_path)
+
+    def _calculate_timed(self, name: str, detail: Optional[str] = None, **kwargs) -> BaseKPI:
+        """
+        Run one strategy, adding its duration to self.timing[name].
+
+        With a detail (e.g. the language), the duration is also added to
+        self.timing[f"{name}.{detail}"]. The call is also recorded as a
+        tracing span when tracing is enabled.
+        """
+        with span(name, 'kpi', file=kwargs['file_info'].get('path')):
+            t_start = time.perf_counter()
+            kpi = self.strategies[name].calculate(**kwargs)
+            elapsed = time.perf_counter() - t_start
+            self.timing[name] += elapsed
+            if detail:
+                key = f"{name}.{detail}"
+                self.timing[key] = self.timing.get(key, 0.0) + elapsed
+        return kpi
+
     def get_timing_report(self) -> Dict[str, float]:
         """
         Get timing statistics for KPI calculations.
@@ -2,10 +2,11 @@ import os
 
 from src.app.core.analyzer import Analyzer
 from src.app.scanning.scanner import Scanner
-from src.app.hierarchy.data_converter import DataConverter
+from src.app.coordination.parallel_report_runner import ParallelReportRunner
 from src.app.coordination.report_coordinator import ReportCoordinator
 from src.app.coordination.delta_review_coordinator import DeltaReviewCoordinator
 from src.app.coordination.filename_generator import FileNameGenerator
+from src.app.coordination.watch_coordinator import WatchCoordinator
 from src.app.infrastructure.timing_reporter import TimingReporter
 from src.app.infrastructure.exception_handler import ExceptionHandler
 from src.app.services.hotspot_service import HotspotService
@@ -13,8 +14,17 @@ from src.app.services.file_change_detector import FileChangeDetector
 from src.utilities.path_helpers import normalize_output_path
 from src.languages.config import Config
 from src.config.app_config import AppConfig
+from src.config.defaults import Defaults
 from src.report.report_generator import ReportGenerator  # noqa: F401 - used in tests for mocking
+from src.utilities.branch_diff import start_branch_diff_service, stop_branch_diff_service
 from src.utilities.debug import debug_print
+from src.utilities.git_cache import get_git_cache
+from src.utilities.git_runner import configure_git_runner, get_git_runner
+from src.utilities.memory_tracking import (
+    get_memory_tracker, memory_phase, start_memory_tracking, stop_memory_tracking
+)
+from src.utilities.profiling import get_profiler, start_profiling, stop_profiling
+from src.utilities.tracing import span, start_tracing, stop_tracing
 
 
 class MetricMancerApp:
@@ -61,7 +71,12 @@ class MetricMancerApp:
             self.lang_config.languages,
             threshold_low=self.app_config.threshold_low,
             threshold_high=self.app_config.threshold_high,
-            churn_period_days=self.app_config.churn_period
+            churn_period_days=self.app_config.churn_period,
+            cache_memory_mb=self.app_config.cache_memory_mb,
+            max_workers=self.app_config.workers,
+            generated_files=self.app_config.generated_files,
+            cognitive_languages=self.app_config.cognitive_languages,
+            cognitive_time_limit=self.app_config.cognitive_time_limit
         )
 
         # Allow swapping report generator (None means multi-format mode)
@@ -151,17 +166,106 @@ class MetricMancerApp:
         4. Run optional analyses (hotspots, review strategy, delta review)
         """
         timing_reporter = TimingReporter()
-
-        # Core pipeline: scan → analyze → report
-        files, repo_infos = self._run_core_pipeline(timing_reporter)
-        report_links = self._prepare_report_links(repo_infos)
-        self._run_report_generation(timing_reporter, repo_infos, report_links)
-
-        # Optional analyses
-        self._run_optional_analyses(repo_infos)
-
-        # Print timing summary
-        self._print_timing_summary(timing_reporter)
+        configure_git_runner(self.app_config.git_timeout, self.app_config.git_budget)
+        get_git_cache().set_ownership_sampling(self.app_config.ownership_sample_lines)
+        start_branch_diff_service()
+        if self.app_config.trace_file:
+            start_tracing()
+        profiling = self.app_config.profile or bool(self.app_config.profile_output)
+        if profiling:
+            start_profiling(self.app_config.profile_top)
+        if self.app_config.memory_profile:
+            start_memory_tracking(self.app_config.memory_threshold_mb)
+
+        try:
+            # Core pipeline: scan → analyze → report
+            files, repo_infos = self._run_core_pipeline(timing_reporter)
+            report_links = self._prepare_report_links(repo_infos)
+            self._run_report_generation(timing_reporter, repo_infos, report_links)
+
+            # Optional analyses
+            self._run_optional_analyses(repo_infos)
+
+            # Print timing summary
+            self._print_timing_summary(timing_reporter)
+            self._report_git_limits(timing_reporter)
+            if profiling:
+                self._report_profile()
+            if self.app_config.memory_profile:
+                self._report_memory(timing_reporter)
+
+            if self.app_config.watch:
+                self._run_watch(repo_infos)
+        finally:
+            stop_branch_diff_service()
+            stop_profiling()
+            stop_memory_tracking()
+            self._write_trace()
+
+    def _run_watch(self, repo_infos):
+        """Keep the caches warm and re-render the reports whenever scanned files change (--watch)."""
+        def render(current_repo_infos):
+            # HEAD may have moved since the last render
+            start_branch_diff_service()
+            with span('watch_render', 'pipeline', repos=len(current_repo_infos)):
+                self._run_report_generation(TimingReporter(), current_repo_infos,
+                                            self._prepare_report_links(current_repo_infos))
+
+        WatchCoordinator(
+            self.analyzer, self.app_config.directories, self.lang_config.languages, render,
+            interval=self.app_config.watch_interval
+        ).run(repo_infos)
+
+    def _report_git_limits(self, timing_reporter: TimingReporter):
+        """Print git command counters and warn about files whose git KPIs were skipped."""
+        git_stats = get_git_runner().to_dict()
+        if not self.app_config.no_timing:
+            timing_reporter.print_git_summary(git_stats)
+        cut_off = sum(cmd['timeouts'] + cmd['skipped'] for cmd in git_stats['commands'])
+        if cut_off:
+            skipped_files = sum(len(files) for files in get_git_cache().skipped_files.values())
+            print(f"[WARN] {cut_off} git command(s) timed out or exceeded the git budget; git KPIs of "
+                  f"{skipped_files} file(s) are marked 'skipped (timeout)' (see --git-timeout / --git-budget)")
+
+    def _report_memory(self, timing_reporter: TimingReporter):
+        """Print peak memory per phase and write it as JSON for CI."""
+        tracker = get_memory_tracker()
+        if tracker is None:
+            return
+        memory = tracker.to_dict()
+        timing_reporter.print_memory_summary(memory)
+        output = self.app_config.memory_output or os.path.join(
+            self.app_config.report_folder, Defaults.MEMORY_OUTPUT
+        )
+        try:
+            tracker.write_json(output)
+            print(f"Memory profile written to {output}")
+        except OSError as e:
+            print(f"Could not write memory profile {output}: {e}")
+
+    def _report_profile(self):
+        """Print the slowest files and git commands and optionally write them as JSON."""
+        profiler = get_profiler()
+        if profiler is None:
+            return
+        profiler.print_report()
+        if self.app_config.profile_output:
+            try:
+                profiler.write_json(self.app_config.profile_output)
+                print(f"Profile written to {self.app_config.profile_output}")
+            except OSError as e:
+                print(f"Could not write profile file {self.app_config.profile_output}: {e}")
+
+    def _write_trace(self):
+        """Stop tracing and write the Chrome trace file, if tracing was enabled."""
+        tracer = stop_tracing()
+        if tracer is None:
+            return
+        try:
+            tracer.write_chrome_trace(self.app_config.trace_file)
+            print(f"Trace written to {self.app_config.trace_file} (open in https://ui.perfetto.dev)")
+        except OSError as e:
+            print(f"Could not write trace file {self.app_config.trace_file}: {e}")
 
     def _run_core_pipeline(self, timing_reporter: TimingReporter):
         """
@@ -175,16 +279,30 @@ class MetricMancerApp:
         """
         # Step 1: Scan files
         timing_reporter.start_scan()
-        files = self._scan_files()
+        with span('scan', 'pipeline', directories=len(self.app_config.directories)) as scan_span:
+            files = self._scan_files()
+            scan_span.set(files=len(files))
         timing_reporter.end_scan()
 
         # Step 2: Analyze files
         timing_reporter.start_analysis()
-        repo_infos = self._analyze_files(files)
+        with span('analyze', 'pipeline', files=len(files)):
+            repo_infos = self._analyze_files(files)
         timing_reporter.end_analysis()
+        self._report_classified_files()
 
         return files, repo_infos
 
+    def _report_classified_files(self):
+        """Print how many generated, minified, vendored and oversized files were skipped or reduced."""
+        counts = getattr(self.analyzer, 'classified_counts', None)
+        if not isinstance(counts, dict) or not counts:
+            return
+        action = 'Skipped' if self.app_config.generated_files == 'skip' else 'Analyzed in reduced mode (churn only)'
+        details = ', '.join(f"{count} {kind}" for kind, count in sorted(counts.items()))
+        print(f"{action}: {sum(counts.values())} generated/vendored file(s) ({details}); "
+              f"use --generated-files analyze to include them")
+
     def _run_report_generation(self, timing_reporter: TimingReporter, repo_infos, report_links):
         """
         Execute report generation for all configured formats.
@@ -237,26 +355,49 @@ class MetricMancerApp:
             self.report_generator_cls
         )
 
+        if self._use_parallel_reports(repo_infos):
+            # Injected generators run in-process; HTML is otherwise rendered in forked workers
+            runner = ParallelReportRunner(
+                coordinator, self.app_config.report_workers,
+                review_strategy_callback=self._run_review_strategy_analysis,
+                use_processes=self.report_generator_cls is None
+            )
+            with span("reports", 'report', formats=len(self.app_config.output_formats), repos=len(repo_infos)):
+                runner.run(self.app_config.output_formats, repo_infos, report_links, is_multi_format)
+            return
+
         for output_format in self.app_config.output_formats:
             debug_print(f"[DEBUG] Generating reports for format: {output_format}")
 
-            # Handle review-strategy formats (aggregate report, not per-repo)
-            if output_format in ['review-strategy', 'review-strategy-branch']:
-                review_branch_only = (output_format == 'review-strategy-branch')
-                output_filename = ('review_strategy_branch.md' if review_branch_only
-                                   else 'review_strategy.md')
-                self._run_review_strategy_analysis(
-                    repo_infos, review_branch_only, output_filename
+            with span(f"report {output_format}", 'report', format=output_format, repos=len(repo_infos)), \
+                    memory_phase(f"report:{output_format}"):
+                # Handle review-strategy formats (aggregate report, not per-repo)
+                if output_format in ['review-strategy', 'review-strategy-branch']:
+                    review_branch_only = (output_format == 'review-strategy-branch')
+                    output_filename = ('review_strategy_branch.md' if review_branch_only
+                                       else 'review_strategy.md')
+                    self._run_review_strategy_analysis(
+                        repo_infos, review_branch_only, output_filename
+                    )
+                    continue
+
+                # Use coordinator for standard report generation
+                coordinator.generate_reports_for_format(
+                    output_format,
+                    repo_infos,
+                    report_links,
+                    is_multi_format
                 )
-                continue
-
-            # Use coordinator for standard report generation
-            coordinator.generate_reports_for_format(
-                output_format,
-                repo_infos,
-                report_links,
-                is_multi_format
-            )
+
+    def _use_parallel_reports(self, repo_infos) -> bool:
+        """Whether more than one report is due and --report-workers allows generating them concurrently."""
+        report_workers = getattr(self.app_config, 'report_workers', 1)
+        if not isinstance(report_workers, int) or report_workers < 2:
+            return False
+        if get_memory_tracker() is not None:
+            # Per-format memory phases need reports generated one at a time
+            return False
+        return len(self.app_config.output_formats) * len(repo_infos) > 1
 
     def _run_hotspot_analysis(self, repo_infos):
         """
@@ -291,95 +432,15 @@ class MetricMancerApp:
             review_branch_only = self.app_config.review_branch_only
         output_filename = output_filename if output_filename is not None else self.app_config.review_output
 
-        # Convert and merge repo data
-        all_data = self._convert_and_merge_repo_data(repo_infos)
-
         # Get changed files if branch-only mode is enabled
         filter_files, current_branch = self._get_changed_files_for_review(review_branch_only)
 
-        # Generate and save the report
+        # Generate and save the report (files are read directly from repo_infos)
         self._generate_and_save_review_report(
-            all_data, filter_files, current_branch,
+            repo_infos, filter_files, current_branch,
             review_branch_only, output_filename
         )
 
-    def _convert_and_merge_repo_data(self, repo_infos):
-        """Convert RepoInfo objects to dict format and merge multiple repos."""
-        all_data = {}
-        for repo_info in repo_infos:
-            repo_data = DataConverter.convert_repo_info_to_dict_with_ownership(repo_info)
-            # Merge data from multiple repos
-            if 'files' not in all_data:
-                all_data = repo_data
-            else:
-                # Merge files (shallow update is fine)
-                all_data['files'].update(repo_data.get('files', {}))
-                # Deep merge scan_dirs to avoid overwriting shared directories
-                self._deep_merge_scan_dirs(all_data['scan_dirs'], repo_data.get('scan_dirs', {}))
-        return all_data
-
-    def _merge_files_at_level(self, target, source):
-        """
-        Merge files from source into target at the current directory level.
-
-        Args:
-            target: Target directory dictionary
-            source: Source directory dictionary
-        """
-        if 'files' in source:
-            if 'files' not in target:
-                target['files'] = {}
-            target['files'].update(source['files'])
-
-    def _merge_subdirectories(self, target, source):
-        """
-        Recursively merge subdirectories from source into target.
-
-        Args:
-            target: Target directory dictionary
-            source: Source directory dictionary
-        """
-        if 'scan_dirs' in source:
-            if 'scan_dirs' not in target:
-                target['scan_dirs'] = {}
-            self._deep_merge_scan_dirs(target['scan_dirs'], source['scan_dirs'])
-
-    def _merge_other_keys(self, target, source):
-        """
-        Merge non-structural keys (KPIs, metadata) from source into target.
-
-        Args:
-            target: Target directory dictionary
-            source: Source directory dictionary
-        """
-        for key in source:
-            if key not in ['files', 'scan_dirs']:
-                target[key] = source[key]
-
-    def _deep_merge_scan_dirs(self, target, source):
-        """
-        Recursively merge scan_dirs dictionaries.
-
-        When multiple scan directories (e.g., src/, tests/) contain the same subdirectory
-        (e.g., analysis/), we need to merge them instead of overwriting.
-
-        This method has been refactored (Refactoring #3) to use helper methods for
-        improved readability and maintainability.
-
-        Args:
-            target: Target dictionary to merge into
-            source: Source dictionary to merge from
-        """
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                # Both have this directory - merge recursively using helper methods
-                self._merge_files_at_level(target[key], value)
-                self._merge_subdirectories(target[key], value)
-                self._merge_other_keys(target[key], value)
-            else:
-                # Key doesn't exist in target or not both dicts - simple assignment
-                target[key] = value
-
     def _get_changed_files_for_review(self, review_branch_only):
         """
         Get list of changed files if branch-only mode is enabled.
@@ -425,26 +486,26 @@ class MetricMancerApp:
 
         return filter_files, current_branch
 
-    def _generate_and_save_review_report(self, all_data, filter_files, current_branch,
+    def _generate_and_save_review_report(self, repo_infos, filter_files, current_branch,
                                          review_branch_only, output_filename):
         """Generate and save the code review strategy report."""
         # Use ExceptionHandler for report generation (Refactoring #2)
         ExceptionHandler.handle_report_generation(
             "review strategy report generation",
             self._generate_review_report_impl,
-            all_data, filter_files, current_branch, review_branch_only, output_filename
+            repo_infos, filter_files, current_branch, review_branch_only, output_filename
         )
 
-    def _generate_review_report_impl(self, all_data, filter_files, current_branch,
+    def _generate_review_report_impl(self, repo_infos, filter_files, current_branch,
                                      review_branch_only, output_filename):
         """Implementation of review report generation (separated for exception handling)."""
-        from src.analysis.code_review_advisor import generate_review_report
+        from src.analysis.code_review_advisor import generate_review_report_for_repos
 
         os.makedirs(self.app_config.report_folder, exist_ok=True)
         output_path = normalize_output_path(self.app_config.report_folder, output_filename)
 
-        generate_review_report(
-            all_data,
+        generate_review_report_for_repos(
+            repo_infos,
             output_file=output_path,
             filter_files=filter_files,
             branch_name=current_branch,
@@ -0,0 +1,131 @@
+"""
+File Watcher - polls scanned directories for changed files (watch mode).
+
+Portable polling instead of OS notification APIs: every poll stats each
+known file (mtime and size) and each known directory. A directory whose
+mtime changed had entries added or removed, so only that directory is
+listed again; new subdirectories are walked in full. Hidden entries and
+unsupported extensions are skipped exactly like Scanner.scan().
+"""
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.utilities.debug import debug_print
+
+
+@dataclass
+class FileChanges:
+    """
+    Files that changed since the previous poll.
+
+    Attributes:
+        changed: File info dicts ('path', 'root', 'ext') of added or modified files
+        removed: Absolute paths of deleted files
+    """
+    changed: List[Dict] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.changed or self.removed)
+
+
+class FileWatcher:
+    """
+    Detects added, modified and deleted source files by polling.
+
+    Usage:
+        watcher = FileWatcher(languages_config)
+        watcher.start(['src', 'tests'])
+        changes = watcher.poll()   # FileChanges since start() or the last poll
+    """
+
+    def __init__(self, languages_config: Dict):
+        self.config = languages_config
+        # path -> (file info, (mtime_ns, size))
+        self._files: Dict[str, Tuple[Dict, Tuple[int, int]]] = {}
+        # directory -> (scan root, mtime_ns)
+        self._dirs: Dict[str, Tuple[str, int]] = {}
+
+    def start(self, directories: List[str]):
+        """Take the initial snapshot of the given scan directories."""
+        self._files.clear()
+        self._dirs.clear()
+        for directory in directories:
+            root = Path(directory).resolve()
+            if root.is_dir() and not root.name.startswith('.'):
+                self._walk(str(root), str(root), FileChanges())
+        debug_print(f"[WATCH] Watching {len(self._files)} files in {len(self._dirs)} directories")
+
+    @property
+    def file_count(self) -> int:
+        """Number of source files currently watched."""
+        return len(self._files)
+
+    def files(self) -> List[Dict]:
+        """Return the file info dicts of all watched source files (like Scanner.scan())."""
+        return [file_info for file_info, _ in self._files.values()]
+
+    def poll(self) -> FileChanges:
+        """Return the files added, modified or deleted since the previous poll."""
+        changes = FileChanges()
+        for directory, (root, mtime) in list(self._dirs.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                del self._dirs[directory]
+                continue
+            if current != mtime:
+                self._dirs[directory] = (root, current)
+                self._list(directory, root, changes)
+
+        added = {file_info['path'] for file_info in changes.changed}
+        for path, (file_info, signature) in list(self._files.items()):
+            if path in added:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self._files[path]
+                changes.removed.append(path)
+                continue
+            current = (stat.st_mtime_ns, stat.st_size)
+            if current != signature:
+                self._files[path] = (file_info, current)
+                changes.changed.append(file_info)
+        return changes
+
+    def _walk(self, directory: str, root: str, changes: FileChanges):
+        """Record a directory and everything below it."""
+        try:
+            self._dirs[directory] = (root, os.stat(directory).st_mtime_ns)
+        except OSError:
+            return
+        self._list(directory, root, changes)
+
+    def _list(self, directory: str, root: str, changes: FileChanges):
+        """List one directory, adding unknown files to changes and walking unknown subdirectories."""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            debug_print(f"[WARN] Unable to scan {directory}: {e}")
+            return
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path not in self._dirs:
+                    self._walk(entry.path, root, changes)
+            elif entry.is_file(follow_symlinks=False) and entry.path not in self._files:
+                ext = os.path.splitext(entry.name)[1]
+                if ext not in self.config:
+                    continue
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                file_info = {'path': entry.path, 'root': root, 'ext': ext}
+                self._files[entry.path] = (file_info, (stat.st_mtime_ns, stat.st_size))
+                changes.changed.append(file_info)
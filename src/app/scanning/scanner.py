@@ -1,7 +1,6 @@
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from tqdm import tqdm
 
 from src.languages.config import LANGUAGES
 from src.utilities.debug import debug_print
@@ -59,6 +58,8 @@ class Scanner:
                 return []
             return _scan_dir(scan_dir, scan_dir)
 
+        from tqdm import tqdm  # Progress bars are loaded on first use, not at CLI startup
+
         with ThreadPoolExecutor() as executor:
             futures = [executor.submit(scan_one_dir, d) for d in directories]
             for future in tqdm(
@@ -31,6 +31,10 @@ class AppConfig:
         report_folder: Folder to write all reports to (default: 'output')
         level: Detail level for reports ('file' or 'function')
         hierarchical: Whether to output full hierarchical data model (JSON only)
+        html_chunked: Whether to write the HTML report as a shell page plus lazily loaded data chunks
+        opensearch_url: OpenSearch endpoint of the 'opensearch' format (default: 'http://localhost:9200')
+        opensearch_index: Index the 'opensearch' format writes to (default: 'metricmancer-metrics')
+        opensearch_batch_mb: Maximum size of one _bulk request in MB (default: 5.0)
         list_hotspots: Whether to display hotspot list after analysis
         hotspot_threshold: Minimum hotspot score to include (default: 50)
         hotspot_output: Optional file to save hotspot list
@@ -39,11 +43,29 @@ class AppConfig:
         review_branch_only: Only include changed files in review strategy
         review_base_branch: Base branch to compare against (default: 'main')
         churn_period: Number of days to analyze for code churn (default: 30)
+        cache_memory_mb: Memory budget in MB for raw git blame data (default: 256, 0 = unbounded)
+        workers: Number of repositories analyzed in parallel (default: 4, 1 = sequential)
+        report_workers: Number of reports generated concurrently (default: 4, 1 = serial)
+        git_timeout: Timeout in seconds per git command (default: 120, 0 = none)
+        git_budget: Total seconds all git commands may take in one run (default: 0 = unlimited)
+        ownership_sample_lines: Files above this many lines get sampled ownership (default: 20000, 0 = never)
+        generated_files: Generated/minified/vendored files: 'skip', 'reduced' (default) or 'analyze'
+        cognitive_languages: Files scored for cognitive complexity: 'python' (default) or 'all'
+        cognitive_time_limit: Seconds one file's cognitive complexity may take (default: 2.0, 0 = no limit)
+        watch: Whether to keep running and re-render reports when scanned files change
+        watch_interval: Seconds between polls in watch mode (default: 0.5)
         delta_review: Whether to generate delta-based review (function-level)
         delta_base_branch: Base branch for delta comparison (default: 'main')
         delta_target_branch: Target branch for delta comparison (None = current)
         delta_output: Output file for delta review (default: 'delta_review.md')
         debug: Whether to show debug output
+        trace_file: Optional path for a Chrome trace-event JSON file of the run
+        profile: Whether to report the slowest files and git commands
+        profile_top: Number of slowest files and git commands to keep (default: 10)
+        profile_output: Optional JSON file for the profile report (implies profile)
+        memory_profile: Whether to record peak memory per pipeline phase
+        memory_threshold_mb: Peak (MB) above which a phase's top allocation sites are listed
+        memory_output: Optional JSON file for the memory profile (default: in report_folder)
     """
 
     # Required fields
@@ -63,6 +85,10 @@ class AppConfig:
     report_folder: str = Defaults.REPORT_FOLDER
     level: str = Defaults.LEVEL
     hierarchical: bool = False
+    html_chunked: bool = False  # HTML shell page + per-directory data chunks
+    opensearch_url: str = Defaults.OPENSEARCH_URL
+    opensearch_index: str = Defaults.OPENSEARCH_INDEX
+    opensearch_batch_mb: float = Defaults.OPENSEARCH_BATCH_MB
 
     # Hotspot analysis settings
     list_hotspots: bool = False
@@ -79,6 +105,29 @@ class AppConfig:
     # Code churn settings
     churn_period: int = Defaults.CHURN_PERIOD
 
+    # Git cache settings
+    cache_memory_mb: int = Defaults.GIT_CACHE_MEMORY_MB
+
+    # Parallel analysis settings
+    workers: int = Defaults.ANALYSIS_WORKERS
+    report_workers: int = Defaults.REPORT_WORKERS
+
+    # Git execution settings
+    git_timeout: float = Defaults.GIT_TIMEOUT_SECONDS
+    git_budget: float = Defaults.GIT_BUDGET_SECONDS
+    ownership_sample_lines: int = Defaults.OWNERSHIP_SAMPLE_MIN_LINES
+
+    # Generated/minified/vendored file handling
+    generated_files: str = Defaults.GENERATED_FILES_MODE
+
+    # Cognitive complexity
+    cognitive_languages: str = Defaults.COGNITIVE_LANGUAGES
+    cognitive_time_limit: float = Defaults.COGNITIVE_TIME_LIMIT_SECONDS
+
+    # Watch mode
+    watch: bool = False
+    watch_interval: float = Defaults.WATCH_INTERVAL_SECONDS
+
     # Delta review settings (function-level analysis)
     delta_review: bool = False
     delta_base_branch: str = Defaults.DELTA_BASE_BRANCH
@@ -88,6 +137,13 @@ class AppConfig:
     # Debug settings
     debug: bool = False
     no_timing: bool = False  # Suppress timing information output
+    trace_file: Optional[str] = None  # Chrome trace-event JSON output (tracing disabled if None)
+    profile: bool = False  # Report slowest files and git commands
+    profile_top: int = Defaults.PROFILE_TOP_K
+    profile_output: Optional[str] = None  # JSON output for the profile (implies profile)
+    memory_profile: bool = False  # Peak memory per pipeline phase (tracemalloc + RSS)
+    memory_threshold_mb: float = Defaults.MEMORY_SITES_THRESHOLD_MB
+    memory_output: Optional[str] = None  # JSON output for the memory profile
 
     def __post_init__(self):
         """
@@ -187,6 +243,10 @@ class AppConfig:
             'report_folder': getattr(args, 'report_folder', None) or Defaults.REPORT_FOLDER,
             'level': args.level,
             'hierarchical': args.hierarchical,
+            'html_chunked': getattr(args, 'html_chunked', False) is True,
+            'opensearch_url': getattr(args, 'opensearch_url', Defaults.OPENSEARCH_URL),
+            'opensearch_index': getattr(args, 'opensearch_index', Defaults.OPENSEARCH_INDEX),
+            'opensearch_batch_mb': getattr(args, 'opensearch_batch_mb', Defaults.OPENSEARCH_BATCH_MB),
         }
 
     @staticmethod
@@ -214,6 +274,17 @@ class AppConfig:
         """Extract code churn settings from CLI args."""
         return {
             'churn_period': getattr(args, 'churn_period', Defaults.CHURN_PERIOD),
+            'cache_memory_mb': getattr(args, 'cache_memory_mb', Defaults.GIT_CACHE_MEMORY_MB),
+            'workers': getattr(args, 'workers', Defaults.ANALYSIS_WORKERS),
+            'report_workers': getattr(args, 'report_workers', Defaults.REPORT_WORKERS),
+            'git_timeout': getattr(args, 'git_timeout', Defaults.GIT_TIMEOUT_SECONDS),
+            'git_budget': getattr(args, 'git_budget', Defaults.GIT_BUDGET_SECONDS),
+            'ownership_sample_lines': getattr(args, 'ownership_sample_lines', Defaults.OWNERSHIP_SAMPLE_MIN_LINES),
+            'generated_files': getattr(args, 'generated_files', Defaults.GENERATED_FILES_MODE),
+            'cognitive_languages': getattr(args, 'cognitive_languages', Defaults.COGNITIVE_LANGUAGES),
+            'cognitive_time_limit': getattr(args, 'cognitive_time_limit', Defaults.COGNITIVE_TIME_LIMIT_SECONDS),
+            'watch': getattr(args, 'watch', False) is True,
+            'watch_interval': getattr(args, 'watch_interval', Defaults.WATCH_INTERVAL_SECONDS),
         }
 
     @staticmethod
@@ -232,6 +303,13 @@ class AppConfig:
         return {
             'debug': getattr(args, 'debug', False),
             'no_timing': getattr(args, 'no_timing', False),
+            'trace_file': getattr(args, 'trace_file', None),
+            'profile': getattr(args, 'profile', False),
+            'profile_top': getattr(args, 'profile_top', Defaults.PROFILE_TOP_K),
+            'profile_output': getattr(args, 'profile_output', None),
+            'memory_profile': getattr(args, 'memory_profile', False),
+            'memory_threshold_mb': getattr(args, 'memory_threshold_mb', Defaults.MEMORY_SITES_THRESHOLD_MB),
+            'memory_output': getattr(args, 'memory_output', None),
         }
 
     @classmethod
@@ -3,11 +3,12 @@
 This module centralizes validation logic to keep AppConfig focused on
 configuration data and construction.
 """
+from urllib.parse import urlsplit
 
 
 VALID_OUTPUT_FORMATS = {
     'summary', 'quick-wins', 'tree',
-    'html', 'json', 'machine',
+    'html', 'json', 'machine', 'opensearch',
     'review-strategy', 'review-strategy-branch'
 }
 
@@ -26,7 +27,18 @@ class ConfigValidator:
         self._validate_directories()
         self._validate_thresholds()
         self._validate_output_formats()
+        self._validate_opensearch()
         self._validate_level()
+        self._validate_cache_memory()
+        self._validate_workers()
+        self._validate_report_workers()
+        self._validate_git_limits()
+        self._validate_ownership_sampling()
+        self._validate_generated_files()
+        self._validate_cognitive_complexity()
+        self._validate_watch_interval()
+        self._validate_profile_top()
+        self._validate_memory_threshold()
 
     def _validate_directories(self) -> None:
         if not getattr(self.cfg, 'directories', None):
@@ -60,6 +72,79 @@ class ConfigValidator:
                 f"Must be one of: {', '.join(sorted(VALID_OUTPUT_FORMATS))}"
             )
 
+    def _validate_opensearch(self) -> None:
+        url = getattr(self.cfg, 'opensearch_url', None)
+        if isinstance(url, str):
+            if not url.startswith(('http://', 'https://')):
+                raise ValueError(f"Invalid opensearch_url '{url}'. Must start with http:// or https://")
+            try:
+                parts = urlsplit(url)
+                parts.port  # Raises ValueError for a non-numeric or out-of-range port
+            except ValueError as e:
+                raise ValueError(f"Invalid opensearch_url '{url}': {e}") from e
+            if not parts.hostname:
+                raise ValueError(f"Invalid opensearch_url '{url}'. Must include a host name")
+        index = getattr(self.cfg, 'opensearch_index', None)
+        if isinstance(index, str) and (not index or index != index.lower()):
+            raise ValueError(f"Invalid opensearch_index '{index}'. Must be a non-empty lowercase name")
+        batch_mb = getattr(self.cfg, 'opensearch_batch_mb', None)
+        if isinstance(batch_mb, (int, float)) and batch_mb <= 0:
+            raise ValueError("opensearch_batch_mb must be positive")
+
+    def _validate_cache_memory(self) -> None:
+        cache_memory_mb = getattr(self.cfg, 'cache_memory_mb', None)
+        if isinstance(cache_memory_mb, int) and cache_memory_mb < 0:
+            raise ValueError("cache_memory_mb must be non-negative (0 = unbounded)")
+
+    def _validate_workers(self) -> None:
+        workers = getattr(self.cfg, 'workers', None)
+        if isinstance(workers, int) and workers < 1:
+            raise ValueError("workers must be at least 1")
+
+    def _validate_report_workers(self) -> None:
+        report_workers = getattr(self.cfg, 'report_workers', None)
+        if isinstance(report_workers, int) and report_workers < 1:
+            raise ValueError("report_workers must be at least 1")
+
+    def _validate_git_limits(self) -> None:
+        for name in ('git_timeout', 'git_budget'):
+            value = getattr(self.cfg, name, None)
+            if isinstance(value, (int, float)) and value < 0:
+                raise ValueError(f"{name} must be non-negative (0 = no limit)")
+
+    def _validate_ownership_sampling(self) -> None:
+        sample_lines = getattr(self.cfg, 'ownership_sample_lines', None)
+        if isinstance(sample_lines, int) and sample_lines < 0:
+            raise ValueError("ownership_sample_lines must be non-negative (0 = always full blame)")
+
+    def _validate_generated_files(self) -> None:
+        mode = getattr(self.cfg, 'generated_files', None)
+        if isinstance(mode, str) and mode not in ('skip', 'reduced', 'analyze'):
+            raise ValueError(f"Invalid generated_files mode '{mode}'. Must be one of: analyze, reduced, skip")
+
+    def _validate_cognitive_complexity(self) -> None:
+        languages = getattr(self.cfg, 'cognitive_languages', None)
+        if isinstance(languages, str) and languages not in ('python', 'all'):
+            raise ValueError(f"Invalid cognitive_languages '{languages}'. Must be one of: all, python")
+        time_limit = getattr(self.cfg, 'cognitive_time_limit', None)
+        if isinstance(time_limit, (int, float)) and time_limit < 0:
+            raise ValueError("cognitive_time_limit must be non-negative (0 = no limit)")
+
+    def _validate_watch_interval(self) -> None:
+        interval = getattr(self.cfg, 'watch_interval', None)
+        if isinstance(interval, (int, float)) and interval <= 0:
+            raise ValueError("watch_interval must be positive")
+
+    def _validate_profile_top(self) -> None:
+        profile_top = getattr(self.cfg, 'profile_top', None)
+        if isinstance(profile_top, int) and profile_top < 1:
+            raise ValueError("profile_top must be at least 1")
+
+    def _validate_memory_threshold(self) -> None:
+        threshold = getattr(self.cfg, 'memory_threshold_mb', None)
+        if isinstance(threshold, (int, float)) and threshold < 0:
+            raise ValueError("memory_threshold_mb must be non-negative")
+
     def _validate_level(self) -> None:
         valid_levels = ('file', 'function')
         level = getattr(self.cfg, 'level', None)
@@ -48,6 +48,36 @@ class Defaults:
     LEVEL: str = "file"
     """Default detail level for reports ('file' or 'function')."""
 
+    TEMPLATE_BYTECODE_CACHE: bool = True
+    """Cache compiled HTML report templates on disk so later runs skip template compilation."""
+
+    TEMPLATE_CACHE_DIR: str = ""
+    """Directory for compiled templates ('' = Jinja's per-user directory in the system temp dir)."""
+
+    HTML_CHUNK_ROWS: int = 1000
+    """Table rows per data chunk of the chunked HTML report (--html-chunked)."""
+
+    HTML_TABLE_PAGE_SIZE: int = 50
+    """Rows per page of the quick-wins and review tables in the chunked HTML report."""
+
+    HTML_TREE_PAGE_SIZE: int = 200
+    """Files listed per directory in the chunked HTML tree before a 'Show more' button."""
+
+    # =========================================================================
+    # OpenSearch Export Settings
+    # =========================================================================
+    OPENSEARCH_URL: str = "http://localhost:9200"
+    """OpenSearch (or Elasticsearch) endpoint of the 'opensearch' output format; may include user:password@."""
+
+    OPENSEARCH_INDEX: str = "metricmancer-metrics"
+    """Index the 'opensearch' output format writes to."""
+
+    OPENSEARCH_BATCH_MB: float = 5.0
+    """Maximum size of one _bulk request body in MB (halved while OpenSearch pushes back)."""
+
+    OPENSEARCH_MAX_RETRIES: int = 5
+    """Retries of a _bulk request that OpenSearch rejected as overloaded or that could not reach it."""
+
     # =========================================================================
     # Hotspot Settings
     # =========================================================================
@@ -69,6 +99,105 @@ class Defaults:
     CHURN_PERIOD: int = 30
     """Number of days to analyze for code churn."""
 
+    CHURN_HISTOGRAM_DAYS: int = 365
+    """History (in days) kept in per-file churn histograms; windows up to this are derived in memory."""
+
+    CHURN_TREND_WINDOWS: tuple = (30, 90, 365)
+    """Churn windows (in days) reported with the churn_acceleration KPI; it compares the first with the last."""
+
+    # =========================================================================
+    # Git Cache Settings
+    # =========================================================================
+    GIT_CACHE_MEMORY_MB: int = 256
+    """Memory budget for raw git blame data; older entries spill to disk beyond this."""
+
+    # =========================================================================
+    # Git Execution Settings
+    # =========================================================================
+    GIT_TIMEOUT_SECONDS: float = 120.0
+    """Timeout for a single git command (0 = no timeout)."""
+
+    GIT_BUDGET_SECONDS: float = 0.0
+    """Total time all git commands of one run may take; later commands are skipped (0 = unlimited)."""
+
+    GIT_CIRCUIT_BREAKER_THRESHOLD: int = 3
+    """Consecutive timeouts of one git subcommand after which further calls to it are skipped."""
+
+    # =========================================================================
+    # Ownership Sampling Settings
+    # =========================================================================
+    OWNERSHIP_SAMPLE_MIN_LINES: int = 20000
+    """Files with more lines get approximate ownership from sampled blame ranges (0 = always full blame)."""
+
+    OWNERSHIP_SAMPLE_RANGES: int = 20
+    """Number of strata (one blamed line range each) for sampled ownership."""
+
+    OWNERSHIP_SAMPLE_RANGE_LINES: int = 100
+    """Lines blamed per stratum for sampled ownership."""
+
+    # =========================================================================
+    # Generated/Vendored File Detection
+    # =========================================================================
+    GENERATED_FILES_MODE: str = 'reduced'
+    """What to do with generated, minified and vendored files: 'skip', 'reduced' (churn only) or 'analyze'."""
+
+    CLASSIFY_MINIFIED_MIN_BYTES: int = 4096
+    """Files smaller than this are never classified as minified."""
+
+    CLASSIFY_MINIFIED_AVG_LINE: int = 250
+    """Average characters per line above which a file is classified as minified."""
+
+    CLASSIFY_MAX_FILE_BYTES: int = 2 * 1024 * 1024
+    """Files larger than this are classified as oversized (amalgamations, dumps; 0 = no limit)."""
+
+    # =========================================================================
+    # Cognitive Complexity Settings
+    # =========================================================================
+    COGNITIVE_LANGUAGES: str = 'python'
+    """Files scored for cognitive complexity: 'python' or 'all' (every language with a calculator)."""
+
+    COGNITIVE_TIME_LIMIT_SECONDS: float = 2.0
+    """Time one file's cognitive complexity may take; slower files get no value (0 = no limit)."""
+
+    # =========================================================================
+    # File Reading Settings
+    # =========================================================================
+    READ_MMAP_MIN_BYTES: int = 1024 * 1024
+    """Files at least this large are memory-mapped instead of read into memory (0 = never mmap)."""
+
+    READ_BINARY_PROBE_BYTES: int = 8192
+    """Leading bytes searched for a NUL byte to detect binary files."""
+
+    # =========================================================================
+    # Watch Mode Settings
+    # =========================================================================
+    WATCH_INTERVAL_SECONDS: float = 0.5
+    """Seconds between polls of the scanned directories for changes in --watch mode."""
+
+    # =========================================================================
+    # Parallel Analysis Settings
+    # =========================================================================
+    ANALYSIS_WORKERS: int = 4
+    """Worker threads shared by all repositories in one analysis run (1 = sequential)."""
+
+    REPORT_WORKERS: int = 4
+    """Reports generated concurrently across formats and repositories (1 = serial)."""
+
+    # =========================================================================
+    # Profiling Settings
+    # =========================================================================
+    PROFILE_TOP_K: int = 10
+    """Number of slowest files and git commands kept by --profile."""
+
+    MEMORY_SITES_THRESHOLD_MB: float = 100.0
+    """Peak traced memory (MB) above which --memory-profile lists a phase's top allocation sites."""
+
+    MEMORY_TOP_SITES: int = 10
+    """Number of allocation sites listed per phase by --memory-profile."""
+
+    MEMORY_OUTPUT: str = "memory_profile.json"
+    """Default --memory-profile JSON file, written to the report folder."""
+
     # =========================================================================
     # Delta Review Settings
     # =========================================================================
@@ -4,3 +4,4 @@ churn package
 Contains KPIs and logic for calculating code churn (change frequency).
 """
 from .kpi import ChurnKPI
+from .acceleration_kpi import ChurnAccelerationKPI
@@ -0,0 +1,46 @@
+import os
+from typing import Sequence
+
+from src.config.defaults import Defaults
+from ..base_kpi import BaseKPI
+
+
+class ChurnAccelerationKPI(BaseKPI):
+    """
+    Ratio of recent churn rate to long-term churn rate for a file.
+
+    Derived in memory from the churn histogram in GitDataCache, so it costs
+    no extra git calls. 1.0 means the file changes at its usual pace, values
+    above 1.0 mean churn is accelerating. calculation_values holds the churn
+    of each trend window (30, 90 and 365 days by default).
+    """
+
+    def __init__(self, value=None, calculation_values=None):
+        super().__init__(
+            name="churn_acceleration",
+            value=value,
+            unit="ratio",
+            description="Recent churn rate divided by long-term churn rate",
+            calculation_values=calculation_values
+        )
+
+    def calculate(self, file_path: str, repo_root: str, short_days: int = 30, long_days: int = 365,
+                  windows: Sequence[int] = Defaults.CHURN_TREND_WINDOWS, **kwargs):
+        from src.utilities.git_cache import get_git_cache
+
+        rel_path = os.path.relpath(file_path, repo_root) if os.path.isabs(file_path) else file_path
+        histogram = get_git_cache().get_churn_histogram(repo_root, rel_path)
+        if histogram is None:
+            self.value = None
+            self.calculation_values = {}
+            return self
+
+        self.value = histogram.acceleration(short_days, long_days)
+        self.calculation_values = {
+            "short_days": short_days,
+            "long_days": long_days,
+            "short_churn": histogram.window(short_days),
+            "long_churn": histogram.window(long_days),
+            "windows": {f"{days}d": histogram.window(days) for days in windows},
+        }
+        return self
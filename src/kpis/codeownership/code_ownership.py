@@ -9,6 +9,10 @@ class CodeOwnershipKPI(BaseKPI):
     Calculates code ownership for a file using git blame.
     Value is a dict: {author: ownership_percent}
     Now uses shared GitDataCache for improved performance.
+
+    For very large files the value is estimated from sampled blame ranges;
+    calculation_values then holds 'approximate': True and per-author
+    confidence 'bounds' (see src/utilities/blame_sampling.py).
     """
 
     def calculate(self, *args, **kwargs):
@@ -29,3 +33,6 @@ class CodeOwnershipKPI(BaseKPI):
         # Convert absolute path to relative path from repo root
         relative_path = os.path.relpath(file_path, repo_root)
         self.value = git_cache.get_ownership_data(repo_root, relative_path)
+        estimate = git_cache.get_ownership_estimate(repo_root, relative_path)
+        if estimate is not None:
+            self.calculation_values = estimate.to_calculation_values()
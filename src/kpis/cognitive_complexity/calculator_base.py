@@ -5,8 +5,13 @@ Defines the interface that all language-specific calculators must implement.
 This enables the Factory Pattern for multi-language support.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
+
+
+class CognitiveComplexityTimeout(Exception):
+    """Raised when scoring a file takes longer than its time limit."""
 
 
 class CognitiveComplexityCalculatorBase(ABC):
@@ -26,6 +31,36 @@ class CognitiveComplexityCalculatorBase(ABC):
     4. Recursion adds +1
     """
 
+    # time.monotonic() value after which check_deadline() gives up (None = no limit)
+    deadline: Optional[float] = None
+
+    def calculate_with_time_limit(self, file_content: str, time_limit: float) -> Dict[str, int]:
+        """
+        Calculate cognitive complexity for all functions in a file, giving up after time_limit seconds.
+
+        Args:
+            file_content: Source code content as string
+            time_limit: Seconds the file may take (0 = no limit)
+
+        Raises:
+            CognitiveComplexityTimeout: If the time limit is exceeded
+        """
+        self.deadline = time.monotonic() + time_limit if time_limit > 0 else None
+        try:
+            return self.calculate_for_file(file_content)
+        finally:
+            self.deadline = None
+
+    def check_deadline(self):
+        """
+        Called by calculate_for_file() before each function it scores.
+
+        Raises:
+            CognitiveComplexityTimeout: If the deadline has passed
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise CognitiveComplexityTimeout(f"{self.get_language_name()} cognitive complexity exceeded its time limit")
+
     @abstractmethod
     def calculate_for_file(self, file_content: str) -> Dict[str, int]:
         """
@@ -10,7 +10,7 @@ https://www.sonarsource.com/docs/CognitiveComplexity.pdf
 
 from typing import Dict, List
 from tree_sitter import Node
-from tree_sitter_language_pack import get_parser
+from src.languages.tree_sitter_support import function_name, parse_tree
 from .calculator_base import CognitiveComplexityCalculatorBase
 
 
@@ -46,7 +46,7 @@ class CCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
     LOGICAL_OPERATORS = {'&&', '||'}
 
     def __init__(self):
-        self.parser = get_parser('c')
+        self.grammar = 'c'
         self.current_function_name = None
 
     def get_language_name(self) -> str:
@@ -72,11 +72,12 @@ class CCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         Raises:
             SyntaxError: If the C code cannot be parsed
         """
-        tree = self.parser.parse(bytes(file_content, 'utf8'))
+        tree = parse_tree(self.grammar, file_content)
         functions = self._find_functions(tree.root_node)
 
         function_complexities = {}
         for func_node in functions:
+            self.check_deadline()
             name = self._get_function_name(func_node)
             complexity = self._calculate_complexity(func_node)
             function_complexities[name] = complexity
@@ -95,16 +96,8 @@ class CCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         return functions
 
     def _get_function_name(self, node: Node) -> str:
-        """Extract function name from function_definition node."""
-        # In C tree-sitter, function_definition has a function_declarator child
-        for child in node.children:
-            if child.type == 'function_declarator':
-                # The identifier is the first child of function_declarator
-                for declarator_child in child.children:
-                    if declarator_child.type == 'identifier':
-                        return declarator_child.text.decode('utf8')
-
-        return 'anonymous'
+        """Extract function name from function_definition node (at the end of its declarator chain)."""
+        return function_name(node)
 
     def _calculate_complexity(self, function_node: Node) -> int:
         """Calculate complexity for a single function."""
@@ -194,3 +187,37 @@ class CCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
             if text in self.LOGICAL_OPERATORS:
                 return text
         return None
+
+
+class CppCognitiveComplexityCalculator(CCognitiveComplexityCalculator):
+    """
+    Calculator for Cognitive Complexity using tree-sitter for C++.
+
+    Uses the C rules on the C++ grammar, plus range-based for loops,
+    catch clauses and lambdas.
+    """
+
+    INCREMENTS = {
+        **CCognitiveComplexityCalculator.INCREMENTS,
+        'for_range_loop': 1,  # for (auto x : items)
+        'catch_clause': 1,
+    }
+
+    NESTING_INCREMENTS = CCognitiveComplexityCalculator.NESTING_INCREMENTS | {
+        'for_range_loop',
+        'catch_clause',
+        'lambda_expression',
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.grammar = 'cpp'
+
+    def get_language_name(self) -> str:
+        """
+        Get the name of the language this calculator supports.
+
+        Returns:
+            str: 'C++'
+        """
+        return 'C++'
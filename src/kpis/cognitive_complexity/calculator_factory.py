@@ -3,16 +3,15 @@ Cognitive Complexity Calculator Factory.
 
 Creates language-specific cognitive complexity calculators based on file extension.
 Implements the Factory Pattern for multi-language support.
+
+Calculator modules are imported on first use for their language, so the
+tree-sitter grammars are only loaded when a file in that language is seen.
 """
 
+import importlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Type
 from .calculator_base import CognitiveComplexityCalculatorBase
-from .calculator_python import PythonCognitiveComplexityCalculator
-from .calculator_java import JavaCognitiveComplexityCalculator
-from .calculator_go import GoCognitiveComplexityCalculator
-from .calculator_javascript import JavaScriptCognitiveComplexityCalculator
-from .calculator_typescript import TypeScriptCognitiveComplexityCalculator
 
 
 class CognitiveComplexityCalculatorFactory:
@@ -22,22 +21,52 @@ class CognitiveComplexityCalculatorFactory:
     Uses file extension to determine which calculator to instantiate.
     """
 
-    # Map file extensions to calculator classes
+    # Map file extensions to calculator classes as (module, class name),
+    # resolved lazily by get_calculator_class()
     # Will be expanded as new language calculators are implemented
     CALCULATORS = {
-        '.py': PythonCognitiveComplexityCalculator,
-        '.java': JavaCognitiveComplexityCalculator,
-        '.go': GoCognitiveComplexityCalculator,
-        '.js': JavaScriptCognitiveComplexityCalculator,
-        '.jsx': JavaScriptCognitiveComplexityCalculator,
-        '.ts': TypeScriptCognitiveComplexityCalculator,
-        '.tsx': TypeScriptCognitiveComplexityCalculator,
+        '.py': ('calculator_python', 'PythonCognitiveComplexityCalculator'),
+        '.java': ('calculator_java', 'JavaCognitiveComplexityCalculator'),
+        '.go': ('calculator_go', 'GoCognitiveComplexityCalculator'),
+        '.js': ('calculator_javascript', 'JavaScriptCognitiveComplexityCalculator'),
+        '.jsx': ('calculator_javascript', 'JavaScriptCognitiveComplexityCalculator'),
+        '.ts': ('calculator_typescript', 'TypeScriptCognitiveComplexityCalculator'),
+        '.tsx': ('calculator_typescript', 'TSXCognitiveComplexityCalculator'),
+        '.c': ('calculator_c', 'CCognitiveComplexityCalculator'),
+        '.cpp': ('calculator_c', 'CppCognitiveComplexityCalculator'),
         # Future additions:
         # '.adb': AdaCognitiveComplexityCalculator,  # Requires custom tree-sitter build
         # '.ads': AdaCognitiveComplexityCalculator,  # Requires custom tree-sitter build
         # ... etc
     }
 
+    # Calculator classes already imported, by extension
+    _loaded = {}
+
+    @classmethod
+    def get_calculator_class(cls, ext: str) -> Optional[Type[CognitiveComplexityCalculatorBase]]:
+        """
+        Return the calculator class for a file extension, importing its module on first use.
+
+        Args:
+            ext: Lowercase file extension including the dot (e.g. '.java')
+
+        Returns:
+            Calculator class or None if the extension is not supported
+        """
+        if ext in cls._loaded:
+            return cls._loaded[ext]
+
+        spec = cls.CALCULATORS.get(ext)
+        if spec is None:
+            return None
+
+        module_name, class_name = spec
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        calculator_class = getattr(module, class_name)
+        cls._loaded[ext] = calculator_class
+        return calculator_class
+
     @classmethod
     def create(cls, file_path: str) -> Optional[CognitiveComplexityCalculatorBase]:
         """
@@ -60,8 +89,8 @@ class CognitiveComplexityCalculatorFactory:
         # Get file extension (lowercase for case-insensitive matching)
         ext = Path(file_path).suffix.lower()
 
-        # Get calculator class for this extension
-        calculator_class = cls.CALCULATORS.get(ext)
+        # Get calculator class for this extension (imports the module on first use)
+        calculator_class = cls.get_calculator_class(ext)
 
         if calculator_class:
             return calculator_class()
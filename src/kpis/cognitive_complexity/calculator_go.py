@@ -10,7 +10,7 @@ https://www.sonarsource.com/docs/CognitiveComplexity.pdf
 
 from typing import Dict, List
 from tree_sitter import Node
-from tree_sitter_language_pack import get_parser
+from src.languages.tree_sitter_support import function_name, parse_tree
 from .calculator_base import CognitiveComplexityCalculatorBase
 
 
@@ -49,7 +49,7 @@ class GoCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
     LOGICAL_OPERATORS = {'&&', '||'}
 
     def __init__(self):
-        self.parser = get_parser('go')
+        self.grammar = 'go'
         self.current_function_name = None
 
     def get_language_name(self) -> str:
@@ -75,11 +75,12 @@ class GoCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         Raises:
             SyntaxError: If the Go code cannot be parsed
         """
-        tree = self.parser.parse(bytes(file_content, 'utf8'))
+        tree = parse_tree(self.grammar, file_content)
         functions = self._find_functions(tree.root_node)
 
         function_complexities = {}
         for func_node in functions:
+            self.check_deadline()
             name = self._get_function_name(func_node)
             complexity = self._calculate_complexity(func_node)
             function_complexities[name] = complexity
@@ -99,14 +100,8 @@ class GoCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         return functions
 
     def _get_function_name(self, node: Node) -> str:
-        """Extract function name from node."""
-        # For function_declaration and method_declaration,
-        # the name is in an 'identifier' child node
-        for child in node.children:
-            if child.type == 'identifier':
-                return child.text.decode('utf8')
-
-        return 'anonymous'
+        """Extract function name from node (identifier, or field_identifier for methods)."""
+        return function_name(node)
 
     def _calculate_complexity(self, function_node: Node) -> int:
         """Calculate complexity for a single function."""
@@ -10,7 +10,7 @@ https://www.sonarsource.com/docs/CognitiveComplexity.pdf
 
 from typing import Dict, List
 from tree_sitter import Node
-from tree_sitter_language_pack import get_parser
+from src.languages.tree_sitter_support import parse_tree
 from .calculator_base import CognitiveComplexityCalculatorBase
 
 
@@ -52,7 +52,7 @@ class JavaCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
     LOGICAL_OPERATORS = {'&&', '||'}
 
     def __init__(self):
-        self.parser = get_parser('java')
+        self.grammar = 'java'
         self.current_method_name = None
 
     def get_language_name(self) -> str:
@@ -78,11 +78,12 @@ class JavaCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         Raises:
             SyntaxError: If the Java code cannot be parsed
         """
-        tree = self.parser.parse(bytes(file_content, 'utf8'))
+        tree = parse_tree(self.grammar, file_content)
         methods = self._find_methods(tree.root_node)
 
         method_complexities = {}
         for method_node in methods:
+            self.check_deadline()
             name = self._get_method_name(method_node)
             complexity = self._calculate_complexity(method_node)
             method_complexities[name] = complexity
@@ -9,9 +9,26 @@ https://www.sonarsource.com/docs/CognitiveComplexity.pdf
 """
 
 import ast
-from typing import Dict
+from typing import Callable, Dict, List, Optional
 from .calculator_base import CognitiveComplexityCalculatorBase
 
+# How _ModuleVisitor treats a node, mirroring calculate_with_nesting():
+_COUNTED = 0    # increments count for the enclosing functions
+_BOOL_TEST = 1  # 'if' condition: only boolean operator sequences count
+_SKIPPED = 2    # not scored (loop headers and else, try body/else/finally); only searched for functions
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Nodes _ModuleVisitor does not treat as generic code inside a function
+_SPECIAL_NODES = frozenset(_FUNCTION_NODES + (ast.ClassDef, ast.If, ast.For, ast.While, ast.Try, ast.IfExp, ast.BoolOp))
+
+# Nodes without children that matter for cognitive complexity; never queued
+_LEAF_NODES = frozenset(
+    [ast.Name, ast.Constant, ast.alias] +
+    [cls for base in (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+     for cls in base.__subclasses__()]
+)
+
 
 class PythonCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
     """
@@ -36,26 +53,22 @@ class PythonCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
         """
         Calculate cognitive complexity for all functions in a Python file.
 
+        All functions (including async ones) are scored in one pass over the
+        module by _ModuleVisitor, with the same per-function scores as
+        calculate_for_function(). Code in nested functions counts towards
+        every enclosing function as well, as it always has.
+
         Args:
             file_content: Python source code as string
 
         Returns:
-            Dict mapping function names to their complexity values
-            Example: {'main': 5, 'helper': 3, 'process_data': 12}
+            Dict mapping qualified function names to their complexity values
+            Example: {'main': 5, 'Parser.parse': 3, 'main.<locals>.helper': 12}
 
         Raises:
             SyntaxError: If the Python code cannot be parsed
         """
-        tree = ast.parse(file_content)
-        function_complexities = {}
-
-        # Calculate for each function in the file
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_complexity = self.calculate_for_function(node)
-                function_complexities[node.name] = func_complexity
-
-        return function_complexities
+        return _ModuleVisitor(self.check_deadline).visit(ast.parse(file_content))
 
     def calculate_for_function(self, function_node: ast.FunctionDef) -> int:
         """
@@ -208,3 +221,193 @@ class PythonCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase):
                 complexity += self.calculate_with_nesting(child, nesting)
 
         return complexity
+
+
+def _children(node: ast.AST, *skip_fields: str) -> List[ast.AST]:
+    """Child nodes of node in source order, leaving out leaves and the given fields (e.g. 'body')."""
+    children = []
+    for name in node._fields:
+        if name in skip_fields:
+            continue
+        value = getattr(node, name, None)
+        if type(value) is list:
+            for item in value:
+                if isinstance(item, ast.AST) and type(item) not in _LEAF_NODES:
+                    children.append(item)
+        elif isinstance(value, ast.AST) and type(value) not in _LEAF_NODES:
+            children.append(value)
+    return children
+
+
+def _reversed_children(node: ast.AST, *skip_fields: str) -> List[ast.AST]:
+    """Child nodes in reverse source order, for pushing onto the visitor's stack."""
+    children = _children(node, *skip_fields)
+    children.reverse()
+    return children
+
+
+class _FunctionScore:
+    """Running score of one function while _ModuleVisitor is inside it."""
+
+    __slots__ = ('name', 'qualname', 'parent', 'counted', 'depth', 'structures', 'structure_points',
+                 'flat_points', 'recursions')
+
+    def __init__(self, name: str, qualname: str, parent: Optional['_FunctionScore'], counted: bool, depth: int):
+        self.name = name
+        self.qualname = qualname
+        self.parent = parent
+        # Whether the def is in a part of the parent that the parent's score includes
+        self.counted = counted
+        # Nesting level of the def within the parent
+        self.depth = depth
+        # Nesting-dependent increments (+1 + nesting): how many, and their points
+        self.structures = 0
+        self.structure_points = 0
+        # Boolean operator sequences (+1 each)
+        self.flat_points = 0
+        # Recursive calls (+1 each)
+        self.recursions = 0
+
+    def total(self) -> int:
+        return self.structure_points + self.flat_points + self.recursions
+
+    def add_nested(self, nested: '_FunctionScore'):
+        """Add a finished nested function's points, shifted by the nesting level of its def."""
+        self.structures += nested.structures
+        self.structure_points += nested.structure_points + nested.depth * nested.structures
+        self.flat_points += nested.flat_points
+
+
+class _ModuleVisitor:
+    """
+    Scores every function of a module in a single iterative pass.
+
+    calculate_for_file() used to run calculate_for_function() for each
+    function found by ast.walk(), so code in nested functions and lambdas
+    was traversed once per enclosing function, and deep nesting could hit
+    the recursion limit. The visitor walks each node once with an explicit
+    stack, attributes each increment to the innermost function and adds a
+    nested function's points to its parent when the nested function ends.
+    A nested function's increments count towards the parent at the nesting
+    level of its def, so the parent's score equals calculate_for_function().
+    Recursive calls are counted directly for every enclosing function of
+    that name.
+    """
+
+    def __init__(self, check_deadline: Optional[Callable[[], None]] = None):
+        self.scores: Dict[str, int] = {}
+        # Enclosing functions by name, for recursion checks
+        self._open_by_name: Dict[str, int] = {}
+        # Called as each function is entered; raises when the file's time limit is exceeded
+        self._check_deadline = check_deadline
+
+    def visit(self, tree: ast.AST) -> Dict[str, int]:
+        """Return {qualified function name: cognitive complexity} for a parsed module."""
+        # Work items: (node, nesting, mode, function, qualname prefix); a bare
+        # _FunctionScore marks the end of that function's body
+        stack: List = [(tree, 0, _SKIPPED, None, '')]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            item = pop()
+            if type(item) is _FunctionScore:
+                self._finish(item)
+                continue
+            node, nesting, mode, function, prefix = item
+            node_type = type(node)
+            if mode == _COUNTED and node_type not in _SPECIAL_NODES:
+                # Most nodes: no increment of their own, children at the same nesting
+                if node_type is ast.Call and type(node.func) is ast.Name and self._open_by_name.get(node.func.id):
+                    self._count_recursion(function, node.func.id)
+                for child in _reversed_children(node):
+                    push((child, nesting, _COUNTED, function, prefix))
+            elif mode == _BOOL_TEST:
+                if node_type is ast.BoolOp:
+                    function.flat_points += 1
+                else:
+                    for child in _reversed_children(node):
+                        push((child, nesting, _BOOL_TEST, function, prefix))
+            elif node_type in _FUNCTION_NODES:
+                self._enter_function(stack, node, nesting, mode, function, prefix)
+            elif node_type is ast.ClassDef:
+                class_prefix = f"{prefix}{node.name}."
+                for child in _reversed_children(node):
+                    push((child, nesting, mode, function, class_prefix))
+            elif mode == _SKIPPED:
+                for child in _reversed_children(node):
+                    push((child, nesting, _SKIPPED, function, prefix))
+            else:
+                self._visit_structure(stack, node, nesting, function, prefix)
+        return self.scores
+
+    def _enter_function(self, stack: List, node: ast.AST, nesting: int, mode: int,
+                        function: Optional[_FunctionScore], prefix: str):
+        """Open a function: its body is scored on its own, decorators and arguments belong to the parent."""
+        if self._check_deadline is not None:
+            self._check_deadline()
+        qualname = f"{prefix}{node.name}"
+        nested = _FunctionScore(node.name, qualname, function, function is not None and mode == _COUNTED, nesting)
+        self._open_by_name[node.name] = self._open_by_name.get(node.name, 0) + 1
+        # Reserve the slot so scores are listed in source order
+        self.scores.setdefault(qualname, 0)
+        stack.append(nested)
+        body_prefix = f"{qualname}.<locals>."
+        stack.extend((child, 0, _COUNTED, nested, body_prefix) for child in reversed(node.body))
+        stack.extend((child, nesting, mode, function, prefix) for child in _reversed_children(node, 'body'))
+
+    def _finish(self, function: _FunctionScore):
+        """Record a function whose body has been visited and pass its points to the parent."""
+        self._open_by_name[function.name] -= 1
+        # A later definition with the same qualified name replaces the earlier one
+        self.scores[function.qualname] = function.total()
+        if function.counted:
+            function.parent.add_nested(function)
+
+    def _count_recursion(self, function: _FunctionScore, name: str):
+        """Count a call to name for each enclosing function of that name whose score includes the call."""
+        while function is not None:
+            if function.name == name:
+                function.recursions += 1
+            if not function.counted:
+                break
+            function = function.parent
+
+    def _visit_structure(self, stack: List, node: ast.AST, nesting: int, function: _FunctionScore, prefix: str):
+        """Score an if/loop/try/ternary/boolean operator in a counted part of a function and queue its parts."""
+        def push(children, child_nesting, mode=_COUNTED):
+            # Pushed in reverse, so children are visited in source order
+            stack.extend((child, child_nesting, mode, function, prefix) for child in reversed(children))
+
+        def increment():
+            function.structures += 1
+            function.structure_points += 1 + nesting
+
+        if isinstance(node, ast.If):
+            increment()
+            if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+                # elif: scored as an 'if' at the same nesting
+                push(node.orelse, nesting)
+            elif node.orelse:
+                increment()
+                push(node.orelse, nesting + 1)
+            push(node.body, nesting + 1)
+            push([node.test], nesting, _BOOL_TEST)
+        elif isinstance(node, (ast.For, ast.While)):
+            increment()
+            push(node.orelse, nesting, _SKIPPED)
+            push(node.body, nesting + 1)
+            push(_children(node, 'body', 'orelse'), nesting, _SKIPPED)
+        elif isinstance(node, ast.Try):
+            push(node.orelse + node.finalbody, nesting, _SKIPPED)
+            for handler in reversed(node.handlers):
+                increment()
+                push(handler.body, nesting + 1)
+                push(_children(handler, 'body'), nesting, _SKIPPED)
+            push(node.body, nesting, _SKIPPED)
+        elif isinstance(node, ast.IfExp):
+            increment()
+            push([node.body, node.test, node.orelse], nesting + 1)
+        else:
+            # ast.BoolOp
+            function.flat_points += 1
+            push(node.values, nesting)
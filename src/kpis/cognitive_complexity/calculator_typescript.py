@@ -10,7 +10,7 @@ https://www.sonarsource.com/docs/CognitiveComplexity.pdf
 
 from typing import Dict, List
 from tree_sitter import Node
-from tree_sitter_language_pack import get_parser
+from src.languages.tree_sitter_support import parse_tree
 from .calculator_base import CognitiveComplexityCalculatorBase
 
 
@@ -55,7 +55,7 @@ class TypeScriptCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase)
     LOGICAL_OPERATORS = {'&&', '||'}
 
     def __init__(self):
-        self.parser = get_parser('typescript')
+        self.grammar = 'typescript'
         self.current_function_name = None
 
     def get_language_name(self) -> str:
@@ -81,11 +81,12 @@ class TypeScriptCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase)
         Raises:
             SyntaxError: If the TypeScript code cannot be parsed
         """
-        tree = self.parser.parse(bytes(file_content, 'utf8'))
+        tree = parse_tree(self.grammar, file_content)
         functions = self._find_functions(tree.root_node)
 
         function_complexities = {}
         for func_node in functions:
+            self.check_deadline()
             name = self._get_function_name(func_node)
             complexity = self._calculate_complexity(func_node)
             function_complexities[name] = complexity
@@ -242,3 +243,16 @@ class TypeScriptCognitiveComplexityCalculator(CognitiveComplexityCalculatorBase)
             if text in self.LOGICAL_OPERATORS:
                 return text
         return None
+
+
+class TSXCognitiveComplexityCalculator(TypeScriptCognitiveComplexityCalculator):
+    """
+    Calculator for Cognitive Complexity of TSX files.
+
+    Same rules as TypeScript, on the TSX grammar (the TypeScript grammar does
+    not parse JSX elements), so the tree is shared with the cyclomatic parser.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.grammar = 'tsx'
@@ -17,6 +17,7 @@ Key principles:
 import ast
 from typing import Dict, Optional
 from ..base_kpi import BaseKPI
+from src.utilities.debug import debug_print
 
 
 class CognitiveComplexityCalculator:
@@ -208,17 +209,19 @@ class CognitiveComplexityKPI(BaseKPI):
             calculation_values=calculation_values or {}
         )
 
-    def calculate(self, file_path: str, file_content: str) -> 'CognitiveComplexityKPI':
+    def calculate(self, file_path: str, file_content: str, time_limit: float = 0.0) -> 'CognitiveComplexityKPI':
         """
         Calculate cognitive complexity using language-specific calculator (via factory).
 
         Args:
             file_path: Path to the file (used to determine language)
             file_content: Source code content
+            time_limit: Seconds the file may take; slower files get no value (0 = no limit)
 
         Returns:
             self: CognitiveComplexityKPI instance with calculated values
         """
+        from .calculator_base import CognitiveComplexityTimeout
         from .calculator_factory import CognitiveComplexityCalculatorFactory
 
         # Use factory to get appropriate calculator for this file
@@ -232,7 +235,7 @@ class CognitiveComplexityKPI(BaseKPI):
 
         try:
             # Calculate per-function complexity
-            function_complexities = calculator.calculate_for_file(file_content)
+            function_complexities = calculator.calculate_with_time_limit(file_content, time_limit)
 
             # Aggregate to file level
             if function_complexities:
@@ -245,6 +248,12 @@ class CognitiveComplexityKPI(BaseKPI):
 
             return self
 
+        except CognitiveComplexityTimeout:
+            debug_print(f"[DEBUG] Cognitive complexity of {file_path} skipped: took longer than {time_limit} s")
+            self.value = None
+            self.calculation_values = {}
+            return self
+
         except Exception:
             # Handle parsing errors gracefully (e.g., SyntaxError)
             self.value = None
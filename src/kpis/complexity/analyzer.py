@@ -1,5 +1,6 @@
 from typing import List, Dict, Any
 import importlib
+import threading
 
 
 class ComplexityAnalyzer:
@@ -7,6 +8,50 @@ class ComplexityAnalyzer:
     A class dedicated to calculating complexity for file content.
     """
 
+    def __init__(self):
+        # Parsers by (parser class, grammar), one set per thread: the tree-sitter parser
+        # memoizes the tree of the last file, which the next call for that file reuses
+        self._parsers = threading.local()
+
+    def _load_parser(self, config: dict):
+        """
+        Return the complexity parser for a language configuration.
+
+        The parser is created on first use and reused for later calls on the
+        same thread, so the prefilter, function analysis and file complexity
+        of one file share one parser (and one tree-sitter parse).
+
+        Raises:
+            ImportError, AttributeError: If the regex parser cannot be loaded
+        """
+        key = (config['parser'], config.get('grammar'))
+        parsers = self._parsers.__dict__
+        parser = parsers.get(key)
+        if parser is None:
+            parser = parsers[key] = self._create_parser(config)
+        return parser
+
+    @staticmethod
+    def _create_parser(config: dict):
+        """
+        Create the complexity parser for a language configuration.
+
+        Languages with a 'grammar' get the tree-sitter parser, with the regex
+        parser named by 'parser' as its fallback. The regex parser is used alone
+        if tree-sitter is not installed.
+        """
+        parser_class_name = config['parser']
+        module_name = parser_class_name.replace('ComplexityParser', '').lower()
+        imported_module = importlib.import_module(f"src.languages.parsers.{module_name}")
+        parser = getattr(imported_module, parser_class_name)()
+        if config.get('grammar'):
+            try:
+                from src.languages.parsers.tree_sitter_parser import TreeSitterComplexityParser
+                return TreeSitterComplexityParser(config['grammar'], parser)
+            except (ImportError, LookupError):
+                pass
+        return parser
+
     def calculate_for_file(self, file_content: str, config: dict) -> tuple[int, int]:
         """
         Calculates cyclomatic complexity and number of functions for a given file content.
@@ -23,12 +68,7 @@ class ComplexityAnalyzer:
 
         if 'parser' in config:
             try:
-                parser_class_name = config['parser']
-                module_name = parser_class_name.replace('ComplexityParser', '').lower()
-                parser_module = f"src.languages.parsers.{module_name}"
-                imported_module = importlib.import_module(parser_module)
-                parser_class = getattr(imported_module, parser_class_name)
-                parser = parser_class()
+                parser = self._load_parser(config)
                 complexity = parser.compute_complexity(file_content)
                 function_count = getattr(parser, 'count_functions', lambda code: 0)(file_content)
             except (ImportError, AttributeError) as e:
@@ -51,14 +91,28 @@ class ComplexityAnalyzer:
         functions = []
         if 'parser' in config:
             try:
-                parser_class_name = config['parser']
-                module_name = parser_class_name.replace('ComplexityParser', '').lower()
-                parser_module = f"src.languages.parsers.{module_name}"
-                imported_module = importlib.import_module(parser_module)
-                parser_class = getattr(imported_module, parser_class_name)
-                parser = parser_class()
+                parser = self._load_parser(config)
                 functions = getattr(parser, 'analyze_functions', lambda code: [])(file_content)
             except (ImportError, AttributeError) as e:
                 print(f"[WARN] Could not load parser for function analysis: {config.get('name')}. Error: {e}")
 
         return functions
+
+    def may_contain_functions(self, data, config: dict) -> bool:
+        """
+        Byte-level prefilter run before a file is decoded (see ComplexityParser.may_contain_functions).
+
+        Args:
+            data: Raw file content (bytes or a read-only mmap)
+            config: A dictionary with language configuration, including parser.
+
+        Returns:
+            False only if analyze_functions() cannot find a function in the file.
+            True if in doubt (no parser configured, parser cannot be loaded).
+        """
+        if 'parser' not in config:
+            return True
+        try:
+            return self._load_parser(config).may_contain_functions(data)
+        except (ImportError, AttributeError):
+            return True
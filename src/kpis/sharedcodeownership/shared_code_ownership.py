@@ -1,5 +1,6 @@
 from src.kpis.base_kpi import BaseKPI
 from src.kpis.codeownership.code_ownership import CodeOwnershipKPI
+from src.utilities.blame_sampling import uncertain_authors
 from typing import Mapping, Optional, Union, List, Dict
 
 
@@ -25,8 +26,15 @@ class SharedOwnershipKPI(BaseKPI):
         if ownership_data is not None:
             self.value = self.calculate_shared_ownership(ownership_data)
         else:
-            ownership = CodeOwnershipKPI(file_path, repo_root).value
-            self.value = self.calculate_shared_ownership(ownership)
+            ownership_kpi = CodeOwnershipKPI(file_path, repo_root)
+            self.value = self.calculate_shared_ownership(ownership_kpi.value)
+            if ownership_kpi.calculation_values.get('approximate'):
+                # Thresholds apply to the estimates; flag authors the estimate cannot place reliably
+                bounds = ownership_kpi.calculation_values.get('bounds', {})
+                self.calculation_values = {
+                    'approximate': True,
+                    'uncertain_authors': uncertain_authors(bounds, self.threshold),
+                }
 
     def calculate_shared_ownership(
             self, ownership: Mapping[str, Union[float, str]]) -> Mapping[str, Union[float, str, int, List[str]]]:
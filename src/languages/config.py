@@ -1,22 +1,29 @@
 """
 Defines supported programming languages and their associated complexity parser classes.
+
+Languages with a 'grammar' (a tree-sitter-language-pack grammar name) get their
+cyclomatic complexity from the tree-sitter parser; the regex parser is the fallback.
 """
 LANGUAGES = {
     '.js': {
         'name': 'JavaScript',
-        'parser': 'JavaScriptComplexityParser'
+        'parser': 'JavaScriptComplexityParser',
+        'grammar': 'javascript'
     },
     '.jsx': {
         'name': 'JavaScript (JSX)',
-        'parser': 'JavaScriptComplexityParser'
+        'parser': 'JavaScriptComplexityParser',
+        'grammar': 'javascript'
     },
     '.ts': {
         'name': 'TypeScript',
-        'parser': 'TypeScriptComplexityParser'
+        'parser': 'TypeScriptComplexityParser',
+        'grammar': 'typescript'
     },
     '.tsx': {
         'name': 'TypeScript (TSX)',
-        'parser': 'TypeScriptComplexityParser'
+        'parser': 'TypeScriptComplexityParser',
+        'grammar': 'tsx'
     },
     '.py': {
         'name': 'Python',
@@ -24,23 +31,28 @@ LANGUAGES = {
     },
     '.java': {
         'name': 'Java',
-        'parser': 'JavaComplexityParser'
+        'parser': 'JavaComplexityParser',
+        'grammar': 'java'
     },
     '.cs': {
         'name': 'C#',
-        'parser': 'CSharpComplexityParser'
+        'parser': 'CSharpComplexityParser',
+        'grammar': 'csharp'
     },
     '.c': {
         'name': 'C',
-        'parser': 'CComplexityParser'
+        'parser': 'CComplexityParser',
+        'grammar': 'c'
     },
     '.cpp': {
         'name': 'C++',
-        'parser': 'CppComplexityParser'
+        'parser': 'CppComplexityParser',
+        'grammar': 'cpp'
     },
     '.go': {
         'name': 'Go',
-        'parser': 'GoComplexityParser'
+        'parser': 'GoComplexityParser',
+        'grammar': 'go'
     },
     '.adb': {
         'name': 'Ada',
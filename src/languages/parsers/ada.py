@@ -24,3 +24,4 @@ class AdaComplexityParser(ComplexityParser):
     # - '\w+' matches return type
     # - '\s+is\b' matches is keyword
     FUNCTION_PATTERN = r'\bfunction\s+([a-zA-Z_]\w*)(?:\s*\([^)]*\))?\s+return\s+\w+\s+is\b'
+    PREFILTER = (b'function', b'return')
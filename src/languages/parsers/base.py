@@ -7,6 +7,10 @@ class ComplexityParser(ABC):
     Abstract base class for complexity parsers for different programming languages.
     Subclasses must implement compute_complexity().
     """
+    # Byte strings that all occur in any file analyze_functions() finds a function in.
+    # Checked on the raw bytes before a file is decoded (see may_contain_functions()).
+    PREFILTER: tuple = ()
+
     @abstractmethod
     def compute_complexity(self, code: str) -> int:
         """
@@ -48,3 +52,19 @@ class ComplexityParser(ABC):
         if pattern:
             return len(re.findall(pattern, code))
         return 0
+
+    def may_contain_functions(self, data) -> bool:
+        """
+        Cheap byte-level check whether analyze_functions() can find anything in a file.
+
+        Returns False if the parser has no FUNCTION_PATTERN (and does not
+        override analyze_functions()), or if one of the PREFILTER byte strings
+        is missing, so the file need not be decoded and parsed.
+
+        Args:
+            data: Raw file content (bytes or a read-only mmap)
+        """
+        if type(self).analyze_functions is ComplexityParser.analyze_functions \
+                and not getattr(self, 'FUNCTION_PATTERN', None):
+            return False
+        return all(data.find(token) != -1 for token in self.PREFILTER)
@@ -32,3 +32,4 @@ class CComplexityParser(ComplexityParser):
     # - '[^)]*' matches parameters
     # - '\)\s*\{' matches closing parenthesis and opening brace
     FUNCTION_PATTERN = r'\b(?:\w+\s+)*([a-zA-Z_]\w*)\s*\([^)]*\)\s*\{'
+    PREFILTER = (b'(', b'{')
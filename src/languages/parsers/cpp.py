@@ -40,3 +40,4 @@ class CppComplexityParser(ComplexityParser):
         r'(?:template<[^>]+>\s+)?(?:\b\w+\s+)+(?:\w+::)*([a-zA-Z_]\w*)\s*'
         r'\([^)]*\)(?:\s+(?:const|override|final|noexcept))*\s*\{'
     )
+    PREFILTER = (b'(', b'{')
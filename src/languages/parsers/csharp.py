@@ -40,3 +40,4 @@ class CSharpComplexityParser(ComplexityParser):
         r'(?:\w+(?:<[^>]+>)?)+\s+([a-zA-Z_]\w*)\s*\([^)]*\)'
         r'(?:\s+where\s+[^{]+)?\s*\{'
     )
+    PREFILTER = (b'(', b'{')
@@ -35,3 +35,4 @@ class GoComplexityParser(ComplexityParser):
     # - '(?:\s+[^{]+)?' optionally matches return type(s)
     # - '\s*\{' matches opening brace
     FUNCTION_PATTERN = r'func\s+(?:\([^)]*\)\s+)?([a-zA-Z_]\w*)\s*\([^)]*\)(?:\s+[^{]+)?\s*\{'
+    PREFILTER = (b'func',)
@@ -165,3 +165,4 @@ class IDLComplexityParser(ComplexityParser):
     # Pattern for matching function/operation definitions
     # Used by base class if needed
     FUNCTION_PATTERN = r'\b\w+\s+(\w+)\s*\([^)]*\)\s*;'
+    PREFILTER = (b'(', b';')
@@ -40,3 +40,4 @@ class JavaComplexityParser(ComplexityParser):
         r'(?:\w+(?:<[^>]+>)?)+\s+([a-zA-Z_]\w*)\s*\([^)]*\)'
         r'(?:\s+throws\s+[^{]+)?\s*\{'
     )
+    PREFILTER = (b'(', b'{')
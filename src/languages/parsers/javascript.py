@@ -32,3 +32,4 @@ class JavaScriptComplexityParser(ComplexityParser):
     # - '[^)]*' matches parameters (stops at ))
     # - '\)\s*\{' matches closing parenthesis and opening brace
     FUNCTION_PATTERN = r'(?:async\s+)?function\s+([a-zA-Z_]\w*)\s*\([^)]*\)\s*\{'
+    PREFILTER = (b'function',)
@@ -201,6 +201,8 @@ class ShellComplexityParser(ComplexityParser):
     - Logical operators (&&, ||)
     """
 
+    PREFILTER = (b'(', b'{')
+
     def compute_complexity(self, code: str) -> int:
         """Calculate cyclomatic complexity for shell script."""
         if not code.strip():
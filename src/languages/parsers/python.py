@@ -30,3 +30,4 @@ class PythonComplexityParser(ComplexityParser):
     # - '(?:->\s*[^:]+)?' optionally matches return type hint (-> Type)
     # - ':' matches the colon ending the function signature
     FUNCTION_PATTERN = r'def\s+([a-zA-Z_]\w*)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:'
+    PREFILTER = (b'def',)
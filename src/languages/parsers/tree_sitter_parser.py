@@ -0,0 +1,176 @@
+"""
+Cyclomatic complexity from tree-sitter syntax trees.
+
+Used instead of the regex parser for languages with a 'grammar' in
+src/languages/config.py. Function spans and decision points come from one
+query over the parsed tree, so keywords in strings and comments are not
+counted and function boundaries are the real ones. The tree is shared with
+the cognitive complexity calculators (see src/languages/tree_sitter_support.py).
+
+The decision points mirror the CONTROL_KEYWORDS of the language's regex
+parser, so the numbers stay comparable with earlier reports.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from tree_sitter import Query, QueryCursor
+from tree_sitter_language_pack import get_language
+
+from src.languages.parsers.base import ComplexityParser
+from src.languages.tree_sitter_support import function_name, parse_tree
+from src.utilities.debug import debug_print
+
+# && and || only as operators (not e.g. C++ rvalue references)
+_LOGICAL = '(binary_expression ["&&" "||"] @decision)'
+_ELSE_IF = '(else_clause "else" @decision . (if_statement))'
+_JS_DECISIONS = '["if" "for" "while" "switch" "case" "catch" "throw" "return"] @decision ' + _ELSE_IF
+_JS_FUNCTIONS = (
+    '[(function_declaration) (generator_function_declaration) (method_definition)] @function '
+    '(variable_declarator value: [(arrow_function) (function_expression)]) @function '
+)
+_C_DECISIONS = (
+    '["if" "for" "while" "do" "switch" "case" "break" "continue" "goto" "return"] @decision '
+    '(case_statement "default" @decision) ' + _ELSE_IF
+)
+
+# grammar -> (functions query, decisions query, PREFILTER)
+_LANGUAGES: Dict[str, Tuple[str, str, tuple]] = {
+    'java': (
+        '[(method_declaration) (constructor_declaration)] @function',
+        '["if" "else" "for" "while" "switch" "case" "catch" "throw" "return"] @decision',
+        (b'(', b'{'),
+    ),
+    'javascript': (
+        _JS_FUNCTIONS + '(field_definition value: [(arrow_function) (function_expression)]) @function',
+        _JS_DECISIONS,
+        (b'(',),
+    ),
+    'typescript': (
+        _JS_FUNCTIONS + '(public_field_definition value: [(arrow_function) (function_expression)]) @function',
+        _JS_DECISIONS,
+        (b'(',),
+    ),
+    'tsx': (
+        _JS_FUNCTIONS + '(public_field_definition value: [(arrow_function) (function_expression)]) @function',
+        _JS_DECISIONS,
+        (b'(',),
+    ),
+    'go': (
+        '[(function_declaration) (method_declaration)] @function',
+        '["if" "for" "switch" "case" "select" "go" "defer" "return"] @decision '
+        '(if_statement "else" @decision . (if_statement))',
+        (b'func',),
+    ),
+    'c': ('(function_definition) @function', _C_DECISIONS, (b'(', b'{')),
+    'cpp': ('(function_definition) @function', _C_DECISIONS, (b'(', b'{')),
+    'csharp': (
+        '[(method_declaration) (constructor_declaration) (destructor_declaration)'
+        ' (operator_declaration) (local_function_statement)] @function',
+        '["if" "for" "while" "switch" "case" "catch" "throw" "return"] @decision',
+        (b'(', b'{'),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _query(grammar: str) -> Query:
+    functions, decisions, _ = _LANGUAGES[grammar]
+    return Query(get_language(grammar), f"{functions} {decisions} {_LOGICAL}")
+
+
+class TreeSitterComplexityParser(ComplexityParser):
+    """
+    Complexity parser that computes cyclomatic complexity from a tree-sitter tree.
+
+    Falls back to the language's regex parser if the tree cannot be built,
+    or if it has syntax errors and no function was found in it.
+    """
+
+    def __init__(self, grammar: str, fallback: ComplexityParser):
+        """
+        Args:
+            grammar: tree-sitter-language-pack grammar name (e.g. 'java', 'tsx')
+            fallback: Regex parser of the same language
+        """
+        if grammar not in _LANGUAGES:
+            raise LookupError(f"No tree-sitter complexity rules for grammar '{grammar}'")
+        self.grammar = grammar
+        self.fallback = fallback
+        self.PREFILTER = _LANGUAGES[grammar][2]
+        self._last = (None, None)
+
+    def _analyze(self, code: str):
+        """
+        Return (number of decision points in the file, functions), or None to use the fallback.
+
+        Each decision point is attributed to the innermost function whose span contains it.
+        """
+        if self._last[0] is code:
+            return self._last[1]
+        result = self._analyze_tree(code)
+        self._last = (code, result)
+        return result
+
+    def _analyze_tree(self, code: str):
+        try:
+            tree = parse_tree(self.grammar, code)
+            captures = QueryCursor(_query(self.grammar)).captures(tree.root_node)
+        except Exception as e:
+            debug_print(f"[DEBUG] tree-sitter failed for {self.grammar}, using regex parser: {e}")
+            return None
+        function_nodes = sorted(captures.get('function', ()), key=lambda n: (n.start_byte, -n.end_byte))
+        if not function_nodes and tree.root_node.has_error:
+            return None
+        decisions = sorted(node.start_byte for node in captures.get('decision', ()))
+
+        functions = [{'name': function_name(node), 'complexity': 1} for node in function_nodes]
+        open_functions: List[Tuple[int, dict]] = []
+        next_function = 0
+        for position in decisions:
+            while next_function < len(function_nodes) and function_nodes[next_function].start_byte <= position:
+                node = function_nodes[next_function]
+                while open_functions and open_functions[-1][0] <= node.start_byte:
+                    open_functions.pop()
+                open_functions.append((node.end_byte, functions[next_function]))
+                next_function += 1
+            while open_functions and open_functions[-1][0] <= position:
+                open_functions.pop()
+            if open_functions:
+                open_functions[-1][1]['complexity'] += 1
+        return len(decisions), functions
+
+    def compute_complexity(self, code: str) -> int:
+        """
+        Compute the cyclomatic complexity of the given code: 1 + its decision points.
+        """
+        result = self._analyze(code)
+        if result is None:
+            return self.fallback.compute_complexity(code)
+        return 1 + result[0]
+
+    def analyze_functions(self, code: str) -> List[Dict[str, Any]]:
+        """
+        Find all functions and their cyclomatic complexity (1 + their own decision points).
+        """
+        result = self._analyze(code)
+        if result is None:
+            return self.fallback.analyze_functions(code)
+        return result[1]
+
+    def count_functions(self, code: str) -> int:
+        """
+        Count the functions in the given code.
+        """
+        result = self._analyze(code)
+        if result is None:
+            return self.fallback.count_functions(code)
+        return len(result[1])
+
+    def may_contain_functions(self, data) -> bool:
+        """
+        Byte-level prefilter (see ComplexityParser.may_contain_functions()).
+
+        Looser than the regex parsers' prefilters where tree-sitter finds more
+        functions (e.g. JavaScript arrow functions).
+        """
+        return all(data.find(token) != -1 for token in self.PREFILTER)
@@ -37,3 +37,4 @@ class TypeScriptComplexityParser(ComplexityParser):
     # - '(?:\s*:\s*[^{]+)?' optionally matches return type hint ': Type'
     # - '\s*\{' matches opening brace
     FUNCTION_PATTERN = r'(?:async\s+)?function\s+([a-zA-Z_]\w*)(?:<[^>]+>)?\s*\([^)]*\)(?:\s*:\s*[^{]+)?\s*\{'
+    PREFILTER = (b'function',)
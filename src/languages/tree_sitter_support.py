@@ -0,0 +1,74 @@
+"""
+Shared tree-sitter parsing.
+
+The cyclomatic complexity engine and the cognitive complexity calculators
+both need the syntax tree of the file being analyzed. parse_tree() keeps one
+parser per grammar and thread (tree-sitter parsers are not thread-safe) and
+remembers the last tree each thread parsed, so the second consumer of a file
+gets the tree of the first instead of parsing the file again.
+"""
+import threading
+from typing import Any, Dict, Optional
+
+_local = threading.local()
+
+
+def get_thread_parser(grammar: str) -> Any:
+    """
+    Return the calling thread's parser for a grammar, creating it on first use.
+
+    Args:
+        grammar: tree-sitter-language-pack grammar name (e.g. 'java', 'tsx')
+
+    Raises:
+        ImportError: If tree-sitter is not installed
+        LookupError: If the grammar is not available
+    """
+    parsers: Optional[Dict[str, Any]] = getattr(_local, 'parsers', None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    parser = parsers.get(grammar)
+    if parser is None:
+        from tree_sitter_language_pack import get_parser
+        parser = parsers[grammar] = get_parser(grammar)
+    return parser
+
+
+def parse_tree(grammar: str, code: str) -> Any:
+    """
+    Parse source code, reusing the calling thread's last tree for the same grammar and code.
+
+    Args:
+        grammar: tree-sitter-language-pack grammar name
+        code: Source code
+
+    Returns:
+        tree_sitter.Tree (treat as read-only; it may be shared with other consumers)
+    """
+    last = getattr(_local, 'last', None)
+    if last is not None and last[0] == grammar and (last[1] is code or last[1] == code):
+        return last[2]
+    tree = get_thread_parser(grammar).parse(code.encode('utf8'))
+    _local.last = (grammar, code, tree)
+    return tree
+
+
+def function_name(node: Any) -> str:
+    """
+    Name of a function node ('anonymous' if it has none).
+
+    Java/Go/C# names are in the 'name' field, JavaScript/TypeScript class fields
+    in 'property', and C/C++ names at the end of the declarator chain.
+    """
+    if node.type == 'operator_declaration':  # C#
+        return 'operator' + node.child_by_field_name('operator').text.decode('utf8')
+    name = node.child_by_field_name('name') or node.child_by_field_name('property')
+    if node.type == 'destructor_declaration' and name is not None:  # C#
+        return '~' + name.text.decode('utf8', 'replace')
+    if name is None:
+        declarator = node.child_by_field_name('declarator')
+        while declarator is not None and declarator.type != 'function_declarator':
+            declarator = declarator.child_by_field_name('declarator') or (
+                declarator.named_children[-1] if declarator.named_children else None)
+        name = declarator.child_by_field_name('declarator') if declarator is not None else None
+    return name.text.decode('utf8', 'replace') if name is not None else 'anonymous'
@@ -6,6 +6,7 @@ Prioritizes improvements by impact vs. effort for maximum ROI.
 from collections import Counter
 from src.report.report_format_strategy import ReportFormatStrategy
 from src.report.cli.cli_format_base import CLIFormatBase
+from src.report.report_view_model import ReportViewModel
 from src.kpis.model import RepoInfo, File
 from typing import List, Tuple, Dict
 
@@ -41,9 +42,9 @@ class CLIQuickWinsFormat(CLIFormatBase, ReportFormatStrategy):
         Prints quick win suggestions prioritized by impact vs. effort.
         Helps teams focus on high-value, low-effort improvements.
         """
-        # Collect files with metrics and calculate quick wins
-        all_files = self._collect_files_with_metrics(repo_info)
-        quick_wins = self._calculate_quick_wins(all_files)
+        # Quick wins of all files with metrics, from the shared view model
+        view_model = kwargs.get('view_model') or ReportViewModel(repo_info)
+        quick_wins = view_model.quick_wins
 
         # Print the report
         self._print_header()
@@ -1,5 +1,6 @@
 from src.report.report_format_strategy import ReportFormatStrategy
 from src.report.cli.cli_format_base import CLIFormatBase
+from src.report.report_view_model import ReportViewModel
 from src.kpis.model import RepoInfo, ScanDir, File, Function
 from src.utilities.debug import debug_print
 from typing import List, Tuple, Dict
@@ -33,12 +34,16 @@ class CLIReportFormat(CLIFormatBase, ReportFormatStrategy):
     # Ownership display configuration
     MAX_AUTHORS_DISPLAY = 3      # Limit authors shown to keep output readable
 
+    # View model of the repository being printed (set by print_report)
+    _view_model = None
+
     def print_report(self, repo_info: RepoInfo, debug_print, level="file", **kwargs):
         """
         Prints a report for the given RepoInfo object directly to the console.
         This method now works directly with the hierarchical RepoInfo data model.
         """
         repo_name = repo_info.repo_name
+        self._view_model = kwargs.get('view_model') or ReportViewModel(repo_info)
         stats, all_files = self._get_repo_stats(repo_info)
         print(f". {repo_name} {stats}")
 
@@ -67,7 +72,10 @@ class CLIReportFormat(CLIFormatBase, ReportFormatStrategy):
 
     def _get_repo_stats(self, repo_info: RepoInfo) -> Tuple[str, List[File]]:
         """Calculates statistics for the entire repository by traversing the model."""
-        all_files = self._collect_all_files(repo_info)
+        if self._view_model is not None:
+            all_files = self._view_model.owned_files
+        else:
+            all_files = self._collect_all_files(repo_info)
         debug_print(f"[DEBUG] _get_repo_stats: collected {len(all_files)} files")
 
         if not all_files:
@@ -139,8 +147,11 @@ class CLIReportFormat(CLIFormatBase, ReportFormatStrategy):
     def _has_tracked_files(self, scan_dir: ScanDir) -> bool:
         """Returns True if this dir or any subdir contains a tracked file.
 
-        Uses short-circuit evaluation to avoid unnecessary recursion.
+        Uses the view model's directory statistics when available, otherwise
+        short-circuit evaluation to avoid unnecessary recursion.
         """
+        if self._view_model is not None:
+            return self._view_model.stats_for(scan_dir).owned_files > 0
         # Check direct files first (cheaper operation)
         if any(self._is_tracked_file(f) for f in scan_dir.files.values()):
             return True
@@ -5,6 +5,7 @@ from src.report.cli.cli_summary_format import CLISummaryFormat
 from src.report.cli.cli_quick_wins_format import CLIQuickWinsFormat
 from src.report.report_interface import ReportInterface
 from src.utilities.debug import debug_print
+from src.utilities.thread_output import captured_stdout
 
 
 class CLIReportGenerator(ReportInterface):
@@ -30,14 +31,8 @@ class CLIReportGenerator(ReportInterface):
         # If save_cli_to_file is True (multi-format mode), capture output to file
         if save_cli_to_file and output_file and (
                 output_file.endswith('.md') or output_file.endswith('.html')):
-            import sys
-            from io import StringIO
-
-            # Capture stdout
-            old_stdout = sys.stdout
-            sys.stdout = captured_output = StringIO()
-
-            try:
+            # Only this thread's output is captured when reports are generated in parallel
+            with captured_stdout() as (captured_output, old_stdout):
                 for repo_info in self.repo_infos:
                     format_strategy.print_report(repo_info, debug_print, level=level, output_file=output_file, **kwargs)
 
@@ -54,8 +49,6 @@ class CLIReportGenerator(ReportInterface):
                 print(f"[OK] Report generated: {output_file}", file=old_stdout)
                 # Also print the content to stdout for CLI visibility
                 print(content, end='', file=old_stdout)
-            finally:
-                sys.stdout = old_stdout
         else:
             # Normal stdout printing (backward compatible)
             for repo_info in self.repo_infos:
@@ -5,6 +5,7 @@ Provides actionable insights prioritized by importance instead of file tree.
 
 from src.report.report_format_strategy import ReportFormatStrategy
 from src.report.cli.cli_format_base import CLIFormatBase
+from src.report.report_view_model import ReportViewModel
 from src.kpis.model import RepoInfo, File
 from typing import List, Tuple, Dict
 
@@ -42,14 +43,14 @@ class CLISummaryFormat(CLIFormatBase, ReportFormatStrategy):
         # Get extreme complexity threshold from kwargs (default: 100)
         extreme_threshold = kwargs.get('extreme_complexity_threshold', 100)
 
-        # Collect all files and calculate statistics
-        all_files = self._collect_tracked_files(repo_info)
-        stats = self._calculate_statistics(all_files)
-
-        # Categorize files by risk level
-        critical_files, emerging_files, high_complexity_files, high_churn_files, extreme_files = self._categorize_files(
-            all_files, extreme_threshold=extreme_threshold
-        )
+        # Files, statistics and risk categories come from the shared view model
+        view_model = kwargs.get('view_model') or ReportViewModel(repo_info)
+        all_files = view_model.owned_files
+        stats = view_model.summary_stats
+        categories = view_model.categories(extreme_threshold)
+        critical_files, emerging_files = categories['critical'], categories['emerging']
+        high_complexity_files, high_churn_files = categories['high_complexity'], categories['high_churn']
+        extreme_files = categories['extreme']
 
         # Print the dashboard
         self._print_header()
@@ -0,0 +1,202 @@
+"""
+Chunked HTML Report Writer
+--------------------------
+Writes the HTML report as a small shell page plus data chunks, for
+repositories too large for a single HTML document.
+
+Layout next to the shell page ``report.html``::
+
+    report.html             Overview, summaries and the viewer script
+    report_data/d0.js       Root directory: its subdirectories and files
+    report_data/d<n>.js     One chunk per directory, loaded when expanded
+    report_data/q<n>.js     Quick wins, Defaults.HTML_CHUNK_ROWS rows per chunk
+    report_data/r<n>.js     Review recommendations (with the review tab)
+
+Each chunk is one JSON document wrapped in a ``MetricMancer.chunk(id, ...)``
+call. Browsers block fetch() of local files opened via file://, but allow
+<script> tags, so the shell loads chunks by adding script elements.
+
+The shell page is streamed from its template and every chunk is written as
+soon as it is built, so the whole report is never held in memory as one string.
+"""
+import json
+import os
+import re
+from collections import deque
+from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.config.defaults import Defaults
+from src.kpis.model import File, RepoInfo
+from src.report.report_view_model import ReportViewModel
+
+# Chunk files written by this module (anything else in the data directory is left alone)
+CHUNK_FILE_PATTERN = re.compile(r'^[dqr]\d+\.js$')
+
+
+def data_dir_for(output_file: str) -> str:
+    """Return the chunk directory of a shell page: 'out/report.html' -> 'out/report_data'."""
+    return os.path.splitext(output_file)[0] + '_data'
+
+
+def _round(kpi) -> Optional[float]:
+    """KPI value rounded like the inline report's round(1) filter, or None if missing."""
+    if kpi is None or getattr(kpi, 'value', None) is None:
+        return None
+    value = kpi.value
+    return round(value, 1) if isinstance(value, (int, float)) else None
+
+
+def kpi_summary(node) -> Dict[str, Optional[float]]:
+    """Tree KPIs of a file or directory: complexity, cognitive complexity, churn and hotspot."""
+    churn = node.kpis.get('churn')
+    return {
+        'c': _round(node.kpis.get('complexity')),
+        'cog': _round(node.kpis.get('cognitive_complexity')),
+        'churn': churn.value if churn is not None and isinstance(churn.value, (int, float)) else None,
+        'hotspot': _round(node.kpis.get('hotspot')),
+    }
+
+
+class ChunkedReportWriter:
+    """
+    Writes a chunked HTML report.
+
+    Usage:
+        writer = ChunkedReportWriter(renderer)
+        writer.write(repo_info, 'output/report.html', view_model=view_model)
+    """
+
+    def __init__(self, renderer, template_file: str = 'report_chunked.html',
+                 chunk_rows: int = Defaults.HTML_CHUNK_ROWS):
+        """
+        Args:
+            renderer: ReportRenderer whose Jinja environment loads the shell template
+            template_file: Shell page template
+            chunk_rows: Table rows per quick-wins or review chunk
+        """
+        self.renderer = renderer
+        self.template_file = template_file
+        self.chunk_rows = chunk_rows
+
+    def write(self, repo_info: RepoInfo, output_file: str, view_model: ReportViewModel = None,
+              report_links=None, review_data: Dict = None) -> Dict[str, int]:
+        """
+        Write the shell page and its data chunks.
+
+        Args:
+            repo_info: Analyzed repository
+            output_file: Path of the shell page; chunks go to data_dir_for(output_file)
+            view_model: Optional ReportViewModel of repo_info (built here if not given)
+            report_links: Optional links to the reports of other repositories
+            review_data: Optional review recommendations (adds the Code Review tab)
+
+        Returns:
+            Number of chunks written, by kind: {'directories': n, 'quick_wins': n, 'review': n}
+        """
+        if view_model is None:
+            view_model = ReportViewModel(repo_info, self.renderer.threshold_low, self.renderer.threshold_high)
+        data_dir = data_dir_for(output_file)
+        self._prepare_data_dir(data_dir)
+
+        quick_wins = view_model.tracked_quick_wins
+        recommendations = review_data['recommendations'] if review_data else []
+        counts = {
+            'directories': self._write_tree(data_dir, repo_info),
+            'quick_wins': self._write_rows(data_dir, 'q', (self._quick_win_row(w) for w in quick_wins)),
+            'review': self._write_rows(data_dir, 'r', (asdict(r) for r in recommendations)),
+        }
+
+        config = {
+            'dataDir': os.path.basename(data_dir),
+            'rootChunk': 'd0',
+            'treePageSize': Defaults.HTML_TREE_PAGE_SIZE,
+            'tablePageSize': Defaults.HTML_TABLE_PAGE_SIZE,
+            'chunkRows': self.chunk_rows,
+            'quickWins': len(quick_wins),
+            'recommendations': len(recommendations),
+        }
+        template = self.renderer.env.get_template(self.template_file)
+        template.stream(
+            repo_info=repo_info,
+            root_kpis=kpi_summary(repo_info),
+            stats=view_model.stats,
+            quick_wins_count=len(quick_wins),
+            best_quick_win=quick_wins[0] if quick_wins else None,
+            review_data=review_data,
+            review_times=self._review_times(recommendations),
+            report_links=report_links,
+            viewer_config=config,
+        ).dump(output_file, encoding='utf-8')
+        return counts
+
+    @staticmethod
+    def _prepare_data_dir(data_dir: str):
+        """Create the chunk directory and remove chunks left by an earlier, larger report."""
+        os.makedirs(data_dir, exist_ok=True)
+        for name in os.listdir(data_dir):
+            if CHUNK_FILE_PATTERN.match(name):
+                os.remove(os.path.join(data_dir, name))
+
+    @staticmethod
+    def _write_chunk(data_dir: str, chunk_id: str, payload):
+        with open(os.path.join(data_dir, f"{chunk_id}.js"), 'w', encoding='utf-8') as f:
+            # json.dumps (C encoder) is several times faster than json.dump's iterative encoding
+            f.write(f'MetricMancer.chunk("{chunk_id}",{json.dumps(payload, separators=(",", ":"), default=str)});\n')
+
+    def _write_tree(self, data_dir: str, repo_info: RepoInfo) -> int:
+        """
+        Write one chunk per directory: its sorted subdirectories (with their chunk ids) and files.
+
+        Directories are numbered breadth first, so a directory's chunk id is
+        known when its parent's chunk is written.
+        """
+        pending = deque([repo_info])
+        written = 0
+        next_id = 1
+        while pending:
+            scan_dir = pending.popleft()
+            dirs, files = [], []
+            for item in ReportViewModel.tree_items(scan_dir):
+                if isinstance(item, File):
+                    files.append({'name': item.name, 'kpis': kpi_summary(item)})
+                else:
+                    dirs.append({'name': item.dir_name, 'chunk': f"d{next_id}", 'kpis': kpi_summary(item)})
+                    pending.append(item)
+                    next_id += 1
+            self._write_chunk(data_dir, f"d{written}", {'dirs': dirs, 'files': files})
+            written += 1
+        return written
+
+    def _write_rows(self, data_dir: str, prefix: str, rows: Iterable[Dict]) -> int:
+        """Write rows in chunks of chunk_rows; returns the number of chunks."""
+        written = 0
+        for chunk in self._batches(rows):
+            self._write_chunk(data_dir, f"{prefix}{written}", chunk)
+            written += 1
+        return written
+
+    def _batches(self, rows: Iterable[Dict]) -> Iterator[List[Dict]]:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.chunk_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _quick_win_row(win: Dict) -> Dict:
+        """A quick win without the File object it was computed from."""
+        return {key: value for key, value in win.items() if key != 'file'}
+
+    @staticmethod
+    def _review_times(recommendations) -> Dict[str, int]:
+        """Estimated review minutes per risk level, plus 'total'."""
+        times = {level: 0 for level in ('critical', 'high', 'medium', 'low')}
+        for rec in recommendations:
+            if rec.risk_level in times:
+                times[rec.risk_level] += rec.estimated_time_minutes
+        times['total'] = sum(times.values())
+        return times
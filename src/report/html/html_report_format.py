@@ -1,8 +1,6 @@
 from src.report.report_format_strategy import ReportFormatStrategy
-from src.report.report_renderer import ReportRenderer
 from src.report.report_writer import ReportWriter
 from src.kpis.model import RepoInfo
-from src.analysis.code_review_advisor import CodeReviewAdvisor
 
 
 class HTMLReportFormat(ReportFormatStrategy):
@@ -19,14 +17,22 @@ class HTMLReportFormat(ReportFormatStrategy):
             include_review_tab: Include Code Review tab with recommendations
             review_branch_only: Only show changed files in review tab
             review_base_branch: Base branch to compare against
+            html_chunked: Write a shell page plus per-directory data chunks (see ChunkedReportWriter)
         """
+        # Jinja2 is only loaded when an HTML report is actually rendered
+        from src.report.report_renderer import ReportRenderer
+        from src.report.report_view_model import ReportViewModel
+
+        view_model = kwargs.get('view_model') or ReportViewModel(repo_info, threshold_low, threshold_high)
+
         # Generate review data if requested
         review_data = None
         if kwargs.get('include_review_tab', False):
             review_data = self._generate_review_data(
                 repo_info,
                 review_branch_only=kwargs.get('review_branch_only', False),
-                review_base_branch=kwargs.get('review_base_branch', 'main')
+                review_base_branch=kwargs.get('review_base_branch', 'main'),
+                view_model=view_model
             )
 
         renderer = ReportRenderer(
@@ -36,17 +42,26 @@ class HTMLReportFormat(ReportFormatStrategy):
             threshold_high=threshold_high
         )
 
+        if kwargs.get('html_chunked') is True:
+            from src.report.html.chunked_report_writer import ChunkedReportWriter, data_dir_for
+            ChunkedReportWriter(renderer).write(repo_info, output_file, view_model=view_model,
+                                                report_links=report_links, review_data=review_data)
+            print(f"[OK] Report generated: {output_file} (data chunks in {data_dir_for(output_file)})")
+            return
+
         html = renderer.render(
             repo_info=repo_info,
             problem_file_threshold=problem_file_threshold,
             report_links=report_links,
+            view_model=view_model,
             review_data=review_data
         )
 
         ReportWriter.write_html(html, output_file)
         print(f"[OK] Report generated: {output_file}")
 
-    def _generate_review_data(self, repo_info: RepoInfo, review_branch_only=False, review_base_branch='main'):
+    def _generate_review_data(self, repo_info: RepoInfo, review_branch_only=False, review_base_branch='main',
+                              view_model=None):
         """
         Generate code review recommendations for all files in the repository.
 
@@ -54,32 +69,23 @@ class HTMLReportFormat(ReportFormatStrategy):
             repo_info: Repository information
             review_branch_only: If True, only analyze changed files
             review_base_branch: Base branch to compare against
+            view_model: Optional ReportViewModel of repo_info (supplies the tracked files)
 
         Returns:
             Dict with review recommendations and metadata
         """
+        from src.analysis.code_review_advisor import CodeReviewAdvisor, ReviewInput
         from src.report.report_renderer import collect_all_files
 
-        advisor = CodeReviewAdvisor()
-        all_files = collect_all_files(repo_info)
+        all_files = view_model.tracked_files if view_model is not None else collect_all_files(repo_info)
 
         # Filter files if needed
         filtered_files = self._filter_files_for_review(all_files, repo_info, review_branch_only, review_base_branch)
 
-        # Generate recommendations for each file
-        recommendations = []
-        for file_obj in filtered_files:
-            complexity, churn, hotspot, ownership_data, shared_ownership_data = self._extract_file_kpi_data(file_obj)
-
-            rec = advisor.analyze_file(
-                file_obj.file_path,
-                complexity,
-                churn,
-                hotspot,
-                ownership_data,
-                shared_ownership_data
-            )
-            recommendations.append(rec)
+        # Generate recommendations for all files in one batch
+        recommendations = CodeReviewAdvisor().analyze_files(
+            ReviewInput(file_obj.file_path, *self._extract_file_kpi_data(file_obj)) for file_obj in filtered_files
+        )
 
         # Sort by priority
         recommendations.sort(key=lambda r: r.priority)
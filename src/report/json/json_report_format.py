@@ -7,6 +7,9 @@ from typing import Any, List, Optional
 
 class JSONReportFormat(ReportFormatStrategy):
 
+    # View model of the repository being serialized (set by get_report_data)
+    _view_model = None
+
     def _to_dict(self, obj: Any) -> Any:
         """
         Recursively converts dataclass objects (RepoInfo, ScanDir, File, etc.)
@@ -28,6 +31,8 @@ class JSONReportFormat(ReportFormatStrategy):
         Determines if a file is tracked by git based on Code Ownership KPI.
         Returns True if the file is tracked or ownership data is unavailable.
         """
+        if self._view_model is not None:
+            return self._view_model.is_tracked(file_obj)
         co = file_obj.kpis.get('Code Ownership')
         if not co or not hasattr(co, 'value') or not isinstance(co.value, dict):
             return True
@@ -81,22 +86,30 @@ class JSONReportFormat(ReportFormatStrategy):
         Extracts file-level KPIs from a File object and returns a dictionary item.
         """
         file_churn = self._kpi_value(file_obj.kpis, 'churn')
+        churn_acceleration = self._kpi_value(file_obj.kpis, 'churn_acceleration')
         code_ownership_value = self._kpi_value(file_obj.kpis, 'Code Ownership')
         shared_ownership_value = self._kpi_value(file_obj.kpis, 'Shared Ownership')
         file_complexity = self._kpi_value(file_obj.kpis, 'complexity')
         file_cognitive_complexity = self._kpi_value(file_obj.kpis, 'cognitive_complexity')
         file_hotspot = self._kpi_value(file_obj.kpis, 'hotspot')
 
-        return {
+        item = {
             "filename": file_obj.file_path,
             "cyclomatic_complexity": file_complexity,
             "cognitive_complexity": file_cognitive_complexity,
             "churn": file_churn,
+            "churn_acceleration": churn_acceleration,
             "hotspot_score": file_hotspot,
             "code_ownership": code_ownership_value,
             "shared_ownership": shared_ownership_value,
             "repo_name": repo_name, "component": component, "team": team, "timestamp": timestamp
         }
+        # Git KPIs whose git command timed out are flagged instead of looking like "no history"
+        churn_values = getattr(file_obj.kpis.get('churn'), 'calculation_values', None)
+        git_status = churn_values.get('status') if isinstance(churn_values, dict) else None
+        if isinstance(git_status, str):
+            item["git_kpis"] = git_status
+        return item
 
     def _extract_function_kpis(self, func_obj, file_obj: File, file_churn: Any,
                                repo_name: Optional[str] = None,
@@ -170,7 +183,8 @@ class JSONReportFormat(ReportFormatStrategy):
 
         return items
 
-    def get_report_data(self, repo_info: RepoInfo, level: str = "file", hierarchical: bool = False) -> Any:
+    def get_report_data(self, repo_info: RepoInfo, level: str = "file", hierarchical: bool = False,
+                        view_model=None) -> Any:
         """
         Serializes the RepoInfo object into a JSON-compatible data structure.
 
@@ -179,11 +193,15 @@ class JSONReportFormat(ReportFormatStrategy):
             level: 'file' or 'function' for flat list output.
             hierarchical: If True, prints the full hierarchical structure.
                           Otherwise, prints a flat list based on 'level'.
+            view_model: Optional ReportViewModel of repo_info (tracked files are looked up there)
 
         Returns:
             A dictionary (for hierarchical) or a list of dictionaries (for flat).
         """
         if hierarchical:
             return self._to_dict(repo_info)
-        else:
+        self._view_model = view_model
+        try:
             return self._collect_flat_list(repo_info, level)
+        finally:
+            self._view_model = None
@@ -15,7 +15,8 @@ class JSONReportGenerator(ReportInterface):
         format_strategy = JSONReportFormat()
         all_repos = []
         for repo_info in self.repo_infos:
-            repo_json = format_strategy.get_report_data(repo_info, level=level, hierarchical=hierarchical)
+            repo_json = format_strategy.get_report_data(repo_info, level=level, hierarchical=hierarchical,
+                                                        view_model=kwargs.get('view_model'))
             all_repos.append(repo_json)
 
         # If only one repo, don't output it in a list
@@ -0,0 +1,44 @@
+from src.config.defaults import Defaults
+from src.report.json.json_report_format import JSONReportFormat
+from src.report.opensearch.opensearch_exporter import OpenSearchBulkExporter, OpenSearchExportError, to_document
+from src.report.report_interface import ReportInterface
+
+
+class OpenSearchReportGenerator(ReportInterface):
+    """
+    Exports the file, function and package records of a repository to OpenSearch.
+
+    The records have the fields of the flat JSON report; both levels are
+    exported regardless of --level. Nothing is written to output_file.
+    """
+
+    def __init__(self, repo_info, threshold_low=10.0, threshold_high=20.0, problem_file_threshold=None):
+        self.repo_info = repo_info
+        self.threshold_low = threshold_low
+        self.threshold_high = threshold_high
+        self.problem_file_threshold = problem_file_threshold
+
+    def collect_documents(self, view_model=None):
+        """Return the package, file and function records of the repository as index documents."""
+        format_strategy = JSONReportFormat()
+        records = format_strategy.get_report_data(self.repo_info, level="file", view_model=view_model)
+        function_records = format_strategy.get_report_data(self.repo_info, level="function", view_model=view_model)
+        records += [record for record in function_records if 'function_name' in record]
+        repo_name = getattr(self.repo_info, 'repo_name', None)
+        timestamp = getattr(self.repo_info, 'timestamp', None)
+        return [to_document(record, repo_name, timestamp) for record in records]
+
+    def generate(self, output_file=None, level="file", hierarchical=False, **kwargs):
+        index = kwargs.get('opensearch_index') or Defaults.OPENSEARCH_INDEX
+        batch_mb = kwargs.get('opensearch_batch_mb') or Defaults.OPENSEARCH_BATCH_MB
+        documents = self.collect_documents(kwargs.get('view_model'))
+        try:
+            with OpenSearchBulkExporter(kwargs.get('opensearch_url') or Defaults.OPENSEARCH_URL, index,
+                                        batch_bytes=int(batch_mb * 1024 * 1024)) as exporter:
+                stats = exporter.export(documents)
+        except (OpenSearchExportError, ValueError) as e:
+            print(f"[WARN] OpenSearch export failed: {e}")
+            return
+        failed = f", {stats.failed} failed" if stats.failed else ""
+        print(f"[OK] {stats.indexed} documents exported to OpenSearch index '{index}' "
+              f"in {stats.batches} bulk requests{failed}")
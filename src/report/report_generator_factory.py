@@ -3,13 +3,15 @@ Factory for creating appropriate report generators based on output format.
 
 This module implements the Factory pattern to encapsulate report generator
 creation logic and remove it from main.py.
+
+Generator modules are imported only for the selected output format, so a
+CLI run never loads the HTML/JSON report stacks.
 """
 
+import importlib
 from typing import Optional, Type
 
-from src.report.cli.cli_report_generator import CLIReportGenerator
-from src.report.json.json_report_generator import JSONReportGenerator
-from src.report.report_generator import ReportGenerator
+from src.report.report_interface import ReportInterface
 
 
 class ReportGeneratorFactory:
@@ -25,16 +27,24 @@ class ReportGeneratorFactory:
         >>> generator = generator_cls(repo_info, thresholds...)
     """
 
-    # Mapping of output formats to their corresponding generator classes
+    # Mapping of output formats to their generator classes as (module, class name)
     _GENERATORS = {
-        'json': JSONReportGenerator,
-        'summary': CLIReportGenerator,
-        'quick-wins': CLIReportGenerator,
-        'tree': CLIReportGenerator,
+        'json': ('src.report.json.json_report_generator', 'JSONReportGenerator'),
+        'opensearch': ('src.report.opensearch.opensearch_report_generator', 'OpenSearchReportGenerator'),
+        'summary': ('src.report.cli.cli_report_generator', 'CLIReportGenerator'),
+        'quick-wins': ('src.report.cli.cli_report_generator', 'CLIReportGenerator'),
+        'tree': ('src.report.cli.cli_report_generator', 'CLIReportGenerator'),
     }
+    _DEFAULT_GENERATOR = ('src.report.cli.cli_report_generator', 'CLIReportGenerator')
+
+    @staticmethod
+    def _load(spec) -> Type[ReportInterface]:
+        """Import a generator module and return the generator class."""
+        module_name, class_name = spec
+        return getattr(importlib.import_module(module_name), class_name)
 
     @classmethod
-    def create(cls, output_format: str) -> Optional[Type[ReportGenerator]]:
+    def create(cls, output_format: str) -> Optional[Type[ReportInterface]]:
         """
         Create and return the appropriate report generator class.
 
@@ -58,7 +68,7 @@ class ReportGeneratorFactory:
             return None
 
         # Return mapped generator or default to CLI generator
-        return cls._GENERATORS.get(output_format, CLIReportGenerator)
+        return cls._load(cls._GENERATORS.get(output_format, cls._DEFAULT_GENERATOR))
 
     @classmethod
     def get_supported_formats(cls) -> list:
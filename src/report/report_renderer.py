@@ -1,24 +1,10 @@
 import os
 from typing import List, Dict
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from src.config.defaults import Defaults
 from src.kpis.model import RepoInfo, ScanDir, File
-
-
-def is_tracked_file(file_obj: File) -> bool:
-    """
-    Check if a file is tracked by git based on its Code Ownership KPI.
-
-    Args:
-        file_obj: File object to check
-
-    Returns:
-        True if file is tracked, False otherwise
-    """
-    co = file_obj.kpis.get('Code Ownership')
-    if not co or not hasattr(co, 'value') or not isinstance(co.value, dict):
-        return True
-    return not (co.value.get('ownership') == 'N/A')
+from src.report.report_view_model import ReportViewModel, is_tracked_file
 
 
 def collect_all_files(scan_dir: ScanDir) -> List[File]:
@@ -56,6 +42,23 @@ def filter_problem_files(all_files: List[File], threshold: float) -> List[File]:
     return problem_files
 
 
+def _bytecode_cache():
+    """
+    Return the on-disk cache for compiled templates, or None if disabled or unusable.
+
+    Jinja compiles report.html to Python code on every new Environment; with the
+    cache, later renders and runs load the compiled code instead. Entries are
+    keyed by template source checksum, so edited templates are recompiled.
+    """
+    if not Defaults.TEMPLATE_BYTECODE_CACHE:
+        return None
+    try:
+        return FileSystemBytecodeCache(Defaults.TEMPLATE_CACHE_DIR or None)
+    except OSError:
+        # E.g. an unwritable temp directory: render without the cache
+        return None
+
+
 class ReportRenderer:
     """
     Renders the HTML report using Jinja2 templates and the analyzed repository data.
@@ -72,13 +75,14 @@ class ReportRenderer:
             threshold_low: Lower threshold for complexity grading.
             threshold_high: Upper threshold for complexity grading.
         """
-        self.env = Environment(loader=FileSystemLoader(template_dir))
+        self.env = Environment(loader=FileSystemLoader(template_dir), bytecode_cache=_bytecode_cache())
         self.env.filters['basename'] = lambda path: os.path.basename(path) if path else ""
         self.template_file = template_file
         self.threshold_low = threshold_low
         self.threshold_high = threshold_high
 
-    def render(self, repo_info: RepoInfo, problem_file_threshold=None, report_links=None, **kwargs):
+    def render(self, repo_info: RepoInfo, problem_file_threshold=None, report_links=None, view_model=None,
+               **kwargs):
         """
         Render the HTML report using the provided template and repository data.
 
@@ -86,26 +90,31 @@ class ReportRenderer:
             repo_info: The analyzed repository data model (RepoInfo).
             problem_file_threshold: Optional threshold for flagging problematic files.
             report_links: Optional links to include in the report.
+            view_model: Optional ReportViewModel of repo_info (built here if not given).
             **kwargs: Additional context variables (e.g., review_data)
 
         Returns:
             Rendered HTML as a string.
         """
         template = self.env.get_template(self.template_file)
+        if view_model is None:
+            view_model = ReportViewModel(repo_info, self.threshold_low, self.threshold_high)
 
-        # Collect all files to identify problem files
-        all_files = collect_all_files(repo_info)
+        # Tracked files identify problem files
+        all_files = view_model.tracked_files
 
         # Filter problem files based on the threshold
         problem_files = []
         if problem_file_threshold is not None:
             problem_files = filter_problem_files(all_files, problem_file_threshold)
 
-        # Calculate quick wins data
-        quick_wins_data = self._calculate_quick_wins(all_files)
+        # Quick wins of tracked files (computed once per view model)
+        quick_wins_data = view_model.tracked_quick_wins
 
         return template.render(
             repo_info=repo_info,
+            stats=view_model.stats,
+            tree_items=view_model.tree_items,
             problem_files=problem_files,
             threshold_low=self.threshold_low,
             threshold_high=self.threshold_high,
@@ -0,0 +1,271 @@
+"""
+Report View Model
+-----------------
+Everything the report formats derive from an analyzed RepoInfo, computed once.
+
+With several output formats each format used to walk the whole tree on its
+own: collecting files, filtering tracked files, computing quick wins and
+categorizing files. ReportCoordinator now builds one ReportViewModel per
+repository after aggregation and passes it to every format as the
+``view_model`` keyword. Formats called without one build their own, so their
+output does not depend on where they are called from.
+
+The flat file lists and per-directory statistics come from a single walk of
+the tree; they, quick wins, categories, hotspots and grades are all computed
+on first use, so a format that does not need them does not pay for them.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Set, Tuple
+
+from src.kpis.model import File, RepoInfo, ScanDir
+from src.report.cli.cli_format_base import CLIFormatBase
+from src.report.grading import grade
+
+# Same limits as the overview statistics of the HTML report
+HIGH_COMPLEXITY_LIMIT = 15
+HOTSPOT_LIMIT = 100
+
+
+def is_tracked_file(file_obj: File) -> bool:
+    """
+    Check if a file is tracked by git based on its Code Ownership KPI.
+
+    Files without ownership data count as tracked; only an explicit 'N/A'
+    ownership (file unknown to git) excludes a file.
+
+    Args:
+        file_obj: File object to check
+
+    Returns:
+        True if file is tracked, False otherwise
+    """
+    co = file_obj.kpis.get('Code Ownership')
+    if not co or not hasattr(co, 'value') or not isinstance(co.value, dict):
+        return True
+    return not (co.value.get('ownership') == 'N/A')
+
+
+def _kpi_value(file_obj: File, name: str):
+    """Return a KPI value, or None if the KPI or its value is missing."""
+    kpi = file_obj.kpis.get(name)
+    return kpi.value if kpi is not None and hasattr(kpi, 'value') else None
+
+
+@dataclass
+class DirectoryStats:
+    """
+    Statistics of all files in a directory and its subdirectories.
+
+    Attributes:
+        total_files: All analyzed files
+        owned_files: Files with valid git ownership data (shown in the CLI tree)
+        files_with_complexity / total_complexity / high_complexity_files: Cyclomatic complexity
+        files_with_cognitive / total_cognitive / high_cognitive_files: Cognitive complexity
+        files_with_churn / total_churn: Churn
+        hotspot_files: Files with a hotspot score above HOTSPOT_LIMIT
+    """
+    total_files: int = 0
+    owned_files: int = 0
+    files_with_complexity: int = 0
+    total_complexity: float = 0
+    high_complexity_files: int = 0
+    files_with_cognitive: int = 0
+    total_cognitive: float = 0
+    high_cognitive_files: int = 0
+    files_with_churn: int = 0
+    total_churn: float = 0
+    hotspot_files: int = 0
+
+    def add_file(self, file_obj: File, owned: bool):
+        """Count one file."""
+        self.total_files += 1
+        self.owned_files += owned
+        complexity = _kpi_value(file_obj, 'complexity')
+        if complexity is not None:
+            self.files_with_complexity += 1
+            self.total_complexity += complexity
+            self.high_complexity_files += complexity > HIGH_COMPLEXITY_LIMIT
+        cognitive = _kpi_value(file_obj, 'cognitive_complexity')
+        if cognitive is not None:
+            self.files_with_cognitive += 1
+            self.total_cognitive += cognitive
+            self.high_cognitive_files += cognitive > HIGH_COMPLEXITY_LIMIT
+        churn = _kpi_value(file_obj, 'churn')
+        if churn is not None:
+            self.files_with_churn += 1
+            self.total_churn += churn
+        hotspot = _kpi_value(file_obj, 'hotspot')
+        if hotspot is not None and hotspot > HOTSPOT_LIMIT:
+            self.hotspot_files += 1
+
+    def add(self, other: 'DirectoryStats'):
+        """Add the statistics of a subdirectory."""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def avg_complexity(self) -> float:
+        return self.total_complexity / self.files_with_complexity if self.files_with_complexity else 0.0
+
+    @property
+    def avg_cognitive(self) -> float:
+        return self.total_cognitive / self.files_with_cognitive if self.files_with_cognitive else 0.0
+
+    @property
+    def avg_churn(self) -> float:
+        return self.total_churn / self.files_with_churn if self.files_with_churn else 0.0
+
+    @property
+    def high_complexity_percent(self) -> float:
+        return self.high_complexity_files / self.files_with_complexity * 100 if self.files_with_complexity else 0.0
+
+    @property
+    def high_cognitive_percent(self) -> float:
+        return self.high_cognitive_files / self.files_with_cognitive * 100 if self.files_with_cognitive else 0.0
+
+    @property
+    def hotspot_percent(self) -> float:
+        return self.hotspot_files / self.total_files * 100 if self.total_files else 0.0
+
+
+class ReportViewModel:
+    """
+    Precomputed report data for one repository.
+
+    Usage:
+        view_model = ReportViewModel(repo_info, threshold_low=10, threshold_high=20)
+        view_model.tracked_files           # Files shown in HTML/JSON reports
+        view_model.stats_for(scan_dir)     # DirectoryStats of a subtree
+        view_model.quick_wins              # Sorted by ROI
+    """
+
+    def __init__(self, repo_info: RepoInfo, threshold_low: float = 10.0, threshold_high: float = 20.0):
+        """
+        Args:
+            repo_info: Analyzed and aggregated repository (must not change while the view model is used)
+            threshold_low: Lower complexity threshold for grading
+            threshold_high: Upper complexity threshold for grading
+        """
+        self.repo_info = repo_info
+        self.threshold_low = threshold_low
+        self.threshold_high = threshold_high
+        self._ownership = CLIFormatBase()
+        self._categories: Dict[int, Dict[str, List]] = {}
+
+    @cached_property
+    def _walk(self) -> Tuple[List[File], List[File], Set[int], Dict[str, DirectoryStats]]:
+        """Walk the tree once: (all files, owned files, ids of tracked files, stats by directory path)."""
+        files, owned_files, tracked_ids, dir_stats = [], [], set(), {}
+
+        def collect(scan_dir: ScanDir) -> DirectoryStats:
+            stats = DirectoryStats()
+            for file_obj in scan_dir.files.values():
+                owned = self._ownership._is_tracked_file(file_obj)
+                files.append(file_obj)
+                if owned:
+                    owned_files.append(file_obj)
+                if is_tracked_file(file_obj):
+                    tracked_ids.add(id(file_obj))
+                stats.add_file(file_obj, owned)
+            for sub_dir in scan_dir.scan_dirs.values():
+                stats.add(collect(sub_dir))
+            dir_stats[scan_dir.scan_dir_path] = stats
+            return stats
+
+        collect(self.repo_info)
+        return files, owned_files, tracked_ids, dir_stats
+
+    @property
+    def files(self) -> List[File]:
+        """All files in depth-first order (a directory's files before its subdirectories)."""
+        return self._walk[0]
+
+    @property
+    def owned_files(self) -> List[File]:
+        """Files with valid git ownership data (CLI summary and tree)."""
+        return self._walk[1]
+
+    @property
+    def dir_stats(self) -> Dict[str, DirectoryStats]:
+        """DirectoryStats of every directory, by scan_dir_path."""
+        return self._walk[3]
+
+    @cached_property
+    def tracked_files(self) -> List[File]:
+        """Files not explicitly untracked (HTML and JSON reports)."""
+        return [f for f in self.files if self.is_tracked(f)]
+
+    @cached_property
+    def files_with_metrics(self) -> List[File]:
+        """Files with cyclomatic or cognitive complexity, tracked or not (quick wins)."""
+        return [f for f in self.files if self._ownership._has_complexity_metrics(f)]
+
+    def is_tracked(self, file_obj: File) -> bool:
+        """Same as is_tracked_file() for files of this repository, without re-reading KPIs."""
+        return id(file_obj) in self._walk[2]
+
+    def stats_for(self, scan_dir: ScanDir) -> DirectoryStats:
+        """Return the statistics of a directory of this repository (empty if unknown)."""
+        return self.dir_stats.get(scan_dir.scan_dir_path) or DirectoryStats()
+
+    @staticmethod
+    def tree_items(scan_dir: ScanDir) -> List:
+        """Subdirectories then files of a directory, each sorted by name ignoring case (HTML file tree)."""
+        return (sorted(scan_dir.scan_dirs.values(), key=lambda d: d.dir_name.lower()) +
+                sorted(scan_dir.files.values(), key=lambda f: f.name.lower()))
+
+    @property
+    def stats(self) -> DirectoryStats:
+        """Statistics of the whole repository."""
+        return self.stats_for(self.repo_info)
+
+    @cached_property
+    def quick_wins(self) -> List[Dict]:
+        """Quick win entries of all files with metrics, sorted by ROI (as in the quick-wins report)."""
+        from src.report.cli.cli_quick_wins_format import CLIQuickWinsFormat
+        return CLIQuickWinsFormat()._calculate_quick_wins(self.files_with_metrics)
+
+    @cached_property
+    def tracked_quick_wins(self) -> List[Dict]:
+        """Quick wins of tracked files only (as in the HTML report)."""
+        return [win for win in self.quick_wins if self.is_tracked(win['file'])]
+
+    @cached_property
+    def summary_stats(self) -> Dict:
+        """Overview statistics of the owned files (as in the summary report)."""
+        from src.report.cli.cli_summary_format import CLISummaryFormat
+        return CLISummaryFormat()._calculate_statistics(self.owned_files)
+
+    def categories(self, extreme_threshold: int = 100) -> Dict[str, List]:
+        """
+        Risk categories of the owned files (as in the summary report).
+
+        Returns:
+            Dict with 'critical', 'emerging', 'high_complexity', 'high_churn' and
+            'extreme' entry lists, each sorted by its relevant metric
+        """
+        if extreme_threshold not in self._categories:
+            from src.report.cli.cli_summary_format import CLISummaryFormat
+            critical, emerging, high_complexity, high_churn, extreme = CLISummaryFormat()._categorize_files(
+                self.owned_files, extreme_threshold=extreme_threshold)
+            self._categories[extreme_threshold] = {
+                'critical': critical, 'emerging': emerging, 'high_complexity': high_complexity,
+                'high_churn': high_churn, 'extreme': extreme,
+            }
+        return self._categories[extreme_threshold]
+
+    @cached_property
+    def top_hotspots(self) -> List[File]:
+        """Tracked files with a hotspot score above 0, highest first."""
+        hotspots = [f for f in self.tracked_files if (_kpi_value(f, 'hotspot') or 0) > 0]
+        hotspots.sort(key=lambda f: _kpi_value(f, 'hotspot'), reverse=True)
+        return hotspots
+
+    @cached_property
+    def file_grades(self) -> Dict[str, str]:
+        """Complexity grade ('A'-'F') of each tracked file with complexity, by file path."""
+        return {
+            f.file_path: grade(_kpi_value(f, 'complexity'), self.threshold_low, self.threshold_high)
+            for f in self.tracked_files if _kpi_value(f, 'complexity') is not None
+        }
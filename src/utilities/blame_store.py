@@ -0,0 +1,313 @@
+"""
+Blame Store
+-----------
+Memory-bounded storage for raw git blame output with spill-to-disk.
+
+Raw ``git blame --line-porcelain`` output is by far the largest thing
+GitDataCache holds: roughly 10-15 lines of porcelain per source line.
+BlameStore keeps it under a byte budget (UTF-8 size of the output) shared
+by all repositories.
+When the budget is exceeded, entries are evicted least-recently-used
+repository first, and within a repository least-recently-used file
+first. Evicted entries are written (zlib-compressed) to a temporary
+directory and transparently re-read on the next access.
+
+GitDataCache exposes one RepoBlameView per repository through
+``blame_cache[repo_root]``, so callers keep using the familiar
+``{repo_root: {file_path: blame_output}}`` mapping shape.
+
+All public methods are serialized on one lock, so repositories analyzed
+on parallel worker threads can share the store and its budget.
+"""
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import wraps
+from typing import Dict, Iterator, Optional, Set, Tuple
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+import zlib
+
+from src.utilities.debug import debug_print
+
+
+def _synchronized(method):
+    """Run a BlameStore method while holding the store's lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _entry_size(value: Optional[str]) -> int:
+    """Size of a blame entry in bytes (UTF-8), counted against the budget."""
+    if not value:
+        return 0
+    # Porcelain output is mostly ASCII, where characters and bytes match; skip the encode then
+    return len(value) if value.isascii() else len(value.encode('utf-8'))
+
+
+class BlameStore:
+    """
+    Byte-bounded, two-level LRU store for blame output.
+
+    Args:
+        memory_budget_bytes: Maximum bytes of blame output kept in memory.
+                             None or 0 disables eviction.
+        spill_dir: Optional directory for spilled entries (default: a
+                   private temporary directory created on first spill)
+
+    Example:
+        >>> store = BlameStore(memory_budget_bytes=10 * 1024 * 1024)
+        >>> store.put("/repo", "src/main.py", blame_output)
+        >>> store.get("/repo", "src/main.py")  # memory or disk, same result
+    """
+
+    def __init__(self, memory_budget_bytes: Optional[int] = None, spill_dir: Optional[str] = None):
+        self.memory_budget_bytes = memory_budget_bytes
+        # repo_root -> OrderedDict(file_path -> blame output); repo order is LRU order
+        self._memory: "OrderedDict[str, OrderedDict[str, Optional[str]]]" = OrderedDict()
+        # (repo_root, file_path) -> (path on disk, uncompressed size)
+        self._spilled: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        # repo_root -> file paths in _spilled, so per-repository lookups do not scan every spilled entry
+        self._spilled_by_repo: Dict[str, Set[str]] = {}
+        self._spill_dir = spill_dir
+        self._finalizer = None
+        self._lock = threading.RLock()
+
+        self.bytes_in_memory = 0
+        self.bytes_on_disk = 0
+        self.evictions = 0
+        self.disk_reads = 0
+
+    # ------------------------------------------------------------------
+    # Mapping-style access
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def contains(self, repo_root: str, file_path: str) -> bool:
+        """Return True if an entry exists in memory or on disk."""
+        repo_entries = self._memory.get(repo_root)
+        if repo_entries is not None and file_path in repo_entries:
+            return True
+        return (repo_root, file_path) in self._spilled
+
+    @_synchronized
+    def get(self, repo_root: str, file_path: str) -> Optional[str]:
+        """
+        Return the blame output for a file, re-reading it from disk if spilled.
+
+        Raises:
+            KeyError: If no entry exists for the file
+        """
+        repo_entries = self._memory.get(repo_root)
+        if repo_entries is not None and file_path in repo_entries:
+            self._memory.move_to_end(repo_root)
+            repo_entries.move_to_end(file_path)
+            return repo_entries[file_path]
+
+        key = (repo_root, file_path)
+        if key not in self._spilled:
+            raise KeyError(file_path)
+
+        value = self._read_spilled(key)
+        self.disk_reads += 1
+        self.put(repo_root, file_path, value)
+        return value
+
+    @_synchronized
+    def put(self, repo_root: str, file_path: str, value: Optional[str]):
+        """Store blame output for a file and evict older entries if over budget."""
+        self._discard_spilled((repo_root, file_path))
+
+        repo_entries = self._memory.setdefault(repo_root, OrderedDict())
+        if file_path in repo_entries:
+            self.bytes_in_memory -= _entry_size(repo_entries[file_path])
+        repo_entries[file_path] = value
+        repo_entries.move_to_end(file_path)
+        self._memory.move_to_end(repo_root)
+        self.bytes_in_memory += _entry_size(value)
+
+        self._enforce_budget(keep=(repo_root, file_path))
+
+    @_synchronized
+    def delete(self, repo_root: str, file_path: str):
+        """Remove an entry from memory and disk."""
+        repo_entries = self._memory.get(repo_root)
+        found = False
+        if repo_entries is not None and file_path in repo_entries:
+            self.bytes_in_memory -= _entry_size(repo_entries.pop(file_path))
+            found = True
+        if (repo_root, file_path) in self._spilled:
+            self._discard_spilled((repo_root, file_path))
+            found = True
+        if not found:
+            raise KeyError(file_path)
+
+    @_synchronized
+    def keys(self, repo_root: str) -> list:
+        """Return all file paths stored for a repository."""
+        # An entry is either in memory or on disk (put() discards the spilled copy)
+        return list(self._memory.get(repo_root, ())) + list(self._spilled_by_repo.get(repo_root, ()))
+
+    @_synchronized
+    def clear(self, repo_root: Optional[str] = None):
+        """Clear entries for one repository, or everything."""
+        if repo_root is None:
+            self._memory.clear()
+            for key in list(self._spilled):
+                self._discard_spilled(key)
+            self.bytes_in_memory = 0
+            return
+
+        for file_path in list(self._spilled_by_repo.get(repo_root, ())):
+            self._discard_spilled((repo_root, file_path))
+        repo_entries = self._memory.pop(repo_root, None) or {}
+        self.bytes_in_memory -= sum(_entry_size(value) for value in repo_entries.values())
+
+    def view(self, repo_root: str) -> 'RepoBlameView':
+        """Return a dict-like view of one repository's entries."""
+        return RepoBlameView(self, repo_root)
+
+    # ------------------------------------------------------------------
+    # Eviction and spilling
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def set_budget(self, memory_budget_bytes: Optional[int]):
+        """Change the memory budget, evicting immediately if needed."""
+        self.memory_budget_bytes = memory_budget_bytes
+        self._enforce_budget()
+
+    def _enforce_budget(self, keep: Optional[Tuple[str, str]] = None):
+        """Evict LRU entries (oldest repository first) until under budget."""
+        if not self.memory_budget_bytes:
+            return
+
+        while self.bytes_in_memory > self.memory_budget_bytes and self._memory:
+            repo_root, repo_entries = next(iter(self._memory.items()))
+            if not repo_entries:
+                del self._memory[repo_root]
+                continue
+            file_path = next(iter(repo_entries))
+            if (repo_root, file_path) == keep:
+                # Never evict the entry being inserted, even if it alone exceeds the budget
+                break
+            self._spill(repo_root, file_path, repo_entries.pop(file_path))
+
+    def _spill(self, repo_root: str, file_path: str, value: Optional[str]):
+        """Move one entry from memory to disk."""
+        size = _entry_size(value)
+        self.bytes_in_memory -= size
+        self.evictions += 1
+
+        if value is None:
+            # Failed blames are cheap to recompute and take no space; just drop them
+            return
+
+        path = os.path.join(self._ensure_spill_dir(), self._spill_name(repo_root, file_path))
+        with open(path, 'wb') as f:
+            f.write(zlib.compress(value.encode('utf-8'), 1))
+        self._spilled[(repo_root, file_path)] = (path, size)
+        self._spilled_by_repo.setdefault(repo_root, set()).add(file_path)
+        self.bytes_on_disk += os.path.getsize(path)
+        debug_print(f"[CACHE] Spilled git blame for {file_path} to disk ({size} bytes)")
+
+    def _read_spilled(self, key: Tuple[str, str]) -> str:
+        path, _ = self._spilled[key]
+        with open(path, 'rb') as f:
+            return zlib.decompress(f.read()).decode('utf-8')
+
+    def _discard_spilled(self, key: Tuple[str, str]):
+        entry = self._spilled.pop(key, None)
+        if entry is None:
+            return
+        repo_root, file_path = key
+        repo_spilled = self._spilled_by_repo.get(repo_root)
+        if repo_spilled is not None:
+            repo_spilled.discard(file_path)
+            if not repo_spilled:
+                del self._spilled_by_repo[repo_root]
+        path, _ = entry
+        try:
+            self.bytes_on_disk -= os.path.getsize(path)
+            os.remove(path)
+        except OSError as e:
+            debug_print(f"[CACHE] Could not remove spilled blame {path}: {e}")
+
+    def _ensure_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='metricmancer-blame-')
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        else:
+            os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    @staticmethod
+    def _spill_name(repo_root: str, file_path: str) -> str:
+        digest = hashlib.sha1(f"{repo_root}\0{file_path}".encode('utf-8')).hexdigest()
+        return f"{digest}.blame.z"
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def entry_count(self) -> int:
+        """Number of entries in memory and on disk."""
+        return sum(len(entries) for entries in self._memory.values()) + len(self._spilled)
+
+    @_synchronized
+    def repo_entry_count(self, repo_root: str) -> int:
+        """Number of entries for one repository."""
+        return len(self._memory.get(repo_root, ())) + len(self._spilled_by_repo.get(repo_root, ()))
+
+    @_synchronized
+    def stats(self) -> Dict[str, int]:
+        """Return memory/disk usage and eviction counters."""
+        return {
+            "memory_budget_bytes": self.memory_budget_bytes or 0,
+            "blame_bytes_in_memory": self.bytes_in_memory,
+            "blame_bytes_on_disk": self.bytes_on_disk,
+            "blame_entries_spilled": len(self._spilled),
+            "evictions": self.evictions,
+            "disk_reads": self.disk_reads,
+        }
+
+
+class RepoBlameView(MutableMapping):
+    """Dict-like view of a single repository's entries in a BlameStore."""
+
+    def __init__(self, store: BlameStore, repo_root: str):
+        self._store = store
+        self._repo_root = repo_root
+
+    def __getitem__(self, file_path: str) -> Optional[str]:
+        return self._store.get(self._repo_root, file_path)
+
+    def __setitem__(self, file_path: str, value: Optional[str]):
+        self._store.put(self._repo_root, file_path, value)
+
+    def __delitem__(self, file_path: str):
+        self._store.delete(self._repo_root, file_path)
+
+    def __contains__(self, file_path) -> bool:
+        return self._store.contains(self._repo_root, file_path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.keys(self._repo_root))
+
+    def __len__(self) -> int:
+        return self._store.repo_entry_count(self._repo_root)
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, MutableMapping)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"RepoBlameView({self._repo_root!r}, {len(self)} entries)"
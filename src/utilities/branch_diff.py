@@ -0,0 +1,164 @@
+"""
+Branch Diff Service
+-------------------
+One place that answers "what changed on this branch?" for a run.
+
+The HTML review tab, the review-strategy report and the delta review all
+compare the current branch with a base branch. Each used to run its own
+rev-parse, diff --name-only and full diff for the same repository and base.
+BranchDiffService resolves them once per (repository, base branch) and
+memoizes:
+
+- the current branch and the commit a ref points to
+- the merge base of base and target (what `git diff base...target` compares)
+- the changed paths
+- the changed lines per file, from one full diff fetched only when a
+  consumer asks for hunks and parsed file section by file section
+  (FunctionDiffParser.iter_git_diff); the raw diff text is not kept
+
+MetricMancerApp starts one service per run (and per watch render, since HEAD
+may have moved in between). Outside of a run, get_branch_diff_service()
+returns a fresh service, so nothing is remembered across calls.
+
+All commands still go through the GitRunner (timeouts, budget, spans).
+Failures are never memoized; the next caller retries.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utilities.debug import debug_print
+from src.utilities.git_helpers import check_git_output, find_git_repo_root
+
+# Commits inspected when the current branch is the base branch itself
+RECENT_COMMITS = 10
+
+
+class BranchDiffService:
+    """Memoized branch comparisons for one run; safe to share between threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, Any] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+
+    def _once(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value for key, computing it at most once at a time."""
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+    def current_branch(self, repo_path: str) -> str:
+        """
+        Name of the branch checked out in the repository containing repo_path.
+
+        Raises:
+            subprocess.CalledProcessError: If git fails, times out or is skipped
+        """
+        repo_root = find_git_repo_root(repo_path)
+        return self._once(('branch', repo_root), lambda: check_git_output(
+            repo_root, ['rev-parse', '--abbrev-ref', 'HEAD']).strip())
+
+    def commit_hash(self, repo_path: str, ref: str) -> str:
+        """
+        Full commit hash a ref points to.
+
+        Raises:
+            subprocess.CalledProcessError: If git fails, times out or is skipped
+        """
+        repo_root = find_git_repo_root(repo_path)
+        return self._once(('commit', repo_root, ref), lambda: check_git_output(
+            repo_root, ['rev-parse', ref]).strip())
+
+    def merge_base(self, repo_path: str, base_ref: str, target_ref: str = 'HEAD') -> str:
+        """
+        Commit that `git diff base_ref...target_ref` compares target_ref with.
+
+        Raises:
+            subprocess.CalledProcessError: If git fails, times out or is skipped
+        """
+        repo_root = find_git_repo_root(repo_path)
+        base_commit = self.commit_hash(repo_root, base_ref)
+        target_commit = self.commit_hash(repo_root, target_ref)
+        return self._once(('merge-base', repo_root, base_commit, target_commit), lambda: check_git_output(
+            repo_root, ['merge-base', base_commit, target_commit]).strip())
+
+    def changed_files(self, repo_path: str, base_branch: str = "main") -> List[str]:
+        """
+        Absolute paths of the files changed on the current branch.
+
+        On the base branch itself, the files changed in the last RECENT_COMMITS
+        commits are returned instead.
+
+        Returns:
+            List of absolute file paths, or [] if git fails
+        """
+        try:
+            repo_root = find_git_repo_root(repo_path)
+            if self.current_branch(repo_root) == base_branch:
+                debug_print("[DEBUG] BranchDiffService: On base branch, getting recent commits")
+                range_args = [f'HEAD~{RECENT_COMMITS}..HEAD']
+            else:
+                debug_print(f"[DEBUG] BranchDiffService: Comparing to {base_branch}")
+                range_args = [self.merge_base(repo_root, base_branch), self.commit_hash(repo_root, 'HEAD')]
+            paths = self._once(('names', repo_root) + tuple(range_args), lambda: check_git_output(
+                repo_root, ['diff', '--name-only'] + range_args).split('\n'))
+        except Exception as e:
+            debug_print(f"[DEBUG] BranchDiffService: changed files vs {base_branch} failed: {e}")
+            return []
+        return [os.path.join(repo_root, path.strip()) for path in paths if path.strip()]
+
+    def file_changes(self, repo_path: str, base_ref: str, target_ref: str) -> List[Dict[str, Any]]:
+        """
+        Changed files with their changed line numbers (FunctionDiffParser.parse_git_diff format).
+
+        Compares target_ref with its merge base with base_ref (`git diff base...target`).
+        Only the parsed result is memoized; the diff text is dropped once parsed.
+
+        Raises:
+            subprocess.CalledProcessError: If git fails, times out or is skipped
+        """
+        # Imported here: unidiff is only needed once hunks are requested
+        from src.analysis.delta.function_diff_parser import FunctionDiffParser
+
+        repo_root = find_git_repo_root(repo_path)
+        base_commit = self.merge_base(repo_root, base_ref, target_ref)
+        target_commit = self.commit_hash(repo_root, target_ref)
+
+        def parse() -> List[Dict[str, Any]]:
+            diff = check_git_output(repo_root, ['diff', base_commit, target_commit])
+            return FunctionDiffParser().parse_git_diff(diff)
+
+        return self._once(('hunks', repo_root, base_commit, target_commit), parse)
+
+
+# Service of the running analysis; None outside of MetricMancerApp.run()
+_service: Optional[BranchDiffService] = None
+
+
+def start_branch_diff_service() -> BranchDiffService:
+    """Install a fresh BranchDiffService for the current run and return it."""
+    global _service
+    _service = BranchDiffService()
+    return _service
+
+
+def stop_branch_diff_service() -> Optional[BranchDiffService]:
+    """Forget the run's BranchDiffService and return it, if any."""
+    global _service
+    service, _service = _service, None
+    return service
+
+
+def get_branch_diff_service() -> BranchDiffService:
+    """Return the run's BranchDiffService, or a fresh one when no run is active."""
+    return _service if _service is not None else BranchDiffService()
@@ -0,0 +1,176 @@
+"""
+Churn Histogram
+---------------
+Compact per-file commit histograms built from a single ``git log`` pass.
+
+Instead of running one ``git log --since`` per file and per churn period,
+GitDataCache runs one log over the whole repository and buckets each
+commit timestamp into fixed-width bins (counted backwards from "now").
+Any churn window, a coarser view (e.g. weekly bins) or a churn
+acceleration figure can then be derived in memory.
+"""
+from array import array
+from typing import Dict, Iterable, Optional, Set
+import time
+
+SECONDS_PER_DAY = 86400
+
+# Marker emitted in front of each commit by the log format used below
+# (git expands %x00 to a NUL byte, which can never appear in a path).
+COMMIT_MARKER = '\x00'
+
+# Bin counters are unsigned 16-bit; saturate instead of overflowing.
+_MAX_BIN_COUNT = 0xFFFF
+
+
+def build_log_args(horizon_days: int) -> list[str]:
+    """
+    Build the git arguments for the single-pass churn log.
+
+    Args:
+        horizon_days: How far back (in days) commits are collected
+
+    Returns:
+        Argument list for run_git_command()
+    """
+    return [
+        '-c', 'core.quotePath=false',
+        'log', '--since', f'{horizon_days} days ago',
+        '--no-merges', '--no-renames', '--relative',
+        '--format=%x00%ct', '--name-only'
+    ]
+
+
+class ChurnHistogram:
+    """
+    Commit counts for one file, bucketed by age.
+
+    Bin ``i`` holds the number of commits whose age is in
+    ``[i * bin_days, (i + 1) * bin_days)`` days relative to the time the
+    histogram was built. Trailing empty bins are never stored, so files
+    without recent commits cost only the object header.
+
+    Example:
+        >>> hist = ChurnHistogram(bin_days=1)
+        >>> hist.add(age_days=3)
+        >>> hist.add(age_days=40)
+        >>> hist.window(30)
+        1
+        >>> hist.window(90)
+        2
+    """
+
+    __slots__ = ('bin_days', 'bins')
+
+    def __init__(self, bin_days: int = 1, bins: Optional[Iterable[int]] = None):
+        if bin_days < 1:
+            raise ValueError("bin_days must be at least 1")
+        self.bin_days = bin_days
+        self.bins = array('H', bins or [])
+
+    def add(self, age_days: float, count: int = 1):
+        """Record ``count`` commits of the given age (negative ages count as 0)."""
+        index = max(0, int(age_days // self.bin_days))
+        if index >= len(self.bins):
+            self.bins.extend([0] * (index + 1 - len(self.bins)))
+        self.bins[index] = min(_MAX_BIN_COUNT, self.bins[index] + count)
+
+    def window(self, days: int) -> int:
+        """
+        Number of commits within the last ``days`` days.
+
+        Exact when ``days`` is a multiple of ``bin_days``; otherwise the
+        partially covered bin is included.
+        """
+        if days <= 0:
+            return 0
+        n_bins = -(-days // self.bin_days)  # ceil division
+        return sum(self.bins[:n_bins])
+
+    def total(self) -> int:
+        """Number of commits across the whole histogram."""
+        return sum(self.bins)
+
+    def rebin(self, bin_days: int) -> 'ChurnHistogram':
+        """
+        Return a coarser histogram (e.g. ``rebin(7)`` for weekly bins).
+
+        Args:
+            bin_days: New bin width; must be a multiple of the current width
+        """
+        if bin_days % self.bin_days:
+            raise ValueError(f"bin_days ({bin_days}) must be a multiple of {self.bin_days}")
+        factor = bin_days // self.bin_days
+        coarse = ChurnHistogram(bin_days)
+        for index, count in enumerate(self.bins):
+            if count:
+                coarse.add(index // factor * bin_days, count)
+        return coarse
+
+    def acceleration(self, short_days: int, long_days: int) -> Optional[float]:
+        """
+        Ratio of the recent commit rate to the long-term commit rate.
+
+        1.0 means the file changes at its usual pace, values above 1.0 mean
+        churn is accelerating. Returns None when the long window is empty.
+
+        Example:
+            >>> hist.acceleration(30, 365)  # 6 commits last month, 12 last year
+            6.08
+        """
+        long_count = self.window(long_days)
+        if not long_count or short_days <= 0:
+            return None
+        short_rate = self.window(short_days) / short_days
+        long_rate = long_count / long_days
+        return round(short_rate / long_rate, 2)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bin storage in bytes."""
+        return self.bins.itemsize * len(self.bins)
+
+    def __eq__(self, other):
+        if not isinstance(other, ChurnHistogram):
+            return NotImplemented
+        return self.bin_days == other.bin_days and self.bins == other.bins
+
+    def __repr__(self):
+        return f"ChurnHistogram(bin_days={self.bin_days}, bins={list(self.bins)})"
+
+
+def parse_churn_log(log_output: str, wanted_files: Optional[Set[str]] = None,
+                    now: Optional[float] = None, bin_days: int = 1) -> Dict[str, ChurnHistogram]:
+    """
+    Parse output of the ``build_log_args()`` log into per-file histograms.
+
+    Args:
+        log_output: Raw git log output (commit markers followed by file names)
+        wanted_files: Optional set of relative paths to keep; other paths are ignored
+        now: Reference timestamp for ages (default: current time)
+        bin_days: Bin width in days
+
+    Returns:
+        Dict mapping relative file path to its ChurnHistogram
+    """
+    now = time.time() if now is None else now
+    histograms: Dict[str, ChurnHistogram] = {}
+    age_days = None
+
+    for line in log_output.splitlines():
+        if line.startswith(COMMIT_MARKER):
+            try:
+                age_days = (now - int(line[1:])) / SECONDS_PER_DAY
+            except ValueError:
+                age_days = None
+            continue
+        if age_days is None or not line:
+            continue
+        if wanted_files is not None and line not in wanted_files:
+            continue
+        histogram = histograms.get(line)
+        if histogram is None:
+            histogram = histograms[line] = ChurnHistogram(bin_days)
+        histogram.add(age_days)
+
+    return histograms
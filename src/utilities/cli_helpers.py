@@ -32,14 +32,54 @@ def _print_output_options():
     """Print output formatting options."""
     print("\nOUTPUT FORMATTING:")
     print("  --output-format <format>     Set the output format. Options: 'summary' (default dashboard), "
-          "'quick-wins' (prioritized improvements), 'tree' (file tree), 'html', 'json'.")
+          "'quick-wins' (prioritized improvements), 'tree' (file tree), 'html', 'json', "
+          "'opensearch' (bulk export to OpenSearch).")
     print("  --output-formats <formats>   Generate multiple formats in one run (comma-separated). "
           "Example: 'html,json,summary,review-strategy'. Includes 'review-strategy' and 'review-strategy-branch'. "
           "Scans code once, generates all formats.")
     print("  --level <level>              Set the detail level for reports. Options: 'file' (default), 'function'.")
     print("  --hierarchical               (JSON only) Output the full hierarchical data model "
           "instead of a flat list.")
+    print("  --html-chunked               (HTML only) Write a small shell page plus per-directory data chunks "
+          "(<report>_data/) that are loaded when folders are opened; tables are paginated.")
+    print("  --opensearch-url <url>       (opensearch only) OpenSearch endpoint, optionally with user:password@ "
+          "(default: http://localhost:9200).")
+    print("  --opensearch-index <name>    (opensearch only) Index the records are written to "
+          "(default: metricmancer-metrics).")
+    print("  --opensearch-batch-mb <mb>   (opensearch only) Maximum size of one _bulk request (default: 5).")
     print("  --churn-period <days>        Number of days to analyze for code churn (default: 30).")
+    print("  --cache-memory-mb <mb>       Memory budget for cached git blame data; older entries spill "
+          "to disk (default: 256, 0 = unbounded).")
+    print("  --workers <n>                Number of repositories analyzed in parallel, largest first "
+          "(default: 4, 1 = sequential).")
+    print("  --report-workers <n>         Number of reports generated concurrently across formats and repositories; "
+          "HTML is rendered in forked processes (default: 4, 1 = serial).")
+    print("  --git-timeout <seconds>      Timeout per git command; files whose blame/log times out get their "
+          "git KPIs marked 'skipped (timeout)' (default: 120, 0 = none).")
+    print("  --git-budget <seconds>       Total time all git commands may take in one run; later commands are "
+          "skipped (default: 0 = unlimited).")
+    print("  --ownership-sample-lines <n> Files with more lines get approximate ownership from sampled git blame "
+          "ranges (default: 20000, 0 = always blame the whole file).")
+    print("  --generated-files <mode>     Generated, minified and vendored files (.gitattributes linguist-*, "
+          "headers, line length): 'skip', 'reduced' (churn only, default) or 'analyze'.")
+    print("  --cognitive-languages <set>  Files scored for cognitive complexity: 'python' (default) or 'all' "
+          "(also Java, Go, JavaScript, TypeScript, C and C++).")
+    print("  --cognitive-time-limit <s>   Seconds one file's cognitive complexity may take; slower files get "
+          "no value (default: 2.0, 0 = no limit).")
+    print("  --watch                      Keep running after the first report: poll the scanned directories, "
+          "re-analyze changed files and re-render the report.")
+    print("  --watch-interval <seconds>   Seconds between polls in --watch mode (default: 0.5).")
+    print("  --trace-file <file>          Write a Chrome trace-event JSON file with spans for scanning, "
+          "git commands, parsing, KPIs and reports (open in https://ui.perfetto.dev).")
+    print("  --profile                    Print the slowest files (read, parse, cognitive, churn, blame) and "
+          "git commands after the timing summary.")
+    print("  --profile-top <n>            Number of slowest files and git commands to keep (default: 10).")
+    print("  --profile-output <file>      Write the profile as JSON to this file (implies --profile).")
+    print("  --memory-profile             Record peak memory per phase (scan, cache prebuild, file analysis, "
+          "aggregation, each report format); slows the run.")
+    print("  --memory-threshold-mb <mb>   List top allocation sites of phases peaking above this (default: 100).")
+    print("  --memory-output <file>       JSON file for --memory-profile (default: <report-folder>/"
+          "memory_profile.json).")
     print("  --auto-report-filename       (Optional) Automatically generate a unique report filename "
           "based on date and directories.")
     print(
@@ -181,7 +221,7 @@ def _add_output_args(parser):
         type=str,
         default=Defaults.OUTPUT_FORMAT,
         help=f"Output format: '{Defaults.OUTPUT_FORMAT}' (default dashboard), 'quick-wins' (prioritized improvements), "
-        "'tree' (file tree), 'html', 'json'."
+        "'tree' (file tree), 'html', 'json', 'opensearch' (bulk export to OpenSearch)."
     )
     parser.add_argument(
         "--output-formats",
@@ -203,17 +243,159 @@ def _add_output_args(parser):
         action="store_true",
         help="(JSON only) Output the full hierarchical data model."
     )
+    parser.add_argument(
+        "--html-chunked",
+        action="store_true",
+        help="(HTML only) Write a small shell page plus per-directory data chunks loaded on demand, "
+             "for repositories too large for a single HTML file."
+    )
+    parser.add_argument(
+        "--opensearch-url",
+        type=str,
+        default=Defaults.OPENSEARCH_URL,
+        help=f"(opensearch only) OpenSearch endpoint, optionally with user:password@ "
+             f"(default: {Defaults.OPENSEARCH_URL})."
+    )
+    parser.add_argument(
+        "--opensearch-index",
+        type=str,
+        default=Defaults.OPENSEARCH_INDEX,
+        help=f"(opensearch only) Index the records are written to (default: {Defaults.OPENSEARCH_INDEX})."
+    )
+    parser.add_argument(
+        "--opensearch-batch-mb",
+        type=float,
+        default=Defaults.OPENSEARCH_BATCH_MB,
+        help=f"(opensearch only) Maximum size of one _bulk request in MB (default: {Defaults.OPENSEARCH_BATCH_MB:g})."
+    )
     parser.add_argument(
         "--churn-period",
         type=int,
         default=Defaults.CHURN_PERIOD,
         help=f"Number of days to analyze for code churn (default: {Defaults.CHURN_PERIOD})."
     )
+    parser.add_argument(
+        "--cache-memory-mb",
+        type=int,
+        default=Defaults.GIT_CACHE_MEMORY_MB,
+        help=f"Memory budget in MB for cached git blame data; older entries spill to disk "
+             f"(default: {Defaults.GIT_CACHE_MEMORY_MB}, 0 = unbounded)."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=Defaults.ANALYSIS_WORKERS,
+        help=f"Number of repositories analyzed in parallel, largest first "
+             f"(default: {Defaults.ANALYSIS_WORKERS}, 1 = sequential)."
+    )
+    parser.add_argument(
+        "--report-workers",
+        type=int,
+        default=Defaults.REPORT_WORKERS,
+        help=f"Number of reports generated concurrently across formats and repositories; HTML is rendered "
+             f"in forked processes where available (default: {Defaults.REPORT_WORKERS}, 1 = serial)."
+    )
+    parser.add_argument(
+        "--git-timeout",
+        type=float,
+        default=Defaults.GIT_TIMEOUT_SECONDS,
+        help=f"Timeout in seconds per git command; files whose git commands time out get their git KPIs "
+             f"marked 'skipped (timeout)' (default: {Defaults.GIT_TIMEOUT_SECONDS:g}, 0 = none)."
+    )
+    parser.add_argument(
+        "--git-budget",
+        type=float,
+        default=Defaults.GIT_BUDGET_SECONDS,
+        help="Total seconds all git commands may take in one run; later commands are skipped "
+             "(default: 0 = unlimited)."
+    )
+    parser.add_argument(
+        "--ownership-sample-lines",
+        type=int,
+        default=Defaults.OWNERSHIP_SAMPLE_MIN_LINES,
+        help=f"Files with more lines get approximate ownership from sampled git blame ranges "
+             f"(default: {Defaults.OWNERSHIP_SAMPLE_MIN_LINES}, 0 = always blame the whole file)."
+    )
+    parser.add_argument(
+        "--generated-files",
+        choices=["skip", "reduced", "analyze"],
+        default=Defaults.GENERATED_FILES_MODE,
+        help=f"How to handle generated, minified and vendored files: 'skip' them, analyze them in 'reduced' "
+             f"mode (churn only, no parsing or blame) or 'analyze' them fully "
+             f"(default: {Defaults.GENERATED_FILES_MODE})."
+    )
+    parser.add_argument(
+        "--cognitive-languages",
+        choices=["python", "all"],
+        default=Defaults.COGNITIVE_LANGUAGES,
+        help=f"Files scored for cognitive complexity: 'python' only, or 'all' languages with a calculator "
+             f"(Java, Go, JavaScript, TypeScript, C, C++) (default: {Defaults.COGNITIVE_LANGUAGES})."
+    )
+    parser.add_argument(
+        "--cognitive-time-limit",
+        type=float,
+        default=Defaults.COGNITIVE_TIME_LIMIT_SECONDS,
+        help=f"Seconds one file's cognitive complexity may take; slower files get no value "
+             f"(default: {Defaults.COGNITIVE_TIME_LIMIT_SECONDS}, 0 = no limit)."
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running after the first report: poll the scanned directories for changes, re-analyze "
+             "only changed files and re-render the report (Ctrl+C to stop)."
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=Defaults.WATCH_INTERVAL_SECONDS,
+        help=f"Seconds between polls in --watch mode (default: {Defaults.WATCH_INTERVAL_SECONDS})."
+    )
     parser.add_argument(
         "--no-timing",
         action="store_true",
         help="Suppress timing information output."
     )
+    parser.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Write a Chrome trace-event JSON file of the run (open in https://ui.perfetto.dev)."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the slowest files and git commands after the timing summary."
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=Defaults.PROFILE_TOP_K,
+        help=f"Number of slowest files and git commands to keep with --profile (default: {Defaults.PROFILE_TOP_K})."
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=None,
+        help="Write the --profile report as JSON to this file (implies --profile)."
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="Record peak memory (tracemalloc and RSS) per pipeline phase and write it as JSON."
+    )
+    parser.add_argument(
+        "--memory-threshold-mb",
+        type=float,
+        default=Defaults.MEMORY_SITES_THRESHOLD_MB,
+        help=f"With --memory-profile, list top allocation sites of phases whose peak exceeds this "
+             f"(default: {Defaults.MEMORY_SITES_THRESHOLD_MB:g})."
+    )
+    parser.add_argument(
+        "--memory-output",
+        type=str,
+        default=None,
+        help=f"JSON file for --memory-profile (default: <report-folder>/{Defaults.MEMORY_OUTPUT})."
+    )
 
 
 def _add_hotspot_args(parser):
@@ -0,0 +1,106 @@
+"""
+File Reader
+-----------
+Binary-safe reading of source files, decoding only what gets parsed.
+
+FileAnalyzer used to open every file in text mode and decode all of it
+before knowing whether the parser would find anything in it. For repos full
+of large data-like ``.json`` and ``.yaml`` files, that decoding was wasted
+work. SourceFile instead:
+
+- reads small files with one ``read()`` and memory-maps files of at least
+  Defaults.READ_MMAP_MIN_BYTES, so prefiltering and line counting a large
+  file never copy it into a Python object
+- detects binary files from a NUL byte in the first
+  Defaults.READ_BINARY_PROBE_BYTES (the heuristic git uses)
+- lets the parser's byte-level prefilter (ComplexityParser.PREFILTER) run on
+  the raw content; decode() is called only for files that go on to parsing
+
+decode() and line_count() give the same results as reading the file in text
+mode with ``encoding='utf-8', errors='ignore'`` (universal newlines).
+"""
+import mmap
+import os
+from pathlib import Path
+from typing import Union
+
+from src.config.defaults import Defaults
+
+_CHUNK_BYTES = 1 << 20
+
+
+class SourceFile:
+    """
+    Raw content of one file, memory-mapped if it is large.
+
+    Usage:
+        with SourceFile(path) as source:
+            if not source.is_binary() and parser.may_contain_functions(source.data):
+                content = source.decode()
+    """
+
+    def __init__(self, path: Union[str, Path], mmap_min_bytes: int = Defaults.READ_MMAP_MIN_BYTES):
+        """
+        Open a file for reading (raises OSError like open()).
+
+        Args:
+            path: File to read
+            mmap_min_bytes: Memory-map files at least this large (0 = never)
+        """
+        self._file = Path(path).open('rb')
+        self._mmap = None
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            if mmap_min_bytes and self.size >= mmap_min_bytes:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.data = self._mmap
+            else:
+                self.data = self._file.read()
+        except (OSError, ValueError):
+            self.close()
+            raise
+
+    @property
+    def mapped(self) -> bool:
+        """True if the content is memory-mapped."""
+        return self._mmap is not None
+
+    def is_binary(self, probe_bytes: int = Defaults.READ_BINARY_PROBE_BYTES) -> bool:
+        """Return True if the first probe_bytes contain a NUL byte."""
+        return self.data.find(b'\0', 0, probe_bytes) != -1
+
+    def line_count(self) -> int:
+        """Count newlines as text mode would (\\r\\n and lone \\r count once each)."""
+        if self.data.find(b'\r') == -1:
+            return self._count(b'\n')
+        return self._count(b'\n') + self._count(b'\r') - self._count(b'\r\n')
+
+    def decode(self) -> str:
+        """Decode the content as UTF-8 (ignoring invalid bytes) with universal newlines."""
+        text = self.data[:].decode('utf-8', errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def _count(self, needle: bytes) -> int:
+        """Count non-overlapping occurrences of a 1-2 byte needle, chunk by chunk for mmaps."""
+        if not self.mapped:
+            return self.data.count(needle)
+        count = 0
+        for start in range(0, self.size, _CHUNK_BYTES):
+            # Overlap by len(needle) - 1 bytes so a needle across a chunk border is found (once)
+            count += self.data[start:start + _CHUNK_BYTES + len(needle) - 1].count(needle)
+        return count
+
+    def close(self):
+        """Release the mmap and the file handle."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
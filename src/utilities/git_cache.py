@@ -6,9 +6,17 @@ Implements the cache design from Issue #38.
 """
 from typing import Dict, Optional, Any, Set
 import os
+import threading
 from collections import Counter
+from src.config.defaults import Defaults
+from src.utilities.blame_sampling import (
+    OwnershipEstimate, blame_range_args, count_lines, estimate_ownership, stratified_ranges
+)
+from src.utilities.blame_store import BlameStore
+from src.utilities.churn_histogram import ChurnHistogram, build_log_args, parse_churn_log
 from src.utilities.debug import debug_print
 from src.utilities.git_helpers import run_git_command
+from src.utilities.git_runner import GIT_SKIPPED_TIMEOUT, get_git_runner
 
 
 class GitDataCache:
@@ -18,8 +26,11 @@ class GitDataCache:
     Cache structure:
     - ownership_cache = {repo_root: {file_path: {author: ownership_percent}}}
     - churn_cache = {repo_root: {file_path: churn_value}}
-    - blame_cache = {repo_root: {file_path: blame_data}}
+    - blame_cache = {repo_root: {file_path: blame_data}}  (memory-bounded, spills to disk)
     - tracked_files_cache = {repo_root: set(tracked_files)}
+    - churn_histogram_cache = {repo_root: {file_path: ChurnHistogram}}
+    - skipped_files = {repo_root: {file_path: reason}}  (git commands that timed out or were skipped)
+    - ownership_estimates = {repo_root: {file_path: OwnershipEstimate}}  (large files, sampled blame)
 
     Helper Methods (organized by function):
 
@@ -36,20 +47,44 @@ class GitDataCache:
     Data Calculation:
         - _calculate_ownership_from_blame(): Extract ownership percentages from blame output
         - _calculate_churn(): Calculate churn count for a file within time period
+        - _build_churn_histograms(): Bucket commit timestamps for all files in one git log pass
     """
 
-    def __init__(self, churn_period_days: int = 30):
+    def __init__(self, churn_period_days: int = 30, memory_budget_bytes: Optional[int] = None):
         # Cache for different types of git data
         self.ownership_cache: Dict[str, Dict[str, Dict[str, float]]] = {}
         self.churn_cache: Dict[str, Dict[str, int]] = {}
-        self.blame_cache: Dict[str, Dict[str, str]] = {}  # Raw git blame output
+        self.blame_cache: Dict[str, Dict[str, str]] = {}  # Raw git blame output, one view per repo
+
+        # Raw blame output is the bulk of the cache; keep it under a memory
+        # budget and spill least-recently-used entries to disk
+        if memory_budget_bytes is None:
+            memory_budget_bytes = Defaults.GIT_CACHE_MEMORY_MB * 1024 * 1024
+        self._blame_store = BlameStore(memory_budget_bytes)
+
+        # Hit/miss counters per cache type, fed by _log_cache_access()
+        self._access_counts: Counter = Counter()
+        self._counts_lock = threading.Lock()
         self.tracked_files_cache: Dict[str, Set[str]] = {}
 
         # Cache for git commands used by multiple KPIs
         self._ls_files_cache: Dict[str, Set[str]] = {}
 
+        # Per-file commit histograms from a single git log pass per repo.
+        # churn_cache values are derived from these when available.
+        self.churn_histogram_cache: Dict[str, Dict[str, ChurnHistogram]] = {}
+
+        # Files whose git commands timed out or were skipped by the GitRunner
+        self.skipped_files: Dict[str, Dict[str, str]] = {}
+
+        # Files above this many lines get ownership from sampled blame ranges (0 = never)
+        self.ownership_sample_min_lines = Defaults.OWNERSHIP_SAMPLE_MIN_LINES
+        self.ownership_estimates: Dict[str, Dict[str, OwnershipEstimate]] = {}
+
         # Churn calculation settings
         self.churn_period_days = churn_period_days
+        # How far back histograms reach; any window up to this is derived in memory
+        self.histogram_days = max(churn_period_days, Defaults.CHURN_HISTOGRAM_DAYS)
 
     # ============================================================================
     # Path and Cache Management Helpers
@@ -104,6 +139,19 @@ class GitDataCache:
         normalized_root = self._normalize_repo_path(repo_root)
         return cache_dict.setdefault(normalized_root, {})
 
+    def _get_blame_cache(self, repo_root: str):
+        """
+        Get the memory-bounded blame mapping for a repository.
+
+        Works like _get_repo_cache() but creates a view onto the shared
+        BlameStore, so entries count against the memory budget and
+        evicted entries are re-read from disk on access.
+        """
+        normalized_root = self._normalize_repo_path(repo_root)
+        if normalized_root not in self.blame_cache:
+            self.blame_cache[normalized_root] = self._blame_store.view(normalized_root)
+        return self.blame_cache[normalized_root]
+
     # ============================================================================
     # Logging and Debugging Helpers
     # ============================================================================
@@ -133,6 +181,8 @@ class GitDataCache:
             Git blame uses special formatting without "data" suffix to match
             existing log format conventions.
         """
+        with self._counts_lock:
+            self._access_counts[(cache_type, hit)] += 1
         status = "Hit" if hit else "Miss"
         # For git blame, don't add "data" suffix to match existing format
         if cache_type == "git blame":
@@ -165,7 +215,33 @@ class GitDataCache:
         if check_file and not self.is_file_tracked(repo_root, check_file):
             return None
 
-        return run_git_command(repo_root, args)
+        output = run_git_command(repo_root, args)
+        if output is None and check_file:
+            self._note_cut_off(repo_root, args, check_file)
+        return output
+
+    def _note_cut_off(self, repo_root: str, args: list[str], file_path: str):
+        """Record file_path in skipped_files if its git command timed out or was skipped."""
+        repo_root = self._normalize_repo_path(repo_root)
+        if get_git_runner().was_cut_off(repo_root, args):
+            self.skipped_files.setdefault(repo_root, {})[file_path] = GIT_SKIPPED_TIMEOUT
+
+    def get_skip_reason(self, repo_root: str, file_path: str) -> Optional[str]:
+        """
+        Return why git data for a file is missing, if a git command for it was cut off.
+
+        Returns:
+            "skipped (timeout)" if a blame or log for the file (or the repo's
+            ls-files) timed out or was skipped by the git budget/circuit breaker,
+            else None
+        """
+        repo_root = self._normalize_repo_path(repo_root)
+        reason = self.skipped_files.get(repo_root, {}).get(file_path)
+        if reason is None and repo_root not in self.tracked_files_cache \
+                and get_git_runner().was_cut_off(repo_root, ['ls-files']):
+            # Without ls-files every file looks untracked, so none of them has git data
+            reason = GIT_SKIPPED_TIMEOUT
+        return reason
 
     # ============================================================================
     # Data Calculation Helpers
@@ -229,16 +305,48 @@ class GitDataCache:
             Uses --oneline for efficient commit counting without full metadata.
         """
         since_date = f"{self.churn_period_days} days ago"
-        output = self._run_git_command(
-            repo_root,
-            ['log', '--oneline', '--since', since_date, '--', file_path]
-        )
+        args = ['log', '--oneline', '--since', since_date, '--', file_path]
+        output = self._run_git_command(repo_root, args)
+        if output is None:
+            self._note_cut_off(repo_root, args, file_path)
 
         if not output:
             return 0
 
         return len([line for line in output.strip().split('\n') if line.strip()])
 
+    def _build_churn_histograms(self, repo_root: str, file_paths: list[str]) -> Dict[str, ChurnHistogram]:
+        """
+        Build commit histograms for many files with a single git log pass.
+
+        Runs one 'git log --name-only' over the last self.histogram_days days
+        and buckets every commit timestamp into daily bins per file. Files
+        without commits in that period get an empty histogram, so a lookup
+        miss always means "not part of the pass" rather than "no churn".
+
+        Args:
+            repo_root: Root directory of the git repository (will be normalized)
+            file_paths: Relative paths of the files to keep histograms for
+
+        Returns:
+            Dictionary mapping file path to ChurnHistogram
+            Empty dict if the git command fails
+
+        Example:
+            >>> hists = cache._build_churn_histograms("/my/repo", ["src/main.py"])
+            >>> hists["src/main.py"].window(30), hists["src/main.py"].window(365)
+            (15, 120)
+        """
+        output = self._run_git_command(repo_root, build_log_args(self.histogram_days))
+        if output is None:
+            return {}
+
+        wanted = set(file_paths)
+        histograms = parse_churn_log(output, wanted_files=wanted)
+        for file_path in wanted - histograms.keys():
+            histograms[file_path] = ChurnHistogram()
+        return histograms
+
     # ============================================================================
     # Public Cache Operations
     # ============================================================================
@@ -254,20 +362,49 @@ class GitDataCache:
         """Clear all caches for a specific repository."""
         self.ownership_cache.pop(repo_root, None)
         self.churn_cache.pop(repo_root, None)
+        self.churn_histogram_cache.pop(repo_root, None)
         self.blame_cache.pop(repo_root, None)
+        self._blame_store.clear(repo_root)
         self.tracked_files_cache.pop(repo_root, None)
         self._ls_files_cache.pop(repo_root, None)
+        self.skipped_files.pop(repo_root, None)
+        self.ownership_estimates.pop(repo_root, None)
         debug_print(f"[CACHE] Cleared cache for repo: {repo_root}")
 
     def _clear_all_caches(self):
         """Clear all cached data."""
         self.ownership_cache.clear()
         self.churn_cache.clear()
+        self.churn_histogram_cache.clear()
         self.blame_cache.clear()
+        self._blame_store.clear()
+        self._access_counts.clear()
         self.tracked_files_cache.clear()
         self._ls_files_cache.clear()
+        self.skipped_files.clear()
+        self.ownership_estimates.clear()
         debug_print("[CACHE] Cleared all caches")
 
+    def invalidate_files(self, repo_root: str, file_paths: list[str]):
+        """
+        Drop the cached blame and ownership of files whose content changed (watch mode).
+
+        Blame covers uncommitted lines, so it goes stale when a file is edited;
+        churn only counts commits and is kept. The tracked-files list is
+        dropped too, so newly added files are looked up again.
+        """
+        repo_root = self._normalize_repo_path(repo_root)
+        blame_cache = self._get_blame_cache(repo_root)
+        for cache in (self.ownership_cache, self.ownership_estimates, self.skipped_files):
+            repo_cache = cache.get(repo_root, {})
+            for file_path in file_paths:
+                repo_cache.pop(file_path, None)
+        for file_path in file_paths:
+            blame_cache.pop(file_path, None)
+        self.tracked_files_cache.pop(repo_root, None)
+        self._ls_files_cache.pop(repo_root, None)
+        debug_print(f"[CACHE] Invalidated {len(file_paths)} changed file(s) in repo: {repo_root}")
+
     def is_file_tracked(self, repo_root: str, file_path: str) -> bool:
         """
         Check if a file is tracked by git.
@@ -301,7 +438,7 @@ class GitDataCache:
         repo_root = self._normalize_repo_path(repo_root)
 
         # Check cache first
-        repo_blame_cache = self._get_repo_cache(self.blame_cache, repo_root)
+        repo_blame_cache = self._get_blame_cache(repo_root)
         if file_path in repo_blame_cache:
             self._log_cache_access(file_path, hit=True, cache_type="git blame")
             return repo_blame_cache[file_path]
@@ -347,6 +484,12 @@ class GitDataCache:
             repo_ownership_cache[file_path] = result
             return result
 
+        # Very large files: estimate from sampled blame ranges
+        sampled = self._sampled_ownership(repo_root, file_path)
+        if sampled is not None:
+            repo_ownership_cache[file_path] = sampled
+            return sampled
+
         # Get git blame data
         blame_output = self.get_git_blame(repo_root, file_path)
         if blame_output is None:
@@ -360,6 +503,53 @@ class GitDataCache:
         repo_ownership_cache[file_path] = result
         return result
 
+    def set_ownership_sampling(self, min_lines: int):
+        """Change the line count above which ownership is estimated from sampled blame (0 = never)."""
+        self.ownership_sample_min_lines = min_lines
+
+    def get_ownership_estimate(self, repo_root: str, file_path: str) -> Optional[OwnershipEstimate]:
+        """
+        Return the sampling details behind a file's ownership data.
+
+        Returns:
+            OwnershipEstimate with confidence bounds if the file's ownership
+            was estimated from sampled blame ranges, None if it was blamed in full
+        """
+        return self.ownership_estimates.get(self._normalize_repo_path(repo_root), {}).get(file_path)
+
+    def _sampled_ownership(self, repo_root: str, file_path: str) -> Optional[Dict[str, float]]:
+        """
+        Estimate ownership of a very large file from stratified blame ranges.
+
+        Returns:
+            {author: percent} estimate ({} if the sampled blame timed out), or
+            None if the file is small enough for a full blame, sampling is
+            disabled, or the sampled blame failed (caller falls back to a full blame)
+        """
+        if self.ownership_sample_min_lines <= 0:
+            return None
+        try:
+            total_lines = count_lines(os.path.join(repo_root, file_path))
+        except OSError:
+            return None
+        if total_lines <= self.ownership_sample_min_lines:
+            return None
+
+        ranges = stratified_ranges(total_lines, Defaults.OWNERSHIP_SAMPLE_RANGES,
+                                   Defaults.OWNERSHIP_SAMPLE_RANGE_LINES, seed=file_path)
+        blame_output = self._run_git_command(repo_root, blame_range_args(file_path, ranges), check_file=file_path)
+        if blame_output is None:
+            if self.get_skip_reason(repo_root, file_path):
+                return {}
+            debug_print(f"[CACHE] Sampled blame failed for {file_path}, falling back to full blame")
+            return None
+
+        estimate = estimate_ownership(blame_output, ranges, total_lines)
+        self._get_repo_cache(self.ownership_estimates, repo_root)[file_path] = estimate
+        debug_print(f"[CACHE] Estimated ownership for {file_path} from {estimate.sampled_lines} "
+                    f"of {total_lines} lines: {len(estimate.ownership)} authors")
+        return estimate.ownership
+
     def get_churn_data(self, repo_root: str, file_path: str) -> int:
         """
         Get churn data for a file.
@@ -373,6 +563,13 @@ class GitDataCache:
             self._log_cache_access(file_path, hit=True, cache_type="churn")
             return repo_churn_cache[file_path]
 
+        # Derive from a prebuilt histogram without calling git
+        histogram = self.get_churn_histogram(repo_root, file_path)
+        if histogram is not None:
+            churn_count = histogram.window(self.churn_period_days)
+            repo_churn_cache[file_path] = churn_count
+            return churn_count
+
         # Check if file exists and is tracked
         full_file_path = os.path.join(repo_root, file_path)
         if not os.path.exists(full_file_path) or not self.is_file_tracked(repo_root, file_path):
@@ -386,6 +583,60 @@ class GitDataCache:
         repo_churn_cache[file_path] = churn_count
         return churn_count
 
+    def get_churn_histogram(self, repo_root: str, file_path: str) -> Optional[ChurnHistogram]:
+        """
+        Get the prebuilt commit histogram for a file.
+
+        Returns:
+            ChurnHistogram with daily bins, or None if no histogram pass
+            covered the file (see prebuild_cache_for_files)
+        """
+        repo_root = self._normalize_repo_path(repo_root)
+        return self.churn_histogram_cache.get(repo_root, {}).get(file_path)
+
+    def get_churn_window(self, repo_root: str, file_path: str, days: int) -> Optional[int]:
+        """
+        Get the number of commits affecting a file within the last ``days`` days.
+
+        Served from the histogram in memory, so any number of windows
+        (e.g. 30, 90 and 365 days) costs no extra git calls.
+
+        Returns:
+            Commit count, or None if no histogram exists for the file or the
+            window reaches beyond the histogram horizon
+        """
+        if days > self.histogram_days:
+            return None
+        histogram = self.get_churn_histogram(repo_root, file_path)
+        return histogram.window(days) if histogram is not None else None
+
+    def set_churn_period(self, churn_period_days: int):
+        """
+        Change the churn period used for get_churn_data().
+
+        Churn values covered by a histogram are re-derived in memory. Only
+        when the new period reaches beyond the histogram horizon are the
+        churn caches dropped so the next prebuild fetches a longer history.
+        """
+        if churn_period_days == self.churn_period_days:
+            return
+
+        self.churn_period_days = churn_period_days
+        if churn_period_days > self.histogram_days:
+            self.histogram_days = churn_period_days
+            self.churn_histogram_cache.clear()
+            self.churn_cache.clear()
+            debug_print("[CACHE] Churn period beyond histogram horizon, cleared churn caches")
+            return
+
+        self.churn_cache.clear()
+        for repo_root, histograms in self.churn_histogram_cache.items():
+            self.churn_cache[repo_root] = {
+                file_path: histogram.window(churn_period_days)
+                for file_path, histogram in histograms.items()
+            }
+        debug_print(f"[CACHE] Re-derived churn for {churn_period_days} days from histograms")
+
     def prefetch_ownership_data(self, repo_root: str, file_paths: list[str]):
         """
         Prefetch ownership data for multiple files in batch.
@@ -430,10 +681,15 @@ class GitDataCache:
         for file_path in uncached_files:
             self.get_churn_data(repo_root, file_path)
 
-    def prebuild_cache_for_files(self, repo_root: str, file_paths: list[str]):
+    def prebuild_cache_for_files(self, repo_root: str, file_paths: list[str],
+                                 churn_only_paths: Optional[Set[str]] = None):
         """
         Pre-build cache for all files efficiently using bulk git operations (Issue #40).
         This method builds the cache before KPI calculations start, reducing individual git calls.
+
+        Args:
+            churn_only_paths: Files among file_paths that need churn but no blame
+                (generated/minified files analyzed in reduced mode)
         """
         repo_root = self._normalize_repo_path(repo_root)
         debug_print(f"[CACHE] Pre-building cache for {len(file_paths)} files")
@@ -444,7 +700,10 @@ class GitDataCache:
             return
 
         # Step 2: Pre-build ownership and blame data
-        self._prebuild_ownership_cache(repo_root, valid_files)
+        if churn_only_paths:
+            self._prebuild_ownership_cache(repo_root, [fp for fp in valid_files if fp not in churn_only_paths])
+        else:
+            self._prebuild_ownership_cache(repo_root, valid_files)
 
         # Step 3: Pre-build churn data
         self._prebuild_churn_cache(repo_root, valid_files)
@@ -471,7 +730,7 @@ class GitDataCache:
     def _prebuild_ownership_cache(self, repo_root: str, valid_files: list[str]):
         """Pre-build ownership and blame data for uncached files."""
         repo_ownership_cache = self._get_repo_cache(self.ownership_cache, repo_root)
-        repo_blame_cache = self._get_repo_cache(self.blame_cache, repo_root)
+        repo_blame_cache = self._get_blame_cache(repo_root)
 
         uncached_files = [fp for fp in valid_files if fp not in repo_ownership_cache]
         debug_print(f"[CACHE] Pre-building ownership for {len(uncached_files)} uncached files")
@@ -482,9 +741,16 @@ class GitDataCache:
     def _prebuild_single_file_ownership(self, repo_root: str, file_path: str,
                                         repo_ownership_cache: dict, repo_blame_cache: dict):
         """Pre-build ownership data for a single file."""
-        blame_output = self._run_git_command(repo_root, ['blame', '--line-porcelain', file_path])
+        sampled = self._sampled_ownership(repo_root, file_path)
+        if sampled is not None:
+            repo_ownership_cache[file_path] = sampled
+            return
+
+        blame_args = ['blame', '--line-porcelain', file_path]
+        blame_output = self._run_git_command(repo_root, blame_args)
 
         if blame_output is None:
+            self._note_cut_off(repo_root, blame_args, file_path)
             debug_print(f"[CACHE] Error pre-building ownership for {file_path}")
             repo_ownership_cache[file_path] = {}
             repo_blame_cache[file_path] = None
@@ -496,21 +762,37 @@ class GitDataCache:
         debug_print(f"[CACHE] Pre-built ownership for {file_path}: {len(ownership_result)} authors")
 
     def _prebuild_churn_cache(self, repo_root: str, valid_files: list[str]):
-        """Pre-build churn data for uncached files."""
+        """Pre-build churn data for uncached files from one histogram pass."""
         repo_churn_cache = self._get_repo_cache(self.churn_cache, repo_root)
         uncached_files = [fp for fp in valid_files if fp not in repo_churn_cache]
         debug_print(f"[CACHE] Pre-building churn for {len(uncached_files)} uncached files")
+        if not uncached_files:
+            return
+
+        histograms = self._build_churn_histograms(repo_root, uncached_files)
+        if not histograms:
+            debug_print("[CACHE] Churn histogram pass failed, churn will be calculated per file")
+            return
 
+        self._get_repo_cache(self.churn_histogram_cache, repo_root).update(histograms)
         for file_path in uncached_files:
-            churn_count = self._calculate_churn(repo_root, file_path)
-            repo_churn_cache[file_path] = churn_count
-            debug_print(
-                f"[CACHE] Pre-built churn for {file_path}: {churn_count} commits "
-                f"(last {self.churn_period_days} days)"
-            )
+            repo_churn_cache[file_path] = histograms[file_path].window(self.churn_period_days)
+        debug_print(
+            f"[CACHE] Pre-built churn for {len(uncached_files)} files in one git log pass "
+            f"(last {self.churn_period_days} days, histogram horizon {self.histogram_days} days)"
+        )
 
-    def get_cache_stats(self) -> Dict[str, Any]:
-        """Return statistics about cache usage."""
+    def get_cache_stats(self, include_memory: bool = False) -> Dict[str, Any]:
+        """
+        Return statistics about cache usage.
+
+        Args:
+            include_memory: Also report memory/disk usage, evictions and hit rates
+
+        Example:
+            >>> cache.get_cache_stats(include_memory=True)["hit_rate"]
+            0.67
+        """
         stats = {
             "repos_cached": len(self.ownership_cache),
             "total_ownership_entries": sum(len(repo_cache) for repo_cache in self.ownership_cache.values()),
@@ -518,31 +800,73 @@ class GitDataCache:
             "total_blame_entries": sum(len(repo_cache) for repo_cache in self.blame_cache.values()),
             "total_tracked_files": sum(len(files) for files in self.tracked_files_cache.values())
         }
+        if include_memory:
+            stats.update(self._get_memory_stats())
+        return stats
+
+    def _get_memory_stats(self) -> Dict[str, Any]:
+        """Memory/disk usage, eviction and hit-rate figures for get_cache_stats()."""
+        stats = self._blame_store.stats()
+        stats["histogram_bytes"] = sum(
+            hist.nbytes for repo_hists in self.churn_histogram_cache.values() for hist in repo_hists.values()
+        )
+        stats["bytes_held"] = stats["blame_bytes_in_memory"] + stats["histogram_bytes"]
+
+        hits = sum(count for (_, hit), count in self._access_counts.items() if hit)
+        misses = sum(count for (_, hit), count in self._access_counts.items() if not hit)
+        stats["hits"] = hits
+        stats["misses"] = misses
+        stats["hit_rate"] = _hit_rate(hits, misses)
+        cache_types = sorted({cache_type for cache_type, _ in self._access_counts})
+        stats["hit_rate_by_type"] = {
+            cache_type: _hit_rate(self._access_counts[(cache_type, True)], self._access_counts[(cache_type, False)])
+            for cache_type in cache_types
+        }
         return stats
 
+    def set_memory_budget(self, memory_budget_bytes: Optional[int]):
+        """Change the blame memory budget (None or 0 disables eviction)."""
+        self._blame_store.set_budget(memory_budget_bytes)
+
+
+def _hit_rate(hits: int, misses: int) -> Optional[float]:
+    """Return hits / (hits + misses) rounded to 2 decimals, or None without accesses."""
+    total = hits + misses
+    return round(hits / total, 2) if total else None
+
 
 # Singleton instance to share between KPIs
 _git_cache_instance = None
+# Repositories analyzed on parallel threads may ask for the cache at the same time
+_git_cache_lock = threading.Lock()
 
 
-def get_git_cache(churn_period_days: int = None) -> GitDataCache:
+def get_git_cache(churn_period_days: int = None, memory_budget_mb: int = None) -> GitDataCache:
     """
     Return singleton instance of GitDataCache.
 
     Args:
         churn_period_days: Number of days for churn calculation (only used when creating new instance)
+        memory_budget_mb: Memory budget for raw blame data in MB (0 disables eviction)
     """
     global _git_cache_instance
-    if _git_cache_instance is None:
-        _git_cache_instance = GitDataCache(churn_period_days or 30)
-        debug_print(
-            f"[CACHE] Created new GitDataCache instance with churn_period={_git_cache_instance.churn_period_days} days"
-        )
-    elif churn_period_days is not None and _git_cache_instance.churn_period_days != churn_period_days:
-        # Update churn period if different and clear churn cache
-        debug_print(
-            f"[CACHE] Updating churn period from {_git_cache_instance.churn_period_days} to {churn_period_days} days"
-        )
-        _git_cache_instance.churn_period_days = churn_period_days
-        _git_cache_instance.churn_cache.clear()
-    return _git_cache_instance
+    with _git_cache_lock:
+        if _git_cache_instance is None:
+            _git_cache_instance = GitDataCache(
+                churn_period_days or 30,
+                memory_budget_bytes=memory_budget_mb * 1024 * 1024 if memory_budget_mb is not None else None
+            )
+            debug_print(
+                f"[CACHE] Created new GitDataCache instance with "
+                f"churn_period={_git_cache_instance.churn_period_days} days"
+            )
+        elif churn_period_days is not None and _git_cache_instance.churn_period_days != churn_period_days:
+            # Update churn period if different and clear churn cache
+            debug_print(
+                f"[CACHE] Updating churn period from {_git_cache_instance.churn_period_days} "
+                f"to {churn_period_days} days"
+            )
+            _git_cache_instance.set_churn_period(churn_period_days)
+        if memory_budget_mb is not None:
+            _git_cache_instance.set_memory_budget(memory_budget_mb * 1024 * 1024)
+        return _git_cache_instance
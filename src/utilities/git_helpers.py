@@ -8,6 +8,25 @@ import os
 import subprocess
 from typing import List, Optional
 from src.utilities.debug import debug_print
+from src.utilities.git_runner import GitResult, get_git_runner, git_subcommand  # noqa: F401 (re-exported)
+
+
+def run_git(repo_root: str, args: list[str], stdin: Optional[str] = None) -> GitResult:
+    """
+    Run a git command through the central GitRunner and return the full result.
+
+    Use this instead of run_git_command() when the caller needs to tell a
+    failed command from one that timed out or was skipped (GitResult.cut_off).
+
+    Args:
+        repo_root: Root directory of the git repository
+        args: List of git command arguments (e.g., ['ls-files'])
+        stdin: Optional text for the command's standard input (e.g. paths for --stdin)
+
+    Returns:
+        GitResult with stdout, status, returncode and duration
+    """
+    return get_git_runner().run(os.path.abspath(repo_root), args, stdin)
 
 
 def run_git_command(repo_root: str, args: list[str]) -> Optional[str]:
@@ -15,14 +34,15 @@ def run_git_command(repo_root: str, args: list[str]) -> Optional[str]:
     Run a git command with consistent error handling.
 
     This is a centralized helper for executing git commands across the codebase.
-    It normalizes the repo path and provides consistent error handling.
+    It normalizes the repo path and runs the command through the GitRunner,
+    which applies the per-command timeout, the run budget and the circuit breaker.
 
     Args:
         repo_root: Root directory of the git repository
         args: List of git command arguments (e.g., ['ls-files'], ['blame', 'file.py'])
 
     Returns:
-        Command stdout output as string, or None on error
+        Command stdout output as string, or None on error, timeout or skip
 
     Example:
         >>> run_git_command("/my/repo", ["ls-files"])
@@ -30,25 +50,24 @@ def run_git_command(repo_root: str, args: list[str]) -> Optional[str]:
         >>> run_git_command("/my/repo", ["blame", "--line-porcelain", "main.py"])
         "<blame output>"
     """
-    repo_root = os.path.abspath(repo_root)
+    result = run_git(repo_root, args)
+    return result.stdout if result.ok else None
 
-    try:
-        result = subprocess.run(
-            ['git', '-C', repo_root] + args,
-            capture_output=True,
-            text=True,
-            check=True
+
+def check_git_output(repo_root: str, args: list[str]) -> str:
+    """
+    Run a git command and return its stdout, raising if it did not succeed.
+
+    Raises:
+        subprocess.CalledProcessError: If the command failed, timed out or was skipped
+    """
+    result = run_git(repo_root, args)
+    if not result.ok:
+        raise subprocess.CalledProcessError(
+            result.returncode if result.returncode is not None else -1,
+            ['git'] + list(args), output=result.stdout, stderr=result.status
         )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        debug_print(f"[GIT] Command failed: git {' '.join(args)} - {e}")
-        return None
-    except PermissionError as e:
-        debug_print(f"[GIT] Permission denied: {e}")
-        return None
-    except Exception as e:
-        debug_print(f"[GIT] Unexpected error running git command: {e}")
-        return None
+    return result.stdout
 
 
 def find_git_repo_root(start_path: str) -> str:
@@ -76,122 +95,26 @@ def find_git_repo_root(start_path: str) -> str:
         current = parent
 
 
-def _get_current_branch_name(repo_root: str) -> str:
-    """
-    Get the name of the current git branch.
-
-    Args:
-        repo_root: Path to the git repository root
-
-    Returns:
-        Current branch name
-
-    Raises:
-        subprocess.CalledProcessError: If git command fails
-    """
-    result = subprocess.run(
-        ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    return result.stdout.strip()
-
-
-def _get_changed_files_on_base_branch(repo_root: str) -> List[str]:
-    """
-    Get files changed in recent commits when on base branch.
-
-    Args:
-        repo_root: Path to the git repository root
-
-    Returns:
-        List of changed file paths
-    """
-    # Get files changed in last 10 commits
-    result = subprocess.run(
-        ['git', 'diff', '--name-only', 'HEAD~10..HEAD'],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    return _process_git_output_to_files(result.stdout, repo_root)
-
-
-def _get_changed_files_vs_base_branch(repo_root: str, base_branch: str) -> List[str]:
-    """
-    Get files changed compared to base branch.
-
-    Args:
-        repo_root: Path to the git repository root
-        base_branch: Base branch to compare against
-
-    Returns:
-        List of changed file paths
-    """
-    result = subprocess.run(
-        ['git', 'diff', '--name-only', f'{base_branch}...HEAD'],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    return _process_git_output_to_files(result.stdout, repo_root)
-
-
-def _process_git_output_to_files(git_output: str, repo_root: str) -> List[str]:
-    """
-    Process git command output into absolute file paths.
-
-    Args:
-        git_output: Raw output from git command
-        repo_root: Path to the git repository root
-
-    Returns:
-        List of absolute file paths
-    """
-    files = [f.strip() for f in git_output.strip().split('\n') if f.strip()]
-    return [os.path.join(repo_root, f) for f in files]
-
-
 def get_changed_files_in_branch(repo_path: str, base_branch: str = "main") -> List[str]:
     """
     Get list of files changed in the current branch compared to base branch.
 
+    The result is shared through the run's BranchDiffService, so the HTML
+    review tab and the review-strategy report do not repeat the git calls.
+
     Args:
         repo_path: Path to the git repository
         base_branch: Base branch to compare against (default: "main")
 
     Returns:
-        List of file paths that have been changed
+        List of absolute paths of the changed files ([] if git fails)
     """
-    try:
-        repo_root = find_git_repo_root(repo_path)
-        debug_print(f"[DEBUG] get_changed_files_in_branch: repo_root={repo_root}")
-
-        # Get current branch name
-        current_branch = _get_current_branch_name(repo_root)
-        debug_print(f"[DEBUG] get_changed_files_in_branch: current_branch={current_branch}")
-
-        # Get changed files based on branch context
-        if current_branch == base_branch:
-            debug_print("[DEBUG] get_changed_files_in_branch: On base branch, getting recent commits")
-            absolute_files = _get_changed_files_on_base_branch(repo_root)
-        else:
-            debug_print(f"[DEBUG] get_changed_files_in_branch: Comparing to {base_branch}")
-            absolute_files = _get_changed_files_vs_base_branch(repo_root, base_branch)
-
-        debug_print(f"[DEBUG] get_changed_files_in_branch: Found {len(absolute_files)} changed files")
-        return absolute_files
-
-    except subprocess.CalledProcessError as e:
-        debug_print(f"[DEBUG] get_changed_files_in_branch: Git command failed: {e}")
-        return []
-    except Exception as e:
-        debug_print(f"[DEBUG] get_changed_files_in_branch: Error: {e}")
-        return []
+    # Imported here: branch_diff builds on the helpers in this module
+    from src.utilities.branch_diff import get_branch_diff_service
+
+    absolute_files = get_branch_diff_service().changed_files(repo_path, base_branch)
+    debug_print(f"[DEBUG] get_changed_files_in_branch: Found {len(absolute_files)} changed files")
+    return absolute_files
 
 
 def get_current_branch(repo_path: str) -> Optional[str]:
@@ -204,9 +127,10 @@ def get_current_branch(repo_path: str) -> Optional[str]:
     Returns:
         Current branch name or None if not in a git repo
     """
+    from src.utilities.branch_diff import get_branch_diff_service
+
     try:
-        repo_root = find_git_repo_root(repo_path)
-        return _get_current_branch_name(repo_root)
+        return get_branch_diff_service().current_branch(repo_path)
     except Exception as e:
         debug_print(f"[DEBUG] get_current_branch: Error: {e}")
         return None
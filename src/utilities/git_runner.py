@@ -0,0 +1,257 @@
+"""
+Git Runner
+----------
+Central execution service for git subprocesses.
+
+Every git command MetricMancer runs goes through GitRunner.run(), which:
+- applies a per-command timeout (--git-timeout), so one blame of a huge
+  generated file cannot hang a CI job
+- enforces a per-run budget (--git-budget): once all git commands together
+  have taken that long, further commands are skipped
+- counts calls, failures, timeouts, skips, seconds and output bytes per
+  subcommand (blame, log, ls-files, ...)
+- opens a circuit breaker for a subcommand after
+  Defaults.GIT_CIRCUIT_BREAKER_THRESHOLD consecutive timeouts, so the
+  remaining calls to it are skipped instead of each waiting for the timeout
+- records a tracing span and, when --profile is on, a profile entry
+
+Commands that timed out or were skipped are remembered, so callers (the git
+cache) can report the affected file's git KPIs as "skipped (timeout)"
+instead of treating them like a file without history.
+"""
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.config.defaults import Defaults
+from src.utilities.debug import debug_print
+from src.utilities.profiling import get_profiler
+from src.utilities.tracing import span
+
+GIT_SKIPPED_TIMEOUT = "skipped (timeout)"
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+STATUS_ERROR = 'error'
+
+
+@dataclass
+class GitResult:
+    """Outcome of one git command."""
+    stdout: str = ''
+    status: str = STATUS_OK
+    returncode: Optional[int] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    @property
+    def cut_off(self) -> bool:
+        """True if the command timed out or was skipped by the budget or circuit breaker."""
+        return self.status in (STATUS_TIMEOUT, STATUS_SKIPPED)
+
+
+@dataclass
+class GitCommandStats:
+    """Counters for one git subcommand."""
+    subcommand: str
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    bytes_out: int = 0
+
+
+def git_subcommand(args: List[str]) -> str:
+    """
+    Return the git subcommand in an argument list, skipping global options.
+
+    Example:
+        >>> git_subcommand(['-c', 'core.quotepath=off', 'log', '--numstat'])
+        'log'
+    """
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+        elif arg in ('-c', '-C', '--git-dir', '--work-tree'):
+            skip_next = True
+        elif not arg.startswith('-'):
+            return arg
+    return 'unknown'
+
+
+class GitRunner:
+    """
+    Runs git commands with timeouts, a run budget and a circuit breaker per subcommand.
+
+    Attributes:
+        timeout: Seconds per command (None = no timeout)
+        budget: Seconds all commands together may take (None = unlimited)
+        breaker_threshold: Consecutive timeouts that open a subcommand's circuit
+        spent: Seconds spent in git commands so far
+        open_circuits: Subcommands whose calls are being skipped
+    """
+
+    def __init__(self, timeout: Optional[float] = Defaults.GIT_TIMEOUT_SECONDS,
+                 budget: Optional[float] = None,
+                 breaker_threshold: int = Defaults.GIT_CIRCUIT_BREAKER_THRESHOLD):
+        self.timeout = timeout or None
+        self.budget = budget or None
+        self.breaker_threshold = breaker_threshold
+        self.spent = 0.0
+        self.open_circuits: Set[str] = set()
+        self._stats: Dict[str, GitCommandStats] = {}
+        self._consecutive_timeouts: Dict[str, int] = {}
+        self._cut_off: Set[Tuple[str, Tuple[str, ...]]] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def budget_exhausted(self) -> bool:
+        return self.budget is not None and self.spent >= self.budget
+
+    def run(self, repo_root: str, args: List[str], stdin: Optional[str] = None) -> GitResult:
+        """
+        Run 'git -C <repo_root> <args>' and return its result.
+
+        Args:
+            stdin: Text fed to the command's standard input (e.g. for --stdin options)
+
+        Never raises: failures, timeouts and skipped commands are reported
+        through GitResult.status.
+        """
+        subcommand = git_subcommand(args)
+        skip_reason = self._skip_reason(subcommand)
+        if skip_reason:
+            debug_print(f"[GIT] Skipped ({skip_reason}): git {' '.join(args)}")
+            return self._finish(repo_root, args, subcommand, GitResult(status=STATUS_SKIPPED))
+
+        timeout = self._effective_timeout()
+        profiler = get_profiler()
+        t_start = time.perf_counter()
+        with span(f"git {subcommand}", 'git', args=' '.join(args), repo=repo_root) as git_span:
+            result = self._execute(['git', '-C', repo_root] + args, timeout, stdin)
+            result.duration = time.perf_counter() - t_start
+            git_span.set(bytes_out=len(result.stdout), returncode=result.returncode, status=result.status)
+        if profiler is not None and result.ok:
+            profiler.record_git_command(repo_root, args, result.duration, result.stdout)
+        if result.status == STATUS_FAILED:
+            debug_print(f"[GIT] Command failed: git {' '.join(args)} (exit {result.returncode})")
+        elif result.status == STATUS_TIMEOUT:
+            debug_print(f"[GIT] Timed out after {timeout:.0f}s: git {' '.join(args)}")
+        return self._finish(repo_root, args, subcommand, result)
+
+    @staticmethod
+    def _execute(command: List[str], timeout: Optional[float], stdin: Optional[str] = None) -> GitResult:
+        kwargs = {'capture_output': True, 'text': True, 'check': True}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        if stdin is not None:
+            kwargs['input'] = stdin
+        try:
+            result = subprocess.run(command, **kwargs)
+            return GitResult(result.stdout, STATUS_OK, result.returncode)
+        except subprocess.CalledProcessError as e:
+            return GitResult(e.stdout or '', STATUS_FAILED, e.returncode)
+        except subprocess.TimeoutExpired:
+            # subprocess.run() has already killed the git process
+            return GitResult(status=STATUS_TIMEOUT)
+        except PermissionError as e:
+            debug_print(f"[GIT] Permission denied: {e}")
+            return GitResult(status=STATUS_ERROR)
+        except Exception as e:
+            debug_print(f"[GIT] Unexpected error running git command: {e}")
+            return GitResult(status=STATUS_ERROR)
+
+    def _skip_reason(self, subcommand: str) -> Optional[str]:
+        with self._lock:
+            if self.budget_exhausted:
+                return f"git budget of {self.budget:.0f}s used up"
+            if subcommand in self.open_circuits:
+                return f"circuit open for git {subcommand}"
+        return None
+
+    def _effective_timeout(self) -> Optional[float]:
+        """Return the per-command timeout, shortened to the budget that is left."""
+        with self._lock:
+            if self.budget is None:
+                return self.timeout
+            remaining = max(self.budget - self.spent, 0.001)
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _finish(self, repo_root: str, args: List[str], subcommand: str, result: GitResult) -> GitResult:
+        with self._lock:
+            stats = self._stats.setdefault(subcommand, GitCommandStats(subcommand))
+            if result.status == STATUS_SKIPPED:
+                stats.skipped += 1
+            else:
+                stats.calls += 1
+                stats.seconds += result.duration
+                stats.bytes_out += len(result.stdout)
+                self.spent += result.duration
+            if result.status in (STATUS_FAILED, STATUS_ERROR):
+                stats.failures += 1
+
+            if result.status == STATUS_TIMEOUT:
+                stats.timeouts += 1
+                self._record_timeout(subcommand)
+            elif result.status != STATUS_SKIPPED:
+                self._consecutive_timeouts[subcommand] = 0
+
+            if result.cut_off:
+                self._cut_off.add((repo_root, tuple(args)))
+        return result
+
+    def _record_timeout(self, subcommand: str):
+        count = self._consecutive_timeouts.get(subcommand, 0) + 1
+        self._consecutive_timeouts[subcommand] = count
+        if count >= self.breaker_threshold and subcommand not in self.open_circuits:
+            self.open_circuits.add(subcommand)
+            print(f"[WARN] git {subcommand} timed out {count} times in a row; "
+                  f"skipping further git {subcommand} calls in this run")
+
+    def was_cut_off(self, repo_root: str, args: List[str]) -> bool:
+        """Return True if this exact command timed out or was skipped."""
+        with self._lock:
+            return (repo_root, tuple(args)) in self._cut_off
+
+    def stats(self) -> Dict[str, GitCommandStats]:
+        """Return a copy of the counters, by subcommand."""
+        with self._lock:
+            return {name: GitCommandStats(**asdict(stats)) for name, stats in self._stats.items()}
+
+    def to_dict(self) -> Dict:
+        """Return the counters and breaker state as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                'timeout': self.timeout,
+                'budget': self.budget,
+                'spent': self.spent,
+                'open_circuits': sorted(self.open_circuits),
+                'commands': [asdict(stats) for stats in sorted(self._stats.values(), key=lambda s: -s.seconds)],
+            }
+
+
+# Runner used by all git commands; replaced by configure_git_runner() at the start of a run
+_runner = GitRunner()
+
+
+def configure_git_runner(timeout: Optional[float] = Defaults.GIT_TIMEOUT_SECONDS,
+                         budget: Optional[float] = None,
+                         breaker_threshold: int = Defaults.GIT_CIRCUIT_BREAKER_THRESHOLD) -> GitRunner:
+    """Install a fresh GitRunner (new counters, closed circuits) and return it."""
+    global _runner
+    _runner = GitRunner(timeout, budget, breaker_threshold)
+    return _runner
+
+
+def get_git_runner() -> GitRunner:
+    """Return the active GitRunner."""
+    return _runner
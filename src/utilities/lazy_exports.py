@@ -0,0 +1,43 @@
+"""
+Lazy package exports.
+
+Package ``__init__`` modules re-export classes from their submodules for
+backward compatibility. Importing them eagerly means that importing any
+submodule loads the whole package. lazy_exports() builds PEP 562 module
+``__getattr__``/``__dir__`` hooks that import an export only when it is
+first accessed.
+
+Usage (in a package __init__.py):
+    __getattr__, __dir__ = lazy_exports(__name__, globals(), {
+        'Analyzer': 'src.app.core.analyzer',
+    })
+"""
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package_name: str, package_globals: dict,
+                 exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a package with lazy exports.
+
+    Args:
+        package_name: The package ``__name__`` (used in error messages)
+        package_globals: The package ``globals()``; resolved exports are cached there
+        exports: Mapping of exported name -> module that defines it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,255 @@
+"""
+Memory Tracking
+---------------
+Peak-memory accounting per pipeline phase (--memory-profile).
+
+Each phase (scan, cache prebuild, file analysis, KPI aggregation, each
+report format, ...) is bracketed by begin_memory_phase()/end_memory_phase()
+or the memory_phase() context manager. While tracking is enabled, every
+phase records:
+- the peak of Python allocations traced by tracemalloc while it was open
+- the process RSS when it ended and the process RSS high-water mark
+
+Phases may nest and may run in several threads at once (parallel
+repositories). tracemalloc has one process-wide peak, so whenever a phase
+begins or ends the peak seen so far is credited to every phase that is
+open, and then reset. Concurrent phases therefore share the peak of the
+whole process while they overlap.
+
+When a phase's peak exceeds the threshold, the allocation sites whose
+memory grew most between the start and the end of the phase are recorded
+(from tracemalloc snapshots taken when the phase begins and ends).
+
+Tracking is off by default: tracemalloc slows allocation-heavy code
+noticeably, and the phase hooks are no-ops while it is off.
+"""
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.config.defaults import Defaults
+from src.utilities.debug import debug_print
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class PhaseMemory:
+    """Memory figures (MB) for one pipeline phase, accumulated over all its runs."""
+    name: str
+    calls: int = 0
+    peak_traced_mb: float = 0.0
+    rss_mb: Optional[float] = None
+    rss_peak_mb: Optional[float] = None
+    top_sites: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def current_rss_mb() -> Optional[float]:
+    """Return the resident set size of this process in MB, or None if unknown."""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / _MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the RSS high-water mark of this process in MB, or None if unknown."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss / _MB if sys.platform == 'darwin' else max_rss / 1024
+
+
+class MemoryTracker:
+    """
+    Records peak memory per phase for one run.
+
+    Attributes:
+        phases: PhaseMemory by phase name, in the order phases first began
+        threshold_mb: Peak above which a phase's top allocation sites are recorded
+        top_sites: Number of allocation sites recorded per phase
+    """
+
+    def __init__(self, threshold_mb: float = Defaults.MEMORY_SITES_THRESHOLD_MB,
+                 top_sites: int = Defaults.MEMORY_TOP_SITES):
+        self.threshold_mb = threshold_mb
+        self.top_sites = top_sites
+        self.phases: Dict[str, PhaseMemory] = {}
+        self._open: Dict[str, int] = {}
+        self._baselines: Dict[tuple, tracemalloc.Snapshot] = {}
+        self._started_tracemalloc = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start tracemalloc (unless something else already did)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        """Stop tracemalloc if this tracker started it."""
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
+
+    def begin(self, name: str):
+        """Open a phase; the same name may be open several times (e.g. one per repository)."""
+        with self._lock:
+            self._credit_peak()
+            phase = self.phases.setdefault(name, PhaseMemory(name))
+            phase.calls += 1
+            self._open[name] = self._open.get(name, 0) + 1
+            if tracemalloc.is_tracing():
+                self._baselines[(name, threading.get_ident())] = self._snapshot()
+
+    def end(self, name: str):
+        """Close a phase and record RSS and, above the threshold, its top allocation sites."""
+        with self._lock:
+            if name not in self._open:
+                return
+            self._credit_peak()
+            self._open[name] -= 1
+            if not self._open[name]:
+                del self._open[name]
+            baseline = self._baselines.pop((name, threading.get_ident()), None)
+            phase = self.phases[name]
+            phase.rss_mb = _max_optional(phase.rss_mb, current_rss_mb())
+            phase.rss_peak_mb = _max_optional(phase.rss_peak_mb, peak_rss_mb())
+            if phase.peak_traced_mb > self.threshold_mb and not phase.top_sites and baseline is not None:
+                phase.top_sites = self._top_allocation_sites(baseline)
+
+    def _credit_peak(self):
+        """Credit the tracemalloc peak since the last call to every open phase."""
+        if not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        for name in self._open:
+            phase = self.phases[name]
+            phase.peak_traced_mb = max(phase.peak_traced_mb, peak / _MB)
+        tracemalloc.reset_peak()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """Take a tracemalloc snapshot without the tracker's own and the import system's allocations."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*'),
+        ))
+
+    def _top_allocation_sites(self, baseline: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """Return the source lines whose traced memory grew most since the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            return []
+        sites = []
+        for stat in self._snapshot().compare_to(baseline, 'lineno'):
+            if len(sites) == self.top_sites:
+                break
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            sites.append({
+                'file': frame.filename,
+                'line': frame.lineno,
+                'size_mb': round(stat.size / _MB, 3),
+                'growth_mb': round(stat.size_diff / _MB, 3),
+                'count': stat.count,
+            })
+        return sites
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the per-phase figures as a JSON-serializable dict."""
+        with self._lock:
+            phases = [asdict(phase) for phase in self.phases.values()]
+        return {
+            'threshold_mb': self.threshold_mb,
+            'peak_rss_mb': peak_rss_mb(),
+            'phases': phases,
+        }
+
+    def write_json(self, path: str):
+        """Write the per-phase figures to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        debug_print(f"[MEMORY] Wrote memory profile to {path}")
+
+
+def _max_optional(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+
+# Active tracker; None means memory tracking is disabled
+_tracker: Optional[MemoryTracker] = None
+
+
+def start_memory_tracking(threshold_mb: float = Defaults.MEMORY_SITES_THRESHOLD_MB,
+                          top_sites: int = Defaults.MEMORY_TOP_SITES) -> MemoryTracker:
+    """Enable memory tracking with a fresh MemoryTracker and return it."""
+    global _tracker
+    stop_memory_tracking()
+    _tracker = MemoryTracker(threshold_mb, top_sites)
+    _tracker.start()
+    return _tracker
+
+
+def stop_memory_tracking() -> Optional[MemoryTracker]:
+    """Disable memory tracking and return the tracker that was active, if any."""
+    global _tracker
+    tracker, _tracker = _tracker, None
+    if tracker is not None:
+        tracker.stop()
+    return tracker
+
+
+def get_memory_tracker() -> Optional[MemoryTracker]:
+    """Return the active tracker, or None when memory tracking is disabled."""
+    return _tracker
+
+
+def begin_memory_phase(name: str):
+    """Open a phase on the active tracker, if any."""
+    tracker = _tracker
+    if tracker is not None:
+        tracker.begin(name)
+
+
+def end_memory_phase(name: str):
+    """Close a phase on the active tracker, if any."""
+    tracker = _tracker
+    if tracker is not None:
+        tracker.end(name)
+
+
+@contextmanager
+def memory_phase(name: str):
+    """Context manager bracketing a phase on the active tracker, if any."""
+    tracker = _tracker
+    if tracker is None:
+        yield
+        return
+    tracker.begin(name)
+    try:
+        yield
+    finally:
+        tracker.end(name)
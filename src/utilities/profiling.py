@@ -0,0 +1,199 @@
+"""
+Profiling
+---------
+Per-file and per-git-command profile of an analysis run.
+
+While profiling is enabled (start_profiling()), Analyzer records the time
+spent reading, parsing and scoring every file, and run_git_command records
+every git subprocess. Only the K slowest of each are kept, in bounded
+heaps, so memory stays constant no matter how many files are analyzed.
+
+At the end of the run the profile is printed next to the timing summary
+and can be written as JSON (--profile-output).
+"""
+import heapq
+import itertools
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from src.config.defaults import Defaults
+from src.languages.config import LANGUAGES
+from src.utilities.debug import debug_print
+
+
+@dataclass
+class FileProfile:
+    """Timings (seconds) and size of one analyzed file."""
+    path: str
+    language: str
+    size_bytes: int
+    lines: int
+    read: float
+    parse: float
+    cognitive: float
+    churn: float
+    blame: float
+    total: float
+
+
+@dataclass
+class GitCommandProfile:
+    """Duration (seconds) and output size of one git subprocess."""
+    command: str
+    repo: str
+    duration: float
+    bytes_out: int
+    lines_out: int
+
+
+class TopK:
+    """
+    Thread-safe bounded min-heap keeping the K items with the highest score.
+
+    Each add() is O(log K); items below the current K-th score are dropped
+    without being stored.
+    """
+
+    def __init__(self, k: int):
+        self.k = max(1, k)
+        self.seen = 0
+        self._heap = []
+        self._counter = itertools.count()  # Tie-breaker, items themselves are not compared
+        self._lock = threading.Lock()
+
+    def add(self, score: float, item: Any):
+        """Offer an item; it is kept only if it is among the K highest scores so far."""
+        entry = (score, next(self._counter), item)
+        with self._lock:
+            self.seen += 1
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            elif score > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        """Return kept items, highest score first."""
+        with self._lock:
+            entries = sorted(self._heap, key=lambda e: (-e[0], e[1]))
+        return [item for _, _, item in entries]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+# KPICalculator timing keys that make up the per-file "blame" column
+_BLAME_KEYS = ('ownership', 'shared_ownership')
+
+
+class Profiler:
+    """
+    Collects the slowest files and git commands of one run.
+
+    Attributes:
+        files: Top-K files by total analysis time
+        git_commands: Top-K git subprocesses by duration
+    """
+
+    def __init__(self, top_k: int = Defaults.PROFILE_TOP_K):
+        self.top_k = top_k
+        self.files = TopK(top_k)
+        self.git_commands = TopK(top_k)
+
+    def record_file(self, path: str, ext: Optional[str], size_bytes: int, lines: int, timing: Dict[str, float]):
+        """
+        Record one analyzed file.
+
+        Args:
+            path: File path
+            ext: File extension, mapped to a language name
+            size_bytes: File size on disk
+            lines: Number of lines read
+            timing: Per-file timing from FileAnalyzer ('read', 'parse') and
+                    KPICalculator ('complexity', 'cognitive_complexity', 'churn', ...);
+                    dotted keys ('cognitive_complexity.Python') break down a KPI's time
+                    and are not added to the total again
+        """
+        language = LANGUAGES.get(ext, {}).get('name', ext or 'unknown')
+        total = sum(value for key, value in timing.items() if '.' not in key)
+        self.files.add(total, FileProfile(
+            path=path,
+            language=language,
+            size_bytes=size_bytes,
+            lines=lines,
+            read=timing.get('read', 0.0),
+            parse=timing.get('parse', 0.0),
+            cognitive=timing.get('cognitive_complexity', 0.0),
+            churn=timing.get('churn', 0.0),
+            blame=sum(timing.get(key, 0.0) for key in _BLAME_KEYS),
+            total=total,
+        ))
+
+    def record_git_command(self, repo: str, args: List[str], duration: float, output: Optional[str]):
+        """Record one git subprocess and the size of its output."""
+        output = output or ''
+        self.git_commands.add(duration, GitCommandProfile(
+            command='git ' + ' '.join(args),
+            repo=repo,
+            duration=duration,
+            bytes_out=len(output),
+            lines_out=output.count('\n'),
+        ))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the profile as a JSON-serializable dict."""
+        return {
+            'top_k': self.top_k,
+            'files_profiled': self.files.seen,
+            'git_commands_profiled': self.git_commands.seen,
+            'slowest_files': [asdict(p) for p in self.files.items()],
+            'slowest_git_commands': [asdict(p) for p in self.git_commands.items()],
+        }
+
+    def write_json(self, path: str):
+        """Write the profile to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        debug_print(f"[PROFILE] Wrote profile to {path}")
+
+    def print_report(self):
+        """Print the slowest files and git commands."""
+        print(f"\n=== SLOWEST FILES (top {len(self.files)} of {self.files.seen}) ===")
+        print(f"  {'total':>7} {'read':>7} {'parse':>7} {'cogn.':>7} {'churn':>7} {'blame':>7} "
+              f"{'KB':>8} {'lines':>7}  language    file")
+        for p in self.files.items():
+            print(f"  {p.total:7.3f} {p.read:7.3f} {p.parse:7.3f} {p.cognitive:7.3f} {p.churn:7.3f} "
+                  f"{p.blame:7.3f} {p.size_bytes / 1024:8.1f} {p.lines:7d}  {p.language:<10}  {p.path}")
+
+        print(f"\n=== SLOWEST GIT COMMANDS (top {len(self.git_commands)} of {self.git_commands.seen}) ===")
+        print(f"  {'seconds':>7} {'KB out':>8} {'lines':>7}  command")
+        for p in self.git_commands.items():
+            print(f"  {p.duration:7.3f} {p.bytes_out / 1024:8.1f} {p.lines_out:7d}  {p.command}  ({p.repo})")
+
+
+# Active profiler; None means profiling is disabled
+_profiler: Optional[Profiler] = None
+
+
+def start_profiling(top_k: int = Defaults.PROFILE_TOP_K) -> Profiler:
+    """Enable profiling with a fresh Profiler and return it."""
+    global _profiler
+    _profiler = Profiler(top_k)
+    return _profiler
+
+
+def stop_profiling() -> Optional[Profiler]:
+    """Disable profiling and return the profiler that was active, if any."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, or None when profiling is disabled."""
+    return _profiler
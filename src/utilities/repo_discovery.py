@@ -0,0 +1,124 @@
+"""
+Repository Discovery
+--------------------
+Memoized lookup of the git repository that owns a directory.
+
+find_git_repo_root() walks up the filesystem on every call, which means
+one stat per directory level per file. RepoDiscoveryIndex remembers the
+answer for every directory it has visited, so each directory is checked
+at most once per run no matter how many files live below it.
+
+A directory is a repository root when it contains a ``.git`` entry:
+- a ``.git`` directory (normal repository), or
+- a ``.git`` file with a ``gitdir:`` line (submodule or linked worktree).
+
+The closest such directory wins, so files inside a submodule or a nested
+repository are attributed to that repository rather than the outer one.
+"""
+import os
+import stat
+from typing import Dict, Optional
+
+from src.utilities.debug import debug_print
+
+
+def read_gitdir_file(git_file: str) -> Optional[str]:
+    """
+    Read the target of a ``.git`` file (``gitdir: <path>``).
+
+    Args:
+        git_file: Path to the ``.git`` file
+
+    Returns:
+        Absolute git directory path, or None if the file is not a gitdir link
+    """
+    try:
+        with open(git_file, 'r', encoding='utf-8', errors='replace') as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+
+    if not first_line.startswith('gitdir:'):
+        return None
+    gitdir = first_line[len('gitdir:'):].strip()
+    if not os.path.isabs(gitdir):
+        gitdir = os.path.join(os.path.dirname(git_file), gitdir)
+    return os.path.normpath(gitdir)
+
+
+def is_repo_root(directory: str) -> bool:
+    """
+    Check the ``.git`` entry of a directory with a single stat.
+
+    Returns:
+        True if the directory has a ``.git`` directory or a ``.git`` file
+        with a ``gitdir:`` line
+    """
+    git_path = os.path.join(directory, '.git')
+    try:
+        mode = os.stat(git_path).st_mode
+    except OSError:
+        return False
+
+    if stat.S_ISDIR(mode):
+        return True
+    return stat.S_ISREG(mode) and read_gitdir_file(git_path) is not None
+
+
+class RepoDiscoveryIndex:
+    """
+    Memoized directory -> repository root index.
+
+    Usage:
+        index = RepoDiscoveryIndex()
+        index.find_repo_root('/work/app/src/pkg')    # walks up, checks each level once
+        index.find_repo_root('/work/app/src/other')  # stops at memoized /work/app/src
+
+    Attributes:
+        stat_calls: Number of directories checked for a ``.git`` entry
+                    (useful to verify memoization)
+    """
+
+    def __init__(self):
+        # directory -> owning repository root (None = not inside a repository)
+        self._roots: Dict[str, Optional[str]] = {}
+        self.stat_calls = 0
+
+    def find_repo_root(self, path: str) -> Optional[str]:
+        """
+        Return the closest repository root containing ``path``.
+
+        Args:
+            path: Directory to resolve (relative paths are made absolute)
+
+        Returns:
+            Absolute path of the repository root, or None if ``path`` is not
+            inside a git repository
+        """
+        current = os.path.abspath(path)
+        visited = []
+        result = None
+
+        while True:
+            if current in self._roots:
+                result = self._roots[current]
+                break
+            visited.append(current)
+            self.stat_calls += 1
+            if is_repo_root(current):
+                result = current
+                debug_print(f"[DEBUG] RepoDiscoveryIndex: Found repository at {current}")
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+
+        for directory in visited:
+            self._roots[directory] = result
+        return result
+
+    def clear(self):
+        """Forget all memoized lookups."""
+        self._roots.clear()
+        self.stat_calls = 0
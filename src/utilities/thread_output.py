@@ -0,0 +1,95 @@
+"""
+Per-thread stdout redirection.
+
+Report formats print to stdout, and CLIReportGenerator captures that output by
+swapping sys.stdout. When reports are generated on several threads at once,
+swapping the process-wide sys.stdout would mix their output. While
+routed_stdout() is active, sys.stdout is a ThreadRoutedStdout that sends each
+thread's writes to the stream that thread selected (or the original stdout),
+and captured_stdout() selects a buffer for the calling thread only.
+
+Usage:
+    with routed_stdout():
+        # on each worker thread:
+        with captured_stdout() as (buffer, previous):
+            print("report")           # -> buffer
+            print("done", file=previous)
+"""
+import sys
+import threading
+from contextlib import contextmanager
+from io import StringIO
+from typing import Iterator, Optional, TextIO, Tuple
+
+
+class ThreadRoutedStdout:
+    """A stdout replacement that writes to a per-thread target stream."""
+
+    def __init__(self, default: TextIO):
+        """
+        Args:
+            default: Stream for threads that did not select one (the original stdout)
+        """
+        self.default = default
+        self._local = threading.local()
+
+    def target(self) -> TextIO:
+        """The stream the calling thread writes to."""
+        return getattr(self._local, 'stream', None) or self.default
+
+    def set_target(self, stream: Optional[TextIO]):
+        """Select the calling thread's stream (None = the default stream)."""
+        self._local.stream = stream
+
+    def write(self, text: str) -> int:
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno(), ... of the original stdout
+        return getattr(self.default, name)
+
+
+@contextmanager
+def routed_stdout() -> Iterator[ThreadRoutedStdout]:
+    """Install a ThreadRoutedStdout as sys.stdout for the duration of the block."""
+    original = sys.stdout
+    if isinstance(original, ThreadRoutedStdout):
+        yield original
+        return
+    router = ThreadRoutedStdout(original)
+    sys.stdout = router
+    try:
+        yield router
+    finally:
+        sys.stdout = original
+
+
+@contextmanager
+def captured_stdout() -> Iterator[Tuple[StringIO, TextIO]]:
+    """
+    Capture what the calling thread prints.
+
+    Under routed_stdout() only the calling thread is redirected; otherwise
+    sys.stdout itself is swapped, as single-threaded code always did.
+
+    Yields:
+        (buffer receiving the output, stream the thread printed to before)
+    """
+    buffer = StringIO()
+    stdout = sys.stdout
+    if isinstance(stdout, ThreadRoutedStdout):
+        previous = stdout.target()
+        stdout.set_target(buffer)
+        try:
+            yield buffer, previous
+        finally:
+            stdout.set_target(None if previous is stdout.default else previous)
+        return
+    sys.stdout = buffer
+    try:
+        yield buffer, stdout
+    finally:
+        sys.stdout = stdout
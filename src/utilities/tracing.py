@@ -0,0 +1,191 @@
+"""
+Tracing
+-------
+Lightweight spans for the analysis pipeline with Chrome trace-event export.
+
+Spans are opened with a context manager anywhere in the code base:
+
+    from src.utilities.tracing import span
+
+    with span("git blame", "git", file=path) as s:
+        output = run(...)
+        s.set(bytes_out=len(output))
+
+Tracing is off by default. While it is off, span() returns a shared no-op
+object, so an instrumented call costs one global lookup and a function
+call. start_tracing() installs a Tracer that records every span as a
+complete ("X") event; write_chrome_trace() saves them in the Chrome
+trace-event JSON format, which can be opened in Perfetto
+(https://ui.perfetto.dev) or chrome://tracing.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.utilities.debug import debug_print
+
+
+class _NullSpan:
+    """No-op span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        """Ignore span arguments."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed region recorded by a Tracer when it exits."""
+
+    __slots__ = ('_tracer', 'name', 'cat', 'args', '_start_ns')
+
+    def __init__(self, tracer: 'Tracer', name: str, cat: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self._start_ns = 0
+
+    def __enter__(self):
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self._tracer.record(self.name, self.cat, self._start_ns, end_ns, self.args)
+        return False
+
+    def set(self, **args):
+        """Attach extra arguments (e.g. output size) to the span."""
+        self.args.update(args)
+
+
+class Tracer:
+    """
+    Collects spans from all threads of one run.
+
+    Attributes:
+        events: Recorded complete events, in the order spans finished
+    """
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, cat: str, start_ns: int, end_ns: int, args: Optional[Dict[str, Any]] = None):
+        """Record a finished span as a Chrome trace complete event."""
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': (start_ns - self._origin_ns) / 1000.0,
+            'dur': (end_ns - start_ns) / 1000.0,
+            'pid': self._pid,
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = {key: _json_safe(value) for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace as a Chrome trace-event JSON object."""
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self._thread_names)
+
+        metadata = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+            'args': {'name': 'MetricMancer'},
+        }]
+        for tid, thread_name in sorted(thread_names.items()):
+            metadata.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid,
+                'args': {'name': thread_name},
+            })
+        return {
+            'traceEvents': metadata + sorted(events, key=lambda e: e['ts']),
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_chrome_trace(self, path: str):
+        """Write the trace to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        debug_print(f"[TRACE] Wrote {len(self.events)} spans to {path}")
+
+
+def _json_safe(value: Any) -> Any:
+    """Keep JSON-native span arguments, stringify everything else."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return str(value)
+
+
+# Active tracer; None means tracing is disabled
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, cat: str = 'app', **args) -> Any:
+    """
+    Open a span for the active tracer.
+
+    Args:
+        name: Span name shown in the trace viewer
+        cat: Category used for filtering (e.g. 'pipeline', 'git', 'file', 'kpi', 'report')
+        **args: Arguments attached to the span
+
+    Returns:
+        Context manager; a shared no-op object while tracing is disabled
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, cat, args)
+
+
+def start_tracing() -> Tracer:
+    """Enable tracing with a fresh Tracer and return it."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Disable tracing and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, or None when tracing is disabled."""
+    return _tracer
+
+
+def is_tracing_enabled() -> bool:
+    """Return True while a tracer is active."""
+    return _tracer is not None
@@ -116,6 +116,41 @@ class TestParseDiff:
         assert len(file_changes) == 1
         assert file_changes[0]['file_path'] == 'src/old_file.py'
 
+    def test_iter_git_diff_yields_each_file_before_reading_the_next(self):
+        """Test that file sections are parsed as the diff lines arrive."""
+        from src.analysis.delta.function_diff_parser import FunctionDiffParser
+
+        diff_lines = dedent("""
+            diff --git a/a.py b/a.py
+            index abc123..def456 100644
+            --- a/a.py
+            +++ b/a.py
+            @@ -1,1 +1,2 @@
+             def a():
+            +    pass
+            diff --git a/b.py b/b.py
+            new file mode 100644
+            index 0000000..def456
+            --- /dev/null
+            +++ b/b.py
+            @@ -0,0 +1,1 @@
+            +x = 1
+        """).lstrip().splitlines(keepends=True)
+        consumed = []
+
+        def lines():
+            for line in diff_lines:
+                consumed.append(line)
+                yield line
+
+        changes = FunctionDiffParser().iter_git_diff(lines())
+        first = next(changes)
+
+        assert first['file_path'] == 'a.py'
+        assert first['changed_lines'] == {1, 2}
+        assert len(consumed) == 8  # a.py's section plus the line that starts b.py's
+        assert [(c['file_path'], c['is_added']) for c in changes] == [('b.py', True)]
+
 
 class TestMapLinesToFunctions:
     """Test mapping changed lines to specific functions."""
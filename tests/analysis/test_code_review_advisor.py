@@ -3,10 +3,18 @@ Tests for code_review_advisor module.
 """
 
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
 from src.analysis.code_review_advisor import (
+    ChangedFileMatcher,
     CodeReviewAdvisor,
-    generate_review_report
+    ReviewInput,
+    generate_review_report,
+    generate_review_report_for_repos,
+    review_inputs_from_repos
 )
+from src.kpis.model import File, RepoInfo, ScanDir
 
 
 class TestCodeReviewAdvisor(unittest.TestCase):
@@ -303,5 +311,103 @@ class TestGenerateReviewReport(unittest.TestCase):
         self.assertIn("CRITICAL PRIORITY FILES", report)
 
 
+def make_file(name, complexity, churn):
+    file_obj = File(name=name, file_path=name)
+    file_obj.kpis = {
+        'complexity': SimpleNamespace(value=complexity),
+        'churn': SimpleNamespace(value=churn),
+        'hotspot': SimpleNamespace(value=complexity * churn),
+    }
+    return file_obj
+
+
+def make_scan_dir(name, files=(), subdirs=()):
+    scan_dir = ScanDir(dir_name=name, scan_dir_path=name, repo_root_path='/repo', repo_name='repo')
+    for file_obj in files:
+        scan_dir.files[file_obj.name] = file_obj
+    for subdir in subdirs:
+        scan_dir.scan_dirs[subdir.dir_name] = subdir
+    return scan_dir
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Test cases for CodeReviewAdvisor.analyze_files."""
+
+    def test_batch_matches_single_file_analysis(self):
+        inputs = [ReviewInput(f"f{c}_{ch}.py", c, float(ch), c * ch, {'Alice': 80.0, 'Bob': 20.0})
+                  for c in (3, 12, 25, 90) for ch in (1, 8, 15)]
+
+        batch = CodeReviewAdvisor().analyze_files(inputs)
+        single = [CodeReviewAdvisor().analyze_file(*file_input) for file_input in inputs]
+
+        self.assertEqual(batch, single)
+        self.assertEqual(batch[-1].template, CodeReviewAdvisor()._generate_template(
+            'critical', 90, 15.0, 'single_owner', 'f90_15.py'))
+
+    def test_recommendations_do_not_share_lists(self):
+        first, second = CodeReviewAdvisor().analyze_files([ReviewInput('a.py', 90, 20.0, 1800),
+                                                           ReviewInput('b.py', 90, 20.0, 1800)])
+        first.focus_areas.append('extra')
+        self.assertNotIn('extra', second.focus_areas)
+
+
+class TestChangedFileMatcher(unittest.TestCase):
+    """Test cases for matching report paths against changed files."""
+
+    def setUp(self):
+        self.matcher = ChangedFileMatcher(['src/app/main.py', './docs/guide.md', 'lib\\util.py'])
+
+    def test_exact_and_suffix_matches(self):
+        self.assertTrue(self.matcher.matches('src/app/main.py'))
+        self.assertTrue(self.matcher.matches('app/main.py'))
+        self.assertTrue(self.matcher.matches('repo/src/app/main.py'))
+        self.assertTrue(self.matcher.matches('docs/guide.md'))
+
+    def test_partial_file_names_do_not_match(self):
+        self.assertFalse(self.matcher.matches('src/app/domain.py'))
+        self.assertFalse(self.matcher.matches('other/main.py.bak'))
+        self.assertFalse(self.matcher.matches('tests/app/main.py'))
+
+
+class TestReviewFromRepos(unittest.TestCase):
+    """Test cases for generating the review report directly from RepoInfo objects."""
+
+    def setUp(self):
+        self.src = RepoInfo(dir_name='src', scan_dir_path='.', repo_root_path='/repo', repo_name='repo')
+        self.src.files['setup.py'] = make_file('setup.py', 3, 1)
+        self.src.scan_dirs['analysis'] = make_scan_dir('analysis', [make_file('advisor.py', 90, 20)])
+        self.tests = RepoInfo(dir_name='tests', scan_dir_path='.', repo_root_path='/repo', repo_name='repo')
+        self.tests.scan_dirs['analysis'] = make_scan_dir(
+            'analysis', [make_file('test_advisor.py', 12, 15)], [make_scan_dir('delta', [make_file('d.py', 25, 2)])])
+
+    def test_directories_of_several_repos_are_merged(self):
+        inputs = review_inputs_from_repos([self.src, self.tests])
+
+        self.assertEqual([i.file_path for i in inputs],
+                         ['setup.py', 'analysis/advisor.py', 'analysis/test_advisor.py', 'analysis/delta/d.py'])
+        self.assertEqual(inputs[1][1:4], (90, 20, 1800))
+
+    def test_same_report_as_dict_pipeline(self):
+        data = {'files': {'setup.py': {'kpis': {'complexity': 3, 'churn': 1, 'hotspot': 3}}},
+                'scan_dirs': {'analysis': {
+                    'files': {'advisor.py': {'kpis': {'complexity': 90, 'churn': 20, 'hotspot': 1800}},
+                              'test_advisor.py': {'kpis': {'complexity': 12, 'churn': 15, 'hotspot': 180}}},
+                    'scan_dirs': {'delta': {'files': {'d.py': {'kpis': {'complexity': 25, 'churn': 2,
+                                                                        'hotspot': 50}}},
+                                            'scan_dirs': {}}}}}}
+
+        with patch('builtins.print'):
+            for filter_files in (None, ['src/analysis/advisor.py', 'delta/d.py']):
+                self.assertEqual(generate_review_report_for_repos([self.src, self.tests], filter_files=filter_files),
+                                 generate_review_report(data, filter_files=filter_files))
+
+    def test_filter_keeps_changed_files_only(self):
+        with patch('builtins.print'):
+            report = generate_review_report_for_repos([self.src, self.tests], filter_files=['analysis/advisor.py'])
+
+        self.assertIn('analysis/advisor.py', report)
+        self.assertNotIn('test_advisor.py', report)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -29,7 +29,7 @@ class TestAnalyzer(unittest.TestCase):
 
         self.repo2_path = self.test_dir / "repo2"
         (self.repo2_path).mkdir()
-        (self.repo2_path / "app.java").write_text("class App {}")
+        (self.repo2_path / "app.java").write_text("class App { void run() {} }")
 
         # --- Create input for Analyzer.analyze (simulating Scanner output) ---
         self.main_py_path = self.repo1_path / "src" / "main.py"
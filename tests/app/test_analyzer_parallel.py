@@ -0,0 +1,133 @@
+"""
+Tests for parallel multi-repository analysis in Analyzer.analyze.
+"""
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.app.core.analyzer import Analyzer, initialize_timing, schedule_repos
+from src.kpis.model import RepoInfo
+from src.utilities.blame_store import BlameStore
+
+
+def _files(root, count):
+    return [{'path': f"{root}/f{i}.py", 'root': root, 'ext': '.py'} for i in range(count)]
+
+
+class TestScheduleRepos(unittest.TestCase):
+    """Test the largest-first scheduler."""
+
+    def test_largest_first_with_path_tiebreak(self):
+        files_by_root = {'/b': [1, 2], '/a': [1, 2], '/c': [1, 2, 3], '/d': [1]}
+        self.assertEqual(schedule_repos(files_by_root), ['/c', '/a', '/b', '/d'])
+
+    def test_empty(self):
+        self.assertEqual(schedule_repos({}), [])
+
+
+class TestParallelAnalyze(unittest.TestCase):
+    """Test worker budget, ordering and per-repo timing buckets."""
+
+    def setUp(self):
+        self.files = _files('/repo_small', 1) + _files('/repo_big', 3) + _files('/repo_mid', 2)
+        self.groups = {
+            '/repo_small': self.files[:1],
+            '/repo_big': self.files[1:4],
+            '/repo_mid': self.files[4:],
+        }
+        self.scan_dirs = {root: {root} for root in self.groups}
+
+    def _fake_analyze_repo(self, started, active, peak, lock):
+        def fake(analyzer, repo_root, files_in_repo, scan_dirs, show_progress=True):
+            with lock:
+                started.append(repo_root)
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            timing = initialize_timing()
+            timing['churn'] = float(len(files_in_repo))
+            analyzer._record_repo_timing(repo_root, timing)
+            with lock:
+                active[0] -= 1
+            return RepoInfo(repo_root_path=repo_root, repo_name=repo_root, dir_name=repo_root, scan_dir_path='.')
+        return fake
+
+    def _run(self, max_workers, analyzer=None):
+        analyzer = analyzer or Analyzer({}, max_workers=max_workers)
+        started, active, peak, lock = [], [0], [0], threading.Lock()
+        with patch.object(Analyzer, '_group_files_by_repo', return_value=(self.groups, self.scan_dirs)), \
+                patch.object(Analyzer, '_analyze_repo', autospec=True,
+                             side_effect=self._fake_analyze_repo(started, active, peak, lock)):
+            summary = analyzer.analyze(self.files)
+        return analyzer, summary, started, peak[0]
+
+    def test_summary_order_is_deterministic(self):
+        for workers in (1, 2, 8):
+            _, summary, _, _ = self._run(workers)
+            self.assertEqual(list(summary), ['/repo_big', '/repo_mid', '/repo_small'])
+
+    def test_sequential_runs_largest_first(self):
+        _, _, started, peak = self._run(1)
+        self.assertEqual(started, ['/repo_big', '/repo_mid', '/repo_small'])
+        self.assertEqual(peak, 1)
+
+    def test_worker_budget_is_respected(self):
+        _, _, started, peak = self._run(2)
+        self.assertEqual(started[0], '/repo_big')
+        self.assertLessEqual(peak, 2)
+
+    def test_timing_buckets_per_repo(self):
+        analyzer, _, _, _ = self._run(3)
+
+        self.assertEqual(analyzer.repo_timing['/repo_big']['churn'], 3.0)
+        self.assertEqual(analyzer.repo_timing['/repo_mid']['churn'], 2.0)
+        self.assertEqual(analyzer.repo_timing['/repo_small']['churn'], 1.0)
+        self.assertEqual(analyzer.timing['churn'], 6.0)
+
+    def test_timing_restarts_with_each_analysis(self):
+        analyzer, _, _, _ = self._run(3)
+        self._run(3, analyzer)
+
+        self.assertEqual(analyzer.repo_timing['/repo_big']['churn'], 3.0)
+        self.assertEqual(analyzer.timing['churn'], 6.0)
+
+    def test_none_results_are_dropped(self):
+        analyzer = Analyzer({}, max_workers=4)
+        with patch.object(Analyzer, '_group_files_by_repo', return_value=(self.groups, self.scan_dirs)), \
+                patch.object(Analyzer, '_analyze_repo', return_value=None):
+            self.assertEqual(analyzer.analyze(self.files), {})
+
+    def test_worker_errors_propagate(self):
+        analyzer = Analyzer({}, max_workers=4)
+        with patch.object(Analyzer, '_group_files_by_repo', return_value=(self.groups, self.scan_dirs)), \
+                patch.object(Analyzer, '_analyze_repo', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                analyzer.analyze(self.files)
+
+
+class TestBlameStoreConcurrency(unittest.TestCase):
+    """The blame store is shared by all repository workers."""
+
+    def test_concurrent_puts_keep_accounting_consistent(self):
+        store = BlameStore(memory_budget_bytes=2000)
+
+        def worker(repo):
+            for i in range(50):
+                store.put(repo, f"f{i}.py", "x" * 100)
+                store.get(repo, f"f{i}.py")
+
+        threads = [threading.Thread(target=worker, args=(f"/repo{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(store.entry_count(), 200)
+        self.assertLessEqual(store.bytes_in_memory, 2000)
+        for n in range(4):
+            self.assertEqual(store.get(f"/repo{n}", "f0.py"), "x" * 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -321,6 +321,14 @@ class TestFileAnalyzerStatistics(unittest.TestCase):
         self.assertEqual(result['kpi_timing'], mock_timing)
         self.assertAlmostEqual(result['total_kpi_time'], 1.381, places=3)
 
+    def test_total_does_not_count_per_language_timing_twice(self):
+        """Should leave the per-language cognitive breakdown out of the total."""
+        self.mock_calculator.get_timing_report.return_value = {
+            'complexity': 0.1, 'cognitive_complexity': 0.3, 'cognitive_complexity.Python': 0.3
+        }
+
+        self.assertAlmostEqual(self.analyzer.get_statistics()['total_kpi_time'], 0.4)
+
 
 class TestFileAnalyzerIntegration(unittest.TestCase):
     """Integration tests with real components."""
@@ -126,6 +126,41 @@ def nested_function(x, y):
         finally:
             os.unlink(temp_path)
 
+    def test_methods_and_nested_functions_get_cognitive_complexity(self):
+        """Should join qualified Python scores ('A.run') to the plain names of the Function objects."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("""
+class A:
+    def run(self, x):
+        if x:                # +1
+            return 1
+        return 0
+
+
+def run(items):
+    for item in items:       # +1
+        if item:             # +2 (1 + 1 nesting)
+            return item
+
+
+def outer(y):
+    def inner():
+        while y:             # +1
+            return 2
+    return inner
+""")
+            temp_path = f.name
+
+        try:
+            file_obj = self.analyzer.analyze_file({'path': temp_path, 'ext': '.py'}, Path(tempfile.gettempdir()))
+        finally:
+            os.unlink(temp_path)
+
+        self.assertEqual(file_obj.kpis['cognitive_complexity'].calculation_values,
+                         {'A.run': 1, 'run': 3, 'outer': 1, 'outer.<locals>.inner': 1})
+        self.assertEqual([(f.name, f.kpis['cognitive_complexity'].value) for f in file_obj.functions],
+                         [('run', 1), ('run', 3), ('outer', 1), ('inner', 1)])
+
     def test_data_model_compatibility(self):
         """Should work with existing Dict[str, BaseKPI] data model."""
         # Create a temporary Python file
@@ -0,0 +1,164 @@
+"""
+Tests for the generated/minified/vendored file classifier and its analyzer modes.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.app.core.analyzer import Analyzer
+from src.app.scanning.file_classifier import (
+    GENERATED, MINIFIED, OVERSIZED, VENDORED, FileClassifier
+)
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.languages.config import LANGUAGES
+from src.utilities.cli_helpers import parse_args
+from src.utilities.git_cache import get_git_cache
+from src.utilities.git_helpers import run_git
+
+FILES = {
+    'app.py': "def f(x):\n    if x:\n        return 1\n    return 2\n",
+    'bundle.js': "var a=function(){return 1};" * 400 + "\n",
+    'api_pb2.py': "# Generated by the protocol buffer compiler.  DO NOT EDIT!\nX = 1\n",
+    'client.go': "// Code generated by openapi-generator. DO NOT EDIT.\npackage client\n",
+    'jquery.min.js': "function $(){}\n",
+    'third_party/lib.js': "function g() { return 1; }\n",
+    'gen/schema.ts': "export const x = 1;\n",
+    'gen/handwritten.ts': "export const y = 2;\n",
+    'tools/codec_pb2.py': "X = 1\n",
+    'settings.py': "# Do not edit without updating the deployment docs.\nDEBUG = False\n",
+}
+
+
+class ClassifierRepoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        for name, content in FILES.items():
+            path = os.path.join(self.repo, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(content)
+        with open(os.path.join(self.repo, '.gitattributes'), 'w') as f:
+            f.write("third_party/** linguist-vendored\ngen/** linguist-generated=true\n"
+                    "gen/handwritten.ts linguist-generated=false\ntools/** -linguist-generated\n")
+        subprocess.run(['git', 'init', '-q', self.repo], check=True)
+        subprocess.run(['git', '-C', self.repo, 'add', '-A'], check=True)
+        subprocess.run(['git', '-C', self.repo, '-c', 'user.name=t', '-c', 'user.email=t@t',
+                        'commit', '-q', '-m', 'init'], check=True)
+
+    def tearDown(self):
+        get_git_cache().clear_cache()
+        shutil.rmtree(self.repo)
+
+    def file_infos(self):
+        return [
+            {'path': os.path.join(self.repo, name), 'root': self.repo, 'ext': os.path.splitext(name)[1]}
+            for name in FILES
+        ]
+
+
+class TestFileClassifier(ClassifierRepoTestCase):
+    def test_classifies_by_attributes_name_header_and_line_length(self):
+        classes = FileClassifier().classify(self.repo, self.file_infos())
+        by_name = {os.path.relpath(path, self.repo): kind for path, kind in classes.items()}
+
+        self.assertEqual(by_name, {
+            'bundle.js': MINIFIED,
+            'api_pb2.py': GENERATED,
+            'client.go': GENERATED,
+            'jquery.min.js': MINIFIED,
+            'third_party/lib.js': VENDORED,
+            'gen/schema.ts': GENERATED,
+        })
+
+    def test_false_or_unset_attributes_override_the_heuristics(self):
+        attributes = FileClassifier.read_gitattributes(self.repo, ['gen/handwritten.ts', 'tools/codec_pb2.py',
+                                                                   'gen/schema.ts', 'app.py'])
+
+        self.assertEqual(attributes, {'gen/handwritten.ts': None, 'tools/codec_pb2.py': None,
+                                      'gen/schema.ts': GENERATED})
+
+    def test_bare_do_not_edit_comment_is_not_a_generator_banner(self):
+        self.assertIsNone(FileClassifier().classify_file(os.path.join(self.repo, 'settings.py')))
+
+    def test_gitattributes_read_in_one_git_call(self):
+        with patch('src.app.scanning.file_classifier.run_git', wraps=run_git) as mock_run:
+            FileClassifier().classify(self.repo, self.file_infos())
+
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args.args[1][:3], ['check-attr', '-z', '--stdin'])
+
+    def test_oversized_files(self):
+        classifier = FileClassifier(max_file_bytes=50)
+        self.assertEqual(classifier.classify_file(os.path.join(self.repo, 'bundle.js')), OVERSIZED)
+        self.assertIsNone(classifier.classify_file(os.path.join(self.repo, 'app.py')))
+
+    def test_no_git_repository(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'a.py')
+            with open(path, 'w') as f:
+                f.write("x = 1\n")
+            self.assertEqual(FileClassifier().classify(tmp, [{'path': path}]), {})
+        finally:
+            shutil.rmtree(tmp)
+
+
+class TestAnalyzerGeneratedFiles(ClassifierRepoTestCase):
+    def analyze(self, mode):
+        analyzer = Analyzer(LANGUAGES, max_workers=1, generated_files=mode)
+        with patch('sys.stderr'):
+            repo_info = analyzer.analyze(self.file_infos())[self.repo]
+        return analyzer, repo_info
+
+    @staticmethod
+    def all_files(scan_dir):
+        files = dict(scan_dir.files)
+        for sub in scan_dir.scan_dirs.values():
+            files.update(TestAnalyzerGeneratedFiles.all_files(sub))
+        return files
+
+    def test_skip_mode_drops_classified_files(self):
+        analyzer, repo_info = self.analyze('skip')
+
+        self.assertEqual(set(self.all_files(repo_info)), {'app.py', 'handwritten.ts', 'codec_pb2.py', 'settings.py'})
+        self.assertEqual(sum(analyzer.classified_counts.values()), 6)
+        self.assertEqual(analyzer.classified_counts[VENDORED], 1)
+
+    def test_reduced_mode_keeps_churn_without_parsing_or_blame(self):
+        analyzer, repo_info = self.analyze('reduced')
+        files = self.all_files(repo_info)
+        bundle = files['bundle.js']
+
+        self.assertEqual(len(files), len(FILES))
+        self.assertEqual(bundle.kpis['complexity'].value, 0)
+        self.assertEqual(bundle.kpis['complexity'].calculation_values['classification'], MINIFIED)
+        self.assertEqual(bundle.kpis['churn'].value, 1)
+        self.assertEqual(bundle.kpis['hotspot'].value, 0)
+        self.assertNotIn('Code Ownership', bundle.kpis)
+        self.assertNotIn('bundle.js', get_git_cache().blame_cache.get(self.repo, {}))
+        self.assertIn('Code Ownership', files['app.py'].kpis)
+
+    def test_analyze_mode_classifies_nothing(self):
+        analyzer, repo_info = self.analyze('analyze')
+
+        self.assertEqual(len(self.all_files(repo_info)), len(FILES))
+        self.assertEqual(analyzer.classified_counts, {})
+
+
+class TestGeneratedFilesConfig(unittest.TestCase):
+    def test_cli_flag_reaches_app_config(self):
+        config = AppConfig.from_cli_args(parse_args().parse_args(['src', '--generated-files', 'reduced']))
+        self.assertEqual(config.generated_files, 'reduced')
+        self.assertEqual(AppConfig(directories=['src']).generated_files, 'reduced')
+
+    def test_invalid_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            ConfigValidator(AppConfig(directories=['src'], generated_files='ignore')).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -259,12 +259,13 @@ class TestKPICalculator(unittest.TestCase):
         self.assertIn('complexity', self.calculator.strategies)
         self.assertIn('cognitive_complexity', self.calculator.strategies)
         self.assertIn('churn', self.calculator.strategies)
+        self.assertIn('churn_acceleration', self.calculator.strategies)
         self.assertIn('hotspot', self.calculator.strategies)
         self.assertIn('ownership', self.calculator.strategies)
         self.assertIn('shared_ownership', self.calculator.strategies)
 
-        # Should initialize timing (6 strategies now including cognitive_complexity)
-        self.assertEqual(len(self.calculator.timing), 6)
+        # Should initialize timing (7 strategies now including cognitive_complexity and churn_acceleration)
+        self.assertEqual(len(self.calculator.timing), 7)
         self.assertTrue(all(v == 0.0 for v in self.calculator.timing.values()))
 
     def test_register_strategy(self):
@@ -333,10 +334,11 @@ class TestKPICalculator(unittest.TestCase):
         )
 
         # Verify all KPIs calculated (including cognitive_complexity added in Phase 2)
-        self.assertEqual(len(result), 6)
+        self.assertEqual(len(result), 7)
         self.assertIn('complexity', result)
         self.assertIn('cognitive_complexity', result)
         self.assertIn('churn', result)
+        self.assertIn('churn_acceleration', result)
         self.assertIn('hotspot', result)
         self.assertIn('Code Ownership', result)
         self.assertIn('Shared Ownership', result)
@@ -373,6 +375,7 @@ class TestKPICalculator(unittest.TestCase):
             0.0, 0.1,   # complexity: 0.1s
             0.1, 0.25,  # cognitive_complexity: 0.15s
             0.25, 0.45,  # churn: 0.2s
+            0.45, 0.45,  # churn_acceleration: 0.0s
             0.45, 0.5,  # hotspot: 0.05s
             0.5, 0.65,  # ownership: 0.15s
             0.65, 0.75  # shared: 0.1s
@@ -6,9 +6,16 @@ Following TDD approach: RED → GREEN → REFACTOR
 """
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.app.kpi.kpi_calculator import KPICalculator
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.cognitive_complexity import calculator_base
 from src.kpis.complexity import ComplexityAnalyzer
+from src.languages import tree_sitter_support
+from src.languages.config import LANGUAGES
+from src.utilities.cli_helpers import parse_args
 
 
 class TestKPICalculatorCognitiveComplexity(unittest.TestCase):
@@ -126,5 +133,93 @@ def nested_complexity(x, y):
         )
 
 
+class TestKPICalculatorCognitiveComplexityAllLanguages(unittest.TestCase):
+    """Test the multi-language cognitive complexity mode (--cognitive-languages all)."""
+
+    GO_CODE = "package m\nfunc (s *S) Get(x int) int { if x > 0 && x < 3 { return 1 }; return 0 }\n"
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.complexity_analyzer = ComplexityAnalyzer()
+        self.calculator = KPICalculator(self.complexity_analyzer, cognitive_languages='all')
+        self.strategy = self.calculator.strategies['cognitive_complexity']
+
+    def calculate(self, name, code):
+        ext = Path(name).suffix
+        return self.strategy.calculate(
+            file_info={'path': f'/fake/path/{name}', 'ext': ext},
+            repo_root=Path('/fake/path'),
+            content=code
+        )
+
+    def test_every_language_with_a_calculator_is_scored(self):
+        """Test that Go, C++ and TSX files are scored, with names matching the cyclomatic functions."""
+        go_kpi = self.calculate('s.go', self.GO_CODE)
+        cpp_kpi = self.calculate('box.cpp', "int Box::put(int x) { for (auto y : ys) { if (y) return y; } return 0; }")
+        tsx_kpi = self.calculate('app.tsx', "const App = (x: number) => { if (x) { return <div/> } return null }")
+
+        self.assertEqual(go_kpi.calculation_values, {'Get': 2})
+        self.assertEqual(cpp_kpi.calculation_values, {'Box::put': 3})
+        self.assertEqual(tsx_kpi.calculation_values, {'App': 1})
+        functions = self.complexity_analyzer.analyze_functions(self.GO_CODE, LANGUAGES['.go'])
+        self.assertEqual([f['name'] for f in functions], list(go_kpi.calculation_values))
+
+    def test_tree_is_shared_with_the_complexity_parser(self):
+        """Test that a file is parsed once for cyclomatic and cognitive complexity."""
+        code = self.GO_CODE + "// parsed once\n"
+        real_parser = tree_sitter_support.get_thread_parser('go')
+
+        with patch.object(tree_sitter_support, 'get_thread_parser', return_value=real_parser) as get_parser:
+            self.complexity_analyzer.analyze_functions(code, LANGUAGES['.go'])
+            self.calculate('s.go', code)
+
+        get_parser.assert_called_once_with('go')
+
+    def test_timing_is_reported_per_language(self):
+        """Test that cognitive complexity time is also recorded per language."""
+        for name in ('a.go', 'b.go', 'c.py', 'd.md'):
+            self.calculator._calculate_timed(
+                'cognitive_complexity',
+                detail=self.strategy.language_of({'ext': Path(name).suffix}),
+                file_info={'path': name, 'ext': Path(name).suffix},
+                repo_root=Path('/fake/path'),
+                content=self.GO_CODE if name.endswith('.go') else 'x = 1\n'
+            )
+
+        timing = self.calculator.get_timing_report()
+        language_keys = sorted(k for k in timing if k.startswith('cognitive_complexity.'))
+        self.assertEqual(language_keys, ['cognitive_complexity.Go', 'cognitive_complexity.Python'])
+        self.assertGreaterEqual(
+            timing['cognitive_complexity'], timing['cognitive_complexity.Go'] + timing['cognitive_complexity.Python']
+        )
+
+    def test_python_mode_only_scores_python(self):
+        """Test that the default mode leaves other languages unscored."""
+        strategy = KPICalculator(self.complexity_analyzer).strategies['cognitive_complexity']
+
+        self.assertIsNone(strategy.language_of({'ext': '.go'}))
+        self.assertEqual(strategy.language_of({'ext': 'py'}), 'Python')
+        self.assertEqual(self.strategy.language_of({'ext': '.cpp'}), 'C++')
+        self.assertIsNone(self.strategy.language_of({'ext': '.cs'}))  # no calculator
+
+    def test_files_over_the_time_limit_get_no_value(self):
+        """Test that a file whose scoring exceeds the time limit is left unscored."""
+        with patch.object(calculator_base.time, 'monotonic', side_effect=[0.0, 0.5, 5.0]):
+            kpi = self.calculate('s.go', self.GO_CODE + "func Other() {}\n")
+
+        self.assertIsNone(kpi.value)
+        self.assertEqual(kpi.calculation_values, {})
+
+    def test_cli_options_reach_app_config(self):
+        """Test the --cognitive-languages and --cognitive-time-limit options."""
+        args = parse_args().parse_args(['src', '--cognitive-languages', 'all', '--cognitive-time-limit', '0.5'])
+        config = AppConfig.from_cli_args(args)
+
+        self.assertEqual((config.cognitive_languages, config.cognitive_time_limit), ('all', 0.5))
+        self.assertEqual(AppConfig(directories=['src']).cognitive_languages, 'python')
+        with self.assertRaises(ValueError):
+            ConfigValidator(AppConfig(directories=['src'], cognitive_time_limit=-1)).validate()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,189 @@
+"""
+Tests for parallel report generation across formats and repositories.
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.app.coordination import parallel_report_runner
+from src.app.coordination.parallel_report_runner import ParallelReportRunner, fork_available
+from src.app.coordination.report_coordinator import ReportCoordinator
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.model import File, RepoInfo
+from src.utilities.cli_helpers import parse_args
+from src.utilities.thread_output import captured_stdout, routed_stdout
+from src.utilities.tracing import start_tracing, stop_tracing
+
+
+def make_repo(name):
+    repo = RepoInfo(dir_name=name, scan_dir_path='.', repo_root_path=f"/{name}", repo_name=name)
+    file_obj = File(name='main.py', file_path='main.py')
+    file_obj.kpis = {
+        'complexity': SimpleNamespace(value=12),
+        'cognitive_complexity': SimpleNamespace(value=8),
+        'churn': SimpleNamespace(value=5),
+        'hotspot': SimpleNamespace(value=60),
+    }
+    repo.files['main.py'] = file_obj
+    return repo
+
+
+class PrintingGenerator:
+    """Report generator that prints its format and repo after a delay that reverses completion order."""
+
+    calls = []
+
+    def __init__(self, repo_info, *args):
+        self.repo_info = repo_info
+
+    def generate(self, output_format=None, **kwargs):
+        time.sleep(0.05 if self.repo_info.repo_name == 'a' else 0.0)
+        PrintingGenerator.calls.append(threading.current_thread().name)
+        print(f"{output_format}:{self.repo_info.repo_name}")
+
+
+class UnpicklableRepo(RepoInfo):
+    def __reduce__(self):
+        raise pickle.PicklingError("RepoInfo must not be pickled")
+
+
+class TestThreadOutput(unittest.TestCase):
+    def test_captured_stdout_only_redirects_the_calling_thread(self):
+        outer = StringIO()
+        with patch('sys.stdout', outer), routed_stdout():
+            captured = {}
+
+            def worker():
+                with captured_stdout() as (buffer, _):
+                    print("worker")
+                    captured['text'] = buffer.getvalue()
+
+            with captured_stdout() as (main_buffer, previous):
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join()
+                print("main")
+                print("direct", file=previous)
+
+        self.assertEqual(captured['text'], "worker\n")
+        self.assertEqual(main_buffer.getvalue(), "main\n")
+        self.assertEqual(outer.getvalue(), "direct\n")
+
+    def test_captured_stdout_swaps_stdout_without_router(self):
+        outer = StringIO()
+        with patch('sys.stdout', outer):
+            with captured_stdout() as (buffer, previous):
+                print("inside")
+            print("after")
+        self.assertIs(previous, outer)
+        self.assertEqual(buffer.getvalue(), "inside\n")
+        self.assertEqual(outer.getvalue(), "after\n")
+
+
+class TestParallelReportRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.config = AppConfig(directories=['a', 'b'], output_formats=['summary', 'json'],
+                                report_folder=self.tmp, report_workers=4)
+        PrintingGenerator.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_plan_follows_serial_order_with_one_review_task(self):
+        self.config.output_formats = ['json', 'review-strategy', 'summary']
+        runner = ParallelReportRunner(ReportCoordinator(self.config), 4)
+
+        tasks = runner.plan(self.config.output_formats, [make_repo('a'), make_repo('b')], [], True)
+
+        self.assertEqual([(t.output_format, t.repo_index) for t in tasks],
+                         [('json', 0), ('json', 1), ('review-strategy', None), ('summary', 0), ('summary', 1)])
+        self.assertEqual([t.index for t in tasks], list(range(5)))
+
+    def test_output_is_written_in_serial_order(self):
+        coordinator = ReportCoordinator(self.config, PrintingGenerator)
+        out = StringIO()
+        with patch('sys.stdout', out):
+            ParallelReportRunner(coordinator, 4, use_processes=False).run(
+                ['summary', 'json'], [make_repo('a'), make_repo('b')], [], True)
+
+        self.assertEqual(out.getvalue().split(), ['summary:a', 'summary:b', 'json:a', 'json:b'])
+        self.assertTrue(all(name.startswith('metricmancer-report') for name in PrintingGenerator.calls))
+
+    def test_review_strategy_task_calls_back_with_all_repos(self):
+        calls = []
+        coordinator = ReportCoordinator(self.config, PrintingGenerator)
+        repos = [make_repo('a'), make_repo('b')]
+        runner = ParallelReportRunner(coordinator, 2, lambda *args: calls.append(args), use_processes=False)
+
+        with patch('sys.stdout', StringIO()):
+            runner.run(['review-strategy-branch', 'summary'], repos, [], True)
+
+        self.assertEqual(calls, [(repos, True, 'review_strategy_branch.md')])
+
+    def test_first_error_is_raised_after_other_reports(self):
+        class FailingGenerator(PrintingGenerator):
+            def generate(self, output_format=None, **kwargs):
+                if self.repo_info.repo_name == 'a':
+                    raise RuntimeError("boom")
+                super().generate(output_format=output_format, **kwargs)
+
+        out = StringIO()
+        with patch('sys.stdout', out), self.assertRaisesRegex(RuntimeError, "boom"):
+            ParallelReportRunner(ReportCoordinator(self.config, FailingGenerator), 4, use_processes=False).run(
+                ['summary'], [make_repo('a'), make_repo('b')], [], True)
+        self.assertEqual(out.getvalue(), "summary:b\n")
+
+    @unittest.skipUnless(fork_available(), "requires fork")
+    def test_html_is_rendered_in_forked_workers_without_pickling_repos(self):
+        repos = []
+        for name in ('a', 'b'):
+            repo = make_repo(name)
+            repo.__class__ = UnpicklableRepo
+            repos.append(repo)
+        self.config.output_formats = ['html', 'json']
+        coordinator = ReportCoordinator(self.config)
+        runner = ParallelReportRunner(coordinator, 2)
+
+        out = StringIO()
+        start_tracing()
+        try:
+            with patch('sys.stdout', out):
+                runner.run(self.config.output_formats, repos, [], True)
+        finally:
+            tracer = stop_tracing()
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn('complexity_report_1.html', lines[0])
+        self.assertIn('complexity_report_2.html', lines[1])
+        self.assertIn('.json', lines[2])
+        for name in ('complexity_report_1.html', 'complexity_report_2.html'):
+            with open(os.path.join(self.tmp, name), encoding='utf-8') as f:
+                self.assertIn('main.py', f.read())
+        html_events = [e for e in tracer.events if e['name'] == 'report html']
+        self.assertEqual([e['args'].get('process') for e in html_events], [True, True])
+        self.assertIsNone(parallel_report_runner._snapshot)
+
+
+class TestReportWorkersConfig(unittest.TestCase):
+    def test_cli_option_reaches_app_config(self):
+        config = AppConfig.from_cli_args(parse_args().parse_args(['src', '--report-workers', '2']))
+        self.assertEqual(config.report_workers, 2)
+        self.assertEqual(AppConfig(directories=['src']).report_workers, 4)
+
+    def test_report_workers_must_be_positive(self):
+        with self.assertRaisesRegex(ValueError, "report_workers"):
+            ConfigValidator(AppConfig(directories=['src'], report_workers=0)).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
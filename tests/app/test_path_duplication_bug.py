@@ -34,7 +34,7 @@ class TestPathDuplicationBug(unittest.TestCase):
             shutil.rmtree(self.test_dir)
 
     @patch('src.utilities.git_helpers.get_current_branch')
-    @patch('src.analysis.code_review_advisor.generate_review_report')
+    @patch('src.analysis.code_review_advisor.generate_review_report_for_repos')
     def test_review_output_with_folder_path_no_duplication(self, mock_generate, mock_get_branch):
         """
         🔴 RED TEST: Verify that review_output with path doesn't duplicate report_folder.
@@ -62,16 +62,10 @@ class TestPathDuplicationBug(unittest.TestCase):
         mock_repo_info.file_stats = {}
         mock_repo_info.directory_stats = {}
 
-        with patch('src.app.metric_mancer_app.DataConverter.convert_repo_info_to_dict_with_ownership') as mock_convert:
-            mock_convert.return_value = {
-                'files': {},
-                'scan_dirs': {}
-            }
+        # Run the method
+        app._run_review_strategy_analysis([mock_repo_info])
 
-            # Run the method
-            app._run_review_strategy_analysis([mock_repo_info])
-
-        # Verify generate_review_report was called
+        # Verify generate_review_report_for_repos was called
         self.assertTrue(mock_generate.called)
 
         # Get the output_file argument
@@ -87,7 +81,7 @@ class TestPathDuplicationBug(unittest.TestCase):
                         f"Path should end with 'output/review_strategy.md', got: {output_file}")
 
     @patch('src.utilities.git_helpers.get_current_branch')
-    @patch('src.analysis.code_review_advisor.generate_review_report')
+    @patch('src.analysis.code_review_advisor.generate_review_report_for_repos')
     def test_review_output_without_folder_path_works(self, mock_generate, mock_get_branch):
         """
         Verify that review_output without path prefix works correctly.
@@ -115,16 +109,10 @@ class TestPathDuplicationBug(unittest.TestCase):
         mock_repo_info.file_stats = {}
         mock_repo_info.directory_stats = {}
 
-        with patch('src.app.metric_mancer_app.DataConverter.convert_repo_info_to_dict_with_ownership') as mock_convert:
-            mock_convert.return_value = {
-                'files': {},
-                'scan_dirs': {}
-            }
-
-            # Run the method
-            app._run_review_strategy_analysis([mock_repo_info])
+        # Run the method
+        app._run_review_strategy_analysis([mock_repo_info])
 
-        # Verify generate_review_report was called
+        # Verify generate_review_report_for_repos was called
         self.assertTrue(mock_generate.called)
 
         # Get the output_file argument
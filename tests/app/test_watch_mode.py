@@ -0,0 +1,211 @@
+"""
+Tests for --watch mode: polling file watcher, incremental re-analysis and the watch loop.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.app.coordination.watch_coordinator import WatchCoordinator
+from src.app.core.analyzer import Analyzer
+from src.app.kpi.file_analyzer import FileAnalyzer
+from src.app.scanning.file_watcher import FileWatcher
+from src.config.app_config import AppConfig
+from src.languages.config import LANGUAGES
+from src.utilities.cli_helpers import parse_args
+from src.utilities.git_cache import get_git_cache
+
+FILES = {
+    'main.py': "def main():\n    return 1\n",
+    'pkg/a.py': "def a(x):\n    if x:\n        return 1\n    return 2\n",
+    'pkg/b.py': "def b(x):\n    for i in x:\n        print(i)\n",
+    'notes.txt': "not source\n",
+}
+
+
+class WatchRepoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        for name, content in FILES.items():
+            self.write(name, content)
+        self.git('init', '-q')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'init')
+
+    def tearDown(self):
+        get_git_cache().clear_cache()
+        shutil.rmtree(self.repo)
+
+    def git(self, *args):
+        subprocess.run(['git', '-C', self.repo, '-c', 'user.name=t', '-c', 'user.email=t@t'] + list(args),
+                       check=True, capture_output=True)
+
+    def write(self, name, content):
+        path = os.path.join(self.repo, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def path(self, name):
+        return os.path.join(self.repo, name)
+
+
+class TestFileWatcher(WatchRepoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.watcher = FileWatcher(LANGUAGES)
+        self.watcher.start([self.repo])
+
+    def test_snapshot_matches_scanned_source_files(self):
+        self.assertEqual(sorted(f['path'] for f in self.watcher.files()),
+                         sorted(self.path(n) for n in ('main.py', 'pkg/a.py', 'pkg/b.py')))
+        self.assertFalse(self.watcher.poll())
+
+    def test_detects_modified_added_and_removed_files(self):
+        self.write('pkg/a.py', FILES['pkg/a.py'] + "\ndef extra():\n    pass\n")
+        self.write('pkg/sub/new.py', "def new():\n    pass\n")
+        self.write('pkg/ignored.txt', "x\n")
+        self.write('.hidden/skip.py', "def skip():\n    pass\n")
+        os.remove(self.path('pkg/b.py'))
+
+        changes = self.watcher.poll()
+
+        self.assertEqual(sorted(f['path'] for f in changes.changed),
+                         [self.path('pkg/a.py'), self.path('pkg/sub/new.py')])
+        self.assertEqual(changes.removed, [self.path('pkg/b.py')])
+        self.assertEqual(changes.changed[0]['root'], self.repo)
+        self.assertFalse(self.watcher.poll())
+
+
+class TestIncrementalReanalysis(WatchRepoTestCase):
+    def analyze(self):
+        analyzer = Analyzer(LANGUAGES, max_workers=1)
+        watcher = FileWatcher(LANGUAGES)
+        watcher.start([self.repo])
+        with patch('sys.stderr'):
+            summary = analyzer.analyze(watcher.files())
+        return analyzer, watcher, summary
+
+    def snapshot(self, scan_dir):
+        """KPI values of a directory tree: {path: {kpi: value}} for every directory and file."""
+        values = {scan_dir.scan_dir_path: {name: kpi.value for name, kpi in scan_dir.kpis.items()
+                                           if name != 'Shared Ownership'}}
+        for file_obj in scan_dir.files.values():
+            values[file_obj.file_path] = {name: kpi.value for name, kpi in file_obj.kpis.items()}
+        for sub in scan_dir.scan_dirs.values():
+            values.update(self.snapshot(sub))
+        return values
+
+    def test_incremental_update_matches_full_analysis(self):
+        analyzer, watcher, summary = self.analyze()
+        self.write('pkg/a.py', FILES['pkg/a.py'] + "def c(y):\n    while y:\n        y -= 1\n")
+        self.write('pkg/sub/new.py', "def new(z):\n    return z or 1\n")
+        os.remove(self.path('main.py'))
+        changes = watcher.poll()
+
+        with patch.object(FileAnalyzer, 'analyze_file', autospec=True,
+                          side_effect=FileAnalyzer.analyze_file) as mock_analyze:
+            updated = analyzer.reanalyze_files(summary, changes.changed, changes.removed)
+
+        self.assertEqual(updated, {self.repo})
+        self.assertEqual(sorted(call.args[1]['path'] for call in mock_analyze.call_args_list),
+                         [self.path('pkg/a.py'), self.path('pkg/sub/new.py')])
+        get_git_cache().clear_cache()
+        _, _, fresh = self.analyze()
+        self.assertEqual(self.snapshot(summary[self.repo]), self.snapshot(fresh[self.repo]))
+        self.assertNotIn('main.py', summary[self.repo].files)
+
+    def test_repository_created_while_watching_is_discovered(self):
+        analyzer, watcher, summary = self.analyze()
+        nested = self.path('pkg')
+        subprocess.run(['git', 'init', '-q', nested], check=True, capture_output=True)
+        self.write('pkg/c.py', "def c():\n    return 1\n")
+        changes = watcher.poll()
+
+        with patch('sys.stderr'):
+            updated = analyzer.reanalyze_files(summary, changes.changed, changes.removed)
+
+        self.assertEqual(updated, {nested})
+        self.assertEqual(set(summary[nested].files), {'c.py'})
+        with patch('sys.stderr'):
+            self.assertEqual(set(analyzer.analyze(watcher.files())), {self.repo, nested})
+
+    def test_removing_last_file_prunes_directory(self):
+        analyzer, watcher, summary = self.analyze()
+        os.remove(self.path('pkg/a.py'))
+        os.remove(self.path('pkg/b.py'))
+        changes = watcher.poll()
+
+        analyzer.reanalyze_files(summary, changes.changed, changes.removed)
+
+        self.assertNotIn('pkg', summary[self.repo].scan_dirs)
+        self.assertEqual(set(summary[self.repo].files), {'main.py'})
+
+
+class TestWatchCoordinator(WatchRepoTestCase):
+    def make_coordinator(self, on_sleep):
+        analyzer = Analyzer(LANGUAGES, max_workers=1)
+        with patch('sys.stderr'):
+            repo_infos = list(analyzer.analyze(self.scanned()).values())
+        render = MagicMock()
+        coordinator = WatchCoordinator(analyzer, [self.repo], LANGUAGES, render, interval=0.01,
+                                       sleep=lambda _seconds: on_sleep())
+        return coordinator, analyzer, render, repo_infos
+
+    def scanned(self):
+        watcher = FileWatcher(LANGUAGES)
+        watcher.start([self.repo])
+        return watcher.files()
+
+    def test_rerenders_only_when_files_change(self):
+        edits = iter([lambda: self.write('pkg/b.py', "def b():\n    pass\n"), lambda: None])
+        coordinator, analyzer, render, repo_infos = self.make_coordinator(lambda: next(edits)())
+
+        with patch('builtins.print'), patch.object(analyzer, 'reanalyze_files',
+                                                   wraps=analyzer.reanalyze_files) as mock_reanalyze:
+            coordinator.run(repo_infos, max_polls=2)
+
+        mock_reanalyze.assert_called_once()
+        render.assert_called_once()
+        self.assertIn(self.repo, [r.repo_root_path for r in render.call_args.args[0]])
+
+    def test_head_move_triggers_full_reanalysis(self):
+        def commit():
+            self.write('main.py', "def main():\n    return 2\n")
+            self.git('commit', '-q', '-am', 'change')
+
+        coordinator, analyzer, render, repo_infos = self.make_coordinator(commit)
+        with patch('builtins.print'), patch('sys.stderr'), \
+                patch.object(analyzer, 'analyze', wraps=analyzer.analyze) as mock_analyze:
+            current = coordinator.run(repo_infos, max_polls=1)
+
+        mock_analyze.assert_called_once()
+        self.assertEqual(current[0].files['main.py'].kpis['churn'].value, 2)
+
+    def test_ctrl_c_stops_watching(self):
+        def interrupt():
+            raise KeyboardInterrupt
+
+        coordinator, _, render, repo_infos = self.make_coordinator(interrupt)
+        with patch('builtins.print'):
+            self.assertEqual(len(coordinator.run(repo_infos)), 1)
+        render.assert_not_called()
+
+
+class TestWatchConfig(unittest.TestCase):
+    def test_cli_flags_reach_app_config(self):
+        config = AppConfig.from_cli_args(parse_args().parse_args(['src', '--watch', '--watch-interval', '2']))
+        self.assertTrue(config.watch)
+        self.assertEqual(config.watch_interval, 2.0)
+        self.assertFalse(AppConfig(directories=['src']).watch)
+
+    def test_interval_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            AppConfig(directories=['src'], watch_interval=0).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
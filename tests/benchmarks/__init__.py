@@ -0,0 +1 @@
+"""Test package for the benchmark suite."""
@@ -0,0 +1,124 @@
+"""
+Tests for the benchmark regression gate.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from benchmarks.compare import (
+    STATUS_IMPROVEMENT, STATUS_MISSING, STATUS_NEW, STATUS_NOISY, STATUS_OK, STATUS_REGRESSION,
+    compare_benchmark, compare_results, format_diff, keep_best, main
+)
+
+
+def _result(throughput, mad_fraction=0.0, items=100):
+    median = items / throughput
+    return {'group': 'g', 'runs': [median], 'median': median, 'mad': median * mad_fraction, 'min': median,
+            'items': items, 'unit': 'files', 'throughput': throughput}
+
+
+def _suite(**benchmarks):
+    return {'schema': 1, 'metadata': {'spec': {'files': 10}}, 'repo': {}, 'benchmarks': benchmarks}
+
+
+class TestCompareBenchmark(unittest.TestCase):
+    def test_statuses(self):
+        cases = [
+            (_result(100), _result(90), STATUS_OK),
+            (_result(100), _result(80), STATUS_REGRESSION),
+            (_result(100), _result(130), STATUS_IMPROVEMENT),
+            # A 20 % drop is within 3x the 10 % relative MAD of a jittery benchmark
+            (_result(100, 0.1), _result(80), STATUS_NOISY),
+            (_result(100, 0.1), _result(60), STATUS_REGRESSION),
+        ]
+        for baseline, current, expected in cases:
+            with self.subTest(expected=expected, current=current['throughput']):
+                self.assertEqual(compare_benchmark('b', baseline, current).status, expected)
+
+    def test_change_and_noise(self):
+        diff = compare_benchmark('b', _result(200, 0.02), _result(100, 0.05))
+        self.assertAlmostEqual(diff.change, -0.5)
+        self.assertAlmostEqual(diff.noise, 0.05)
+        self.assertEqual(diff.unit, 'files')
+
+    def test_tolerance_is_configurable(self):
+        self.assertEqual(compare_benchmark('b', _result(100), _result(80), tolerance=0.25).status, STATUS_OK)
+
+    def test_missing_and_new_benchmarks_do_not_regress(self):
+        diffs = compare_results(_suite(a=_result(100), b=_result(100)), _suite(a=_result(100), c=_result(5)))
+        self.assertEqual([(d.name, d.status) for d in diffs],
+                         [('a', STATUS_OK), ('b', STATUS_MISSING), ('c', STATUS_NEW)])
+
+    def test_keep_best_takes_faster_rerun(self):
+        current = _suite(a=_result(50), b=_result(100))
+        keep_best(current, _suite(a=_result(90), b=_result(70)))
+        self.assertEqual(current['benchmarks']['a']['throughput'], 90)
+        self.assertEqual(current['benchmarks']['b']['throughput'], 100)
+
+    def test_format_diff_lists_every_benchmark_and_verdict(self):
+        diffs = compare_results(_suite(scan=_result(100), analyze=_result(100)),
+                                _suite(scan=_result(50), analyze=_result(101)))
+        text = format_diff(diffs)
+
+        self.assertIn('scan', text)
+        self.assertIn('-50.0%', text)
+        self.assertIn('REGRESSION (files/s)', text)
+        self.assertIn('1 benchmark(s) regressed by more than 15%', text)
+        self.assertIn('analyze', text)
+
+
+class TestCompareMain(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, name, data):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return path
+
+    def _main(self, *argv):
+        with patch('sys.stdout', new_callable=StringIO) as out, patch('sys.stderr', new_callable=StringIO):
+            code = main(list(argv))
+        return code, out.getvalue()
+
+    def test_exit_codes(self):
+        baseline = self._write('base.json', _suite(scan=_result(100)))
+        same = self._write('same.json', _suite(scan=_result(95)))
+        slower = self._write('slower.json', _suite(scan=_result(50)))
+
+        self.assertEqual(self._main('--baseline', baseline, '--current', same)[0], 0)
+        code, output = self._main('--baseline', baseline, '--current', slower)
+        self.assertEqual(code, 1)
+        self.assertIn('REGRESSION', output)
+        self.assertEqual(self._main('--baseline', os.path.join(self.tmp, 'none.json'), '--current', same)[0], 2)
+
+    def test_runs_suite_with_baseline_spec_and_confirms_regressions(self):
+        baseline = self._write('base.json', {
+            'metadata': {'spec': {'files': 3, 'commits': 2}},
+            'benchmarks': {'scan': _result(100), 'analyze': _result(100)},
+        })
+        runs = []
+
+        def fake_run_suite(spec, repeat, name_filter=None, progress=None, names=None):
+            runs.append((spec.files, names))
+            throughput = 40 if names is None else 99
+            return _suite(scan=_result(throughput), analyze=_result(100))
+
+        with patch('benchmarks.compare.run_suite', side_effect=fake_run_suite):
+            code, output = self._main('--baseline', baseline, '--repeat', '1')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(runs, [(3, None), (3, ['scan'])])
+        self.assertIn('Re-running 1 regressed benchmark(s)', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
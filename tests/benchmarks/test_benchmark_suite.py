@@ -0,0 +1,165 @@
+"""
+Tests for the synthetic repository generator and the benchmark suite.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from benchmarks.suite import (
+    Benchmark, main, median_absolute_deviation, run_benchmark, run_suite
+)
+from benchmarks.synthetic_repo import (
+    SUPPORTED_EXTENSIONS, SyntheticRepoSpec, generate_repo, generate_report_tree, generate_source, render_source
+)
+from src.kpis.complexity import ComplexityAnalyzer
+from src.languages.config import LANGUAGES
+
+SMALL_SPEC = SyntheticRepoSpec(files=6, functions_per_file=2, nesting_depth=2, commits=4, authors=2, renames=1,
+                               render_files=50)
+
+
+def _git(repo, *args):
+    return subprocess.run(['git'] + list(args), cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+class TestSyntheticSource(unittest.TestCase):
+    def test_every_extension_renders_functions_for_its_parser(self):
+        analyzer = ComplexityAnalyzer()
+        for ext in SUPPORTED_EXTENSIONS:
+            if ext in ('.json', '.yaml'):
+                continue
+            with self.subTest(ext=ext):
+                functions = analyzer.analyze_functions(generate_source(ext, functions=3, depth=2), LANGUAGES[ext])
+                self.assertGreaterEqual(len(functions), 3)
+
+    def test_data_files_are_valid(self):
+        data = json.loads(generate_source('.json', functions=3, depth=3))
+        self.assertEqual(len(data), 3)
+
+    def test_nesting_depth_raises_complexity(self):
+        shallow = render_source('.py', 'm', [0], depth=1)
+        deep = render_source('.py', 'm', [0], depth=4)
+        analyzer = ComplexityAnalyzer()
+        self.assertGreater(analyzer.calculate_for_file(deep, LANGUAGES['.py'])[0],
+                           analyzer.calculate_for_file(shallow, LANGUAGES['.py'])[0])
+
+    def test_unknown_extension_rejected(self):
+        with self.assertRaises(ValueError):
+            render_source('.xyz', 'm', [0], 1)
+
+
+class TestSyntheticRepo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_repo_matches_spec(self):
+        info = generate_repo(os.path.join(self.tmp, 'repo'), SMALL_SPEC)
+        repo = info['path']
+
+        self.assertEqual(len(info['files']), 6)
+        self.assertEqual(sorted(_git(repo, 'ls-files').split()), info['files'])
+        self.assertEqual(_git(repo, 'rev-list', '--count', 'HEAD').strip(), '5')
+        self.assertEqual(len(set(_git(repo, 'log', '--format=%an').split('\n')) - {''}), 2)
+        self.assertEqual(len([f for f in info['files'] if '/renamed' in f]), 1)
+        self.assertEqual(_git(repo, 'status', '--porcelain'), '')
+
+    def test_same_seed_gives_same_content(self):
+        first = generate_repo(os.path.join(self.tmp, 'a'), SMALL_SPEC)
+        second = generate_repo(os.path.join(self.tmp, 'b'), SMALL_SPEC)
+
+        self.assertEqual(first['files'], second['files'])
+        self.assertEqual(_git(first['path'], 'rev-parse', 'HEAD^{tree}'),
+                         _git(second['path'], 'rev-parse', 'HEAD^{tree}'))
+
+    def test_language_mix(self):
+        spec = SyntheticRepoSpec(files=4, language_mix={'.go': 1, '.sh': 1}, commits=0, renames=0)
+        info = generate_repo(os.path.join(self.tmp, 'repo'), spec)
+
+        self.assertEqual(sorted(os.path.splitext(f)[1] for f in info['files']), ['.go', '.go', '.sh', '.sh'])
+
+    def test_unsupported_language_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_repo(os.path.join(self.tmp, 'repo'), SyntheticRepoSpec(language_mix={'.rs': 1}))
+
+
+class TestReportTree(unittest.TestCase):
+    def test_tree_has_requested_files_and_aggregated_kpis(self):
+        tree = generate_report_tree(45, files_per_directory=10, fanout=2)
+
+        def count(scan_dir):
+            return len(scan_dir.files) + sum(count(d) for d in scan_dir.scan_dirs.values())
+
+        self.assertEqual(count(tree), 45)
+        self.assertEqual(len(tree.scan_dirs), 2)
+        self.assertIn('complexity', tree.kpis)
+        again = generate_report_tree(45, files_per_directory=10, fanout=2)
+        self.assertEqual(again.scan_dirs['dir1'].files['mod0.py'].kpis['complexity'].value,
+                         tree.scan_dirs['dir1'].files['mod0.py'].kpis['complexity'].value)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_median_absolute_deviation(self):
+        self.assertEqual(median_absolute_deviation([1.0, 2.0, 3.0, 4.0, 100.0]), 1.0)
+        self.assertEqual(median_absolute_deviation([5.0]), 0.0)
+
+    def test_run_benchmark_skips_warmup_and_discards_output(self):
+        calls = []
+        result = run_benchmark(Benchmark('b', 'g', lambda: calls.append(print('noise')), items=10), repeat=3,
+                               min_run_seconds=0)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(result['runs']), 3)
+        self.assertEqual(result['loops'], 1)
+        self.assertEqual(result['items'], 10)
+        self.assertGreater(result['throughput'], 0)
+
+    def test_fast_benchmarks_are_looped(self):
+        calls = []
+        result = run_benchmark(Benchmark('b', 'g', lambda: calls.append(1)), repeat=2, min_run_seconds=0.01)
+
+        self.assertGreater(result['loops'], 1)
+        self.assertEqual(len(calls), 1 + 2 * result['loops'])
+
+    def test_run_suite_selects_exact_names(self):
+        results = run_suite(SMALL_SPEC, repeat=1, names=['scan', 'parser.python'])
+        self.assertEqual(set(results['benchmarks']), {'scan', 'parser.python'})
+
+    def test_suite_covers_all_components(self):
+        results = run_suite(SMALL_SPEC, repeat=1)
+        names = set(results['benchmarks'])
+
+        for expected in ('scan', 'git_cache.prebuild', 'kpi_aggregator', 'delta_analyzer', 'analyze',
+                         'report.summary', 'report.quick-wins', 'report.tree', 'report.json', 'report.html',
+                         'render.html', 'cognitive.c', 'cognitive.cpp', 'cognitive.tsx', 'cognitive.python'):
+            self.assertIn(expected, names)
+        parser_modules = {language['parser'].replace('ComplexityParser', '').lower()
+                          for language in LANGUAGES.values() if language.get('parser')}
+        parsers = {n.split('.', 1)[1] for n in names if n.startswith('parser.')}
+        self.assertEqual({p for p in parsers if not p.startswith('treesitter.')}, parser_modules)
+        self.assertLessEqual({'treesitter.java', 'treesitter.tsx', 'treesitter.cpp'}, parsers)
+        self.assertEqual(results['repo']['files'], 6)
+        self.assertEqual(results['metadata']['spec']['commits'], 4)
+
+    def test_main_writes_filtered_results(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            output = os.path.join(tmp, 'bench.json')
+            exit_code = main(['--quick', '--filter', 'parser', '--output', output])
+            with open(output, encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmp)
+
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(data['benchmarks'])
+        self.assertTrue(all(r['group'] == 'parser' for r in data['benchmarks'].values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -322,3 +322,46 @@ class TestCCalculatorLanguageName:
 
         calculator = CCognitiveComplexityCalculator()
         assert calculator.get_language_name() == 'C'
+
+
+class TestCppCalculator:
+    """Test the C++ calculator (C rules on the C++ grammar)."""
+
+    def test_methods_range_for_and_catch(self):
+        """Range-based for and catch add +1 + nesting; methods are named like the cyclomatic functions."""
+        from src.kpis.cognitive_complexity.calculator_c import (
+            CppCognitiveComplexityCalculator
+        )
+
+        code = '''
+template <class T>
+int Box<T>::put(T value) {
+    for (auto item : items) {      // +1
+        try {
+            store(item);
+        } catch (const Error& e) {  // +2 (nesting 1)
+            return -1;
+        }
+    }
+    return 0;
+}
+
+struct Queue {
+    bool empty() const { return size == 0 || closed; }  // +1
+};
+'''
+        calculator = CppCognitiveComplexityCalculator()
+        result = calculator.calculate_for_file(code)
+
+        assert result == {'Box<T>::put': 3, 'empty': 1}
+        assert calculator.get_language_name() == 'C++'
+
+    def test_pointer_returning_c_function_is_named(self):
+        """Functions returning pointers are found at the end of the declarator chain."""
+        from src.kpis.cognitive_complexity.calculator_c import (
+            CCognitiveComplexityCalculator
+        )
+
+        result = CCognitiveComplexityCalculator().calculate_for_file("char *dup(const char *s) { if (!s) return 0; }")
+
+        assert result == {'dup': 1}
@@ -0,0 +1,116 @@
+"""
+Tests for the Python Cognitive Complexity Calculator's single-pass module scoring.
+
+calculate_for_file() scores all functions in one pass, keyed by qualified name,
+with the same score per function as calculate_for_function().
+"""
+import ast
+import inspect
+from textwrap import dedent
+
+from src.kpis.cognitive_complexity import calculator_python
+from src.kpis.cognitive_complexity.calculator_python import PythonCognitiveComplexityCalculator
+
+
+class TestQualifiedNames:
+    """Functions are keyed by qualified name, so same-named functions do not overwrite each other."""
+
+    def test_methods_with_the_same_name_are_kept_apart(self):
+        code = dedent('''
+            class Reader:
+                def run(self, x):
+                    if x:
+                        return 1
+
+            class Writer:
+                def run(self, x):
+                    for item in x:
+                        if item:
+                            return item
+        ''')
+
+        result = PythonCognitiveComplexityCalculator().calculate_for_file(code)
+
+        assert result == {'Reader.run': 1, 'Writer.run': 3}
+
+    def test_nested_functions_use_locals_in_their_name(self):
+        code = dedent('''
+            def outer(x):
+                class Local:
+                    def method(self):
+                        pass
+
+                def inner(y):
+                    if y:
+                        return y
+                return inner
+        ''')
+
+        result = PythonCognitiveComplexityCalculator().calculate_for_file(code)
+
+        assert list(result) == ['outer', 'outer.<locals>.Local.method', 'outer.<locals>.inner']
+
+    def test_async_functions_are_scored(self):
+        code = dedent('''
+            async def fetch(session, urls):
+                for url in urls:
+                    if url and session:
+                        await session.get(url)
+        ''')
+
+        result = PythonCognitiveComplexityCalculator().calculate_for_file(code)
+
+        assert result == {'fetch': 1 + 2 + 1}
+
+
+class TestNestedFunctionScores:
+    """Enclosing functions include the code of their nested functions, as calculate_for_function() does."""
+
+    def test_nested_code_counts_at_the_nesting_of_its_def(self):
+        code = dedent('''
+            def outer(x):
+                if x:
+                    def inner(y):
+                        if y:
+                            return inner(y - 1)
+                        return outer(y)
+                    return inner
+        ''')
+
+        result = PythonCognitiveComplexityCalculator().calculate_for_file(code)
+
+        # inner: if (+1) and a recursive call (+1)
+        assert result['outer.<locals>.inner'] == 2
+        # outer: if (+1), inner's if one level deeper (+2), inner's call back to outer (+1)
+        assert result['outer'] == 4
+
+    def test_code_in_skipped_parts_only_counts_for_its_own_function(self):
+        code = dedent('''
+            def outer(x):
+                try:
+                    def inner(y):
+                        if y:
+                            return y
+                except ValueError:
+                    return None
+        ''')
+
+        result = PythonCognitiveComplexityCalculator().calculate_for_file(code)
+
+        assert result == {'outer': 1, 'outer.<locals>.inner': 1}
+
+    def test_scores_match_calculate_for_function_on_real_code(self):
+        calculator = PythonCognitiveComplexityCalculator()
+        code = inspect.getsource(calculator_python)
+        tree = ast.parse(code)
+        expected = {}
+        for class_node in [tree] + [n for n in tree.body if isinstance(n, ast.ClassDef)]:
+            prefix = f"{class_node.name}." if isinstance(class_node, ast.ClassDef) else ''
+            for node in class_node.body:
+                if isinstance(node, ast.FunctionDef):
+                    expected[prefix + node.name] = calculator.calculate_for_function(node)
+
+        result = calculator.calculate_for_file(code)
+
+        assert expected
+        assert {name: result[name] for name in expected} == expected
@@ -0,0 +1,147 @@
+"""
+Unit tests for the tree-sitter cyclomatic complexity parser.
+Tests function spans, decision points, the regex fallback and the tree shared with the cognitive calculators.
+"""
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.kpis.cognitive_complexity.calculator_java import JavaCognitiveComplexityCalculator
+from src.kpis.complexity.analyzer import ComplexityAnalyzer
+from src.languages import tree_sitter_support
+from src.languages.config import LANGUAGES
+from src.languages.parsers.c import CComplexityParser
+from src.languages.parsers.cpp import CppComplexityParser
+from src.languages.parsers.go import GoComplexityParser
+from src.languages.parsers.java import JavaComplexityParser
+from src.languages.parsers.javascript import JavaScriptComplexityParser
+from src.languages.parsers.tree_sitter_parser import TreeSitterComplexityParser
+
+
+class TestTreeSitterComplexityParser(unittest.TestCase):
+    """Test cases for the tree-sitter complexity parser."""
+
+    def test_keywords_in_strings_and_comments_are_not_counted(self):
+        """Test that only real decision points are counted."""
+        code = """
+        class A {
+            // if this and that || other
+            int get(int x) {
+                String s = "if (a && b) return while";
+                return x > 0 && x < 10 ? 1 : 2;
+            }
+        }
+        """
+        parser = TreeSitterComplexityParser('java', JavaComplexityParser())
+
+        self.assertEqual(parser.analyze_functions(code), [{'name': 'get', 'complexity': 3}])
+        self.assertEqual(parser.compute_complexity(code), 3)
+
+    def test_function_boundaries_and_nested_functions(self):
+        """Test that decision points count for the innermost named function only."""
+        code = """
+        function outer(x) {
+            const inner = (y) => { if (y) { return 1; } };
+            items.forEach(item => { while (item) {} });
+            if (x) {}
+        }
+        class K { method() { for (;;) {} } }
+        if (topLevel) {}
+        """
+        parser = TreeSitterComplexityParser('javascript', JavaScriptComplexityParser())
+
+        self.assertEqual(parser.analyze_functions(code), [
+            {'name': 'outer', 'complexity': 3},  # the anonymous callback's while and outer's if
+            {'name': 'inner', 'complexity': 3},
+            {'name': 'method', 'complexity': 2},
+        ])
+        self.assertEqual(parser.count_functions(code), 3)
+        self.assertEqual(parser.compute_complexity(code), 1 + 6)
+
+    def test_else_if_counts_like_the_regex_parser(self):
+        """Test that 'else if' adds to the 'if', while a plain 'else' does not."""
+        code = (
+            "package m\n"
+            "func F(x int) int { if x > 0 { return 1 } else if x < 0 { return 2 } else { go f() }; return 0 }\n"
+        )
+        parser = TreeSitterComplexityParser('go', GoComplexityParser())
+
+        self.assertEqual(parser.analyze_functions(code), [{'name': 'F', 'complexity': 1 + 7}])
+        self.assertEqual(parser.compute_complexity(code), GoComplexityParser().compute_complexity(code))
+
+    def test_cpp_names_and_logical_operators(self):
+        """Test qualified C++ names, and that && is only counted as an operator."""
+        code = """
+        template <class T> void Box<T>::put(T&& value) { if (a && b) {} }
+        int *find(int x) { return x; }
+        """
+        parser = TreeSitterComplexityParser('cpp', CppComplexityParser())
+
+        self.assertEqual(parser.analyze_functions(code), [
+            {'name': 'Box<T>::put', 'complexity': 3},
+            {'name': 'find', 'complexity': 2},
+        ])
+
+    def test_falls_back_to_regex_parser_without_a_usable_tree(self):
+        """Test that broken code without functions is left to the regex parser."""
+        code = "int f(int x) { if (x) { return 1; }\n#if\n)))"
+        regex = CComplexityParser()
+        parser = TreeSitterComplexityParser('c', regex)
+
+        with patch.object(regex, 'analyze_functions', return_value=[{'name': 'f', 'complexity': 3}]) as fallback:
+            self.assertEqual(parser.analyze_functions(code), [{'name': 'f', 'complexity': 3}])
+        fallback.assert_called_once_with(code)
+
+    def test_unknown_grammar_is_rejected(self):
+        """Test that only grammars with complexity rules are accepted."""
+        with self.assertRaises(LookupError):
+            TreeSitterComplexityParser('python', JavaComplexityParser())
+
+
+class TestComplexityAnalyzerWithTreeSitter(unittest.TestCase):
+    """Test that the ComplexityAnalyzer uses tree-sitter for languages with a grammar."""
+
+    def test_languages_with_a_grammar_use_tree_sitter(self):
+        """Test that the tree-sitter parser is chosen, with the regex parser as fallback."""
+        parser = ComplexityAnalyzer()._load_parser(LANGUAGES['.java'])
+
+        self.assertIsInstance(parser, TreeSitterComplexityParser)
+        self.assertIsInstance(parser.fallback, JavaComplexityParser)
+        self.assertNotIsInstance(ComplexityAnalyzer()._load_parser(LANGUAGES['.py']), TreeSitterComplexityParser)
+
+    def test_parser_is_reused_for_all_calls_on_a_file(self):
+        """Test that one parser per language and thread serves every call, parsing a file once."""
+        analyzer = ComplexityAnalyzer()
+        code = "class A { void run(int x) { if (x > 0) { x--; } } }"
+
+        with patch.object(TreeSitterComplexityParser, '_analyze_tree', autospec=True,
+                          side_effect=TreeSitterComplexityParser._analyze_tree) as analyze_tree:
+            self.assertTrue(analyzer.may_contain_functions(code.encode(), LANGUAGES['.java']))
+            analyzer.analyze_functions(code, LANGUAGES['.java'])
+            self.assertEqual(analyzer.calculate_for_file(code, LANGUAGES['.java']), (2, 1))
+
+        analyze_tree.assert_called_once()
+        parser = analyzer._load_parser(LANGUAGES['.java'])
+        self.assertIs(analyzer._load_parser(dict(LANGUAGES['.java'])), parser)
+        other_thread = []
+        thread = threading.Thread(target=lambda: other_thread.append(analyzer._load_parser(LANGUAGES['.java'])))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other_thread[0], parser)
+
+    def test_cognitive_calculator_reuses_the_tree(self):
+        """Test that cyclomatic and cognitive complexity of a file share one parse."""
+        code = "class A { void run(int x) { if (x > 0) { x--; } } }"
+        real_parser = tree_sitter_support.get_thread_parser('java')
+
+        with patch.object(tree_sitter_support, 'get_thread_parser', return_value=real_parser) as get_parser:
+            functions = ComplexityAnalyzer().analyze_functions(code, LANGUAGES['.java'])
+            cognitive = JavaCognitiveComplexityCalculator().calculate_for_file(code)
+
+        self.assertEqual(functions, [{'name': 'run', 'complexity': 2}])
+        self.assertEqual(cognitive, {'run': 1})
+        get_parser.assert_called_once_with('java')
+
+
+if __name__ == '__main__':
+    unittest.main()
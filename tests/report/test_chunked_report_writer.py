@@ -0,0 +1,165 @@
+"""
+Tests for the chunked HTML report: a shell page plus lazily loaded per-directory data chunks.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.analysis.code_review_advisor import ReviewRecommendation
+from src.config.app_config import AppConfig
+from src.kpis.model import File, RepoInfo, ScanDir
+from src.report.html.chunked_report_writer import ChunkedReportWriter, data_dir_for
+from src.report.html.html_report_format import HTMLReportFormat
+from src.report.report_renderer import ReportRenderer
+from src.report.report_view_model import ReportViewModel
+from src.utilities.cli_helpers import parse_args
+
+
+def make_file(name, path, complexity, cognitive, churn):
+    file_obj = File(name=name, file_path=path)
+    file_obj.kpis = {
+        'complexity': SimpleNamespace(value=complexity),
+        'cognitive_complexity': SimpleNamespace(value=cognitive),
+        'churn': SimpleNamespace(value=churn),
+        'hotspot': SimpleNamespace(value=complexity * churn),
+    }
+    return file_obj
+
+
+def make_repo():
+    """repo/{main.py, gen.py, lib/{util.py, core/big.py}}"""
+    repo = RepoInfo(dir_name='repo', scan_dir_path='.', repo_root_path='/repo', repo_name='repo')
+    lib = ScanDir(dir_name='lib', scan_dir_path='lib', repo_root_path='/repo', repo_name='repo')
+    core = ScanDir(dir_name='core', scan_dir_path='lib/core', repo_root_path='/repo', repo_name='repo')
+    repo.files['main.py'] = make_file('main.py', 'main.py', 20, 30, 20)
+    repo.files['gen.py'] = make_file('gen.py', 'gen.py', 40, 10, 12)
+    lib.files['util.py'] = make_file('util.py', 'lib/util.py', 0, 0, 3)
+    core.files['big.py'] = make_file('big.py', 'lib/core/big.py', 120, 60, 2)
+    repo.scan_dirs['lib'] = lib
+    lib.scan_dirs['core'] = core
+    return repo
+
+
+def read_chunk(data_dir, chunk_id):
+    with open(os.path.join(data_dir, f"{chunk_id}.js"), encoding='utf-8') as f:
+        content = f.read()
+    prefix = f'MetricMancer.chunk("{chunk_id}",'
+    assert content.startswith(prefix) and content.endswith(');\n'), content[:80]
+    return json.loads(content[len(prefix):-3])
+
+
+class TestChunkedReportWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmp, 'report.html')
+        self.data_dir = os.path.join(self.tmp, 'report_data')
+        self.repo = make_repo()
+        self.writer = ChunkedReportWriter(ReportRenderer(), chunk_rows=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_data_dir_is_next_to_the_shell_page(self):
+        self.assertEqual(data_dir_for('out/report.html'), 'out/report_data')
+
+    def test_one_chunk_per_directory_linked_from_its_parent(self):
+        counts = self.writer.write(self.repo, self.output)
+
+        self.assertEqual(counts['directories'], 3)
+        root = read_chunk(self.data_dir, 'd0')
+        self.assertEqual([f['name'] for f in root['files']], ['gen.py', 'main.py'])
+        self.assertEqual(root['files'][1]['kpis'], {'c': 20, 'cog': 30, 'churn': 20, 'hotspot': 400})
+        self.assertEqual([(d['name'], d['chunk']) for d in root['dirs']], [('lib', 'd1')])
+        lib = read_chunk(self.data_dir, 'd1')
+        self.assertEqual([f['name'] for f in lib['files']], ['util.py'])
+        core = read_chunk(self.data_dir, lib['dirs'][0]['chunk'])
+        self.assertEqual(core, {'dirs': [], 'files': [
+            {'name': 'big.py', 'kpis': {'c': 120, 'cog': 60, 'churn': 2, 'hotspot': 240}}]})
+
+    def test_shell_page_holds_overview_but_not_the_tree(self):
+        self.writer.write(self.repo, self.output)
+        with open(self.output, encoding='utf-8') as f:
+            html = f.read()
+
+        self.assertIn('Total Files Analyzed:</strong> 4', html)
+        self.assertIn('"dataDir": "report_data"', html)
+        self.assertNotIn('big.py', html)
+        self.assertNotIn('id="tab-review"', html)
+
+    def test_quick_wins_are_split_into_row_chunks(self):
+        counts = self.writer.write(self.repo, self.output)
+
+        rows = []
+        for index in range(counts['quick_wins']):
+            rows += read_chunk(self.data_dir, f"q{index}")
+        expected = ReportViewModel(self.repo).tracked_quick_wins
+        self.assertEqual([r['file_path'] for r in rows], [w['file_path'] for w in expected])
+        self.assertEqual(counts['quick_wins'], (len(expected) + 1) // 2)
+        self.assertNotIn('file', rows[0])
+
+    def test_review_recommendations_get_chunks_and_a_tab(self):
+        recs = [ReviewRecommendation(f"f{i}.py", 'high', 2, 2, 'peer', ['area'], ['check'], '', 30)
+                for i in range(3)]
+        review_data = {'recommendations': recs, 'total_files': 3, 'total_time_minutes': 90,
+                       'risk_counts': {'critical': 0, 'high': 3, 'medium': 0, 'low': 0},
+                       'branch_filter': False, 'base_branch': None}
+
+        counts = self.writer.write(self.repo, self.output, review_data=review_data)
+
+        self.assertEqual(counts['review'], 2)
+        self.assertEqual(read_chunk(self.data_dir, 'r1')[0]['file_path'], 'f2.py')
+        with open(self.output, encoding='utf-8') as f:
+            html = f.read()
+        self.assertIn('id="tab-review"', html)
+        self.assertIn('1h 30m', html)
+
+    def test_stale_chunks_are_removed_and_other_files_kept(self):
+        os.makedirs(self.data_dir)
+        for name in ('d99.js', 'q7.js', 'notes.txt'):
+            open(os.path.join(self.data_dir, name), 'w').close()
+
+        self.writer.write(self.repo, self.output)
+
+        names = set(os.listdir(self.data_dir))
+        self.assertNotIn('d99.js', names)
+        self.assertNotIn('q7.js', names)
+        self.assertIn('notes.txt', names)
+
+    def test_all_files_of_a_directory_share_its_chunk(self):
+        for index in range(30):
+            self.repo.files[f"m{index:02d}.py"] = make_file(f"m{index:02d}.py", f"m{index:02d}.py", 1, 1, 1)
+
+        self.writer.write(self.repo, self.output)
+
+        self.assertEqual(len(read_chunk(self.data_dir, 'd0')['files']), 32)
+
+
+class TestHTMLChunkedOption(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmp, 'report.html')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_html_format_writes_chunked_report_only_when_requested(self):
+        with patch('builtins.print'):
+            HTMLReportFormat().print_report(make_repo(), print, output_file=self.output)
+        self.assertFalse(os.path.exists(data_dir_for(self.output)))
+
+        with patch('builtins.print'):
+            HTMLReportFormat().print_report(make_repo(), print, output_file=self.output, html_chunked=True)
+        self.assertTrue(os.path.exists(os.path.join(data_dir_for(self.output), 'd0.js')))
+
+    def test_cli_flag_reaches_app_config(self):
+        config = AppConfig.from_cli_args(parse_args().parse_args(['src', '--html-chunked']))
+        self.assertTrue(config.html_chunked)
+        self.assertFalse(AppConfig(directories=['src']).html_chunked)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+"""
+Tests for the OpenSearch bulk exporter, run against a local stand-in for the _bulk API.
+Tests batching by bytes, the kept-alive connection, idempotent document IDs,
+backpressure, and that the documents match the generated index mapping.
+"""
+import importlib.util
+import io
+import json
+import threading
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.base_kpi import BaseKPI
+from src.kpis.model import File, Function, RepoInfo, ScanDir
+from src.report.opensearch.opensearch_exporter import (
+    MIN_BATCH_BYTES, OpenSearchBulkExporter, OpenSearchExportError, to_document
+)
+from src.report.opensearch.opensearch_report_generator import OpenSearchReportGenerator
+from src.report.report_generator_factory import ReportGeneratorFactory
+from src.utilities.cli_helpers import parse_args
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class DummyKPI(BaseKPI):
+    def __init__(self, name, value):
+        super().__init__(name=name, value=value)
+
+    def calculate(self, *args, **kwargs):
+        return self.value
+
+
+class _BulkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        lines = body.decode('utf-8').splitlines()
+        actions = [(json.loads(lines[i])['index']['_id'], json.loads(lines[i + 1])) for i in range(0, len(lines), 2)]
+        server = self.server
+        server.requests.append({'path': self.path, 'headers': dict(self.headers), 'size': len(body),
+                                'ids': [doc_id for doc_id, _ in actions]})
+        server.connections.add(self.client_address)
+        status, headers, statuses = server.responses.pop(0) if server.responses else (200, {}, None)
+        items = []
+        for position, (doc_id, document) in enumerate(actions):
+            item_status = statuses[position] if statuses else 201
+            if item_status < 300 and status == 200:
+                server.documents[doc_id] = document
+            items.append({'index': {'_id': doc_id, 'status': item_status}})
+        payload = json.dumps({'errors': any(item['index']['status'] >= 300 for item in items),
+                              'items': items} if status == 200 else {'error': 'busy'}).encode('utf-8')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInOpenSearch(ThreadingHTTPServer):
+    """Local stand-in for the _bulk API; responses are (status, headers, per-item statuses or None)."""
+
+    daemon_threads = True
+
+    def __init__(self, responses=()):
+        super().__init__(('127.0.0.1', 0), _BulkHandler)
+        self.responses = list(responses)
+        self.requests = []
+        self.connections = set()
+        self.documents = {}
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def _documents(count, prefix='src/module'):
+    return [{'filename': f"{prefix}_{i}.py", 'cyclomatic_complexity': i, 'repo_name': 'repo',
+             'timestamp': '2025-11-14T12:30:00Z'} for i in range(count)]
+
+
+class TestOpenSearchBulkExporter(unittest.TestCase):
+    """Test the _bulk requests the exporter sends."""
+
+    def setUp(self):
+        self.sleeps = []
+
+    def _exporter(self, url, **kwargs):
+        return OpenSearchBulkExporter(url, 'metricmancer-metrics', sleep=self.sleeps.append, **kwargs)
+
+    def test_batches_are_sized_by_bytes_on_one_connection(self):
+        """Test that the documents are split into _bulk bodies under batch_bytes, sent over one connection."""
+        with StandInOpenSearch() as server, self._exporter(server.url, batch_bytes=2000) as exporter:
+            stats = exporter.export(_documents(60))
+
+        self.assertEqual((stats.indexed, stats.failed, stats.retries), (60, 0, 0))
+        self.assertGreater(stats.batches, 3)
+        self.assertEqual(len(server.requests), stats.batches)
+        self.assertTrue(all(request['size'] <= 2000 for request in server.requests))
+        self.assertEqual({request['path'] for request in server.requests}, {'/metricmancer-metrics/_bulk'})
+        self.assertEqual(server.requests[0]['headers']['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(len(server.connections), 1)
+
+    def test_exporting_a_run_again_overwrites_its_documents(self):
+        """Test that document IDs are stable, and items with the same identity are kept apart."""
+        documents = _documents(5) + [
+            {'filename': 'app.js', 'function_name': 'anonymous', 'timestamp': 't1'},
+            {'filename': 'app.js', 'function_name': 'anonymous', 'timestamp': 't1'},
+        ]
+        with StandInOpenSearch() as server:
+            for _ in range(2):
+                with self._exporter(server.url) as exporter:
+                    exporter.export(documents)
+            with self._exporter(server.url) as exporter:
+                exporter.export([dict(document, timestamp='t2') for document in documents])
+
+        self.assertEqual(server.requests[0]['ids'], server.requests[1]['ids'])
+        self.assertEqual(len(server.documents), 2 * len(documents))
+
+    def test_overloaded_cluster_is_retried_with_smaller_batches(self):
+        """Test that a 429 is retried after Retry-After, and later batches are halved."""
+        responses = [(429, {'Retry-After': '0'}, None)]
+        with StandInOpenSearch(responses) as server, self._exporter(server.url, batch_bytes=4 * MIN_BATCH_BYTES) as ex:
+            stats = ex.export(_documents(3))
+
+        self.assertEqual((stats.indexed, stats.retries), (3, 1))
+        self.assertEqual(self.sleeps, [0.0])
+        self.assertEqual(ex.batch_bytes, 2 * MIN_BATCH_BYTES)
+        self.assertEqual(server.requests[0]['ids'], server.requests[1]['ids'])
+
+    def test_only_rejected_documents_are_retried(self):
+        """Test that per-document 429s are resent alone and other per-document errors are counted."""
+        responses = [(200, {}, [201, 429, 400])]
+        with StandInOpenSearch(responses) as server, self._exporter(server.url, backoff=0.25) as exporter:
+            stats = exporter.export(_documents(3))
+
+        self.assertEqual((stats.indexed, stats.failed, stats.retries), (2, 1, 1))
+        self.assertEqual(server.requests[1]['ids'], server.requests[0]['ids'][1:2])
+        self.assertEqual(self.sleeps, [0.25])
+
+    def test_unrecoverable_responses_stop_the_export(self):
+        """Test that a refused request, or an overload outlasting the retries, raises."""
+        with StandInOpenSearch([(401, {}, None)]) as server, self._exporter(server.url) as exporter:
+            with self.assertRaises(OpenSearchExportError):
+                exporter.export(_documents(1))
+        self.assertEqual(self.sleeps, [])
+
+        with StandInOpenSearch([(503, {}, None)] * 3) as server, self._exporter(server.url, max_retries=2) as exporter:
+            with self.assertRaises(OpenSearchExportError):
+                exporter.export(_documents(1))
+        self.assertEqual(self.sleeps, [0.5, 1.0])
+
+    def test_unreachable_server_is_retried_then_reported(self):
+        """Test that connection failures are retried and then raise."""
+        with StandInOpenSearch() as server:
+            url = server.url
+        with self._exporter(url, max_retries=1) as exporter:
+            with self.assertRaises(OpenSearchExportError):
+                exporter.export(_documents(1))
+        self.assertEqual(self.sleeps, [0.5])
+
+    def test_credentials_in_the_url_are_sent_as_basic_auth(self):
+        """Test that user:password@ becomes an Authorization header."""
+        with StandInOpenSearch() as server:
+            url = server.url.replace('http://', 'http://admin:s%40cret@')
+            with self._exporter(url) as exporter:
+                exporter.export(_documents(1))
+
+        self.assertEqual(server.requests[0]['headers']['Authorization'], 'Basic YWRtaW46c0BjcmV0')
+
+
+class TestOpenSearchReportGenerator(unittest.TestCase):
+    """Test the 'opensearch' output format end to end."""
+
+    def setUp(self):
+        file_kpis = {
+            'complexity': DummyKPI('complexity', 10),
+            'cognitive_complexity': DummyKPI('cognitive_complexity', 4),
+            'churn': DummyKPI('churn', 5),
+            'hotspot': DummyKPI('hotspot', 50),
+            'Code Ownership': DummyKPI('Code Ownership', {'Alice': 80.0, 'Bob': 20.0}),
+            'Shared Ownership': DummyKPI('Shared Ownership', {'num_significant_authors': 2, 'authors': ['Alice', 'Bob'],
+                                                              'threshold': 20.0}),
+        }
+        function = Function(name='run', kpis={'complexity': DummyKPI('complexity', 3)})
+        sub_dir = ScanDir(dir_name='app', scan_dir_path='app', repo_root_path='/repo', repo_name='repo',
+                          files={'main.py': File(name='main.py', file_path='app/main.py', kpis=file_kpis,
+                                                 functions=[function])})
+        self.repo_info = RepoInfo(dir_name='repo', scan_dir_path='.', repo_root_path='/repo', repo_name='repo',
+                                  timestamp='2025-11-14T12:30:00+00:00', scan_dirs={'app': sub_dir})
+
+    def test_documents_follow_the_generated_mapping(self):
+        """Test that package, file and function documents only use mapped fields, with mapped types."""
+        spec = importlib.util.spec_from_file_location(
+            'generate_opensearch_mapping', REPO_ROOT / 'scripts' / 'generate_opensearch_mapping.py')
+        script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(script)
+        schema = json.loads((REPO_ROOT / 'schemas' / 'metricmancer-v1.schema.json').read_text(encoding='utf-8'))
+        properties = script.generate_mapping_from_schema(schema)['mappings']['properties']
+
+        documents = OpenSearchReportGenerator(self.repo_info).collect_documents()
+
+        self.assertEqual([('package' in d, 'function_name' in d) for d in documents],
+                         [(True, False), (True, False), (False, False), (False, True)])
+        for document in documents:
+            self.assertLessEqual(set(document), set(properties))
+            self.assertEqual((document['repo_name'], document['timestamp']), ('repo', '2025-11-14T12:30:00+00:00'))
+            for name, value in document.items():
+                if properties[name]['type'] == 'integer':
+                    self.assertTrue(value is None or isinstance(value, int), f"{name}={value!r}")
+        self.assertEqual(documents[2]['shared_ownership'], 2)
+        self.assertIsNone(to_document({'filename': 'x', 'shared_ownership': {'shared_ownership': 'N/A'}})[
+            'shared_ownership'])
+
+    def test_generate_exports_to_the_configured_index(self):
+        """Test that the factory's generator exports with the CLI settings."""
+        args = parse_args().parse_args(['src', '--output-formats', 'opensearch', '--opensearch-index', 'quality',
+                                        '--opensearch-batch-mb', '0.5'])
+        config = AppConfig.from_cli_args(args)
+        generator_cls = ReportGeneratorFactory.create('opensearch')
+        output = io.StringIO()
+
+        with StandInOpenSearch() as server, redirect_stdout(output):
+            generator_cls(self.repo_info).generate(opensearch_url=server.url, opensearch_index=config.opensearch_index,
+                                                   opensearch_batch_mb=config.opensearch_batch_mb)
+
+        self.assertEqual(config.opensearch_batch_mb, 0.5)
+        self.assertEqual(server.requests[0]['path'], '/quality/_bulk')
+        self.assertEqual(len(server.documents), 4)
+        self.assertIn("[OK] 4 documents exported to OpenSearch index 'quality'", output.getvalue())
+
+    def test_invalid_url_is_reported_as_a_warning(self):
+        """Test that a URL the exporter cannot use does not abort the run."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            OpenSearchReportGenerator(self.repo_info).generate(opensearch_url='http://')
+
+        self.assertIn("[WARN] OpenSearch export failed: Invalid OpenSearch URL 'http://'", output.getvalue())
+
+    def test_invalid_settings_are_rejected(self):
+        """Test validation of the OpenSearch settings."""
+        for settings in ({'opensearch_url': 'localhost:9200'}, {'opensearch_url': 'http://'},
+                         {'opensearch_url': 'http://localhost:port'}, {'opensearch_index': 'Metrics'},
+                         {'opensearch_batch_mb': 0}):
+            with self.subTest(settings=settings), self.assertRaises(ValueError):
+                ConfigValidator(AppConfig(directories=['src'], output_formats=['opensearch'], **settings)).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
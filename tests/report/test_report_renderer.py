@@ -72,6 +72,20 @@ class TestReportRenderer(unittest.TestCase):
         self.assertIn("problem_files", kwargs)
         self.assertEqual(kwargs["problem_files"], [file2])
         self.assertEqual(html, "<html>report</html>")
+        self.assertEqual(kwargs["stats"].total_files, 2)
+        self.assertEqual(kwargs["tree_items"](root), [file1, file2])
+
+    def test_bytecode_cache_uses_configured_dir_or_can_be_disabled(self):
+        from jinja2 import FileSystemBytecodeCache
+        from src.report.report_renderer import _bytecode_cache
+        with patch("src.report.report_renderer.Defaults") as MockDefaults:
+            MockDefaults.TEMPLATE_BYTECODE_CACHE = True
+            MockDefaults.TEMPLATE_CACHE_DIR = "/tmp"
+            cache = _bytecode_cache()
+            self.assertIsInstance(cache, FileSystemBytecodeCache)
+            self.assertEqual(cache.directory, "/tmp")
+            MockDefaults.TEMPLATE_BYTECODE_CACHE = False
+            self.assertIsNone(_bytecode_cache())
 
 
 if __name__ == "__main__":
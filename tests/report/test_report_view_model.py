@@ -0,0 +1,155 @@
+"""
+Tests for ReportViewModel - report data computed once per repository and shared by all formats.
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+from src.app.coordination.report_coordinator import ReportCoordinator
+from src.kpis.model import File, RepoInfo, ScanDir
+from src.report.cli.cli_quick_wins_format import CLIQuickWinsFormat
+from src.report.cli.cli_report_format import CLIReportFormat
+from src.report.cli.cli_summary_format import CLISummaryFormat
+from src.report.json.json_report_format import JSONReportFormat
+from src.report.report_renderer import collect_all_files
+from src.report.report_view_model import DirectoryStats, ReportViewModel
+
+
+def make_file(name, path, complexity, cognitive, churn, ownership=None):
+    file_obj = File(name=name, file_path=path)
+    file_obj.kpis = {
+        'complexity': SimpleNamespace(value=complexity),
+        'cognitive_complexity': SimpleNamespace(value=cognitive),
+        'churn': SimpleNamespace(value=churn),
+        'hotspot': SimpleNamespace(value=complexity * churn),
+    }
+    if ownership is not None:
+        file_obj.kpis['Code Ownership'] = SimpleNamespace(value=ownership)
+    return file_obj
+
+
+def make_repo():
+    """
+    repo/
+        main.py        owned, hotspot 400
+        gen.py         untracked (ownership N/A), hotspot 480
+        lib/
+            util.py    no ownership data, no complexity
+            core/
+                big.py owned, complexity 120
+    """
+    repo = RepoInfo(dir_name='repo', scan_dir_path='.', repo_root_path='/repo', repo_name='repo')
+    lib = ScanDir(dir_name='lib', scan_dir_path='lib', repo_root_path='/repo', repo_name='repo')
+    core = ScanDir(dir_name='core', scan_dir_path='lib/core', repo_root_path='/repo', repo_name='repo')
+    repo.files['main.py'] = make_file('main.py', 'main.py', 20, 30, 20, {'alice': 100.0})
+    repo.files['gen.py'] = make_file('gen.py', 'gen.py', 40, 10, 12, {'ownership': 'N/A'})
+    lib.files['util.py'] = make_file('util.py', 'lib/util.py', 0, 0, 3)
+    core.files['big.py'] = make_file('big.py', 'lib/core/big.py', 120, 60, 2, {'alice': 50.0, 'bob': 50.0})
+    repo.scan_dirs['lib'] = lib
+    lib.scan_dirs['core'] = core
+    return repo
+
+
+class TestReportViewModel(unittest.TestCase):
+    def setUp(self):
+        self.repo = make_repo()
+        self.view_model = ReportViewModel(self.repo)
+
+    def paths(self, files):
+        return [f.file_path for f in files]
+
+    def test_file_lists_match_the_formats_own_collection(self):
+        self.assertEqual(self.paths(self.view_model.files), ['main.py', 'gen.py', 'lib/util.py', 'lib/core/big.py'])
+        self.assertEqual(self.view_model.tracked_files, collect_all_files(self.repo))
+        self.assertEqual(self.view_model.owned_files, CLISummaryFormat()._collect_tracked_files(self.repo))
+        self.assertEqual(self.view_model.files_with_metrics,
+                         CLIQuickWinsFormat()._collect_files_with_metrics(self.repo))
+
+    def test_directory_stats_cover_subtrees(self):
+        stats = self.view_model.stats
+        self.assertEqual((stats.total_files, stats.owned_files), (4, 2))
+        self.assertEqual(stats.avg_complexity, 45.0)
+        self.assertEqual((stats.high_complexity_files, stats.high_cognitive_files, stats.hotspot_files), (3, 2, 3))
+        self.assertEqual(self.view_model.stats_for(self.repo.scan_dirs['lib']).total_files, 2)
+        core = self.view_model.stats_for(self.repo.scan_dirs['lib'].scan_dirs['core'])
+        self.assertEqual((core.total_files, core.owned_files, core.total_churn), (1, 1, 2))
+        unknown = ScanDir(dir_name='x', scan_dir_path='x', repo_root_path='/repo', repo_name='repo')
+        self.assertEqual(self.view_model.stats_for(unknown), DirectoryStats())
+
+    def test_directory_stats_percentages(self):
+        stats = self.view_model.stats
+        self.assertEqual(stats.high_complexity_percent, 75.0)
+        self.assertEqual(stats.high_cognitive_percent, 50.0)
+        self.assertEqual(stats.hotspot_percent, 75.0)
+        self.assertEqual(DirectoryStats().hotspot_percent, 0.0)
+
+    def test_tree_items_lists_directories_then_files_ignoring_case(self):
+        self.repo.files['Zeta.py'] = make_file('Zeta.py', 'Zeta.py', 1, 1, 1)
+        self.repo.scan_dirs['Alpha'] = ScanDir(dir_name='Alpha', scan_dir_path='Alpha', repo_root_path='/repo',
+                                               repo_name='repo')
+        names = [getattr(item, 'dir_name', None) or item.name for item in ReportViewModel.tree_items(self.repo)]
+        self.assertEqual(names, ['Alpha', 'lib', 'gen.py', 'main.py', 'Zeta.py'])
+
+    def test_derived_data_matches_format_logic_and_is_cached(self):
+        expected = CLIQuickWinsFormat()._calculate_quick_wins(self.view_model.files_with_metrics)
+        self.assertEqual(self.view_model.quick_wins, expected)
+        self.assertIs(self.view_model.quick_wins, self.view_model.quick_wins)
+        self.assertNotIn('gen.py', [w['file_path'] for w in self.view_model.tracked_quick_wins])
+        self.assertIn('gen.py', [w['file_path'] for w in self.view_model.quick_wins])
+
+        categories = self.view_model.categories(extreme_threshold=100)
+        self.assertEqual([entry[0].file_path for entry in categories['extreme']], ['lib/core/big.py'])
+        self.assertEqual([entry[0].file_path for entry in categories['critical']], ['main.py'])
+        self.assertIs(categories, self.view_model.categories(100))
+        self.assertEqual(self.view_model.categories(200)['extreme'], [])
+
+        self.assertEqual(self.paths(self.view_model.top_hotspots), ['main.py', 'lib/core/big.py'])
+        self.assertEqual(self.view_model.file_grades, {'main.py': 'C', 'lib/util.py': 'A', 'lib/core/big.py': 'F'})
+
+    def test_tree_is_walked_lazily_once(self):
+        repo = Mock()
+        ReportViewModel(repo)
+        repo.files.values.assert_not_called()
+        self.assertIs(self.view_model.files, self.view_model.files)
+
+
+class TestFormatsConsumeViewModel(unittest.TestCase):
+    """Output with a shared view model is identical to each format's own computation."""
+
+    def setUp(self):
+        self.repo = make_repo()
+        self.view_model = ReportViewModel(self.repo)
+
+    def render(self, format_strategy, **kwargs):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            format_strategy.print_report(self.repo, MagicMock(), extreme_complexity_threshold=100, **kwargs)
+        return out.getvalue()
+
+    def test_cli_formats(self):
+        for format_cls in (CLISummaryFormat, CLIQuickWinsFormat, CLIReportFormat):
+            with self.subTest(format=format_cls.__name__):
+                self.assertEqual(self.render(format_cls(), view_model=self.view_model), self.render(format_cls()))
+
+    def test_json_format(self):
+        json_format = JSONReportFormat()
+        self.assertEqual(json_format.get_report_data(self.repo, view_model=self.view_model),
+                         json_format.get_report_data(self.repo))
+
+    def test_coordinator_builds_one_view_model_per_repo(self):
+        app_config = MagicMock(output_file='report.html', report_folder='out', using_output_formats_flag=True,
+                               threshold_low=10.0, threshold_high=20.0)
+        generator_cls = MagicMock()
+        coordinator = ReportCoordinator(app_config, generator_cls)
+        for output_format in ('summary', 'tree', 'json'):
+            coordinator.generate_reports_for_format(output_format, [self.repo], [], is_multi_format=True)
+
+        view_models = {id(c.kwargs['view_model']) for c in generator_cls.return_value.generate.call_args_list}
+        self.assertEqual(len(view_models), 1)
+        self.assertIs(coordinator.get_view_model(self.repo).repo_info, self.repo)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Import-time benchmark for the CLI entry point.
+
+MetricMancer runs from pre-commit hooks, so startup latency matters. These
+tests import src.main in a fresh interpreter with ``python -X importtime``
+and check that:
+- heavy third-party modules (Jinja2, unidiff, PyYAML, tree-sitter, tqdm)
+  are not loaded until a report format or language needs them
+- the cumulative import time of src.main stays under a budget
+
+The budget can be overridden with METRICMANCER_IMPORT_BUDGET_MS on slow CI machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = float(os.environ.get('METRICMANCER_IMPORT_BUDGET_MS', 400))
+
+HEAVY_MODULES = ('jinja2', 'unidiff', 'yaml', 'tree_sitter', 'tree_sitter_language_pack', 'tqdm')
+
+
+def _importtime(code):
+    """
+    Run code with -X importtime in a fresh interpreter.
+
+    Returns:
+        dict: module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        try:
+            timings[name.strip()] = int(cumulative.strip())
+        except ValueError:
+            continue  # header line
+    return timings
+
+
+def _loaded_modules(code):
+    """Run code in a fresh interpreter and return the set of modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, '-c', f'{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def _heavy(modules):
+    return sorted({name.split('.')[0] for name in modules} & set(HEAVY_MODULES))
+
+
+class TestCliImportTime:
+    """Startup cost of the CLI entry point."""
+
+    def test_main_does_not_import_heavy_modules(self):
+        loaded = _heavy(_loaded_modules('import src.main'))
+        assert loaded == [], f"src.main eagerly imports {loaded}"
+
+    def test_main_import_time_within_budget(self):
+        # Best of three runs: the first one may still be compiling .pyc files
+        cumulative_ms = min(_importtime('import src.main')['src.main'] for _ in range(3)) / 1000
+
+        assert cumulative_ms <= IMPORT_BUDGET_MS, (
+            f"import src.main took {cumulative_ms:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms); "
+            f"run 'python -X importtime -c \"import src.main\"' to find the slow import"
+        )
+
+    @pytest.mark.parametrize('module, heavy', [
+        ('src.report.report_generator', 'jinja2'),
+        ('src.app.coordination.delta_review_coordinator', 'unidiff'),
+        ('src.kpis.cognitive_complexity.calculator_factory', 'tree_sitter'),
+    ])
+    def test_heavy_dependency_loaded_on_first_use_only(self, module, heavy):
+        assert heavy not in _loaded_modules(f'import {module}')
+
+    def test_python_calculator_does_not_load_tree_sitter(self):
+        loaded = _loaded_modules(
+            'from src.kpis.cognitive_complexity.calculator_factory import CognitiveComplexityCalculatorFactory\n'
+            'CognitiveComplexityCalculatorFactory.create("a.py")'
+        )
+        assert 'src.kpis.cognitive_complexity.calculator_python' in loaded
+        assert 'tree_sitter' not in loaded
+
+    def test_java_calculator_loads_tree_sitter(self):
+        loaded = _loaded_modules(
+            'from src.kpis.cognitive_complexity.calculator_factory import CognitiveComplexityCalculatorFactory\n'
+            'CognitiveComplexityCalculatorFactory.create("A.java")'
+        )
+        assert 'tree_sitter' in loaded
+
+    def test_report_factory_loads_selected_format_only(self):
+        loaded = _loaded_modules(
+            'from src.report.report_generator_factory import ReportGeneratorFactory\n'
+            'ReportGeneratorFactory.create("summary")'
+        )
+        assert 'src.report.cli.cli_report_generator' in loaded
+        assert 'src.report.json.json_report_generator' not in loaded
+        assert 'jinja2' not in loaded
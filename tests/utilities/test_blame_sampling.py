@@ -0,0 +1,168 @@
+"""
+Tests for approximate ownership of very large files from sampled blame ranges.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.codeownership import CodeOwnershipKPI
+from src.kpis.sharedcodeownership.shared_code_ownership import SharedOwnershipKPI
+from src.utilities.blame_sampling import (
+    blame_range_args, count_lines, estimate_ownership, stratified_ranges, uncertain_authors
+)
+from src.utilities.cli_helpers import parse_args
+from src.utilities.git_cache import GitDataCache, get_git_cache
+
+SHA = 'a' * 40
+
+
+def _porcelain(lines):
+    """Build --line-porcelain output from (final_line, author) pairs."""
+    return ''.join(f"{SHA} {n} {n}\nauthor {author}\nauthor-mail <x>\n\tcode\n" for n, author in lines)
+
+
+class TestStratifiedRanges(unittest.TestCase):
+    def test_one_range_per_stratum(self):
+        ranges = stratified_ranges(10000, strata=10, range_lines=50, seed='big.py')
+
+        self.assertEqual(len(ranges), 10)
+        for h, (start, end) in enumerate(ranges):
+            self.assertEqual(end - start + 1, 50)
+            self.assertGreaterEqual(start, h * 1000 + 1)
+            self.assertLessEqual(end, (h + 1) * 1000)
+
+    def test_same_seed_gives_same_ranges(self):
+        self.assertEqual(stratified_ranges(5000, 5, 20, 'a.py'), stratified_ranges(5000, 5, 20, 'a.py'))
+        self.assertNotEqual(stratified_ranges(5000, 5, 20, 'a.py'), stratified_ranges(5000, 5, 20, 'b.py'))
+
+    def test_small_strata_are_blamed_whole(self):
+        self.assertEqual(stratified_ranges(6, strata=3, range_lines=50), [(1, 2), (3, 4), (5, 6)])
+
+    def test_blame_args(self):
+        self.assertEqual(blame_range_args('f.py', [(1, 5), (10, 12)]),
+                         ['blame', '--line-porcelain', '-L', '1,5', '-L', '10,12', '--', 'f.py'])
+
+
+class TestEstimateOwnership(unittest.TestCase):
+    def test_estimate_and_bounds(self):
+        ranges = [(1, 10), (101, 110), (201, 210), (301, 310)]
+        # Alice owns the first two strata, Bob the last two
+        blamed = [(n, 'Alice' if n < 200 else 'Bob') for start, end in ranges for n in range(start, end + 1)]
+        estimate = estimate_ownership(_porcelain(blamed), ranges, total_lines=400)
+
+        self.assertEqual(estimate.ownership, {'Alice': 50.0, 'Bob': 50.0})
+        self.assertEqual(estimate.sampled_lines, 40)
+        low, high = estimate.bounds['Alice']
+        self.assertLess(low, 50.0)
+        self.assertGreater(high, 50.0)
+        self.assertTrue(estimate.to_calculation_values()['approximate'])
+
+    def test_single_author_has_tight_bounds(self):
+        ranges = [(1, 10), (11, 20)]
+        estimate = estimate_ownership(_porcelain([(n, 'Alice') for n in range(1, 21)]), ranges, total_lines=1000)
+
+        self.assertEqual(estimate.ownership, {'Alice': 100.0})
+        self.assertEqual(estimate.bounds['Alice'], (100.0, 100.0))
+
+    def test_empty_output(self):
+        self.assertEqual(estimate_ownership('', [(1, 10)], 100).ownership, {})
+
+    def test_uncertain_authors(self):
+        bounds = {'Alice': [60.0, 80.0], 'Bob': [12.0, 28.0], 'Carol': [1.0, 5.0]}
+        self.assertEqual(uncertain_authors(bounds, threshold=20.0), ['Bob'])
+
+    def test_count_lines(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'f.txt')
+            for content, expected in ((b'', 0), (b'a\nb\n', 2), (b'a\nb', 2)):
+                with open(path, 'wb') as f:
+                    f.write(content)
+                self.assertEqual(count_lines(path), expected)
+        finally:
+            shutil.rmtree(tmp)
+
+
+class TestSampledOwnershipInRepo(unittest.TestCase):
+    """A 3000-line file: lines 1-1500 by Alice, 1501-3000 by Bob."""
+
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        self.path = os.path.join(self.repo, 'big.py')
+        self._git('init', '-q')
+        self._commit('Alice', [f"a = {i}\n" for i in range(1500)])
+        self._commit('Bob', [f"a = {i}\n" for i in range(1500)] + [f"b = {i}\n" for i in range(1500)])
+
+    def tearDown(self):
+        get_git_cache().clear_cache()
+        get_git_cache().set_ownership_sampling(20000)
+        shutil.rmtree(self.repo)
+
+    def _git(self, *args, author='t'):
+        subprocess.run(['git', '-C', self.repo, '-c', f'user.name={author}', '-c', 'user.email=t@t'] + list(args),
+                       check=True, capture_output=True)
+
+    def _commit(self, author, lines):
+        with open(self.path, 'w') as f:
+            f.writelines(lines)
+        self._git('add', 'big.py')
+        self._git('commit', '-q', '-m', author, author=author)
+
+    def test_large_file_is_sampled(self):
+        cache = GitDataCache()
+        cache.set_ownership_sampling(1000)
+        ownership = cache.get_ownership_data(self.repo, 'big.py')
+        estimate = cache.get_ownership_estimate(self.repo, 'big.py')
+
+        self.assertIsNotNone(estimate)
+        self.assertEqual(estimate.total_lines, 3000)
+        self.assertLess(estimate.sampled_lines, 3000)
+        self.assertEqual(set(ownership), {'Alice', 'Bob'})
+        for author in ('Alice', 'Bob'):
+            low, high = estimate.bounds[author]
+            self.assertLessEqual(low, 50.0)
+            self.assertGreaterEqual(high, 50.0)
+
+    def test_small_file_gets_full_blame(self):
+        cache = GitDataCache()
+        ownership = cache.get_ownership_data(self.repo, 'big.py')
+
+        self.assertIsNone(cache.get_ownership_estimate(self.repo, 'big.py'))
+        self.assertEqual(ownership, {'Alice': 50.0, 'Bob': 50.0})
+
+    def test_prebuild_uses_sampling(self):
+        cache = GitDataCache()
+        cache.set_ownership_sampling(1000)
+        cache.prebuild_cache_for_files(self.repo, ['big.py'])
+
+        self.assertIsNotNone(cache.get_ownership_estimate(self.repo, 'big.py'))
+        self.assertNotIn('big.py', cache.blame_cache.get(self.repo, {}))
+
+    def test_kpis_flag_estimates(self):
+        get_git_cache().set_ownership_sampling(1000)
+        ownership_kpi = CodeOwnershipKPI(self.path, self.repo)
+        shared_kpi = SharedOwnershipKPI(self.path, self.repo, threshold=20.0)
+
+        self.assertTrue(ownership_kpi.calculation_values['approximate'])
+        self.assertIn('Alice', ownership_kpi.calculation_values['bounds'])
+        self.assertEqual(shared_kpi.value['num_significant_authors'], 2)
+        self.assertTrue(shared_kpi.calculation_values['approximate'])
+        self.assertEqual(shared_kpi.calculation_values['uncertain_authors'], [])
+
+
+class TestOwnershipSamplingConfig(unittest.TestCase):
+    def test_cli_flag_reaches_app_config(self):
+        config = AppConfig.from_cli_args(parse_args().parse_args(['src', '--ownership-sample-lines', '5000']))
+        self.assertEqual(config.ownership_sample_lines, 5000)
+
+    def test_must_be_non_negative(self):
+        with self.assertRaises(ValueError):
+            ConfigValidator(AppConfig(directories=['src'], ownership_sample_lines=-1)).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
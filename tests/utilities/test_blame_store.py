@@ -0,0 +1,158 @@
+"""
+Tests for the memory-bounded blame store used by GitDataCache.
+"""
+import os
+import unittest
+from unittest.mock import patch
+
+from src.utilities.blame_store import BlameStore
+from src.utilities.git_cache import GitDataCache
+
+
+class TestBlameStore(unittest.TestCase):
+    """Test LRU eviction and spill-to-disk of blame output."""
+
+    def setUp(self):
+        self.store = BlameStore(memory_budget_bytes=25)
+
+    def tearDown(self):
+        self.store.clear()
+
+    def test_entries_within_budget_stay_in_memory(self):
+        self.store.put("/repo", "a.py", "x" * 10)
+        self.store.put("/repo", "b.py", "y" * 10)
+
+        self.assertEqual(self.store.bytes_in_memory, 20)
+        self.assertEqual(self.store.evictions, 0)
+
+    def test_lru_entry_spills_and_is_reread(self):
+        self.store.put("/repo", "a.py", "a" * 10)
+        self.store.put("/repo", "b.py", "b" * 10)
+        self.store.get("/repo", "a.py")  # a.py is now most recently used
+        self.store.put("/repo", "c.py", "c" * 10)
+
+        stats = self.store.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["blame_entries_spilled"], 1)
+        self.assertGreater(stats["blame_bytes_on_disk"], 0)
+        self.assertTrue(self.store.contains("/repo", "b.py"))
+
+        self.assertEqual(self.store.get("/repo", "b.py"), "b" * 10)
+        self.assertEqual(self.store.disk_reads, 1)
+        self.assertLessEqual(self.store.bytes_in_memory, 25)
+
+    def test_least_recently_used_repo_is_evicted_first(self):
+        self.store.put("/old", "a.py", "a" * 10)
+        self.store.put("/new", "b.py", "b" * 10)
+        self.store.put("/new", "c.py", "c" * 10)
+
+        self.assertEqual(self.store.keys("/new"), ["b.py", "c.py"])
+        self.assertEqual(self.store.stats()["blame_entries_spilled"], 1)
+        self.assertEqual(self.store.get("/old", "a.py"), "a" * 10)
+
+    def test_oversized_entry_is_kept(self):
+        self.store.put("/repo", "big.py", "z" * 100)
+        self.assertEqual(self.store.get("/repo", "big.py"), "z" * 100)
+        self.assertEqual(self.store.disk_reads, 0)
+
+    def test_clear_removes_spill_files(self):
+        self.store.put("/repo", "a.py", "a" * 20)
+        self.store.put("/repo", "b.py", "b" * 20)
+        spilled_paths = [path for path, _ in self.store._spilled.values()]
+        self.assertTrue(all(os.path.exists(p) for p in spilled_paths))
+
+        self.store.clear("/repo")
+
+        self.assertFalse(any(os.path.exists(p) for p in spilled_paths))
+        self.assertEqual(self.store.entry_count(), 0)
+        self.assertEqual(self.store.bytes_on_disk, 0)
+
+    def test_clearing_one_repo_keeps_the_others(self):
+        store = BlameStore(memory_budget_bytes=10)
+        for repo in ("/one", "/two"):
+            for name in ("a.py", "b.py", "c.py"):
+                store.put(repo, name, name * 2)
+
+        self.assertEqual(sorted(store.keys("/one")), ["a.py", "b.py", "c.py"])
+        self.assertEqual(store.repo_entry_count("/one"), 3)
+
+        store.clear("/one")
+
+        self.assertEqual(store.repo_entry_count("/one"), 0)
+        self.assertEqual(store.bytes_in_memory, sum(len(v) for v in store._memory.get("/two", {}).values()))
+        self.assertEqual(sorted(store.keys("/two")), ["a.py", "b.py", "c.py"])
+        store.clear()
+
+    def test_budget_counts_utf8_bytes(self):
+        self.store.put("/repo", "a.py", "author Åsa Öberg")
+
+        self.assertEqual(self.store.bytes_in_memory, len("author Åsa Öberg".encode('utf-8')))
+
+    def test_unbounded_store_never_evicts(self):
+        store = BlameStore(memory_budget_bytes=0)
+        for i in range(10):
+            store.put("/repo", f"{i}.py", "x" * 100)
+        self.assertEqual(store.evictions, 0)
+
+    def test_view_behaves_like_dict(self):
+        view = self.store.view("/repo")
+        view["a.py"] = "blame"
+        view["b.py"] = None
+
+        self.assertIn("a.py", view)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view, {"a.py": "blame", "b.py": None})
+        del view["a.py"]
+        self.assertNotIn("a.py", view)
+        with self.assertRaises(KeyError):
+            view["missing.py"]
+
+
+class TestGitDataCacheMemoryBudget(unittest.TestCase):
+    """Test GitDataCache integration of the blame store."""
+
+    def setUp(self):
+        self.cache = GitDataCache(memory_budget_bytes=30)
+        self.repo = os.path.abspath("/test/repo")
+
+    def tearDown(self):
+        self.cache.clear_cache()
+
+    @patch.object(GitDataCache, 'is_file_tracked', return_value=True)
+    @patch('os.path.exists', return_value=True)
+    def test_evicted_blame_is_served_from_disk(self, mock_exists, mock_tracked):
+        outputs = {f"{name}.py": f"author {name}\n" * 2 for name in ("Alice", "Bob", "Carol")}
+
+        with patch('src.utilities.git_cache.run_git_command', side_effect=lambda root, args: outputs[args[-1]]):
+            for file_path in outputs:
+                self.cache.get_git_blame(self.repo, file_path)
+
+        with patch('src.utilities.git_cache.run_git_command') as mock_run:
+            self.assertEqual(self.cache.get_git_blame(self.repo, "Alice.py"), outputs["Alice.py"])
+            mock_run.assert_not_called()
+
+        stats = self.cache.get_cache_stats(include_memory=True)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(stats["disk_reads"], 1)
+        self.assertEqual(stats["total_blame_entries"], 3)
+        self.assertLessEqual(stats["blame_bytes_in_memory"], 30)
+
+    def test_cache_stats_report_hit_rate(self):
+        self.cache.churn_cache[self.repo] = {"a.py": 3}
+        self.cache.get_churn_data(self.repo, "a.py")
+        self.cache._log_cache_access("b.py", hit=False, cache_type="ownership")
+
+        stats = self.cache.get_cache_stats(include_memory=True)
+
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["hit_rate_by_type"], {"churn": 1.0, "ownership": 0.0})
+        self.assertIn("bytes_held", stats)
+
+    def test_default_stats_unchanged(self):
+        self.assertNotIn("bytes_held", self.cache.get_cache_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for the per-run BranchDiffService shared by the review reports and the delta review.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.analysis.delta.delta_analyzer import DeltaAnalyzer
+from src.utilities import branch_diff
+from src.utilities.branch_diff import BranchDiffService, start_branch_diff_service, stop_branch_diff_service
+from src.utilities.git_helpers import check_git_output, get_changed_files_in_branch, get_current_branch
+
+
+def git(repo, *args):
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+class TestBranchDiffService(unittest.TestCase):
+    """main: a.py, b.py; feature: edits a.py, adds c.py; main then edits b.py."""
+
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        git(self.repo, 'init', '-q', '-b', 'main')
+        git(self.repo, 'config', 'user.email', 'test@example.com')
+        git(self.repo, 'config', 'user.name', 'Test User')
+        self.write('a.py', "def a():\n    return 1\n")
+        self.write('b.py', "def b():\n    return 2\n")
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-qm', 'initial')
+        git(self.repo, 'checkout', '-qb', 'feature')
+        self.write('a.py', "def a():\n    if True:\n        return 1\n    return 0\n")
+        self.write('c.py', "def c():\n    pass\n")
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-qm', 'feature')
+        git(self.repo, 'checkout', '-q', 'main')
+        self.write('b.py', "def b():\n    return 3\n")
+        git(self.repo, 'commit', '-qam', 'main moves on')
+        git(self.repo, 'checkout', '-q', 'feature')
+        self.git_calls = patch.object(branch_diff, 'check_git_output', wraps=check_git_output)
+
+    def tearDown(self):
+        stop_branch_diff_service()
+        shutil.rmtree(self.repo)
+
+    def write(self, name, content):
+        with open(os.path.join(self.repo, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def test_changed_files_match_three_dot_diff(self):
+        expected = git(self.repo, 'diff', '--name-only', 'main...HEAD').split()
+
+        changed = BranchDiffService().changed_files(self.repo, 'main')
+
+        self.assertEqual(changed, [os.path.join(self.repo, name) for name in expected])
+        self.assertEqual(expected, ['a.py', 'c.py'])
+
+    def test_diff_is_fetched_once_and_shared_by_all_consumers(self):
+        start_branch_diff_service()
+        with self.git_calls as calls:
+            self.assertEqual(get_current_branch(self.repo), 'feature')
+            changed = get_changed_files_in_branch(self.repo, 'main')
+            self.assertEqual(get_changed_files_in_branch(os.path.join(self.repo, '.'), 'main'), changed)
+            delta = DeltaAnalyzer(self.repo).analyze_branch_delta('main')
+            DeltaAnalyzer(self.repo).analyze_branch_delta('main')
+
+        self.assertEqual([f.function_name for f in delta.modified_functions], ['a'])
+        self.assertEqual([f.function_name for f in delta.added_functions], ['c'])
+        commands = [call.args[1] for call in calls.call_args_list]
+        self.assertEqual(commands.count(['rev-parse', '--abbrev-ref', 'HEAD']), 1)
+        self.assertEqual([args[0] for args in commands].count('merge-base'), 1)
+        self.assertEqual([args[0] for args in commands].count('diff'), 2)  # --name-only and the full diff
+
+    def test_only_parsed_hunks_are_memoized(self):
+        service = BranchDiffService()
+
+        changes = service.file_changes(self.repo, 'main', 'HEAD')
+
+        self.assertEqual(sorted(change['file_path'] for change in changes), ['a.py', 'c.py'])
+        self.assertIs(service.file_changes(self.repo, 'main', 'HEAD'), changes)
+        self.assertFalse([value for value in service._values.values()
+                          if isinstance(value, str) and 'diff --git' in value])
+
+    def test_nothing_is_remembered_outside_of_a_run(self):
+        with self.git_calls as calls:
+            get_current_branch(self.repo)
+            get_current_branch(self.repo)
+        self.assertEqual(calls.call_count, 2)
+
+    def test_failures_return_no_files_and_are_retried(self):
+        service = BranchDiffService()
+        self.assertEqual(service.changed_files(self.repo, 'missing'), [])
+
+        git(self.repo, 'branch', 'missing', 'main')
+
+        self.assertEqual(len(service.changed_files(self.repo, 'missing')), 2)
+
+    def test_base_branch_compares_recent_commits(self):
+        git(self.repo, 'checkout', '-q', 'main')
+        for index in range(10):
+            self.write('d.py', f"x = {index}\n")
+            git(self.repo, 'add', '.')
+            git(self.repo, 'commit', '-qm', f"commit {index}")
+
+        changed = BranchDiffService().changed_files(self.repo, 'main')
+
+        self.assertEqual(changed, [os.path.join(self.repo, 'd.py')])
+
+
+if __name__ == '__main__':
+    unittest.main()
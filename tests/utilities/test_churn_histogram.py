@@ -0,0 +1,234 @@
+"""
+Tests for churn histograms built from a single git log pass.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.app.kpi.kpi_calculator import KPICalculator
+from src.kpis.codechurn import ChurnAccelerationKPI
+from src.kpis.complexity import ComplexityAnalyzer
+from src.kpis.model import File
+from src.report.json.json_report_format import JSONReportFormat
+from src.utilities.churn_histogram import (
+    ChurnHistogram, SECONDS_PER_DAY, build_log_args, parse_churn_log
+)
+from src.utilities.git_cache import GitDataCache
+
+
+NOW = 1_700_000_000
+
+
+def _log_entry(age_days, *files):
+    return f"\x00{int(NOW - age_days * SECONDS_PER_DAY)}\n\n" + "\n".join(files) + "\n"
+
+
+class TestChurnHistogram(unittest.TestCase):
+    """Test the ChurnHistogram container."""
+
+    def test_window_counts_commits_by_age(self):
+        hist = ChurnHistogram()
+        for age in (0.5, 3, 29.9, 40, 200):
+            hist.add(age)
+
+        self.assertEqual(hist.window(30), 3)
+        self.assertEqual(hist.window(90), 4)
+        self.assertEqual(hist.window(365), 5)
+        self.assertEqual(hist.window(0), 0)
+        self.assertEqual(hist.total(), 5)
+
+    def test_trailing_bins_are_not_stored(self):
+        hist = ChurnHistogram()
+        self.assertEqual(hist.nbytes, 0)
+        hist.add(9)
+        self.assertEqual(len(hist.bins), 10)
+
+    def test_negative_age_goes_to_first_bin(self):
+        hist = ChurnHistogram()
+        hist.add(-2)
+        self.assertEqual(list(hist.bins), [1])
+
+    def test_bin_count_saturates(self):
+        hist = ChurnHistogram(bins=[0xFFFF])
+        hist.add(0)
+        self.assertEqual(hist.bins[0], 0xFFFF)
+
+    def test_rebin_weekly(self):
+        hist = ChurnHistogram()
+        for age in (0, 6, 7, 20):
+            hist.add(age)
+
+        weekly = hist.rebin(7)
+
+        self.assertEqual(weekly.bin_days, 7)
+        self.assertEqual(list(weekly.bins), [2, 1, 1])
+        self.assertEqual(weekly.window(21), hist.window(21))
+
+    def test_rebin_requires_multiple_of_bin_width(self):
+        with self.assertRaises(ValueError):
+            ChurnHistogram(bin_days=7).rebin(10)
+
+    def test_acceleration(self):
+        hist = ChurnHistogram()
+        for _ in range(6):
+            hist.add(10)
+        for _ in range(6):
+            hist.add(200)
+
+        self.assertEqual(hist.acceleration(30, 365), 6.08)
+        self.assertIsNone(ChurnHistogram().acceleration(30, 365))
+
+
+class TestParseChurnLog(unittest.TestCase):
+    """Test parsing of the single-pass churn log."""
+
+    def test_parse_buckets_files_per_commit(self):
+        output = _log_entry(1, "a.py", "b.py") + _log_entry(45, "a.py")
+
+        hists = parse_churn_log(output, now=NOW)
+
+        self.assertEqual(hists["a.py"].window(30), 1)
+        self.assertEqual(hists["a.py"].window(90), 2)
+        self.assertEqual(hists["b.py"].window(30), 1)
+
+    def test_parse_filters_wanted_files(self):
+        output = _log_entry(1, "a.py", "vendor/lib.js")
+
+        hists = parse_churn_log(output, wanted_files={"a.py"}, now=NOW)
+
+        self.assertEqual(set(hists), {"a.py"})
+
+    def test_parse_ignores_lines_before_first_commit(self):
+        hists = parse_churn_log("a.py\nb.py\n", now=NOW)
+        self.assertEqual(hists, {})
+
+    def test_log_args_cover_horizon(self):
+        args = build_log_args(365)
+        self.assertIn('365 days ago', args)
+        self.assertIn('--name-only', args)
+
+
+class TestGitDataCacheHistograms(unittest.TestCase):
+    """Test that GitDataCache derives churn from histograms."""
+
+    def setUp(self):
+        self.cache = GitDataCache(churn_period_days=30)
+        self.repo = os.path.abspath("/test/repo")
+
+    def test_prebuild_churn_uses_single_log_pass(self):
+        output = _log_entry(1, "a.py") + _log_entry(60, "a.py", "b.py")
+
+        with patch.object(GitDataCache, '_run_git_command', return_value=output) as mock_run, \
+                patch('src.utilities.churn_histogram.time.time', return_value=NOW):
+            self.cache._prebuild_churn_cache(self.repo, ["a.py", "b.py", "c.py"])
+
+        mock_run.assert_called_once()
+        self.assertEqual(self.cache.churn_cache[self.repo], {"a.py": 1, "b.py": 0, "c.py": 0})
+        self.assertEqual(self.cache.get_churn_window(self.repo, "a.py", 90), 2)
+        self.assertEqual(self.cache.get_churn_window(self.repo, "c.py", 365), 0)
+        self.assertIsNone(self.cache.get_churn_window(self.repo, "a.py", 400))
+
+    def test_get_churn_data_uses_histogram_without_git(self):
+        self.cache.churn_histogram_cache[self.repo] = {"a.py": ChurnHistogram(bins=[1, 0, 2])}
+
+        with patch.object(GitDataCache, '_run_git_command') as mock_run:
+            self.assertEqual(self.cache.get_churn_data(self.repo, "a.py"), 3)
+            mock_run.assert_not_called()
+
+    def test_set_churn_period_rederives_without_git(self):
+        hist = ChurnHistogram()
+        hist.add(10)
+        hist.add(60)
+        self.cache.churn_histogram_cache[self.repo] = {"a.py": hist}
+        self.cache.churn_cache[self.repo] = {"a.py": 1}
+
+        with patch.object(GitDataCache, '_run_git_command') as mock_run:
+            self.cache.set_churn_period(90)
+            self.assertEqual(self.cache.get_churn_data(self.repo, "a.py"), 2)
+            mock_run.assert_not_called()
+
+    def test_set_churn_period_beyond_horizon_clears(self):
+        self.cache.churn_histogram_cache[self.repo] = {"a.py": ChurnHistogram(bins=[1])}
+        self.cache.churn_cache[self.repo] = {"a.py": 1}
+
+        self.cache.set_churn_period(800)
+
+        self.assertEqual(self.cache.histogram_days, 800)
+        self.assertEqual(self.cache.churn_histogram_cache, {})
+        self.assertEqual(self.cache.churn_cache, {})
+
+    def test_failed_log_pass_leaves_churn_uncached(self):
+        with patch.object(GitDataCache, '_run_git_command', return_value=None):
+            self.cache._prebuild_churn_cache(self.repo, ["a.py"])
+
+        self.assertEqual(self.cache.churn_cache.get(self.repo), {})
+        self.assertNotIn(self.repo, self.cache.churn_histogram_cache)
+
+
+class TestChurnHistogramRealRepo(unittest.TestCase):
+    """Compare the histogram pass with per-file git log on a real repository."""
+
+    def setUp(self):
+        self.repo_dir = tempfile.mkdtemp()
+        env = dict(os.environ)
+        subprocess.run(['git', 'init'], cwd=self.repo_dir, check=True, capture_output=True)
+        subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=self.repo_dir, check=True)
+        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=self.repo_dir, check=True)
+        for age_days, name in ((100, 'a.py'), (50, 'a.py'), (5, 'a.py'), (5, 'b.py')):
+            with open(os.path.join(self.repo_dir, name), 'a') as f:
+                f.write(f"# {age_days}\n")
+            date = f"@{int(time.time() - age_days * SECONDS_PER_DAY)} +0000"
+            commit_env = dict(env, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+            subprocess.run(['git', 'add', name], cwd=self.repo_dir, check=True)
+            subprocess.run(['git', 'commit', '-q', '-m', name], cwd=self.repo_dir, check=True, env=commit_env)
+
+    def tearDown(self):
+        shutil.rmtree(self.repo_dir)
+
+    def test_histogram_matches_per_file_log(self):
+        cache = GitDataCache(churn_period_days=30)
+        cache.prebuild_cache_for_files(self.repo_dir, ['a.py', 'b.py'])
+
+        for period in (30, 90, 365):
+            per_file = GitDataCache(churn_period_days=period)
+            for name in ('a.py', 'b.py'):
+                self.assertEqual(
+                    cache.get_churn_window(self.repo_dir, name, period),
+                    per_file._calculate_churn(self.repo_dir, name),
+                    f"{name} over {period} days"
+                )
+
+    def test_acceleration_kpi(self):
+        cache = GitDataCache()
+        cache.prebuild_cache_for_files(self.repo_dir, ['a.py'])
+
+        with patch('src.utilities.git_cache.get_git_cache', return_value=cache):
+            kpi = ChurnAccelerationKPI().calculate(
+                file_path=os.path.join(self.repo_dir, 'a.py'), repo_root=self.repo_dir
+            )
+
+        self.assertEqual(kpi.calculation_values['short_churn'], 1)
+        self.assertEqual(kpi.calculation_values['long_churn'], 3)
+        self.assertEqual(kpi.calculation_values['windows'], {'30d': 1, '90d': 2, '365d': 3})
+        self.assertEqual(kpi.value, round((1 / 30) / (3 / 365), 2))
+
+    def test_acceleration_is_calculated_per_file_and_reported_in_json(self):
+        cache = GitDataCache()
+        cache.prebuild_cache_for_files(self.repo_dir, ['a.py'])
+        file_info = {'path': os.path.join(self.repo_dir, 'a.py'), 'ext': '.py'}
+
+        with patch('src.utilities.git_cache.get_git_cache', return_value=cache):
+            kpis = KPICalculator(ComplexityAnalyzer()).calculate_all(file_info, Path(self.repo_dir), '', [])
+        record = JSONReportFormat()._extract_file_kpis(File(name='a.py', file_path='a.py', kpis=kpis))
+
+        self.assertEqual(kpis['churn_acceleration'].calculation_values['windows'], {'30d': 1, '90d': 2, '365d': 3})
+        self.assertEqual(record['churn_acceleration'], round((1 / 30) / (3 / 365), 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Tests for binary-safe, memory-mapped file reading and the byte-level parser prefilter.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.app.kpi.file_analyzer import FileAnalyzer
+from src.app.kpi.kpi_calculator import KPICalculator
+from src.kpis.complexity import ComplexityAnalyzer
+from src.languages.config import LANGUAGES
+from src.languages.parsers.json_yaml import JSONComplexityParser, ShellComplexityParser, YAMLComplexityParser
+from src.languages.parsers.python import PythonComplexityParser
+from src.utilities import file_reader
+from src.utilities.file_reader import SourceFile
+
+MIXED_NEWLINES = "def a():\r\n    return 1\rdef b():\n    return 'é'\r\n"
+
+
+class FileReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'wb') as f:
+            f.write(data.encode('utf-8') if isinstance(data, str) else data)
+        return path
+
+    @staticmethod
+    def text_mode(path):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+
+
+class TestSourceFile(FileReaderTestCase):
+    def test_small_file_is_read_large_file_is_mapped(self):
+        path = self.write('a.py', MIXED_NEWLINES)
+        with SourceFile(path) as small, SourceFile(path, mmap_min_bytes=1) as large:
+            self.assertFalse(small.mapped)
+            self.assertTrue(large.mapped)
+            self.assertEqual(small.decode(), large.decode())
+
+    def test_decode_and_line_count_match_text_mode(self):
+        path = self.write('a.py', MIXED_NEWLINES.encode('utf-8') + b"x = '\xff\xfe'\nno newline")
+        expected = self.text_mode(path)
+        for mmap_min_bytes in (0, 1):
+            with self.subTest(mmap_min_bytes=mmap_min_bytes), SourceFile(path, mmap_min_bytes) as source:
+                self.assertEqual(source.decode(), expected)
+                self.assertEqual(source.line_count(), expected.count('\n'))
+
+    def test_line_count_across_chunk_borders(self):
+        path = self.write('a.txt', "ab\r\ncd\r\n\r\n\ref\n" * 7)
+        expected = self.text_mode(path).count('\n')
+        for chunk in (2, 3, 4, 5):
+            with self.subTest(chunk=chunk), patch.object(file_reader, '_CHUNK_BYTES', chunk), \
+                    SourceFile(path, mmap_min_bytes=1) as source:
+                self.assertEqual(source.line_count(), expected)
+
+    def test_binary_detected_from_first_block(self):
+        path = self.write('data.json', b'{"a": 1}' + b'\0' * 4)
+        with SourceFile(path) as source:
+            self.assertTrue(source.is_binary())
+            self.assertFalse(source.is_binary(probe_bytes=8))
+
+    def test_empty_file(self):
+        path = self.write('empty.py', '')
+        with SourceFile(path, mmap_min_bytes=1) as source:
+            self.assertFalse(source.mapped)
+            self.assertEqual((source.decode(), source.line_count()), ('', 0))
+
+
+class TestParserPrefilter(unittest.TestCase):
+    def test_parsers_without_function_analysis_never_match(self):
+        self.assertFalse(JSONComplexityParser().may_contain_functions(b'{"def": "function() {}"}'))
+        self.assertFalse(YAMLComplexityParser().may_contain_functions(b'key: value\n'))
+
+    def test_tokens_must_all_occur(self):
+        self.assertTrue(PythonComplexityParser().may_contain_functions(b'def f(): pass'))
+        self.assertFalse(PythonComplexityParser().may_contain_functions(b'X = 1\n'))
+        self.assertTrue(ShellComplexityParser().may_contain_functions(b'f() { echo; }'))
+        self.assertFalse(ShellComplexityParser().may_contain_functions(b'echo (x)'))
+
+    def test_unknown_parser_is_not_filtered(self):
+        analyzer = ComplexityAnalyzer()
+        self.assertTrue(analyzer.may_contain_functions(b'', {'name': 'X', 'parser': 'NoSuchComplexityParser'}))
+        self.assertTrue(analyzer.may_contain_functions(b'', {'name': 'X'}))
+
+
+class TestFileAnalyzerReading(FileReaderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.analyzer = FileAnalyzer(LANGUAGES, KPICalculator(ComplexityAnalyzer()))
+
+    def analyze(self, name):
+        ext = os.path.splitext(name)[1]
+        with patch('src.utilities.git_cache.GitDataCache.get_churn_data', return_value=0), \
+                patch('src.utilities.git_cache.GitDataCache.get_ownership_data', return_value={}):
+            return self.analyzer.analyze_file({'path': os.path.join(self.tmp, name), 'ext': ext}, Path(self.tmp))
+
+    def test_data_files_are_not_decoded_or_parsed(self):
+        self.write('data.json', '{"items": [' + ', '.join(['{"a": 1}'] * 1000) + ']}\n')
+        with patch.object(SourceFile, 'decode') as mock_decode, \
+                patch.object(ComplexityAnalyzer, 'analyze_functions') as mock_parse:
+            file_obj = self.analyze('data.json')
+
+        mock_decode.assert_not_called()
+        mock_parse.assert_not_called()
+        self.assertEqual(file_obj.kpis['complexity'].value, 0)
+        self.assertEqual(self.analyzer.last_line_count, 1)
+
+    def test_prefiltered_python_file_keeps_its_kpis(self):
+        self.write('consts.py', "X = 1\nY = 2\n")
+        file_obj = self.analyze('consts.py')
+
+        self.assertEqual(file_obj.functions, [])
+        self.assertEqual(file_obj.kpis['complexity'].value, 0)
+        self.assertEqual(file_obj.kpis['cognitive_complexity'].value, 0)
+
+    def test_empty_file_has_no_cognitive_complexity(self):
+        self.write('__init__.py', "")
+        file_obj = self.analyze('__init__.py')
+
+        self.assertFalse(self.analyzer.last_prefiltered)
+        self.assertIsNone(file_obj.kpis['cognitive_complexity'].value)
+
+    def test_source_files_are_parsed(self):
+        self.write('a.py', MIXED_NEWLINES)
+        file_obj = self.analyze('a.py')
+
+        self.assertEqual([f.name for f in file_obj.functions], ['a', 'b'])
+        self.assertEqual(self.analyzer.last_line_count, 4)
+
+    def test_binary_files_are_skipped(self):
+        self.write('blob.py', b'def f():\0\0\0')
+        self.assertIsNone(self.analyze('blob.py'))
+
+    def test_read_without_language_config_always_decodes(self):
+        path = self.write('data.json', '{"a": 1}\n')
+        self.assertEqual(self.analyzer._read_file_content(Path(path)), '{"a": 1}\n')
+        self.assertEqual(self.analyzer._read_file_content(Path(path), LANGUAGES['.json']), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from unittest.mock import patch, call
 import os
 import subprocess
 
+from src.config.defaults import Defaults
 from src.utilities.git_cache import GitDataCache, get_git_cache
 
 
@@ -87,7 +88,8 @@ class TestGitDataCache(unittest.TestCase):
             ['git', '-C', os.path.abspath(self.test_repo), 'ls-files'],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=Defaults.GIT_TIMEOUT_SECONDS
         )
 
     def test_is_file_tracked_cache_hit(self):
@@ -127,7 +129,8 @@ class TestGitDataCache(unittest.TestCase):
             ['git', '-C', os.path.abspath(self.test_repo), 'blame', '--line-porcelain', self.test_file],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=Defaults.GIT_TIMEOUT_SECONDS
         )
 
     def test_get_git_blame_cache_hit(self):
@@ -351,7 +354,8 @@ class TestGitCacheHelperMethods(unittest.TestCase):
             ['git', '-C', os.path.abspath(self.test_repo), 'ls-files'],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=Defaults.GIT_TIMEOUT_SECONDS
         )
 
     @patch('subprocess.run')
@@ -0,0 +1,213 @@
+"""
+Tests for the central git runner: timeouts, run budget, circuit breaker and counters.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.app.kpi.kpi_calculator import KPICalculator
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.complexity import ComplexityAnalyzer
+from src.report.json.json_report_format import JSONReportFormat
+from src.utilities.cli_helpers import parse_args
+from src.utilities.git_cache import GitDataCache, get_git_cache
+from src.utilities.git_helpers import check_git_output, run_git_command
+from src.utilities.git_runner import (
+    GIT_SKIPPED_TIMEOUT, STATUS_FAILED, STATUS_OK, STATUS_SKIPPED, STATUS_TIMEOUT,
+    GitRunner, configure_git_runner, get_git_runner
+)
+
+
+def _completed(stdout):
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _timeout(cmd, **kwargs):
+    raise subprocess.TimeoutExpired(cmd, kwargs.get('timeout'))
+
+
+class TestGitRunner(unittest.TestCase):
+    @patch('subprocess.run', return_value=_completed('abc\n'))
+    def test_passes_timeout_and_counts_by_subcommand(self, mock_run):
+        runner = GitRunner(timeout=5)
+        result = runner.run('/repo', ['log', '--oneline'])
+        runner.run('/repo', ['log', '-1'])
+        runner.run('/repo', ['ls-files'])
+
+        self.assertEqual(result.status, STATUS_OK)
+        self.assertEqual(result.stdout, 'abc\n')
+        mock_run.assert_any_call(['git', '-C', '/repo', 'log', '--oneline'],
+                                 capture_output=True, text=True, check=True, timeout=5)
+        stats = runner.stats()
+        self.assertEqual(stats['log'].calls, 2)
+        self.assertEqual(stats['log'].bytes_out, 8)
+        self.assertEqual(stats['ls-files'].calls, 1)
+
+    @patch('subprocess.run', return_value=_completed(''))
+    def test_zero_timeout_means_no_timeout(self, mock_run):
+        GitRunner(timeout=0).run('/repo', ['status'])
+        self.assertNotIn('timeout', mock_run.call_args.kwargs)
+
+    @patch('subprocess.run', side_effect=subprocess.CalledProcessError(128, 'git'))
+    def test_failure_is_reported_not_raised(self, _mock_run):
+        runner = GitRunner()
+        result = runner.run('/repo', ['show', 'HEAD:missing.py'])
+
+        self.assertEqual(result.status, STATUS_FAILED)
+        self.assertFalse(result.cut_off)
+        self.assertEqual(runner.stats()['show'].failures, 1)
+
+    @patch('subprocess.run', side_effect=_timeout)
+    def test_timeout_is_remembered_per_command(self, _mock_run):
+        runner = GitRunner(timeout=1)
+        result = runner.run('/repo', ['blame', '--line-porcelain', 'big.py'])
+
+        self.assertEqual(result.status, STATUS_TIMEOUT)
+        self.assertTrue(runner.was_cut_off('/repo', ['blame', '--line-porcelain', 'big.py']))
+        self.assertFalse(runner.was_cut_off('/repo', ['blame', '--line-porcelain', 'small.py']))
+        self.assertEqual(runner.stats()['blame'].timeouts, 1)
+
+    def test_circuit_opens_after_consecutive_timeouts(self):
+        runner = GitRunner(timeout=1, breaker_threshold=3)
+        with patch('subprocess.run', side_effect=_timeout) as mock_run, patch('builtins.print'):
+            for i in range(5):
+                runner.run('/repo', ['blame', f'f{i}.py'])
+
+        self.assertEqual(mock_run.call_count, 3)
+        self.assertEqual(runner.open_circuits, {'blame'})
+        self.assertEqual(runner.stats()['blame'].skipped, 2)
+        self.assertTrue(runner.was_cut_off('/repo', ['blame', 'f4.py']))
+
+        # Other subcommands keep running
+        with patch('subprocess.run', return_value=_completed('x')):
+            self.assertEqual(runner.run('/repo', ['log']).status, STATUS_OK)
+
+    def test_success_resets_consecutive_timeouts(self):
+        runner = GitRunner(timeout=1, breaker_threshold=2)
+        with patch('subprocess.run', side_effect=[subprocess.TimeoutExpired('git', 1),
+                                                  _completed(''),
+                                                  subprocess.TimeoutExpired('git', 1)]):
+            for name in ('a', 'b', 'c'):
+                runner.run('/repo', ['blame', name])
+
+        self.assertEqual(runner.open_circuits, set())
+
+    def test_budget_skips_commands_once_used_up(self):
+        runner = GitRunner(timeout=10, budget=1.0)
+        runner.spent = 0.75
+        with patch('subprocess.run', return_value=_completed('')) as mock_run:
+            runner.run('/repo', ['log'])
+            self.assertAlmostEqual(mock_run.call_args.kwargs['timeout'], 0.25, delta=0.01)
+
+        runner.spent = 1.0
+        with patch('subprocess.run') as mock_run:
+            result = runner.run('/repo', ['log'])
+
+        mock_run.assert_not_called()
+        self.assertEqual(result.status, STATUS_SKIPPED)
+        self.assertTrue(runner.budget_exhausted)
+
+    @patch('subprocess.run', return_value=_completed('out'))
+    def test_to_dict_sorts_commands_by_time(self, _mock_run):
+        runner = GitRunner()
+        runner.run('/repo', ['log'])
+        data = runner.to_dict()
+
+        self.assertEqual(data['timeout'], 120.0)
+        self.assertIsNone(data['budget'])
+        self.assertEqual(data['commands'][0]['subcommand'], 'log')
+
+
+class TestGitHelpersUseRunner(unittest.TestCase):
+    def tearDown(self):
+        configure_git_runner()
+
+    def test_configure_installs_fresh_runner(self):
+        runner = configure_git_runner(timeout=3, budget=60)
+        self.assertIs(get_git_runner(), runner)
+        self.assertEqual((runner.timeout, runner.budget), (3, 60))
+
+    @patch('subprocess.run', side_effect=_timeout)
+    def test_run_git_command_returns_none_on_timeout(self, _mock_run):
+        configure_git_runner(timeout=1)
+        self.assertIsNone(run_git_command('/repo', ['log']))
+
+    @patch('subprocess.run', side_effect=subprocess.CalledProcessError(1, 'git'))
+    def test_check_git_output_raises_on_failure(self, _mock_run):
+        with self.assertRaises(subprocess.CalledProcessError):
+            check_git_output('/repo', ['diff', 'main...HEAD'])
+
+
+class TestSkippedGitKPIs(unittest.TestCase):
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        subprocess.run(['git', 'init', '-q', self.repo], check=True)
+        with open(os.path.join(self.repo, 'a.py'), 'w') as f:
+            f.write("def f():\n    return 1\n")
+        subprocess.run(['git', '-C', self.repo, 'add', 'a.py'], check=True)
+        subprocess.run(['git', '-C', self.repo, '-c', 'user.name=t', '-c', 'user.email=t@t',
+                        'commit', '-q', '-m', 'init'], check=True)
+
+    def tearDown(self):
+        get_git_cache().clear_cache()
+        configure_git_runner()
+        shutil.rmtree(self.repo)
+
+    def test_blame_timeout_marks_file_skipped(self):
+        configure_git_runner(timeout=1)
+        cache = GitDataCache()
+        with patch('subprocess.run', side_effect=_timeout):
+            cache._prebuild_single_file_ownership(self.repo, 'a.py', {}, {})
+
+        self.assertEqual(cache.get_skip_reason(self.repo, 'a.py'), GIT_SKIPPED_TIMEOUT)
+        self.assertIsNone(cache.get_skip_reason(self.repo, 'b.py'))
+
+        cache.clear_cache(self.repo)
+        self.assertIsNone(cache.get_skip_reason(self.repo, 'a.py'))
+
+    def test_failed_blame_is_not_marked_skipped(self):
+        cache = GitDataCache()
+        with patch('subprocess.run', side_effect=subprocess.CalledProcessError(128, 'git')):
+            cache._prebuild_single_file_ownership(self.repo, 'a.py', {}, {})
+
+        self.assertIsNone(cache.get_skip_reason(self.repo, 'a.py'))
+
+    def test_git_kpis_report_skip_status(self):
+        get_git_cache().skipped_files[self.repo] = {'a.py': GIT_SKIPPED_TIMEOUT}
+        file_path = os.path.join(self.repo, 'a.py')
+        with open(file_path) as f:
+            content = f.read()
+
+        kpis = KPICalculator(ComplexityAnalyzer()).calculate_all(
+            {'path': file_path, 'ext': '.py'}, Path(self.repo), content, [{'name': 'f', 'complexity': 1}]
+        )
+
+        for name in ('churn', 'hotspot', 'Code Ownership', 'Shared Ownership'):
+            self.assertEqual(kpis[name].calculation_values['status'], GIT_SKIPPED_TIMEOUT)
+        self.assertNotIn('status', kpis['complexity'].calculation_values)
+
+        file_obj = MagicMock(file_path='a.py', kpis=kpis)
+        self.assertEqual(JSONReportFormat()._extract_file_kpis(file_obj)['git_kpis'], GIT_SKIPPED_TIMEOUT)
+
+
+class TestGitLimitConfig(unittest.TestCase):
+    def test_cli_flags_reach_app_config(self):
+        args = parse_args().parse_args(['src', '--git-timeout', '30', '--git-budget', '600'])
+        config = AppConfig.from_cli_args(args)
+
+        self.assertEqual(config.git_timeout, 30.0)
+        self.assertEqual(config.git_budget, 600.0)
+
+    def test_limits_must_be_non_negative(self):
+        for field in ('git_timeout', 'git_budget'):
+            with self.subTest(field=field), self.assertRaises(ValueError):
+                ConfigValidator(AppConfig(directories=['src'], **{field: -1})).validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Tests for per-phase peak-memory accounting (--memory-profile).
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from src.app.infrastructure.timing_reporter import TimingReporter
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.utilities.cli_helpers import parse_args
+from src.utilities.memory_tracking import (
+    MemoryTracker, begin_memory_phase, current_rss_mb, end_memory_phase, get_memory_tracker,
+    memory_phase, peak_rss_mb, start_memory_tracking, stop_memory_tracking
+)
+
+_MB = 1024 * 1024
+
+
+def _allocate(mb):
+    """Allocate roughly mb megabytes in many small blocks from one source line."""
+    return [bytearray(1024) for _ in range(mb * 1024)]
+
+
+class TestMemoryTracking(unittest.TestCase):
+    def tearDown(self):
+        stop_memory_tracking()
+
+    def test_hooks_are_no_ops_when_disabled(self):
+        begin_memory_phase('scan')
+        end_memory_phase('scan')
+        with memory_phase('scan'):
+            pass
+
+        self.assertIsNone(get_memory_tracker())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_phase_records_peak_of_transient_allocation(self):
+        tracker = start_memory_tracking(threshold_mb=1000)
+        with memory_phase('file_analysis'):
+            data = _allocate(4)
+            del data
+
+        phase = tracker.phases['file_analysis']
+        self.assertEqual(phase.calls, 1)
+        self.assertGreaterEqual(phase.peak_traced_mb, 4)
+        self.assertEqual(phase.top_sites, [])
+
+    def test_nested_phases_credit_peak_to_outer_phase(self):
+        tracker = start_memory_tracking(threshold_mb=1000)
+        begin_memory_phase('analysis')
+        with memory_phase('small'):
+            pass
+        with memory_phase('cache_prebuild'):
+            data = _allocate(3)
+            del data
+        with memory_phase('kpi_aggregation'):
+            pass
+        end_memory_phase('analysis')
+
+        phases = tracker.phases
+        self.assertGreaterEqual(phases['cache_prebuild'].peak_traced_mb, 3)
+        self.assertGreaterEqual(phases['analysis'].peak_traced_mb, phases['cache_prebuild'].peak_traced_mb)
+        self.assertLess(phases['kpi_aggregation'].peak_traced_mb, 3)
+        self.assertEqual(list(phases), ['analysis', 'small', 'cache_prebuild', 'kpi_aggregation'])
+
+    def test_repeated_phase_accumulates_calls_and_max_peak(self):
+        tracker = start_memory_tracking(threshold_mb=1000)
+        for mb in (1, 3, 2):
+            with memory_phase('cache_prebuild'):
+                data = _allocate(mb)
+                del data
+
+        phase = tracker.phases['cache_prebuild']
+        self.assertEqual(phase.calls, 3)
+        self.assertGreaterEqual(phase.peak_traced_mb, 3)
+        self.assertLess(phase.peak_traced_mb, 4)
+
+    def test_top_sites_listed_above_threshold(self):
+        tracker = start_memory_tracking(threshold_mb=1)
+        with memory_phase('report:json'):
+            kept = _allocate(2)
+
+        sites = tracker.phases['report:json'].top_sites
+        self.assertTrue(sites)
+        self.assertEqual(sites[0]['file'], __file__)
+        self.assertGreaterEqual(sites[0]['growth_mb'], 2)
+        self.assertGreater(len(kept), 0)
+
+    def test_concurrent_phases_from_threads(self):
+        tracker = start_memory_tracking(threshold_mb=1000)
+        barrier = threading.Barrier(3)
+
+        def work():
+            with memory_phase('file_analysis'):
+                barrier.wait()
+
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(tracker.phases['file_analysis'].calls, 3)
+        self.assertEqual(tracker._open, {})
+        self.assertEqual(tracker._baselines, {})
+
+    def test_end_without_begin_is_ignored(self):
+        tracker = start_memory_tracking()
+        end_memory_phase('scan')
+        self.assertEqual(tracker.phases, {})
+
+    def test_stop_leaves_foreign_tracemalloc_running(self):
+        tracemalloc.start()
+        try:
+            start_memory_tracking()
+            stop_memory_tracking()
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_rss_helpers(self):
+        self.assertGreater(current_rss_mb(), 0)
+        self.assertGreater(peak_rss_mb(), 0)
+
+    def test_timing_reporter_brackets_phases_and_prints_summary(self):
+        tracker = start_memory_tracking(threshold_mb=0)
+        reporter = TimingReporter()
+        reporter.start_scan()
+        reporter.end_scan()
+        reporter.start_analysis()
+        kept = _allocate(1)
+        reporter.end_analysis()
+        reporter.start_report_generation()
+        reporter.end_report_generation()
+
+        memory = tracker.to_dict()
+        self.assertEqual([p['name'] for p in memory['phases']], ['scan', 'analysis', 'report_generation'])
+        self.assertEqual(json.loads(json.dumps(memory)), memory)
+
+        with patch('sys.stdout', new_callable=StringIO) as out:
+            reporter.print_memory_summary(memory)
+        self.assertIn('MEMORY SUMMARY', out.getvalue())
+        self.assertIn('Top allocation sites: analysis', out.getvalue())
+        self.assertGreater(len(kept), 0)
+
+    def test_print_memory_summary_ignores_empty_data(self):
+        with patch('sys.stdout', new_callable=StringIO) as out:
+            TimingReporter().print_memory_summary(None)
+            TimingReporter().print_memory_summary(MemoryTracker().to_dict())
+        self.assertEqual(out.getvalue(), '')
+
+
+class TestMemoryProfileConfig(unittest.TestCase):
+    def tearDown(self):
+        stop_memory_tracking()
+
+    def test_cli_flags_reach_app_config(self):
+        args = parse_args().parse_args(['src', '--memory-profile', '--memory-threshold-mb', '50',
+                                        '--memory-output', 'mem.json'])
+        config = AppConfig.from_cli_args(args)
+
+        self.assertTrue(config.memory_profile)
+        self.assertEqual(config.memory_threshold_mb, 50.0)
+        self.assertEqual(config.memory_output, 'mem.json')
+
+    def test_negative_threshold_rejected(self):
+        with self.assertRaises(ValueError):
+            ConfigValidator(AppConfig(directories=['src'], memory_threshold_mb=-1)).validate()
+
+    def test_app_writes_memory_json_with_all_phases(self):
+        from src.app.metric_mancer_app import MetricMancerApp
+
+        tmp = tempfile.mkdtemp()
+        try:
+            src = os.path.join(tmp, 'src')
+            os.makedirs(src)
+            with open(os.path.join(src, 'a.py'), 'w') as f:
+                f.write('def f():\n    return 1\n')
+            report_folder = os.path.join(tmp, 'output')
+            config = AppConfig(directories=[src], output_formats=['summary', 'json'],
+                               report_folder=report_folder, no_timing=True, memory_profile=True)
+            with patch('sys.stdout', new_callable=StringIO) as out:
+                MetricMancerApp(config=config).run()
+            with open(os.path.join(report_folder, 'memory_profile.json'), encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmp)
+
+        names = [p['name'] for p in data['phases']]
+        for expected in ('scan', 'analysis', 'cache_prebuild', 'file_analysis', 'kpi_aggregation',
+                         'report_generation', 'report:summary', 'report:json'):
+            self.assertIn(expected, names)
+        self.assertIn('MEMORY SUMMARY', out.getvalue())
+        self.assertIsNone(get_memory_tracker())
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == '__main__':
+    unittest.main()
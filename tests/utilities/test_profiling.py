@@ -0,0 +1,228 @@
+"""
+Tests for the --profile report of slowest files and git commands.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from src.app.core.analyzer import Analyzer, initialize_timing
+from src.config.app_config import AppConfig
+from src.config.config_validator import ConfigValidator
+from src.kpis.complexity import ComplexityAnalyzer
+from src.languages.config import LANGUAGES
+from src.utilities.cli_helpers import parse_args
+from src.utilities.git_helpers import run_git_command
+from src.utilities.profiling import Profiler, TopK, get_profiler, start_profiling, stop_profiling
+
+
+class TestTopK(unittest.TestCase):
+    def test_keeps_only_highest_scores(self):
+        top = TopK(3)
+        for score in [5, 1, 9, 3, 7, 2, 8]:
+            top.add(score, f'item{score}')
+
+        self.assertEqual(top.items(), ['item9', 'item8', 'item7'])
+        self.assertEqual(len(top), 3)
+        self.assertEqual(top.seen, 7)
+
+    def test_equal_scores_keep_insertion_order_and_do_not_compare_items(self):
+        top = TopK(2)
+        top.add(1.0, {'a': 1})
+        top.add(1.0, {'b': 2})
+        top.add(1.0, {'c': 3})
+
+        self.assertEqual(top.items(), [{'a': 1}, {'b': 2}])
+
+    def test_concurrent_adds_stay_bounded(self):
+        top = TopK(5)
+
+        def work(offset):
+            for i in range(200):
+                top.add(offset + i, offset + i)
+
+        threads = [threading.Thread(target=work, args=(n * 1000,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(top.seen, 800)
+        self.assertEqual(top.items(), [3199, 3198, 3197, 3196, 3195])
+
+
+class TestProfiler(unittest.TestCase):
+    def test_record_file_maps_timings_to_columns(self):
+        profiler = Profiler(top_k=2)
+        profiler.record_file('/r/a.py', '.py', 2048, 80, {
+            'read': 0.1, 'parse': 0.2, 'complexity': 0.05, 'cognitive_complexity': 0.3,
+            'churn': 0.4, 'hotspot': 0.0, 'ownership': 0.5, 'shared_ownership': 0.25,
+        })
+
+        [profile] = profiler.files.items()
+        self.assertEqual(profile.language, 'Python')
+        self.assertEqual((profile.size_bytes, profile.lines), (2048, 80))
+        self.assertAlmostEqual(profile.cognitive, 0.3)
+        self.assertAlmostEqual(profile.blame, 0.75)
+        self.assertAlmostEqual(profile.total, 1.8)
+
+    def test_per_language_timing_is_not_counted_twice(self):
+        profiler = Profiler()
+        profiler.record_file('a.py', '.py', 1, 1, {'parse': 0.1, 'cognitive_complexity': 0.3,
+                                                   'cognitive_complexity.Python': 0.3})
+
+        [profile] = profiler.files.items()
+        self.assertAlmostEqual(profile.cognitive, 0.3)
+        self.assertAlmostEqual(profile.total, 0.4)
+
+    def test_unknown_extension_keeps_extension_as_language(self):
+        profiler = Profiler()
+        profiler.record_file('a.xyz', '.xyz', 0, 0, {})
+
+        self.assertEqual(profiler.files.items()[0].language, '.xyz')
+
+    def test_slowest_files_and_commands_are_ranked(self):
+        profiler = Profiler(top_k=2)
+        for name, seconds in [('a.py', 0.1), ('b.py', 0.9), ('c.py', 0.5)]:
+            profiler.record_file(name, '.py', 1, 1, {'parse': seconds})
+        profiler.record_git_command('/r', ['blame', 'big.py'], 2.0, 'x\ny\n')
+        profiler.record_git_command('/r', ['log'], 0.5, None)
+
+        data = profiler.to_dict()
+        self.assertEqual([f['path'] for f in data['slowest_files']], ['b.py', 'c.py'])
+        self.assertEqual(data['files_profiled'], 3)
+        self.assertEqual(data['slowest_git_commands'][0]['command'], 'git blame big.py')
+        self.assertEqual(data['slowest_git_commands'][0]['bytes_out'], 4)
+        self.assertEqual(data['slowest_git_commands'][0]['lines_out'], 2)
+        self.assertEqual(data['slowest_git_commands'][1]['bytes_out'], 0)
+
+    def test_write_json_and_print_report(self):
+        profiler = Profiler()
+        profiler.record_file('a.py', '.py', 1, 1, {'parse': 0.1})
+        profiler.record_git_command('/r', ['ls-files'], 0.1, 'a.py\n')
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'nested', 'profile.json')
+            profiler.write_json(path)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), profiler.to_dict())
+        finally:
+            shutil.rmtree(tmp)
+
+        with patch('sys.stdout', new_callable=StringIO) as out:
+            profiler.print_report()
+        self.assertIn('SLOWEST FILES (top 1 of 1)', out.getvalue())
+        self.assertIn('git ls-files', out.getvalue())
+
+
+class TestProfilingHooks(unittest.TestCase):
+    def setUp(self):
+        self.repo = tempfile.mkdtemp()
+        subprocess.run(['git', 'init', '-q'], cwd=self.repo, check=True)
+        self.file_path = os.path.join(self.repo, 'a.py')
+        with open(self.file_path, 'w') as f:
+            f.write('def f(x):\n    if x:\n        return 1\n    return 0\n')
+        subprocess.run(['git', 'add', 'a.py'], cwd=self.repo, check=True)
+
+    def tearDown(self):
+        stop_profiling()
+        shutil.rmtree(self.repo)
+
+    def test_git_commands_recorded_only_while_profiling(self):
+        run_git_command(self.repo, ['ls-files'])
+        profiler = start_profiling(top_k=3)
+        run_git_command(self.repo, ['ls-files'])
+        stop_profiling()
+        run_git_command(self.repo, ['ls-files'])
+
+        [command] = profiler.git_commands.items()
+        self.assertEqual(command.command, 'git ls-files')
+        self.assertEqual(command.lines_out, 1)
+        self.assertIsNone(get_profiler())
+
+    def test_analyzer_records_per_file_profile_and_resets_timing(self):
+        profiler = start_profiling()
+        analyzer = Analyzer(LANGUAGES)
+        file_analyzer = analyzer._create_file_analyzer(ComplexityAnalyzer())
+
+        analyzer._process_file({'path': self.file_path, 'ext': '.py'}, Path(self.repo), file_analyzer,
+                               initialize_timing())
+
+        [profile] = profiler.files.items()
+        self.assertEqual(profile.path, self.file_path)
+        self.assertEqual(profile.lines, 4)
+        self.assertEqual(profile.size_bytes, os.path.getsize(self.file_path))
+        self.assertGreater(profile.parse, 0)
+        self.assertEqual(file_analyzer.timing, {'read': 0.0, 'parse': 0.0})
+
+
+class TestProfileConfig(unittest.TestCase):
+    def test_cli_flags_reach_app_config(self):
+        args = parse_args().parse_args(['src', '--profile-top', '3', '--profile-output', 'p.json'])
+        config = AppConfig.from_cli_args(args)
+
+        self.assertFalse(config.profile)
+        self.assertEqual(config.profile_top, 3)
+        self.assertEqual(config.profile_output, 'p.json')
+
+    def test_profile_top_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ConfigValidator(AppConfig(directories=['src'], profile_top=0)).validate()
+
+    def test_app_writes_profile_json(self):
+        from src.app.metric_mancer_app import MetricMancerApp
+
+        tmp = tempfile.mkdtemp()
+        try:
+            src = os.path.join(tmp, 'src')
+            os.makedirs(src)
+            for name in ('a.py', 'b.py'):
+                with open(os.path.join(src, name), 'w') as f:
+                    f.write('x = 1\n')
+            profile_path = os.path.join(tmp, 'profile.json')
+            config = AppConfig(directories=[src], report_folder=os.path.join(tmp, 'output'),
+                               no_timing=True, profile_output=profile_path)
+            with patch('sys.stdout', new_callable=StringIO) as out:
+                MetricMancerApp(config=config).run()
+            with open(profile_path, encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmp)
+
+        self.assertEqual(data['files_profiled'], 2)
+        self.assertIn('SLOWEST FILES', out.getvalue())
+        self.assertIsNone(get_profiler())
+
+    def test_profile_totals_with_per_language_timing(self):
+        from src.app.metric_mancer_app import MetricMancerApp
+
+        tmp = tempfile.mkdtemp()
+        try:
+            src = os.path.join(tmp, 'src')
+            os.makedirs(src)
+            with open(os.path.join(src, 'a.py'), 'w') as f:
+                f.write('def f(x):\n    if x:\n        return 1\n    return 0\n')
+            profile_path = os.path.join(tmp, 'profile.json')
+            args = parse_args().parse_args([src, '--profile', '--profile-output', profile_path,
+                                            '--report-folder', os.path.join(tmp, 'output'), '--no-timing'])
+            with patch.object(Profiler, 'record_file', autospec=True, side_effect=Profiler.record_file) as record, \
+                    patch('sys.stdout', new_callable=StringIO):
+                MetricMancerApp(config=AppConfig.from_cli_args(args)).run()
+            with open(profile_path, encoding='utf-8') as f:
+                [profile] = json.load(f)['slowest_files']
+        finally:
+            shutil.rmtree(tmp)
+
+        timing = record.call_args.args[5]
+        self.assertIn('cognitive_complexity.Python', timing)
+        self.assertAlmostEqual(profile['total'], sum(timing.values()) - timing['cognitive_complexity.Python'])
+
+
+if __name__ == '__main__':
+    unittest.main()
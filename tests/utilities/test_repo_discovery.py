@@ -0,0 +1,106 @@
+"""
+Tests for the memoized repository discovery index.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.app.core.analyzer import Analyzer
+from src.utilities.repo_discovery import RepoDiscoveryIndex, is_repo_root, read_gitdir_file
+
+
+def _write(path, content=''):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class TestRepoDiscoveryIndex(unittest.TestCase):
+    """Test directory -> repository root resolution."""
+
+    def setUp(self):
+        self.tmp = os.path.realpath(tempfile.mkdtemp())
+        # outer/                 normal repository
+        # outer/lib/sub/         submodule (.git file into outer/.git/modules)
+        # outer/vendor/nested/   nested repository (.git directory)
+        # wt/                    linked worktree of outer
+        self.outer = os.path.join(self.tmp, 'outer')
+        self.submodule = os.path.join(self.outer, 'lib', 'sub')
+        self.nested = os.path.join(self.outer, 'vendor', 'nested')
+        self.worktree = os.path.join(self.tmp, 'wt')
+
+        os.makedirs(os.path.join(self.outer, '.git', 'modules', 'sub'))
+        _write(os.path.join(self.submodule, '.git'), 'gitdir: ../../.git/modules/sub\n')
+        os.makedirs(os.path.join(self.nested, '.git'))
+        _write(os.path.join(self.worktree, '.git'), f'gitdir: {self.outer}/.git/worktrees/wt\n')
+        for d in (os.path.join(self.outer, 'src', 'pkg'),
+                  os.path.join(self.submodule, 'src'),
+                  os.path.join(self.nested, 'src'),
+                  os.path.join(self.worktree, 'src')):
+            os.makedirs(d, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_resolves_closest_repository(self):
+        index = RepoDiscoveryIndex()
+
+        self.assertEqual(index.find_repo_root(os.path.join(self.outer, 'src', 'pkg')), self.outer)
+        self.assertEqual(index.find_repo_root(os.path.join(self.submodule, 'src')), self.submodule)
+        self.assertEqual(index.find_repo_root(os.path.join(self.nested, 'src')), self.nested)
+        self.assertEqual(index.find_repo_root(os.path.join(self.worktree, 'src')), self.worktree)
+
+    def test_each_directory_checked_once(self):
+        index = RepoDiscoveryIndex()
+        pkg = os.path.join(self.outer, 'src', 'pkg')
+
+        index.find_repo_root(pkg)
+        first = index.stat_calls
+        self.assertEqual(first, 3)  # pkg, src, outer
+
+        index.find_repo_root(pkg)
+        index.find_repo_root(os.path.join(self.outer, 'src'))
+        self.assertEqual(index.stat_calls, first)
+
+        # A sibling directory only costs its own level
+        os.makedirs(os.path.join(self.outer, 'src', 'other'))
+        index.find_repo_root(os.path.join(self.outer, 'src', 'other'))
+        self.assertEqual(index.stat_calls, first + 1)
+
+    def test_outside_any_repository_returns_none(self):
+        plain = os.path.join(self.tmp, 'plain', 'dir')
+        os.makedirs(plain)
+        index = RepoDiscoveryIndex()
+        # The temp directory itself may live inside a repository on some machines
+        expected = index.find_repo_root(self.tmp)
+
+        self.assertEqual(index.find_repo_root(plain), expected)
+
+    def test_git_file_without_gitdir_is_ignored(self):
+        bogus = os.path.join(self.tmp, 'bogus')
+        _write(os.path.join(bogus, '.git'), 'not a gitdir link\n')
+
+        self.assertFalse(is_repo_root(bogus))
+        self.assertIsNone(read_gitdir_file(os.path.join(bogus, '.git')))
+
+    def test_relative_gitdir_is_resolved(self):
+        gitdir = read_gitdir_file(os.path.join(self.submodule, '.git'))
+        self.assertEqual(gitdir, os.path.join(self.outer, '.git', 'modules', 'sub'))
+
+    def test_analyzer_group_files_by_repo_splits_submodule(self):
+        files = [
+            {'path': os.path.join(self.outer, 'src', 'pkg', 'a.py'), 'root': self.outer, 'ext': '.py'},
+            {'path': os.path.join(self.submodule, 'src', 'b.py'), 'root': self.outer, 'ext': '.py'},
+            {'path': os.path.join(self.nested, 'src', 'c.py'), 'root': self.outer, 'ext': '.py'},
+        ]
+
+        files_by_root, scan_dirs_by_root = Analyzer({})._group_files_by_repo(files)
+
+        self.assertEqual(set(files_by_root), {self.outer, self.submodule, self.nested})
+        self.assertEqual([f['path'] for f in files_by_root[self.submodule]], [files[1]['path']])
+        self.assertEqual(scan_dirs_by_root[self.submodule], {self.outer})
+
+
+if __name__ == '__main__':
+    unittest.main()
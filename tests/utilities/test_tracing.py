@@ -0,0 +1,230 @@
+"""
+Tests for the tracing layer and its Chrome trace-event export.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+
+from src.config.app_config import AppConfig
+from src.utilities import tracing
+from src.utilities.git_helpers import git_subcommand, run_git_command
+from src.utilities.tracing import (
+    Tracer, get_tracer, is_tracing_enabled, span, start_tracing, stop_tracing
+)
+
+
+def _complete_events(tracer):
+    return [e for e in tracer.to_chrome_trace()['traceEvents'] if e['ph'] == 'X']
+
+
+class TestTracingDisabled(unittest.TestCase):
+    def setUp(self):
+        stop_tracing()
+
+    def test_span_is_shared_no_op_when_disabled(self):
+        first = span('scan', 'pipeline', files=3)
+        second = span('parse', 'file')
+
+        self.assertIs(first, second)
+        with first as s:
+            s.set(bytes_out=10)
+        self.assertFalse(is_tracing_enabled())
+        self.assertIsNone(get_tracer())
+
+    def test_disabled_span_does_not_swallow_exceptions(self):
+        with self.assertRaises(ValueError):
+            with span('boom'):
+                raise ValueError('boom')
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.tracer = start_tracing()
+
+    def tearDown(self):
+        stop_tracing()
+
+    def test_span_records_complete_event_with_args(self):
+        with span('git log', 'git', args='log --numstat') as s:
+            s.set(bytes_out=42)
+
+        [event] = _complete_events(self.tracer)
+        self.assertEqual(event['name'], 'git log')
+        self.assertEqual(event['cat'], 'git')
+        self.assertEqual(event['args'], {'args': 'log --numstat', 'bytes_out': 42})
+        self.assertGreaterEqual(event['ts'], 0)
+        self.assertGreaterEqual(event['dur'], 0)
+        self.assertEqual(event['tid'], threading.get_ident())
+
+    def test_nested_spans_are_contained_in_parent(self):
+        with span('analyze_file', 'file'):
+            with span('parse', 'file'):
+                pass
+
+        events = {e['name']: e for e in _complete_events(self.tracer)}
+        parent, child = events['analyze_file'], events['parse']
+        self.assertLessEqual(parent['ts'], child['ts'])
+        self.assertGreaterEqual(parent['ts'] + parent['dur'], child['ts'] + child['dur'])
+
+    def test_exception_is_recorded_and_propagated(self):
+        with self.assertRaises(KeyError):
+            with span('churn', 'kpi'):
+                raise KeyError('x')
+
+        [event] = _complete_events(self.tracer)
+        self.assertEqual(event['args']['error'], 'KeyError')
+
+    def test_non_json_args_are_stringified(self):
+        with span('prebuild', 'pipeline', repo=tempfile.gettempdir(), files=(1, 2), obj=object()):
+            pass
+
+        [event] = _complete_events(self.tracer)
+        self.assertEqual(event['args']['files'], [1, 2])
+        self.assertIsInstance(event['args']['obj'], str)
+
+    def test_threads_get_their_own_track(self):
+        # Keep all threads alive until each has recorded, so thread ids are not reused
+        barrier = threading.Barrier(3)
+
+        def work():
+            with span('repo', 'pipeline'):
+                pass
+            barrier.wait()
+
+        threads = [threading.Thread(target=work, name=f'worker-{i}') for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        trace = self.tracer.to_chrome_trace()
+        thread_names = {e['args']['name'] for e in trace['traceEvents'] if e['name'] == 'thread_name'}
+        self.assertEqual(thread_names, {'worker-0', 'worker-1', 'worker-2'})
+        self.assertEqual(len(_complete_events(self.tracer)), 3)
+
+    def test_write_chrome_trace_produces_loadable_json(self):
+        with span('scan', 'pipeline'):
+            pass
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'traces', 'run.json')
+            self.tracer.write_chrome_trace(path)
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmp)
+
+        self.assertEqual(data['displayTimeUnit'], 'ms')
+        phases = [e['ph'] for e in data['traceEvents']]
+        self.assertIn('M', phases)
+        self.assertIn('X', phases)
+
+    def test_start_tracing_replaces_previous_tracer(self):
+        with span('old'):
+            pass
+        new_tracer = start_tracing()
+
+        self.assertIsNot(new_tracer, self.tracer)
+        self.assertIs(tracing.get_tracer(), new_tracer)
+        self.assertEqual(new_tracer.events, [])
+        self.assertIs(stop_tracing(), new_tracer)
+        self.assertIsNone(stop_tracing())
+
+    def test_tracer_events_relative_to_origin(self):
+        tracer = Tracer()
+        tracer.record('x', 'app', tracer._origin_ns + 2000, tracer._origin_ns + 5000)
+
+        self.assertEqual(tracer.events[0]['ts'], 2.0)
+        self.assertEqual(tracer.events[0]['dur'], 3.0)
+        self.assertNotIn('args', tracer.events[0])
+
+
+class TestGitSpans(unittest.TestCase):
+    def setUp(self):
+        self.repo = tempfile.mkdtemp()
+        subprocess.run(['git', 'init', '-q'], cwd=self.repo, check=True)
+        with open(os.path.join(self.repo, 'a.py'), 'w') as f:
+            f.write('x = 1\n')
+        subprocess.run(['git', 'add', 'a.py'], cwd=self.repo, check=True)
+        self.tracer = start_tracing()
+
+    def tearDown(self):
+        stop_tracing()
+        shutil.rmtree(self.repo)
+
+    def test_git_subcommand_skips_global_options(self):
+        self.assertEqual(git_subcommand(['-c', 'core.quotepath=off', 'log', '--numstat']), 'log')
+        self.assertEqual(git_subcommand(['--no-pager', 'blame', 'a.py']), 'blame')
+        self.assertEqual(git_subcommand(['--version']), 'unknown')
+
+    def test_run_git_command_records_args_and_bytes_out(self):
+        output = run_git_command(self.repo, ['ls-files'])
+
+        [event] = _complete_events(self.tracer)
+        self.assertEqual(event['name'], 'git ls-files')
+        self.assertEqual(event['args']['args'], 'ls-files')
+        self.assertEqual(event['args']['bytes_out'], len(output))
+        self.assertEqual(event['args']['returncode'], 0)
+
+    def test_failed_git_command_records_return_code(self):
+        self.assertIsNone(run_git_command(self.repo, ['rev-parse', 'no-such-ref']))
+
+        [event] = _complete_events(self.tracer)
+        self.assertEqual(event['name'], 'git rev-parse')
+        self.assertNotEqual(event['args']['returncode'], 0)
+
+
+class TestPipelineTrace(unittest.TestCase):
+    """End-to-end: --trace-file covers scan, files, KPIs and report formats."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp, 'src')
+        os.makedirs(self.src)
+        with open(os.path.join(self.src, 'a.py'), 'w') as f:
+            f.write('def f(x):\n    if x:\n        return 1\n    return 0\n')
+        self.trace_path = os.path.join(self.tmp, 'trace.json')
+
+    def tearDown(self):
+        stop_tracing()
+        shutil.rmtree(self.tmp)
+
+    def test_app_writes_trace_file(self):
+        from src.app.metric_mancer_app import MetricMancerApp
+
+        config = AppConfig(
+            directories=[self.src],
+            output_formats=['summary', 'json'],
+            report_folder=os.path.join(self.tmp, 'output'),
+            no_timing=True,
+            trace_file=self.trace_path,
+        )
+        MetricMancerApp(config=config).run()
+
+        self.assertFalse(is_tracing_enabled())
+        with open(self.trace_path, encoding='utf-8') as f:
+            events = [e for e in json.load(f)['traceEvents'] if e['ph'] == 'X']
+        names = {e['name'] for e in events}
+        for expected in ('scan', 'analyze', 'prebuild_git_cache', 'analyze_file', 'read', 'parse',
+                         'complexity', 'cognitive_complexity', 'churn', 'hotspot', 'ownership',
+                         'shared_ownership', 'aggregate_kpis', 'report summary', 'report json'):
+            self.assertIn(expected, names)
+        parse = next(e for e in events if e['name'] == 'parse')
+        self.assertEqual(parse['args'], {'language': '.py', 'functions': 1})
+
+    def test_app_without_trace_file_does_not_enable_tracing(self):
+        from src.app.metric_mancer_app import MetricMancerApp
+
+        config = AppConfig(directories=[self.src], report_folder=os.path.join(self.tmp, 'output'), no_timing=True)
+        MetricMancerApp(config=config).run()
+
+        self.assertFalse(os.path.exists(self.trace_path))
+        self.assertIsNone(get_tracer())
+
+
+if __name__ == '__main__':
+    unittest.main()